@@ -137,3 +137,15 @@ class ConfigManager:
     def get_global_interval(self) -> int:
         """Get global check interval in minutes"""
         return self.config.get("autonomous", {}).get("global_interval_minutes", 30)
+
+    def get_max_concurrent_workers(self) -> int:
+        """Get maximum number of workers allowed to run at the same time"""
+        return max(1, int(self.config.get("autonomous", {}).get("max_concurrent_workers", 2)))
+
+    def get_jitter_seconds(self) -> float:
+        """Get maximum random delay added to each scheduled worker start"""
+        return max(0.0, float(self.config.get("autonomous", {}).get("jitter_seconds", 30)))
+
+    def get_shutdown_timeout(self) -> float:
+        """Get seconds to wait for running workers to finish on shutdown"""
+        return max(0.0, float(self.config.get("autonomous", {}).get("shutdown_timeout_seconds", 60)))
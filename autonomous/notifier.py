@@ -0,0 +1,473 @@
+"""
+Alert Notifier
+Non-blocking delivery of worker alerts to Slack webhooks and email
+
+Workers hand their alerts to a shared Notifier, which queues them and
+returns immediately. A background dispatcher coalesces alerts that arrive
+within a short window into one digest per destination, then delivers each
+digest over a pooled aiohttp session with per-destination rate limiting and
+retry with exponential backoff.
+"""
+
+import asyncio
+import logging
+import os
+import random
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+SENDGRID_API_URL = "https://api.sendgrid.com/v3/mail/send"
+
+# Slack rejects section text over 3000 characters
+SLACK_SECTION_LIMIT = 3000
+MAX_ALERTS_PER_WORKER = 20
+
+_STOP = object()
+
+
+class NotificationError(Exception):
+    """Delivery failure; retryable errors are attempted again after a backoff"""
+
+    def __init__(self, message: str, retryable: bool = True, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+@dataclass
+class AlertBatch:
+    """Alerts produced by one worker run"""
+
+    worker: str
+    alerts: List[Any]
+    created_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def title(self) -> str:
+        return self.worker.replace("_", " ").title()
+
+
+class NotificationChannel(ABC):
+    """
+    Destination for alert digests
+
+    Channels are identified by `key`; alerts for the same key are coalesced
+    into one message and share a rate limit.
+    """
+
+    default_rate_limit_per_minute = 30
+
+    @property
+    @abstractmethod
+    def key(self) -> str:
+        """Unique destination key (used for coalescing and rate limiting)"""
+
+    @abstractmethod
+    def format(self, batches: List[AlertBatch]) -> Any:
+        """Build the payload for one digest"""
+
+    @abstractmethod
+    async def deliver(self, session: aiohttp.ClientSession, payload: Any) -> None:
+        """
+        Send a payload
+
+        Raises:
+            NotificationError: If delivery failed
+        """
+
+
+def _raise_for_status(response: aiohttp.ClientResponse, body: str) -> None:
+    """Map an HTTP error response to a NotificationError"""
+    if response.status < 400:
+        return
+
+    retry_after = None
+    if response.status == 429:
+        try:
+            retry_after = float(response.headers.get("Retry-After", ""))
+        except ValueError:
+            retry_after = None
+
+    retryable = response.status == 429 or response.status >= 500
+    raise NotificationError(
+        f"HTTP {response.status}: {body[:200]}", retryable=retryable, retry_after=retry_after
+    )
+
+
+def _alert_lines(batch: AlertBatch) -> List[str]:
+    """Bullet lines for a batch, capped at MAX_ALERTS_PER_WORKER"""
+    lines = [f"• {alert}" for alert in batch.alerts[:MAX_ALERTS_PER_WORKER]]
+    if len(batch.alerts) > MAX_ALERTS_PER_WORKER:
+        lines.append(f"…and {len(batch.alerts) - MAX_ALERTS_PER_WORKER} more")
+    return lines
+
+
+class SlackWebhookChannel(NotificationChannel):
+    """Slack incoming webhook (Slack allows about one message per second)"""
+
+    default_rate_limit_per_minute = 60
+
+    def __init__(self, webhook_url: str):
+        self.webhook_url = webhook_url
+
+    @property
+    def key(self) -> str:
+        return f"slack:{self.webhook_url}"
+
+    def format(self, batches: List[AlertBatch]) -> Dict[str, Any]:
+        """Single-worker alerts keep the classic layout; several workers become a digest"""
+        workers = _merge_by_worker(batches)
+
+        if len(workers) == 1:
+            title = workers[0].title
+            header = f"🚨 {title}"
+            text = f"*{title} Alert*"
+        else:
+            alert_total = sum(len(batch.alerts) for batch in workers)
+            header = f"🚨 Autonomous Alerts Digest ({alert_total})"
+            text = f"*Autonomous alerts from {len(workers)} workers*"
+
+        blocks: List[Dict[str, Any]] = [
+            {"type": "header", "text": {"type": "plain_text", "text": header}},
+        ]
+        for batch in workers:
+            lines = _alert_lines(batch)
+            if len(workers) > 1:
+                lines.insert(0, f"*{batch.title}*")
+            section = "\n".join(lines)
+            if len(section) > SLACK_SECTION_LIMIT:
+                section = section[:SLACK_SECTION_LIMIT - 1] + "…"
+            blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": section}})
+
+        return {"text": text, "blocks": blocks}
+
+    async def deliver(self, session: aiohttp.ClientSession, payload: Dict[str, Any]) -> None:
+        async with session.post(self.webhook_url, json=payload) as response:
+            _raise_for_status(response, await response.text())
+
+
+class SendGridEmailChannel(NotificationChannel):
+    """Plain-text alert email sent through the SendGrid v3 API"""
+
+    default_rate_limit_per_minute = 10
+
+    def __init__(self, recipients: List[str], api_key: Optional[str] = None,
+                 from_email: Optional[str] = None):
+        self.recipients = sorted(recipients)
+        self.api_key = api_key or os.getenv("SENDGRID_API_KEY")
+        self.from_email = from_email or os.getenv("SENDGRID_FROM_EMAIL", "noreply@localhost")
+
+    @property
+    def key(self) -> str:
+        return f"email:{','.join(self.recipients)}"
+
+    def format(self, batches: List[AlertBatch]) -> Dict[str, Any]:
+        workers = _merge_by_worker(batches)
+        alert_total = sum(len(batch.alerts) for batch in workers)
+
+        if len(workers) == 1:
+            subject = f"{workers[0].title} Alert ({alert_total})"
+        else:
+            subject = f"Autonomous Alerts Digest: {alert_total} alerts from {len(workers)} workers"
+
+        sections = [
+            "\n".join([batch.title, *_alert_lines(batch)])
+            for batch in workers
+        ]
+        return {
+            "personalizations": [{"to": [{"email": email} for email in self.recipients]}],
+            "from": {"email": self.from_email},
+            "subject": subject,
+            "content": [{"type": "text/plain", "value": "\n\n".join(sections)}],
+        }
+
+    async def deliver(self, session: aiohttp.ClientSession, payload: Dict[str, Any]) -> None:
+        if not self.api_key:
+            raise NotificationError("SENDGRID_API_KEY is not configured", retryable=False)
+
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        async with session.post(SENDGRID_API_URL, json=payload, headers=headers) as response:
+            _raise_for_status(response, await response.text())
+
+
+def _merge_by_worker(batches: List[AlertBatch]) -> List[AlertBatch]:
+    """Combine batches from repeated runs of the same worker, keeping arrival order"""
+    merged: Dict[str, AlertBatch] = {}
+    for batch in batches:
+        if batch.worker in merged:
+            merged[batch.worker].alerts.extend(batch.alerts)
+        else:
+            merged[batch.worker] = AlertBatch(batch.worker, list(batch.alerts), batch.created_at)
+    return list(merged.values())
+
+
+class Notifier:
+    """
+    Shared, non-blocking alert dispatcher
+
+    `enqueue` never waits: alerts go onto a bounded queue (dropped with a
+    warning when full) and a background task started on first use delivers
+    them. Call `shutdown` to deliver what is queued and close the session.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize notifier
+
+        Args:
+            config: Notification settings (autonomous.notifications); also the
+                default destinations for workers without their own settings
+        """
+        self.config: Dict[str, Any] = {}
+        self._channels: Dict[str, NotificationChannel] = {}
+        self._next_send: Dict[str, float] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._deliveries: set = set()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._closing = False
+        self.stats = {
+            "enqueued": 0,
+            "dropped": 0,
+            "digests": 0,
+            "sent": 0,
+            "failed": 0,
+            "retries": 0,
+        }
+        self.configure(config or {})
+
+    def configure(self, config: Dict[str, Any]) -> None:
+        """
+        Apply notification settings (e.g. after a config reload)
+
+        Args:
+            config: Notification settings dict
+        """
+        self.config = config
+        self.digest_window = max(0.0, float(config.get("digest_window_seconds", 5)))
+        self.queue_size = max(1, int(config.get("queue_size", 1000)))
+        self.max_retries = max(0, int(config.get("max_retries", 3)))
+        self.retry_backoff = max(0.0, float(config.get("retry_backoff_seconds", 1.0)))
+        self.request_timeout = float(config.get("request_timeout_seconds", 10))
+        self.rate_limit_per_minute = config.get("rate_limit_per_minute")
+
+    def channels_for(self, overrides: Optional[Dict[str, Any]] = None) -> List[NotificationChannel]:
+        """
+        Resolve the destinations for a worker
+
+        Args:
+            overrides: Worker-level notification settings layered over the defaults
+
+        Returns:
+            Channels to deliver to
+        """
+        settings = {**self.config, **(overrides or {})}
+        channels: List[NotificationChannel] = []
+
+        if settings.get("slack_enabled") and settings.get("slack_webhook"):
+            channels.append(SlackWebhookChannel(settings["slack_webhook"]))
+
+        if settings.get("email_enabled") and settings.get("email_to"):
+            recipients = settings["email_to"]
+            if isinstance(recipients, str):
+                recipients = [email.strip() for email in recipients.split(",") if email.strip()]
+            channels.append(SendGridEmailChannel(recipients))
+
+        return [self._channels.setdefault(channel.key, channel) for channel in channels]
+
+    def enqueue(self, worker_name: str, alerts: List[Any],
+                overrides: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Queue alerts for delivery without waiting
+
+        Args:
+            worker_name: Worker that produced the alerts
+            alerts: Alert messages
+            overrides: Worker-level notification settings
+
+        Returns:
+            Number of destinations the alerts were queued for
+        """
+        if not alerts or self._closing:
+            return 0
+
+        channels = self.channels_for(overrides)
+        if not channels:
+            return 0
+
+        self._ensure_started()
+        queued = 0
+        for channel in channels:
+            try:
+                self._queue.put_nowait((channel.key, AlertBatch(worker_name, list(alerts))))
+                queued += 1
+            except asyncio.QueueFull:
+                self.stats["dropped"] += 1
+                logger.warning(
+                    f"Notification queue full ({self.queue_size}), "
+                    f"dropping {len(alerts)} alerts from {worker_name}"
+                )
+        self.stats["enqueued"] += queued
+        return queued
+
+    def _ensure_started(self) -> None:
+        """Create the queue and dispatcher inside the running event loop"""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+        if self._task is None:
+            self._task = asyncio.create_task(self._dispatch(), name="notifier")
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Pooled HTTP session shared by all channels"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+                connector=aiohttp.TCPConnector(limit=10),
+            )
+        return self._session
+
+    async def _collect(self) -> Tuple[List[Tuple[str, AlertBatch]], bool]:
+        """
+        Wait for alerts, then keep collecting for the digest window
+
+        Returns:
+            (queued items, whether shutdown was requested)
+        """
+        first = await self._queue.get()
+        if first is _STOP:
+            return [], True
+
+        items = [first]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.digest_window
+        while True:
+            remaining = deadline - loop.time()
+            try:
+                item = self._queue.get_nowait() if remaining <= 0 else \
+                    await asyncio.wait_for(self._queue.get(), timeout=remaining)
+            except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                return items, False
+            if item is _STOP:
+                return items, True
+            items.append(item)
+
+    async def _dispatch(self) -> None:
+        """Background loop: coalesce queued alerts and start one delivery per destination"""
+        stopping = False
+        while not stopping:
+            items, stopping = await self._collect()
+
+            digests: Dict[str, List[AlertBatch]] = {}
+            for key, batch in items:
+                digests.setdefault(key, []).append(batch)
+
+            for key, batches in digests.items():
+                self.stats["digests"] += 1
+                task = asyncio.create_task(self._deliver(self._channels[key], batches))
+                self._deliveries.add(task)
+                task.add_done_callback(self._deliveries.discard)
+
+    async def _wait_for_slot(self, channel: NotificationChannel) -> None:
+        """Space out sends to a destination according to its rate limit"""
+        per_minute = self.rate_limit_per_minute or channel.default_rate_limit_per_minute
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        send_at = max(now, self._next_send.get(channel.key, now))
+        self._next_send[channel.key] = send_at + 60.0 / per_minute
+        if send_at > now:
+            await asyncio.sleep(send_at - now)
+
+    async def _deliver(self, channel: NotificationChannel, batches: List[AlertBatch]) -> bool:
+        """
+        Deliver one digest with retries
+
+        Args:
+            channel: Destination
+            batches: Alert batches to combine
+
+        Returns:
+            True if delivered
+        """
+        payload = channel.format(batches)
+        alert_count = sum(len(batch.alerts) for batch in batches)
+        lock = self._locks.setdefault(channel.key, asyncio.Lock())
+
+        async with lock:
+            for attempt in range(self.max_retries + 1):
+                await self._wait_for_slot(channel)
+                try:
+                    await channel.deliver(self._get_session(), payload)
+                    self.stats["sent"] += 1
+                    logger.info(f"Sent {alert_count} alerts to {channel.key.split(':', 1)[0]}")
+                    return True
+                except NotificationError as e:
+                    error = e
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    error = NotificationError(f"{type(e).__name__}: {e}")
+
+                if not error.retryable or attempt == self.max_retries:
+                    break
+
+                self.stats["retries"] += 1
+                delay = error.retry_after
+                if delay is None:
+                    delay = self.retry_backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+                logger.warning(
+                    f"Notification to {channel.key.split(':', 1)[0]} failed ({error}), "
+                    f"retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+        self.stats["failed"] += 1
+        logger.error(f"Failed to deliver {alert_count} alerts to {channel.key.split(':', 1)[0]}: {error}")
+        return False
+
+    async def shutdown(self, timeout: float = 30) -> None:
+        """
+        Deliver queued alerts and close the HTTP session
+
+        Args:
+            timeout: Seconds to wait for outstanding deliveries before cancelling
+        """
+        self._closing = True
+
+        if self._task is not None:
+            await self._queue.put(_STOP)
+            await self._task
+            self._task = None
+
+        if self._deliveries:
+            _, pending = await asyncio.wait(set(self._deliveries), timeout=timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                logger.warning(f"Cancelled {len(pending)} notification(s) still sending after {timeout}s")
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+        self._queue = None
+        self._closing = False
+
+    async def __aenter__(self) -> "Notifier":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.shutdown()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get delivery statistics"""
+        return {
+            **self.stats,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "in_flight": len(self._deliveries),
+        }
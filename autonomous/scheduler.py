@@ -4,18 +4,34 @@ Main loop that runs enabled workers on their schedules
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
-from typing import Dict, Any
-from datetime import datetime
+import random
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timedelta
 
 from .config_manager import ConfigManager
+from .notifier import Notifier
 from .workers import WORKER_REGISTRY
 
 logger = logging.getLogger(__name__)
 
 
 class AutonomousScheduler:
-    """Scheduler for autonomous workers"""
+    """
+    Scheduler for autonomous workers
+
+    Workers are kept in a next-due priority queue. Each worker runs at most
+    once at a time (in-flight guard), at most `max_concurrent_workers` run
+    together, and every scheduled start gets a random jitter so workers with
+    the same interval do not hit the database at the same moment.
+
+    The concurrency limit is a slot count rather than a semaphore so
+    reload_config() can change it while workers are running: a higher limit
+    lets waiting workers start at once, a lower one takes effect as running
+    workers finish.
+    """
 
     def __init__(self, config_manager: ConfigManager, tools: Any):
         """
@@ -29,6 +45,20 @@ class AutonomousScheduler:
         self.tools = tools
         self.workers: Dict[str, Any] = {}
         self.running = False
+
+        self.max_concurrent_workers = config_manager.get_max_concurrent_workers()
+        self.jitter_seconds = config_manager.get_jitter_seconds()
+        self.shutdown_timeout = config_manager.get_shutdown_timeout()
+        self.notifier = Notifier(config_manager.get_notification_config())
+
+        self._active_workers = 0
+        self._slot_waiters: List[asyncio.Future] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._queue: List[Tuple[float, int, str]] = []  # (due loop time, seq, worker name)
+        self._sequence = itertools.count()
+        self._next_due: Dict[str, float] = {}
+        self._in_flight: Dict[str, asyncio.Task] = {}
+
         self._initialize_workers()
 
     def _initialize_workers(self) -> None:
@@ -39,7 +69,8 @@ class AutonomousScheduler:
             if worker_name in WORKER_REGISTRY:
                 worker_class = WORKER_REGISTRY[worker_name]
                 self.workers[worker_name] = worker_class(
-                    name=worker_name, config=worker_config, tools=self.tools
+                    name=worker_name, config=worker_config, tools=self.tools,
+                    notifier=self.notifier,
                 )
                 logger.info(f"Initialized worker: {worker_name}")
             else:
@@ -55,10 +86,11 @@ class AutonomousScheduler:
         results = {}
 
         for worker_name, worker in self.workers.items():
-            if worker.should_run():
+            if worker_name in self._in_flight:
+                logger.debug(f"Worker {worker_name} already running, skipping")
+            elif worker.should_run():
                 logger.info(f"Triggering worker: {worker_name}")
-                result = await worker.run()
-                results[worker_name] = result
+                results[worker_name] = await self._execute_worker(worker_name, worker)
             else:
                 logger.debug(f"Worker {worker_name} not due yet")
 
@@ -80,43 +112,205 @@ class AutonomousScheduler:
                 "error": f"Worker {worker_name} not found or not enabled",
             }
 
+        if worker_name in self._in_flight:
+            return {
+                "status": "skipped",
+                "worker": worker_name,
+                "error": f"Worker {worker_name} is already running",
+            }
+
         logger.info(f"Manual trigger of worker: {worker_name}")
-        return await self.workers[worker_name].run()
+        return await self._execute_worker(worker_name, self.workers[worker_name])
+
+    def _ensure_primitives(self) -> None:
+        """Create asyncio primitives inside the running event loop"""
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+
+    def _schedule(self, worker_name: str, delay_seconds: float) -> None:
+        """
+        Queue a worker to start after a delay plus random jitter
+
+        Args:
+            worker_name: Name of worker to schedule
+            delay_seconds: Seconds until the worker is due
+        """
+        jitter = random.uniform(0, self.jitter_seconds) if self.jitter_seconds else 0.0
+        due = asyncio.get_running_loop().time() + delay_seconds + jitter
+        self._next_due[worker_name] = due
+        heapq.heappush(self._queue, (due, next(self._sequence), worker_name))
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _acquire_slot(self) -> None:
+        """Wait until fewer than max_concurrent_workers workers are running"""
+        while self._active_workers >= self.max_concurrent_workers:
+            waiter = asyncio.get_running_loop().create_future()
+            self._slot_waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                self._slot_waiters.remove(waiter)
+        self._active_workers += 1
+
+    def _release_slot(self) -> None:
+        self._active_workers -= 1
+        self._wake_slot_waiters()
+
+    def _wake_slot_waiters(self) -> None:
+        """Let every waiting worker recheck the limit"""
+        for waiter in self._slot_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def _execute_worker(self, worker_name: str, worker: Any) -> Dict[str, Any]:
+        """
+        Run a worker under the in-flight guard and concurrency limit
+
+        Args:
+            worker_name: Name of worker
+            worker: Worker instance
+
+        Returns:
+            Worker execution result
+        """
+        self._in_flight[worker_name] = asyncio.current_task()
+        try:
+            await self._acquire_slot()
+            try:
+                return await worker.run()
+            finally:
+                self._release_slot()
+        finally:
+            self._in_flight.pop(worker_name, None)
+
+    def _forget_task(self, worker_name: str, task: asyncio.Task) -> None:
+        """Drop a finished task that never got to clear its own in-flight entry"""
+        if self._in_flight.get(worker_name) is task:
+            del self._in_flight[worker_name]
+
+    async def _run_scheduled(self, worker_name: str, worker: Any) -> None:
+        """Run a worker from the queue and schedule its next run"""
+        try:
+            await self._execute_worker(worker_name, worker)
+        finally:
+            # Reschedule only if the worker survived a config reload
+            if self.running and self.workers.get(worker_name) is worker:
+                # A failed run leaves last_run unchanged; retry after a full interval
+                delay = worker.seconds_until_due() or worker.interval_seconds
+                self._schedule(worker_name, delay)
+
+    def _dispatch_due(self) -> float:
+        """
+        Start every worker whose due time has passed
+
+        Returns:
+            Seconds until the next queued worker is due (inf if queue is empty)
+        """
+        now = asyncio.get_running_loop().time()
+
+        while self._queue and self._queue[0][0] <= now:
+            due, _, worker_name = heapq.heappop(self._queue)
+
+            # Drop stale entries (rescheduled, reloaded or removed workers)
+            if self._next_due.get(worker_name) != due or worker_name not in self.workers:
+                continue
+            del self._next_due[worker_name]
+
+            if worker_name in self._in_flight:
+                # Still running from a manual trigger; it is rescheduled on completion
+                logger.info(f"Worker {worker_name} still running, skipping scheduled start")
+                self._schedule(worker_name, self.workers[worker_name].interval_seconds)
+                continue
+
+            worker = self.workers[worker_name]
+            if not worker.config.get("enabled", False):
+                continue
+
+            logger.info(f"Triggering worker: {worker_name}")
+            # Registered now, not when the task first runs: the in-flight map
+            # keeps the only reference to the task and guards against a
+            # second start (or a shutdown that misses it) in between
+            task = asyncio.create_task(
+                self._run_scheduled(worker_name, worker), name=f"worker:{worker_name}"
+            )
+            self._in_flight[worker_name] = task
+            task.add_done_callback(lambda done, name=worker_name: self._forget_task(name, done))
+
+        return self._queue[0][0] - now if self._queue else float("inf")
 
     async def run_forever(self) -> None:
         """
-        Run scheduler loop indefinitely
-        Checks all workers and runs those that are due
+        Run scheduler loop until stopped
+        Sleeps until the next worker is due, then drains running workers on exit
         """
         self.running = True
-        check_interval_seconds = self.config_manager.get_global_interval() * 60
+        self._ensure_primitives()
+        max_sleep_seconds = self.config_manager.get_global_interval() * 60
 
         logger.info(
             f"Starting autonomous scheduler. "
-            f"Check interval: {check_interval_seconds}s. "
-            f"Workers enabled: {len(self.workers)}"
+            f"Workers enabled: {len(self.workers)}, "
+            f"max concurrent: {self.max_concurrent_workers}, "
+            f"jitter: {self.jitter_seconds}s"
         )
 
-        while self.running:
-            try:
-                # Check each worker
-                for worker_name, worker in self.workers.items():
-                    if worker.should_run():
-                        # Run worker in background (don't block other workers)
-                        asyncio.create_task(worker.run())
+        self._queue.clear()
+        self._next_due.clear()
+        for worker_name, worker in self.workers.items():
+            self._schedule(worker_name, worker.seconds_until_due())
 
-                # Wait until next check
-                await asyncio.sleep(check_interval_seconds)
+        try:
+            while self.running:
+                try:
+                    self._wakeup.clear()
+                    sleep_seconds = min(self._dispatch_due(), max_sleep_seconds)
 
-            except Exception as e:
-                logger.error(f"Scheduler error: {e}", exc_info=True)
-                # Continue running even if there's an error
-                await asyncio.sleep(60)
+                    # Wake early when a worker is rescheduled or stop() is called
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=sleep_seconds)
+                    except asyncio.TimeoutError:
+                        pass
+
+                except Exception as e:
+                    logger.error(f"Scheduler error: {e}", exc_info=True)
+                    # Continue running even if there's an error
+                    await asyncio.sleep(60)
+        finally:
+            await self.shutdown()
 
     def stop(self) -> None:
-        """Stop the scheduler"""
+        """Stop the scheduler (running workers are drained by run_forever)"""
         logger.info("Stopping autonomous scheduler")
         self.running = False
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def shutdown(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop scheduling and wait for running workers to finish
+
+        Args:
+            timeout: Seconds to wait before cancelling (default from config)
+        """
+        self.stop()
+        current = asyncio.current_task()
+        tasks = [task for task in self._in_flight.values() if task is not current]
+        timeout = self.shutdown_timeout if timeout is None else timeout
+
+        if tasks:
+            logger.info(f"Waiting up to {timeout}s for {len(tasks)} running worker(s)")
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+
+            for task in pending:
+                task.cancel()
+            if pending:
+                logger.warning(f"Cancelled {len(pending)} worker(s) still running after {timeout}s")
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        # Deliver alerts raised by the drained workers
+        await self.notifier.shutdown(timeout=timeout)
 
     def get_status(self) -> Dict[str, Any]:
         """
@@ -129,15 +323,46 @@ class AutonomousScheduler:
             "running": self.running,
             "timestamp": datetime.now().isoformat(),
             "global_interval_minutes": self.config_manager.get_global_interval(),
+            "max_concurrent_workers": self.max_concurrent_workers,
+            "in_flight": sorted(self._in_flight),
+            "notifications": self.notifier.get_stats(),
             "workers": {
-                worker_name: worker.get_stats()
+                worker_name: {
+                    **worker.get_stats(),
+                    "running": worker_name in self._in_flight,
+                    "next_run": self._next_run_iso(worker_name),
+                }
                 for worker_name, worker in self.workers.items()
             },
         }
 
+    def _next_run_iso(self, worker_name: str) -> Optional[str]:
+        """Wall-clock time of a worker's next scheduled start"""
+        due = self._next_due.get(worker_name)
+        if due is None:
+            return None
+        try:
+            remaining = due - asyncio.get_running_loop().time()
+        except RuntimeError:
+            return None
+        return (datetime.now() + timedelta(seconds=max(0.0, remaining))).isoformat()
+
     def reload_config(self) -> None:
         """Reload configuration and reinitialize workers"""
         logger.info("Reloading autonomous configuration")
         self.config_manager.load_config()
+        self.max_concurrent_workers = self.config_manager.get_max_concurrent_workers()
+        self.jitter_seconds = self.config_manager.get_jitter_seconds()
+        self.shutdown_timeout = self.config_manager.get_shutdown_timeout()
+        self.notifier.configure(self.config_manager.get_notification_config())
+        # Running workers keep their slots; waiting ones recheck the new limit
+        self._wake_slot_waiters()
         self.workers.clear()
         self._initialize_workers()
+
+        # Queue reloaded workers; in-flight runs of replaced workers finish untouched
+        self._next_due.clear()
+        self._queue.clear()
+        if self.running:
+            for worker_name, worker in self.workers.items():
+                self._schedule(worker_name, worker.seconds_until_due())
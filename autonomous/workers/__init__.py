@@ -11,6 +11,7 @@ from .nps_csat_monitor import NPSCSATMonitor
 from .support_sla_tracker import SupportSLATracker
 from .upsell_detector import UpsellDetector
 from .retention_analyzer import RetentionAnalyzer
+from .health_score_refresh import HealthScoreRefresh
 
 # Worker registry - maps config keys to worker classes
 WORKER_REGISTRY = {
@@ -21,6 +22,7 @@ WORKER_REGISTRY = {
     "support_sla_tracker": SupportSLATracker,
     "upsell_detector": UpsellDetector,
     "retention_analyzer": RetentionAnalyzer,
+    "health_score_refresh": HealthScoreRefresh,
 }
 
 __all__ = [
@@ -33,4 +35,5 @@ __all__ = [
     "SupportSLATracker",
     "UpsellDetector",
     "RetentionAnalyzer",
+    "HealthScoreRefresh",
 ]
@@ -8,7 +8,8 @@ import logging
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
-import requests
+
+from ..notifier import Notifier
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +17,8 @@ logger = logging.getLogger(__name__)
 class AutonomousWorker(ABC):
     """Base class for all autonomous workers"""
 
-    def __init__(self, name: str, config: Dict[str, Any], tools: Any):
+    def __init__(self, name: str, config: Dict[str, Any], tools: Any,
+                 notifier: Optional[Notifier] = None):
         """
         Initialize worker
 
@@ -24,10 +26,12 @@ class AutonomousWorker(ABC):
             name: Worker name (e.g., "deal_risk_monitor")
             config: Worker configuration from autonomous_config.json
             tools: Access to MCP tools
+            notifier: Shared alert notifier (a temporary one is used if omitted)
         """
         self.name = name
         self.config = config
         self.tools = tools
+        self.notifier = notifier
         self.last_run: Optional[datetime] = None
         self.run_count = 0
         self.alert_count = 0
@@ -53,6 +57,24 @@ class AutonomousWorker(ABC):
         next_run = self.last_run + timedelta(hours=interval_hours)
         return datetime.now() >= next_run
 
+    @property
+    def interval_seconds(self) -> float:
+        """Configured run interval in seconds"""
+        return self.config.get("interval_hours", 24) * 3600
+
+    def seconds_until_due(self) -> float:
+        """
+        Seconds until the worker is next due
+
+        Returns:
+            0 if due now (or never run), otherwise remaining seconds
+        """
+        if self.last_run is None:
+            return 0.0
+
+        next_run = self.last_run + timedelta(seconds=self.interval_seconds)
+        return max(0.0, (next_run - datetime.now()).total_seconds())
+
     @abstractmethod
     async def execute(self) -> Dict[str, Any]:
         """
@@ -115,53 +137,21 @@ class AutonomousWorker(ABC):
         """
         Send notifications for alerts
 
+        Alerts are handed to the shared notifier and delivered in the
+        background; a worker run outside the scheduler delivers them through
+        a temporary notifier before returning.
+
         Args:
             alerts: List of alert dicts
         """
-        notification_config = self.config.get("notifications", {})
-
-        # Slack notifications
-        if notification_config.get("slack_enabled"):
-            webhook_url = notification_config.get("slack_webhook")
-            if webhook_url:
-                await self._send_slack_notification(webhook_url, alerts)
-
-        # Email notifications (placeholder - implement with your email service)
-        if notification_config.get("email_enabled"):
-            email_to = notification_config.get("email_to")
-            if email_to:
-                logger.info(f"Email notification would be sent to {email_to}")
-                # TODO: Implement email sending
-
-    async def _send_slack_notification(self, webhook_url: str, alerts: list) -> None:
-        """Send Slack notification"""
-        try:
-            message = self._format_slack_message(alerts)
-            response = requests.post(webhook_url, json=message, timeout=10)
-            response.raise_for_status()
-            logger.info(f"Sent Slack notification for {len(alerts)} alerts")
-        except Exception as e:
-            logger.error(f"Failed to send Slack notification: {e}")
+        overrides = self.config.get("notifications")
 
-    def _format_slack_message(self, alerts: list) -> Dict[str, Any]:
-        """Format alerts as Slack message"""
-        alert_text = "\n".join([f"• {alert}" for alert in alerts])
-        return {
-            "text": f"*{self.name.replace('_', ' ').title()} Alert*",
-            "blocks": [
-                {
-                    "type": "header",
-                    "text": {
-                        "type": "plain_text",
-                        "text": f"🚨 {self.name.replace('_', ' ').title()}",
-                    },
-                },
-                {
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": alert_text},
-                },
-            ],
-        }
+        if self.notifier is not None:
+            self.notifier.enqueue(self.name, alerts, overrides)
+            return
+
+        async with Notifier(overrides) as notifier:
+            notifier.enqueue(self.name, alerts)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get worker statistics"""
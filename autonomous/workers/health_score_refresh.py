@@ -0,0 +1,60 @@
+"""
+Health Score Refresh
+Nightly set-based rescoring of the whole customer book
+"""
+
+import asyncio
+from typing import Dict, Any
+from .base_worker import AutonomousWorker
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class HealthScoreRefresh(AutonomousWorker):
+    """Rescores every customer with the bulk health scoring engine"""
+
+    def _score(self, status, lookback_period_days: int, batch_size: int) -> Dict[str, Any]:
+        """Run one bulk scoring pass on a sync session"""
+        from src.database import SessionLocal
+        from src.services.health_scoring import BulkHealthScoringEngine
+
+        with SessionLocal() as db:
+            engine = BulkHealthScoringEngine(
+                db,
+                lookback_period_days=lookback_period_days,
+                batch_size=batch_size
+            )
+            return engine.score_book(status=status).to_dict()
+
+    async def execute(self) -> Dict[str, Any]:
+        """
+        Rescore customers:
+        - Writes a HealthScoreComponents row per customer
+        - Updates each customer's health score and trend
+        - Alerts when critical-risk customers are found
+        """
+        params = self.config.get("params", {})
+        status = params.get("account_status", "active")
+        lookback_period_days = params.get("lookback_period_days", 30)
+        batch_size = params.get("batch_size", 1000)
+
+        logger.info(f"Rescoring customer health (status: {status or 'all'})")
+
+        # Scoring is synchronous and database-bound; keep it off the event loop
+        result = await asyncio.to_thread(self._score, status, lookback_period_days, batch_size)
+
+        critical = result["risk_counts"].get("critical", 0)
+        declining = result["trend_counts"].get("declining", 0)
+        alerts = []
+        if critical:
+            alerts.append(f"🔴 {critical} customers at critical health after rescoring")
+
+        return {
+            "summary": (
+                f"Rescored {result['customers_scored']} customers "
+                f"(avg {result['average_score']}, {declining} declining) in {result['duration_seconds']}s"
+            ),
+            **result,
+            "alerts": alerts,
+        }
@@ -0,0 +1,30 @@
+"""Add composite indexes for keyset pagination of customers
+
+Revision ID: 3c9e1a7d4b20
+Revises: 6b022f57af5f
+Create Date: 2026-10-16 09:12:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9e1a7d4b20'
+down_revision: Union[str, Sequence[str], None] = '6b022f57af5f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_customers_health_score_client_id', 'customers', ['health_score', 'client_id'])
+    op.create_index('ix_customers_created_at_client_id', 'customers', ['created_at', 'client_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_customers_created_at_client_id', table_name='customers')
+    op.drop_index('ix_customers_health_score_client_id', table_name='customers')
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Ticket Routing Benchmark
+
+Routes a synthetic backlog with the heap-based TicketRouter and,
+optionally, with the previous per-ticket scan over all agents (the same
+scoring, O(tickets x agents)) for comparison. Both see identical queues
+generated from a fixed seed.
+
+Usage:
+    python scripts/benchmark_routing.py
+    python scripts/benchmark_routing.py --tickets 10000 --agents 300 --compare-scan
+    python scripts/benchmark_routing.py --max-ms 250 --output routing.json
+
+With --max-ms the script exits 1 if the median routing time exceeds the
+budget, so it can gate CI.
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.services.ticket_router import EXPERTISE_BONUS, WORKLOAD_WEIGHT, TicketRouter, priority_weight  # noqa: E402
+
+PRIORITIES = ['P0', 'P1', 'P2', 'P3', 'P4']
+
+
+def synthetic_queue(
+    tickets: int,
+    agents: int,
+    categories: int = 12,
+    capacity: int = 40,
+    seed: int = 42
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Generate a ticket backlog and an agent roster.
+
+    Args:
+        tickets: Unassigned tickets
+        agents: Available agents
+        categories: Distinct ticket categories (agent skills)
+        capacity: Max tickets per agent
+        seed: Random seed
+
+    Returns:
+        (tickets, agents)
+    """
+    rng = random.Random(seed)
+    names = [f"category_{i}" for i in range(categories)]
+
+    agent_rows = [
+        {
+            'email': f"agent{i}@company.com",
+            'name': f"Agent {i}",
+            'team': f"Team {i % 5}",
+            'current_tickets': rng.randint(0, capacity // 2),
+            'max_tickets': capacity,
+            'expertise': rng.sample(names, rng.randint(1, 3)),
+            'seniority': 'senior' if rng.random() < 0.2 else 'standard',
+            'status': 'available',
+        }
+        for i in range(agents)
+    ]
+    ticket_rows = [
+        {
+            'ticket_id': f"TKT-{i}",
+            'priority': rng.choice(PRIORITIES),
+            'category': rng.choice(names),
+            'sla_breach_risk': rng.randint(0, 2),
+            'assigned_agent': None,
+        }
+        for i in range(tickets)
+    ]
+    return ticket_rows, agent_rows
+
+
+def scan_route(tickets: List[Dict[str, Any]], agents: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+    """Baseline: sort the queue, then scan every agent for every ticket"""
+    loads = {a['email']: a['current_tickets'] for a in agents}
+    ordered = sorted(
+        tickets,
+        key=lambda t: (priority_weight(t['priority']), t.get('sla_breach_risk', 0)),
+        reverse=True
+    )
+
+    routed = []
+    for ticket in ordered:
+        available = [a for a in agents if loads[a['email']] < a['max_tickets']]
+        if not available:
+            continue
+        best = max(
+            available,
+            key=lambda a: (
+                (EXPERTISE_BONUS if ticket['category'] in a['expertise'] else 0) +
+                (a['max_tickets'] - loads[a['email']]) * WORKLOAD_WEIGHT
+            )
+        )
+        loads[best['email']] += 1
+        routed.append((ticket['ticket_id'], best['email']))
+    return routed
+
+
+def heap_route(tickets: List[Dict[str, Any]], agents: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+    """TicketRouter, including building the heaps"""
+    router = TicketRouter(agents)
+    assignments, _ = router.route(tickets)
+    return [(a.ticket_id, a.agent.email) for a in assignments]
+
+
+def _time(fn, tickets, agents, runs: int) -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+    timings = []
+    result = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = fn(tickets, agents)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        'runs': runs,
+        'median_ms': round(statistics.median(timings), 2),
+        'min_ms': round(timings[0], 2),
+        'max_ms': round(timings[-1], 2),
+        'routed': len(result),
+    }, result
+
+
+def benchmark(
+    tickets: int = 10000,
+    agents: int = 300,
+    categories: int = 12,
+    runs: int = 5,
+    compare_scan: bool = False
+) -> Dict[str, Any]:
+    """
+    Route the same synthetic backlog several times and summarize.
+
+    Args:
+        tickets: Backlog size
+        agents: Roster size
+        categories: Distinct categories
+        runs: Timed runs per implementation
+        compare_scan: Also time the per-ticket scan (slow for large queues)
+
+    Returns:
+        Dict of per-implementation summaries
+    """
+    ticket_rows, agent_rows = synthetic_queue(tickets, agents, categories)
+    results = {}
+    results['heap'], heap_routes = _time(heap_route, ticket_rows, agent_rows, runs)
+
+    if compare_scan:
+        results['scan'], scan_routes = _time(scan_route, ticket_rows, agent_rows, 1)
+        results['scan']['same_assignments'] = sorted(scan_routes) == sorted(heap_routes)
+        results['speedup'] = round(results['scan']['median_ms'] / max(results['heap']['median_ms'], 1e-6), 1)
+
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ticket routing")
+    parser.add_argument("--tickets", type=int, default=10000)
+    parser.add_argument("--agents", type=int, default=300)
+    parser.add_argument("--categories", type=int, default=12)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--compare-scan", action="store_true", help="Also time the per-ticket agent scan")
+    parser.add_argument("--max-ms", type=float, help="Fail if the heap router median exceeds this")
+    parser.add_argument("--output", type=Path, help="Append the JSON result to this file")
+    args = parser.parse_args()
+
+    report = {
+        'timestamp': datetime.now().isoformat(),
+        'python': sys.version.split()[0],
+        'tickets': args.tickets,
+        'agents': args.agents,
+        'categories': args.categories,
+        'results': benchmark(args.tickets, args.agents, args.categories, args.runs, args.compare_scan),
+    }
+    print(json.dumps(report, indent=2))
+
+    if args.output:
+        with open(args.output, 'a') as f:
+            f.write(json.dumps(report) + "\n")
+
+    median = report['results']['heap']['median_ms']
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"Routing took {median}ms, budget {args.max_ms}ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
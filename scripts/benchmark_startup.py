@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+MCP Server Cold-Start Benchmark
+
+Claude Desktop spawns the server once per session, so cold start is paid
+by every user. This script measures it in fresh interpreters (no warm
+module cache), as the time to:
+
+    lazy:   import FastMCP, create the server and register all tools from
+            the manifest (what initialization.register_tools does)
+    eager:  the same plus importing every tool module up front (the cost
+            lazy registration defers to first use)
+    server: import server.py, i.e. the full initialize_all() path
+
+Usage:
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py --runs 10 --modes lazy eager
+    python scripts/benchmark_startup.py --max-seconds 2.0 --output startup.json
+
+With --max-seconds the script exits 1 if the lazy median exceeds the
+budget, so it can gate CI.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+_SETUP = f"""
+import sys, time
+sys.path.insert(0, {str(PROJECT_ROOT)!r})
+start = time.perf_counter()
+"""
+
+_LAZY = """
+from mcp.server.fastmcp import FastMCP
+from src.tools import register_all_tools
+mcp = FastMCP("startup-benchmark")
+register_all_tools(mcp)
+"""
+
+_EAGER = _LAZY + """
+import importlib
+from src.tools.manifest import load_manifest
+failed = 0
+for entry in load_manifest()['tools']:
+    try:
+        importlib.import_module(entry['module'])
+    except Exception:
+        failed += 1
+print("FAILED_IMPORTS", failed, file=sys.stderr)
+"""
+
+_SERVER = """
+import server
+"""
+
+_REPORT = """
+elapsed = time.perf_counter() - start
+tool_modules = sum(1 for name in sys.modules if name.startswith("src.tools.") and name.count(".") >= 3)
+print("RESULT", elapsed, len(sys.modules), tool_modules)
+"""
+
+MODES = {
+    'lazy': _LAZY,
+    'eager': _EAGER,
+    'server': _SERVER,
+}
+
+
+def run_once(mode: str) -> Dict[str, Any]:
+    """
+    Time one cold start in a fresh interpreter.
+
+    Args:
+        mode: lazy, eager or server
+
+    Returns:
+        Dict with seconds, modules loaded and tool modules imported
+        (or an error message)
+    """
+    code = _SETUP + MODES[mode] + _REPORT
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=300
+    )
+
+    for line in proc.stdout.splitlines():
+        if line.startswith("RESULT "):
+            _, seconds, modules, tool_modules = line.split()
+            result = {
+                'seconds': float(seconds),
+                'modules_loaded': int(modules),
+                'tool_modules_imported': int(tool_modules),
+            }
+            for err_line in proc.stderr.splitlines():
+                if err_line.startswith("FAILED_IMPORTS "):
+                    result['tool_import_failures'] = int(err_line.split()[1])
+            return result
+
+    return {'error': (proc.stderr.strip().splitlines() or ["no output"])[-1]}
+
+
+def benchmark(modes: List[str], runs: int = 5) -> Dict[str, Any]:
+    """
+    Run each mode several times and summarize.
+
+    Args:
+        modes: Modes to measure
+        runs: Cold starts per mode
+
+    Returns:
+        Dict of per-mode summaries
+    """
+    results = {}
+    for mode in modes:
+        samples = [run_once(mode) for _ in range(runs)]
+        timings = sorted(s['seconds'] for s in samples if 'seconds' in s)
+
+        if not timings:
+            results[mode] = {'error': samples[-1].get('error')}
+            continue
+
+        last = next(s for s in reversed(samples) if 'seconds' in s)
+        results[mode] = {
+            'runs': len(timings),
+            'median_s': round(statistics.median(timings), 4),
+            'min_s': round(timings[0], 4),
+            'max_s': round(timings[-1], 4),
+            'modules_loaded': last['modules_loaded'],
+            'tool_modules_imported': last['tool_modules_imported'],
+        }
+        if 'tool_import_failures' in last:
+            results[mode]['tool_import_failures'] = last['tool_import_failures']
+
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure MCP server cold-start time")
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts per mode (default 5)")
+    parser.add_argument("--modes", nargs="+", choices=sorted(MODES), default=['lazy', 'eager'])
+    parser.add_argument("--max-seconds", type=float, help="Fail if the lazy median exceeds this")
+    parser.add_argument("--output", type=Path, help="Append the JSON result to this file")
+    args = parser.parse_args()
+
+    report = {
+        'timestamp': datetime.now().isoformat(),
+        'python': sys.version.split()[0],
+        'results': benchmark(args.modes, args.runs),
+    }
+    print(json.dumps(report, indent=2))
+
+    if args.output:
+        with open(args.output, 'a') as f:
+            f.write(json.dumps(report) + "\n")
+
+    lazy = report['results'].get('lazy', {})
+    if args.max_seconds is not None and lazy.get('median_s', float('inf')) > args.max_seconds:
+        print(f"Lazy startup {lazy.get('median_s')}s exceeds budget {args.max_seconds}s", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,10 +15,13 @@ Key Components:
 - ConfidenceAssessment: Task completion evaluation
 """
 
+import asyncio
+import atexit
 import json
 import os
 import shutil
 import time
+import weakref
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple, Union
@@ -40,6 +43,63 @@ from src.security.credential_manager import CredentialManager
 
 logger = structlog.get_logger(__name__)
 
+# Write-behind: memory mutations are persisted at most once per flush interval
+AGENT_MEMORY_WRITE_BEHIND = os.getenv('AGENT_MEMORY_WRITE_BEHIND', 'true').lower() == 'true'
+AGENT_MEMORY_FLUSH_INTERVAL = float(os.getenv('AGENT_MEMORY_FLUSH_INTERVAL', '5'))
+
+# Memories with unsaved changes, flushed at interpreter exit
+_dirty_memories: "weakref.WeakSet[AgentMemory]" = weakref.WeakSet()
+
+
+def _flush_dirty_memories() -> None:
+    for memory in list(_dirty_memories):
+        try:
+            memory.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush memory for client {memory.client_id}: {e}")
+
+
+atexit.register(_flush_dirty_memories)
+
+# Seconds between checks of the Claude Desktop config for changes
+DATA_SOURCE_CONFIG_CHECK_INTERVAL = float(os.getenv('DATA_SOURCE_CONFIG_CHECK_INTERVAL', '5'))
+CLAUDE_DESKTOP_CONFIG_PATH = Path.home() / "Library/Application Support/Claude/claude_desktop_config.json"
+
+
+def _readonly(self, *args, **kwargs) -> Any:
+    raise TypeError("Discovered data sources are shared and read-only; copy before modifying")
+
+
+class _ReadOnlyDict(dict):
+    """dict shared between callers; mutation raises TypeError (still JSON serializable)"""
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    update = pop = popitem = setdefault = clear = _readonly
+
+    def __reduce__(self) -> Any:
+        # Rebuild from the items so copy, deepcopy and pickle bypass __setitem__
+        return type(self), (dict(self),)
+
+
+class _ReadOnlyList(list):
+    """list shared between callers; mutation raises TypeError (still JSON serializable)"""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __reduce__(self) -> Any:
+        return type(self), (list(self),)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists to their read-only counterparts"""
+    if isinstance(value, dict):
+        return _ReadOnlyDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return _ReadOnlyList(_freeze(item) for item in value)
+    return value
+
+
 class DataSourceRegistry:
     """Maps business functions to potential data sources with priority ordering"""
     
@@ -110,17 +170,31 @@ class DataSourceRegistry:
 
 
 class DataSourceDiscovery:
-    """Runtime discovery and prioritization of available data sources"""
+    """
+    Runtime discovery and prioritization of available data sources
+
+    Availability is computed once per business function into an immutable
+    table and the same read-only result is handed to every caller. The table
+    is rebuilt by invalidate() (e.g. after environment or config reload) and
+    when the Claude Desktop config file changes on disk, which is checked at
+    most every DATA_SOURCE_CONFIG_CHECK_INTERVAL seconds.
+    """
     
-    def __init__(self, config_path: Path) -> Any:
+    def __init__(self, config_path: Path,
+                 desktop_config_path: Path = CLAUDE_DESKTOP_CONFIG_PATH) -> Any:
         self.config_path = config_path
+        self.desktop_config_path = desktop_config_path
+        self._config_signature = self._desktop_config_signature()
+        self._last_config_check = time.monotonic()
         self.claude_desktop_config = self._load_claude_desktop_config()
+        self._availability: Dict[str, Dict[str, Any]] = {}
+        self._build_availability_table()
         
     def _load_claude_desktop_config(self) -> Dict[str, Any]:
         """Load Claude Desktop configuration to check available MCP servers"""
         try:
             safe_file_ops = SafeFileOperations()
-            config_path = Path.home() / "Library/Application Support/Claude/claude_desktop_config.json"
+            config_path = self.desktop_config_path
             if config_path.exists():
                 config = safe_file_ops.read_json(config_path)
                 if config:
@@ -130,11 +204,56 @@ class DataSourceDiscovery:
             logger.warning(f"Could not load Claude Desktop config: {e}")
             return {}
     
+    def _desktop_config_signature(self) -> Optional[Tuple[float, int]]:
+        """(mtime, size) of the Claude Desktop config, or None if missing"""
+        try:
+            stat = self.desktop_config_path.stat()
+            return stat.st_mtime, stat.st_size
+        except OSError:
+            return None
+    
+    def _build_availability_table(self) -> Any:
+        """Compute availability for every registered business function"""
+        self._availability = {
+            business_function: self._compute_available_sources(business_function)
+            for business_function in DataSourceRegistry.get_all_functions()
+        }
+    
+    def _check_config_changed(self) -> Any:
+        """Rebuild the table if the Claude Desktop config changed since the last check"""
+        now = time.monotonic()
+        if now - self._last_config_check < DATA_SOURCE_CONFIG_CHECK_INTERVAL:
+            return
+        self._last_config_check = now
+        
+        signature = self._desktop_config_signature()
+        if signature != self._config_signature:
+            logger.info("Claude Desktop config changed, refreshing data source availability")
+            self.invalidate()
+    
+    def invalidate(self) -> Any:
+        """Reload the Claude Desktop config and recompute availability (call after env/config reload)"""
+        self._config_signature = self._desktop_config_signature()
+        self.claude_desktop_config = self._load_claude_desktop_config()
+        self._build_availability_table()
+    
     def discover_available_sources(self, business_function: str) -> Dict[str, Any]:
         """
         Discover available data sources for a business function
         Priority: API Keys → MCP Servers → Web Search → Dummy Data
+
+        Returns a shared read-only mapping; copy it before modifying.
         """
+        self._check_config_changed()
+        
+        available = self._availability.get(business_function)
+        if available is None:
+            # Unregistered functions get the default sources, cached as well
+            available = self._availability[business_function] = self._compute_available_sources(business_function)
+        return available
+    
+    def _compute_available_sources(self, business_function: str) -> Dict[str, Any]:
+        """Build the availability result for a business function"""
         sources = DataSourceRegistry.get_sources_for_function(business_function)
         
         available = {
@@ -158,7 +277,7 @@ class DataSourceDiscovery:
             available['priority_source'] = 'web_search'
             available['confidence_factors']['primary'] = 'web_search_fallback'
             
-        return available
+        return _freeze(available)
     
     def _check_api_keys(self, api_keys: List[str]) -> Dict[str, bool]:
         """Check which API keys are configured in environment"""
@@ -176,14 +295,23 @@ class DataSourceDiscovery:
 
 
 class AgentMemory:
-    """Persistent memory management with bounded growth and learning capabilities"""
+    """
+    Persistent memory management with bounded growth and learning capabilities
+
+    In write-behind mode (default) save_memory only updates the in-memory copy
+    and marks it dirty; a background flush persists it at most once per flush
+    interval, and flush()/shutdown() persist pending changes immediately.
+    Without a running event loop saves are written through.
+    """
     
     MAX_FILE_SIZE = 500 * 1024  # 500KB limit
     MAX_LEARNING_CONTEXTS = 50
     MAX_PERFORMANCE_RECORDS = 100
     MAX_WORKFLOW_PATTERNS = 20
     
-    def __init__(self, client_id: str, config_path: Path) -> Any:
+    def __init__(self, client_id: str, config_path: Path,
+                 write_behind: Optional[bool] = None,
+                 flush_interval: Optional[float] = None) -> Any:
         self.client_id = client_id
         self.config_path = config_path
         self.memory_dir = config_path / "client_configs" / client_id
@@ -191,6 +319,13 @@ class AgentMemory:
         self.client_config_file = self.memory_dir / "config.json"
         self._memory_cache = None
         self._cache_timestamp = 0
+        self.write_behind = AGENT_MEMORY_WRITE_BEHIND if write_behind is None else write_behind
+        self.flush_interval = AGENT_MEMORY_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self._dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+        # Background write in progress (outlives a cancelled flush task)
+        self._write_future: Optional[asyncio.Future] = None
+        self.writes = 0
         
         # Ensure memory directory exists
         self.memory_dir.mkdir(parents=True, exist_ok=True)
@@ -281,6 +416,10 @@ class AgentMemory:
         """Load memory with caching"""
         current_time = time.time()
         
+        # Unsaved changes make the cached copy newer than the file
+        if self._dirty:
+            return self._memory_cache
+        
         # Use cache if recent and not forced reload
         if (not force_reload and 
             self._memory_cache is not None and 
@@ -306,32 +445,126 @@ class AgentMemory:
             return self.load_memory(force_reload=True)
     
     def save_memory(self, memory: Dict[str, Any]) -> Any:
-        """Atomically save memory with backup"""
+        """Save memory, deferred to the background flush in write-behind mode"""
         # Update timestamp
         memory["last_updated"] = datetime.now().isoformat()
-        
-        # Prune if needed
-        memory = self._prune_memory_if_needed(memory)
-        
-        # Use safe file operations for atomic write
-        safe_file_ops = SafeFileOperations()
 
+        if not self.write_behind:
+            self._write(self._serialize(memory))
+            return
+
+        self._memory_cache = memory
+        self._cache_timestamp = time.time()
+        self._dirty = True
+        _dirty_memories.add(self)
+
+        if self._flush_task is not None and not self._flush_task.done():
+            return
         try:
-            # Safe atomic write handles backups internally
-            success = safe_file_ops.write_json(self.memory_file, memory)
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to flush from, write through
+            self.flush()
+            return
+        self._flush_task = loop.create_task(self._flush_after_interval())
+
+    def _serialize(self, memory: Dict[str, Any]) -> str:
+        """Prune if needed and serialize; the result becomes the cached copy"""
+        memory = self._prune_memory_if_needed(memory)
+        self._memory_cache = memory
+        self._cache_timestamp = time.time()
+        return json.dumps(memory, indent=2)
 
-            if not success:
+    def _write(self, content: str) -> None:
+        """Atomically write serialized memory (temp file + rename)"""
+        try:
+            if not SafeFileOperations.write_file(self.memory_file, content):
                 raise Exception("Failed to write memory file")
 
-            # Update cache
-            self._memory_cache = memory
-            self._cache_timestamp = time.time()
-
+            self.writes += 1
             logger.debug(f"Memory saved for client {self.client_id}")
 
         except Exception as e:
             logger.error(f"Failed to save memory: {e}")
             raise
+
+    def _take_pending(self) -> Optional[str]:
+        """Serialize pending changes and clear the dirty flag"""
+        if not self._dirty:
+            return None
+        self._dirty = False
+        _dirty_memories.discard(self)
+        return self._serialize(self._memory_cache)
+
+    async def _flush_after_interval(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        try:
+            await self._flush_async()
+        except Exception as e:
+            # Changes stay dirty and are retried below
+            logger.error(f"Background memory flush failed for client {self.client_id}, retrying: {e}")
+        # Saves made while the write ran saw this task pending and did not
+        # schedule their own flush
+        if self._dirty:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_after_interval())
+
+    async def _flush_async(self) -> bool:
+        # Never run two writes of the same file at once
+        if self._write_future is not None and not self._write_future.done():
+            await asyncio.wait([self._write_future])
+
+        # Serialize on the loop so mutations cannot interleave, write off it
+        content = self._take_pending()
+        if content is None:
+            return False
+        self._write_future = asyncio.ensure_future(asyncio.to_thread(self._write, content))
+        self._write_future.add_done_callback(self._write_done)
+        # Shielded: cancelling the flush task must not abandon a running write
+        await asyncio.shield(self._write_future)
+        return True
+
+    def _write_done(self, future: asyncio.Future) -> None:
+        """Keep changes dirty when a background write fails"""
+        if future.cancelled() or future.exception() is not None:
+            self._dirty = True
+            _dirty_memories.add(self)
+
+    def flush(self) -> bool:
+        """
+        Persist pending changes now
+
+        Returns:
+            True if anything was written
+        """
+        content = self._take_pending()
+        if content is None:
+            return False
+        try:
+            self._write(content)
+        except Exception:
+            self._dirty = True
+            _dirty_memories.add(self)
+            raise
+        return True
+
+    async def shutdown(self) -> bool:
+        """
+        Cancel the pending background flush and persist pending changes
+
+        A background write already in progress is waited for, not repeated
+        alongside.
+
+        Returns:
+            True if anything was written
+        """
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        self._flush_task = None
+        return await self._flush_async()
     
     def get_relevant_memory(self, process_num: int, task_type: str) -> Dict[str, Any]:
         """Get memory relevant to current task"""
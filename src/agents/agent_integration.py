@@ -13,7 +13,9 @@ and the existing MCP server tools. It includes:
 import asyncio
 import functools
 import json
+import os
 import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Callable, Tuple
 from pathlib import Path
@@ -28,9 +30,168 @@ from .adaptive_agent import (
     UnifiedDataClient,
     ConfidenceAssessment
 )
+from src.monitoring import (
+    record_cache_hit,
+    record_cache_miss,
+    update_cache_size,
+    record_cache_eviction
+)
 
 logger = structlog.get_logger(__name__)
 
+# Bounds for the per-client AgentMemory cache
+AGENT_MEMORY_CACHE_SIZE = int(os.getenv('AGENT_MEMORY_CACHE_SIZE', '500'))
+AGENT_MEMORY_IDLE_TTL = float(os.getenv('AGENT_MEMORY_IDLE_TTL', '1800'))  # seconds
+
+# Process sequences kept per client for workflow pattern analysis
+MAX_TRACKED_PROCESSES = 5
+
+
+class _CachedClient:
+    """Cached AgentMemory with the client's recent process sequence"""
+
+    __slots__ = ('memory', 'processes', 'last_access')
+
+    def __init__(self, memory: AgentMemory, now: float) -> None:
+        self.memory = memory
+        self.processes: List[int] = []
+        self.last_access = now
+
+
+class AgentMemoryCache:
+    """
+    LRU cache of per-client AgentMemory instances bounded by size and idle time
+
+    Entries are kept in access order, so both the least recently used and the
+    idle entries are found at the front. Evicted memories have their pending
+    write-behind changes flushed; a client requested again while its flush is
+    in progress gets the same instance back.
+    """
+
+    CACHE_TYPE = 'agent_memory'
+
+    def __init__(self, config_path: Path,
+                 max_size: int = AGENT_MEMORY_CACHE_SIZE,
+                 idle_ttl: float = AGENT_MEMORY_IDLE_TTL) -> None:
+        self.config_path = config_path
+        self.max_size = max(1, max_size)
+        self.idle_ttl = idle_ttl
+        self._entries: "OrderedDict[str, _CachedClient]" = OrderedDict()
+        self._evicting: Dict[str, AgentMemory] = {}
+        self._flush_tasks: set = set()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, client_id: str) -> bool:
+        return client_id in self._entries
+
+    def _entry(self, client_id: str, record_lookup: bool = False) -> _CachedClient:
+        now = time.monotonic()
+        self.evict_idle(now)
+
+        entry = self._entries.get(client_id)
+        if entry is not None:
+            self._entries.move_to_end(client_id)
+            entry.last_access = now
+            if record_lookup:
+                record_cache_hit(self.CACHE_TYPE)
+            return entry
+
+        if record_lookup:
+            record_cache_miss(self.CACHE_TYPE)
+        memory = self._evicting.pop(client_id, None) or AgentMemory(client_id, self.config_path)
+        entry = self._entries[client_id] = _CachedClient(memory, now)
+        while len(self._entries) > self.max_size:
+            self._evict(reason='size')
+        update_cache_size(self.CACHE_TYPE, len(self._entries))
+        return entry
+
+    def get(self, client_id: str) -> AgentMemory:
+        """Get or create the AgentMemory for a client (counted as a cache hit or miss)"""
+        return self._entry(client_id, record_lookup=True).memory
+
+    def process_sequence(self, client_id: str) -> List[int]:
+        """Recent process numbers for a client (mutable, bounded by the caller; not a cache lookup)"""
+        return self._entry(client_id).processes
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """
+        Evict entries not accessed within the idle TTL
+
+        Returns:
+            Number of entries evicted
+        """
+        now = time.monotonic() if now is None else now
+        evicted = 0
+        while self._entries:
+            oldest = next(iter(self._entries.values()))
+            if now - oldest.last_access < self.idle_ttl:
+                break
+            self._evict(reason='idle')
+            evicted += 1
+        if evicted:
+            update_cache_size(self.CACHE_TYPE, len(self._entries))
+        return evicted
+
+    def _evict(self, reason: str) -> None:
+        client_id, entry = self._entries.popitem(last=False)
+        self.evictions += 1
+        record_cache_eviction(self.CACHE_TYPE, reason)
+        self._flush_evicted(client_id, entry.memory)
+
+    def _flush_evicted(self, client_id: str, memory: AgentMemory) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            try:
+                memory.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush evicted memory for client {client_id}: {e}")
+            return
+
+        self._evicting[client_id] = memory
+        task = loop.create_task(memory.shutdown())
+        self._flush_tasks.add(task)
+
+        def done(finished: asyncio.Task) -> None:
+            self._flush_tasks.discard(finished)
+            if self._evicting.get(client_id) is memory:
+                del self._evicting[client_id]
+            if not finished.cancelled() and finished.exception():
+                logger.error(f"Failed to flush evicted memory for client {client_id}: {finished.exception()}")
+
+        task.add_done_callback(done)
+
+    async def shutdown(self) -> int:
+        """
+        Flush all cached memories and wait for eviction flushes
+
+        Returns:
+            Number of memories written
+        """
+        written = 0
+        for client_id, entry in list(self._entries.items()):
+            try:
+                if await entry.memory.shutdown():
+                    written += 1
+            except Exception as e:
+                logger.error(f"Failed to flush memory for client {client_id}: {e}")
+        if self._flush_tasks:
+            await asyncio.gather(*list(self._flush_tasks), return_exceptions=True)
+        return written
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache size and eviction statistics"""
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'idle_ttl': self.idle_ttl,
+            'evictions': self.evictions,
+            'pending_flushes': len(self._flush_tasks),
+        }
+
 
 class AdaptiveSalesAgent:
     """Main agent orchestrator that coordinates all adaptive capabilities"""
@@ -38,14 +199,25 @@ class AdaptiveSalesAgent:
     def __init__(self, config_path: Path) -> Any:
         self.config_path = config_path
         self.discovery = DataSourceDiscovery(config_path)
-        self._client_memories = {}  # Cache of AgentMemory instances per client
-        self._last_processes = {}   # Track process sequences per client
+        # Bounded cache of AgentMemory instances and process sequences per client
+        self._client_memories = AgentMemoryCache(config_path)
         
     def get_memory(self, client_id: str) -> AgentMemory:
         """Get or create memory instance for client"""
-        if client_id not in self._client_memories:
-            self._client_memories[client_id] = AgentMemory(client_id, self.config_path)
-        return self._client_memories[client_id]
+        return self._client_memories.get(client_id)
+    
+    async def shutdown(self) -> int:
+        """
+        Persist pending write-behind memory changes for all clients
+
+        Returns:
+            Number of memories written
+        """
+        return await self._client_memories.shutdown()
+    
+    def refresh_data_sources(self) -> None:
+        """Recompute data source availability after an environment or config reload"""
+        self.discovery.invalidate()
     
     def get_unified_client(self, client_id: str) -> UnifiedDataClient:
         """Get unified data client for client"""
@@ -366,14 +538,11 @@ class AdaptiveSalesAgent:
     
     def _track_process_sequence(self, client_id: str, process_num: int) -> Any:
         """Track process sequences for workflow pattern analysis"""
-        if client_id not in self._last_processes:
-            self._last_processes[client_id] = []
-        
-        sequence = self._last_processes[client_id]
+        sequence = self._client_memories.process_sequence(client_id)
         sequence.append(process_num)
         
         # Keep last 5 processes
-        if len(sequence) > 5:
+        if len(sequence) > MAX_TRACKED_PROCESSES:
             sequence.pop(0)
         
         # Record patterns of 2+ processes
@@ -112,12 +112,17 @@ class EnhancedSalesAgent:
         
         results = []
         
+        # Cache key must not see parameters added during execution (e.g. rate_limit),
+        # and results are per client, so entries are never shared across clients
+        cache_parameters = {**parameters, 'client_id': client_id}
+        cache_tags = ['process_execution']
+
         for process_num in processes:
             # Check cache first
-            should_use_cache, cache_entry, cache_reason = self.cache_manager.should_use_cache(
+            should_use_cache, cache_entry, cache_reason = await self.cache_manager.should_use_cache_async(
                 f"process_{process_num}",
-                parameters,
-                ['nlp_triggered'],
+                cache_parameters,
+                cache_tags,
                 routing_result['intent']['original_request']
             )
             
@@ -145,12 +150,13 @@ class EnhancedSalesAgent:
                 
                 # Cache the result if it's worth caching
                 if result.get('adaptive_feedback', {}).get('confidence_score', 0) > 0.6:
-                    self.cache_manager.store_data(
+                    await self.cache_manager.store_data_async(
                         f"process_{process_num}",
-                        parameters,
-                        ['process_execution'],
+                        cache_parameters,
+                        cache_tags,
                         result,
-                        result.get('adaptive_feedback', {}).get('confidence_score', 0.8)
+                        result.get('adaptive_feedback', {}).get('confidence_score', 0.8),
+                        client_id=client_id
                     )
             
             # Add process result to context
@@ -367,9 +373,13 @@ class EnhancedSalesAgent:
         return self.context_manager.create_context_summary(session.session_id)
     
     def invalidate_cache(self, client_id: str, task_type: Optional[str] = None) -> Any:
-        """Invalidate cache for client"""
-        self.cache_manager.invalidate_cache(task_type)
-        logger.info(f"Cache invalidated for client {client_id}")
+        """Invalidate the client's cached results, optionally for one task type"""
+        removed = self.cache_manager.invalidate_cache(task_type, client_id=client_id)
+        logger.info(
+            f"Cache invalidated for client {client_id}: {removed} entries"
+            f" ({task_type or 'all task types'})"
+        )
+        return removed
     
     def cleanup(self) -> Any:
         """Clean up expired sessions and cache"""
@@ -17,6 +17,7 @@ Key Components:
 """
 
 import json
+import os
 import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple, Union, Set
@@ -31,6 +32,73 @@ from collections import defaultdict, deque
 logger = structlog.get_logger(__name__)
 
 
+def _hashable(value: Any) -> bool:
+    """True if value can be used as an index key"""
+    try:
+        hash(value)
+        return True
+    except TypeError:
+        return False
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    """Write JSON to a temp file and rename it over path"""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class AppendOnlyLog:
+    """
+    JSON Lines record log
+
+    Records are appended one line at a time (O(1) per write); compact()
+    atomically rewrites the file with the records still needed. A torn last
+    line left by a crash is skipped on read.
+    """
+
+    def __init__(self, path: Path) -> Any:
+        self.path = path
+        self.line_count = 0
+
+    def read(self) -> List[Dict[str, Any]]:
+        """Read all intact records"""
+        records = []
+        if not self.path.exists():
+            self.line_count = 0
+            return records
+        with open(self.path, 'r') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(event=f"Skipping unreadable record in {self.path.name}")
+        self.line_count = len(records)
+        return records
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append one record"""
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(record, separators=(',', ':')) + "\n")
+        self.line_count += 1
+
+    def compact(self, records: List[Dict[str, Any]]) -> None:
+        """Atomically replace the log with the given records"""
+        tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+        with open(tmp_path, 'w') as f:
+            for record in records:
+                f.write(json.dumps(record, separators=(',', ':')) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self.line_count = len(records)
+
+
 class OutcomeType(Enum):
     """Types of sales outcomes for learning"""
     WIN = "win"
@@ -108,6 +176,84 @@ class StrategyRecommendation:
     measurement_criteria: List[str]
 
 
+def _outcome_to_dict(outcome: SalesOutcome) -> Dict[str, Any]:
+    """Serialize an outcome for storage"""
+    return {
+        "outcome_id": outcome.outcome_id,
+        "outcome_type": outcome.outcome_type.value,
+        "deal_value": outcome.deal_value,
+        "sales_cycle_days": outcome.sales_cycle_days,
+        "rep_id": outcome.rep_id,
+        "client_id": outcome.client_id,
+        "strategy_used": outcome.strategy_used,
+        "context_factors": outcome.context_factors,
+        "outcome_date": outcome.outcome_date.isoformat(),
+        "feedback_score": outcome.feedback_score,
+        "lessons_learned": outcome.lessons_learned,
+        "contributing_factors": outcome.contributing_factors
+    }
+
+
+def _outcome_from_dict(outcome_data: Dict[str, Any]) -> SalesOutcome:
+    """Deserialize a stored outcome"""
+    return SalesOutcome(
+        outcome_id=outcome_data["outcome_id"],
+        outcome_type=OutcomeType(outcome_data["outcome_type"]),
+        deal_value=outcome_data["deal_value"],
+        sales_cycle_days=outcome_data["sales_cycle_days"],
+        rep_id=outcome_data["rep_id"],
+        client_id=outcome_data["client_id"],
+        strategy_used=outcome_data["strategy_used"],
+        context_factors=outcome_data["context_factors"],
+        outcome_date=datetime.fromisoformat(outcome_data["outcome_date"]),
+        feedback_score=outcome_data.get("feedback_score"),
+        lessons_learned=outcome_data.get("lessons_learned", []),
+        contributing_factors=outcome_data.get("contributing_factors", [])
+    )
+
+
+def _pattern_to_dict(pattern: LearningPattern) -> Dict[str, Any]:
+    """Serialize a learned pattern for storage"""
+    return {
+        "pattern_id": pattern.pattern_id,
+        "pattern_type": pattern.pattern_type,
+        "conditions": pattern.conditions,
+        "outcomes": pattern.outcomes,
+        "confidence_score": pattern.confidence_score,
+        "sample_size": pattern.sample_size,
+        "success_rate": pattern.success_rate,
+        "average_deal_value": pattern.average_deal_value,
+        "average_cycle_time": pattern.average_cycle_time,
+        "first_observed": pattern.first_observed.isoformat(),
+        "last_updated": pattern.last_updated.isoformat(),
+        "client_ids": list(pattern.client_ids)
+    }
+
+
+def _pattern_from_dict(pattern_data: Dict[str, Any]) -> LearningPattern:
+    """Deserialize a stored learned pattern"""
+    return LearningPattern(
+        pattern_id=pattern_data["pattern_id"],
+        pattern_type=pattern_data["pattern_type"],
+        conditions=pattern_data["conditions"],
+        outcomes=pattern_data["outcomes"],
+        confidence_score=pattern_data["confidence_score"],
+        sample_size=pattern_data["sample_size"],
+        success_rate=pattern_data["success_rate"],
+        average_deal_value=pattern_data["average_deal_value"],
+        average_cycle_time=pattern_data["average_cycle_time"],
+        first_observed=datetime.fromisoformat(pattern_data["first_observed"]),
+        last_updated=datetime.fromisoformat(pattern_data["last_updated"]),
+        client_ids=set(pattern_data["client_ids"])
+    )
+
+
+# Outcome attributes usable as pattern conditions, indexed for lookup
+OUTCOME_INDEX_KEYS = (
+    "outcome_type", "rep_id", "territory", "deal_size_category", "cycle_category", "strategy_type"
+)
+
+
 class SalesLearningEngine:
     """
     Core learning engine for sales patterns and outcomes
@@ -117,6 +263,10 @@ class SalesLearningEngine:
     - Failure modes and risk factors
     - Optimal timing and approach patterns
     - Rep and client-specific preferences
+
+    Outcomes are indexed by each OUTCOME_INDEX_KEYS value and patterns by
+    their condition values, so similar-outcome and context lookups are set
+    intersections instead of scans of the full history.
     """
     
     def __init__(self, client_id: str, storage_dir: Optional[Path] = None) -> Any:
@@ -129,138 +279,184 @@ class SalesLearningEngine:
         self.learned_patterns: Dict[str, LearningPattern] = {}
         self.pattern_performance: Dict[str, List[float]] = defaultdict(list)
         
+        # Inverted indexes: (key, value) -> outcome positions / pattern ids
+        self._outcome_index: Dict[Tuple[str, Any], Set[int]] = defaultdict(set)
+        self._pattern_index: Dict[Tuple[str, Any], Set[str]] = defaultdict(set)
+        self._patterns_by_key: Dict[str, Set[str]] = defaultdict(set)
+        
         # Learning parameters
         self.min_pattern_samples = 5  # Minimum samples to establish a pattern
         self.pattern_confidence_threshold = 0.7
         self.max_outcomes_history = 2000  # Maximum outcomes to keep
         self.learning_rate = 0.1  # How quickly to adapt to new information
+        self.snapshot_interval = 200  # Outcomes between pattern snapshots
+        
+        # Storage: append-only outcome log plus periodic pattern snapshots
+        self._outcome_log = AppendOnlyLog(self.storage_dir / "outcomes.jsonl")
+        self._snapshot_file = self.storage_dir / "patterns_snapshot.json"
+        self._seq = 0  # Sequence number of the last logged outcome
+        self._snapshot_seq = 0  # Last outcome included in the snapshot
         
         # Load existing data
         self._load_learning_data()
     
     def _load_learning_data(self) -> Any:
-        """Load learning data from storage"""
+        """
+        Load learning data from storage
+
+        Patterns come from the latest snapshot; outcomes logged after the
+        snapshot are replayed to bring the patterns up to date.
+        """
         try:
-            # Load outcomes history
-            outcomes_file = self.storage_dir / "outcomes_history.json"
-            if outcomes_file.exists():
-                with open(outcomes_file, 'r') as f:
-                    outcomes_data = json.load(f)
-                
-                for outcome_data in outcomes_data:
-                    outcome = SalesOutcome(
-                        outcome_id=outcome_data["outcome_id"],
-                        outcome_type=OutcomeType(outcome_data["outcome_type"]),
-                        deal_value=outcome_data["deal_value"],
-                        sales_cycle_days=outcome_data["sales_cycle_days"],
-                        rep_id=outcome_data["rep_id"],
-                        client_id=outcome_data["client_id"],
-                        strategy_used=outcome_data["strategy_used"],
-                        context_factors=outcome_data["context_factors"],
-                        outcome_date=datetime.fromisoformat(outcome_data["outcome_date"]),
-                        feedback_score=outcome_data.get("feedback_score"),
-                        lessons_learned=outcome_data.get("lessons_learned", []),
-                        contributing_factors=outcome_data.get("contributing_factors", [])
-                    )
+            if not self._outcome_log.path.exists() and (self.storage_dir / "outcomes_history.json").exists():
+                self._migrate_legacy_storage()
+                return
+            
+            snapshot = {}
+            if self._snapshot_file.exists():
+                with open(self._snapshot_file, 'r') as f:
+                    snapshot = json.load(f)
+            for pattern_id, pattern_data in snapshot.get("patterns", {}).items():
+                self.learned_patterns[pattern_id] = _pattern_from_dict(pattern_data)
+            self._snapshot_seq = snapshot.get("last_seq", 0)
+            
+            tail = []
+            for record in self._outcome_log.read():
+                outcome = _outcome_from_dict(record)
+                self._seq = max(self._seq, record.get("seq", 0))
+                if record.get("seq", 0) > self._snapshot_seq:
+                    tail.append(outcome)
+                else:
                     self.outcomes_history.append(outcome)
             
-            # Load learned patterns
-            patterns_file = self.storage_dir / "learned_patterns.json"
-            if patterns_file.exists():
-                with open(patterns_file, 'r') as f:
-                    patterns_data = json.load(f)
-                
-                for pattern_id, pattern_data in patterns_data.items():
-                    pattern = LearningPattern(
-                        pattern_id=pattern_data["pattern_id"],
-                        pattern_type=pattern_data["pattern_type"],
-                        conditions=pattern_data["conditions"],
-                        outcomes=pattern_data["outcomes"],
-                        confidence_score=pattern_data["confidence_score"],
-                        sample_size=pattern_data["sample_size"],
-                        success_rate=pattern_data["success_rate"],
-                        average_deal_value=pattern_data["average_deal_value"],
-                        average_cycle_time=pattern_data["average_cycle_time"],
-                        first_observed=datetime.fromisoformat(pattern_data["first_observed"]),
-                        last_updated=datetime.fromisoformat(pattern_data["last_updated"]),
-                        client_ids=set(pattern_data["client_ids"])
-                    )
-                    self.learned_patterns[pattern_id] = pattern
+            self._rebuild_indexes()
+            for outcome in tail:
+                self._apply_outcome(outcome)
             
             logger.info(event=f"Loaded learning data for client {self.client_id}",
                        outcomes=len(self.outcomes_history),
-                       patterns=len(self.learned_patterns))
+                       patterns=len(self.learned_patterns),
+                       replayed=len(tail))
                        
         except Exception as e:
             logger.warning(event=f"Could not load learning data: {e}")
     
-    def _save_learning_data(self) -> Any:
-        """Save learning data to storage"""
+    def _migrate_legacy_storage(self) -> Any:
+        """Convert outcomes_history.json / learned_patterns.json into log + snapshot"""
+        outcomes_file = self.storage_dir / "outcomes_history.json"
+        patterns_file = self.storage_dir / "learned_patterns.json"
+        
+        with open(outcomes_file, 'r') as f:
+            for outcome_data in json.load(f):
+                self.outcomes_history.append(_outcome_from_dict(outcome_data))
+        if patterns_file.exists():
+            with open(patterns_file, 'r') as f:
+                for pattern_id, pattern_data in json.load(f).items():
+                    self.learned_patterns[pattern_id] = _pattern_from_dict(pattern_data)
+        
+        self._rebuild_indexes()
+        self._seq = len(self.outcomes_history)
+        self.compact()
+        
+        for legacy_file in (outcomes_file, patterns_file):
+            if legacy_file.exists():
+                legacy_file.rename(legacy_file.with_name(legacy_file.name + ".migrated"))
+        
+        logger.info(event=f"Migrated learning data for client {self.client_id} to append-only log",
+                   outcomes=len(self.outcomes_history),
+                   patterns=len(self.learned_patterns))
+    
+    def _save_learning_data(self, outcome: SalesOutcome) -> Any:
+        """Append an outcome to the log; snapshot and compact periodically"""
         try:
-            # Save outcomes history (keep recent)
-            recent_outcomes = self.outcomes_history[-self.max_outcomes_history:]
-            outcomes_data = []
+            self._seq += 1
+            self._outcome_log.append({"seq": self._seq, **_outcome_to_dict(outcome)})
             
-            for outcome in recent_outcomes:
-                outcome_data = {
-                    "outcome_id": outcome.outcome_id,
-                    "outcome_type": outcome.outcome_type.value,
-                    "deal_value": outcome.deal_value,
-                    "sales_cycle_days": outcome.sales_cycle_days,
-                    "rep_id": outcome.rep_id,
-                    "client_id": outcome.client_id,
-                    "strategy_used": outcome.strategy_used,
-                    "context_factors": outcome.context_factors,
-                    "outcome_date": outcome.outcome_date.isoformat(),
-                    "feedback_score": outcome.feedback_score,
-                    "lessons_learned": outcome.lessons_learned,
-                    "contributing_factors": outcome.contributing_factors
-                }
-                outcomes_data.append(outcome_data)
-            
-            outcomes_file = self.storage_dir / "outcomes_history.json"
-            with open(outcomes_file, 'w') as f:
-                json.dump(outcomes_data, f, indent=2)
-            
-            # Save learned patterns
-            patterns_data = {}
-            for pattern_id, pattern in self.learned_patterns.items():
-                patterns_data[pattern_id] = {
-                    "pattern_id": pattern.pattern_id,
-                    "pattern_type": pattern.pattern_type,
-                    "conditions": pattern.conditions,
-                    "outcomes": pattern.outcomes,
-                    "confidence_score": pattern.confidence_score,
-                    "sample_size": pattern.sample_size,
-                    "success_rate": pattern.success_rate,
-                    "average_deal_value": pattern.average_deal_value,
-                    "average_cycle_time": pattern.average_cycle_time,
-                    "first_observed": pattern.first_observed.isoformat(),
-                    "last_updated": pattern.last_updated.isoformat(),
-                    "client_ids": list(pattern.client_ids)
-                }
-            
-            patterns_file = self.storage_dir / "learned_patterns.json"
-            with open(patterns_file, 'w') as f:
-                json.dump(patterns_data, f, indent=2)
+            if self._seq - self._snapshot_seq >= self.snapshot_interval:
+                self.compact()
                 
         except Exception as e:
             logger.error(event=f"Could not save learning data: {e}")
     
+    def compact(self) -> Any:
+        """
+        Write a pattern snapshot and trim the outcome log
+
+        The snapshot records the last outcome sequence number it includes,
+        so a crash between the two writes only leaves extra log records
+        that are skipped on load.
+        """
+        patterns_data = {
+            pattern_id: _pattern_to_dict(pattern)
+            for pattern_id, pattern in self.learned_patterns.items()
+        }
+        _write_json_atomic(self._snapshot_file, {"last_seq": self._seq, "patterns": patterns_data})
+        self._snapshot_seq = self._seq
+        
+        if len(self.outcomes_history) > self.max_outcomes_history:
+            self.outcomes_history = self.outcomes_history[-self.max_outcomes_history:]
+            self._rebuild_indexes()
+        
+        if self._outcome_log.line_count > len(self.outcomes_history) or not self._outcome_log.path.exists():
+            first_seq = self._seq - len(self.outcomes_history) + 1
+            self._outcome_log.compact([
+                {"seq": first_seq + i, **_outcome_to_dict(outcome)}
+                for i, outcome in enumerate(self.outcomes_history)
+            ])
+    
+    def _outcome_keys(self, outcome: SalesOutcome) -> Dict[str, Any]:
+        """Indexed attribute values of an outcome (as used by pattern conditions)"""
+        keys = {
+            "outcome_type": outcome.outcome_type.value,
+            "rep_id": outcome.rep_id,
+            "territory": outcome.context_factors.get("territory"),
+            "deal_size_category": self._categorize_deal_size(outcome.deal_value),
+            "cycle_category": self._categorize_cycle_length(outcome.sales_cycle_days),
+            "strategy_type": outcome.strategy_used.get("strategy_type"),
+        }
+        return {key: value for key, value in keys.items() if _hashable(value)}
+    
+    def _index_outcome(self, position: int, outcome: SalesOutcome) -> Any:
+        """Add an outcome at a history position to the outcome index"""
+        for key, value in self._outcome_keys(outcome).items():
+            self._outcome_index[(key, value)].add(position)
+    
+    def _index_pattern(self, pattern: LearningPattern) -> Any:
+        """Add a pattern to the pattern index by its condition values"""
+        for key, value in pattern.conditions.items():
+            self._patterns_by_key[key].add(pattern.pattern_id)
+            if _hashable(value):
+                self._pattern_index[(key, value)].add(pattern.pattern_id)
+    
+    def _rebuild_indexes(self) -> Any:
+        """Rebuild outcome and pattern indexes from the current data"""
+        self._outcome_index.clear()
+        self._pattern_index.clear()
+        self._patterns_by_key.clear()
+        for position, outcome in enumerate(self.outcomes_history):
+            self._index_outcome(position, outcome)
+        for pattern in self.learned_patterns.values():
+            self._index_pattern(pattern)
+    
     async def record_outcome(self, outcome: SalesOutcome) -> str:
         """Record a sales outcome for learning"""
-        self.outcomes_history.append(outcome)
-        
-        # Trigger pattern learning
-        await self._update_patterns_with_outcome(outcome)
+        self._apply_outcome(outcome)
         
         # Save data
-        self._save_learning_data()
+        self._save_learning_data(outcome)
         
         logger.info(event=f"Recorded sales outcome {outcome.outcome_id}")
         return outcome.outcome_id
     
-    async def _update_patterns_with_outcome(self, outcome: SalesOutcome) -> Any:
+    def _apply_outcome(self, outcome: SalesOutcome) -> Any:
+        """Add an outcome to the history and update patterns (also used for replay)"""
+        self.outcomes_history.append(outcome)
+        self._index_outcome(len(self.outcomes_history) - 1, outcome)
+        
+        # Trigger pattern learning
+        self._update_patterns_with_outcome(outcome)
+    
+    def _update_patterns_with_outcome(self, outcome: SalesOutcome) -> Any:
         """Update learned patterns with new outcome"""
         # Extract pattern candidates from outcome
         pattern_candidates = self._extract_pattern_candidates(outcome)
@@ -270,12 +466,12 @@ class SalesLearningEngine:
             
             if pattern_id in self.learned_patterns:
                 # Update existing pattern
-                await self._update_existing_pattern(pattern_id, outcome, candidate)
+                self._update_existing_pattern(pattern_id, outcome, candidate)
             else:
                 # Check if we should create a new pattern
                 similar_outcomes = self._find_similar_outcomes(candidate["conditions"])
                 if len(similar_outcomes) >= self.min_pattern_samples:
-                    await self._create_new_pattern(pattern_id, similar_outcomes, candidate)
+                    self._create_new_pattern(pattern_id, similar_outcomes, candidate)
     
     def _extract_pattern_candidates(self, outcome: SalesOutcome) -> List[Dict[str, Any]]:
         """Extract potential patterns from an outcome"""
@@ -361,13 +557,29 @@ class SalesLearningEngine:
             return "extended"
     
     def _find_similar_outcomes(self, conditions: Dict[str, Any]) -> List[SalesOutcome]:
-        """Find outcomes matching given conditions"""
-        similar = []
-        
-        for outcome in self.outcomes_history:
-            if self._matches_conditions(outcome, conditions):
-                similar.append(outcome)
+        """Find outcomes matching given conditions (intersection of index postings)"""
+        postings = []
+        fallback = {}
+        for key, value in conditions.items():
+            if key not in OUTCOME_INDEX_KEYS:
+                continue  # Unknown keys do not constrain matches
+            if not _hashable(value):
+                fallback[key] = value
+                continue
+            posting = self._outcome_index.get((key, value))
+            if not posting:
+                return []
+            postings.append(posting)
+        
+        if postings:
+            postings.sort(key=len)
+            positions = sorted(postings[0].intersection(*postings[1:]))
+            similar = [self.outcomes_history[i] for i in positions]
+        else:
+            similar = list(self.outcomes_history)
         
+        if fallback:
+            similar = [o for o in similar if self._matches_conditions(o, fallback)]
         return similar
     
     def _matches_conditions(self, outcome: SalesOutcome, conditions: Dict[str, Any]) -> bool:
@@ -391,7 +603,7 @@ class SalesLearningEngine:
         
         return True
     
-    async def _update_existing_pattern(self, pattern_id: str, outcome: SalesOutcome, candidate: Dict[str, Any]) -> Any:
+    def _update_existing_pattern(self, pattern_id: str, outcome: SalesOutcome, candidate: Dict[str, Any]) -> Any:
         """Update an existing learned pattern"""
         pattern = self.learned_patterns[pattern_id]
         
@@ -423,7 +635,7 @@ class SalesLearningEngine:
             pattern.outcomes[outcome_key] = 0
         pattern.outcomes[outcome_key] += 1
     
-    async def _create_new_pattern(self, pattern_id: str, similar_outcomes: List[SalesOutcome], candidate: Dict[str, Any]) -> Any:
+    def _create_new_pattern(self, pattern_id: str, similar_outcomes: List[SalesOutcome], candidate: Dict[str, Any]) -> Any:
         """Create a new learned pattern"""
         # Calculate statistics from similar outcomes
         success_outcomes = [o for o in similar_outcomes if o.outcome_type in [OutcomeType.WIN, OutcomeType.PIPELINE]]
@@ -462,6 +674,7 @@ class SalesLearningEngine:
         )
         
         self.learned_patterns[pattern_id] = pattern
+        self._index_pattern(pattern)
         
         logger.info(event=f"Created new pattern {pattern_id}",
                    sample_size=len(similar_outcomes),
@@ -470,31 +683,33 @@ class SalesLearningEngine:
     def get_patterns_for_context(self, context: Dict[str, Any], 
                                 min_confidence: float = 0.7) -> List[LearningPattern]:
         """Get relevant patterns for given context"""
-        relevant_patterns = []
-        
-        for pattern in self.learned_patterns.values():
-            if pattern.confidence_score < min_confidence:
+        # Values the context pins down; deal size and cycle categories may
+        # also be derived from raw deal_value / expected_cycle_days
+        constraints = {key: value for key, value in context.items() if key != "outcome_type"}
+        if "deal_size_category" not in constraints and "deal_value" in context:
+            constraints["deal_size_category"] = self._categorize_deal_size(context["deal_value"])
+        if "cycle_category" not in constraints and "expected_cycle_days" in context:
+            constraints["cycle_category"] = self._categorize_cycle_length(context["expected_cycle_days"])
+        
+        # A pattern is excluded when it conditions on a constrained key with a
+        # different value; patterns without that key are unaffected
+        excluded: Set[str] = set()
+        for key, value in constraints.items():
+            with_key = self._patterns_by_key.get(key)
+            if not with_key:
                 continue
-            
-            # Check if pattern conditions match context
-            matches = True
-            for key, value in pattern.conditions.items():
-                if key == "outcome_type":
-                    continue  # Skip outcome type for context matching
-                elif key in context and context[key] != value:
-                    matches = False
-                    break
-                elif key == "deal_size_category" and "deal_value" in context:
-                    if self._categorize_deal_size(context["deal_value"]) != value:
-                        matches = False
-                        break
-                elif key == "cycle_category" and "expected_cycle_days" in context:
-                    if self._categorize_cycle_length(context["expected_cycle_days"]) != value:
-                        matches = False
-                        break
-            
-            if matches:
-                relevant_patterns.append(pattern)
+            if _hashable(value):
+                excluded |= with_key - self._pattern_index.get((key, value), set())
+            else:
+                excluded |= {
+                    pattern_id for pattern_id in with_key
+                    if self.learned_patterns[pattern_id].conditions[key] != value
+                }
+        
+        relevant_patterns = [
+            pattern for pattern_id, pattern in self.learned_patterns.items()
+            if pattern_id not in excluded and pattern.confidence_score >= min_confidence
+        ]
         
         # Sort by confidence and sample size
         relevant_patterns.sort(key=lambda p: (p.confidence_score, p.sample_size), reverse=True)
@@ -1152,8 +1367,16 @@ class PerformanceOptimizer:
 class ClientPreferenceLearner:
     """
     Learns client-specific preferences and customization patterns
+
+    Interactions are appended to a JSON Lines log; preferences are
+    snapshotted periodically and the interactions logged since the snapshot
+    are replayed on load.
     """
     
+    MAX_INTERACTIONS = 100  # Recent interactions kept
+    MAX_CUSTOMIZATIONS = 50  # Recent customizations kept
+    SNAPSHOT_INTERVAL = 50  # Interactions between preference snapshots
+    
     def __init__(self, client_id: str, storage_dir: Optional[Path] = None) -> Any:
         self.client_id = client_id
         self.storage_dir = storage_dir or Path("client_configs") / client_id
@@ -1164,36 +1387,72 @@ class ClientPreferenceLearner:
         self.interaction_patterns: List[Dict[str, Any]] = []
         self.customization_history: List[Dict[str, Any]] = []
         
+        # Storage: append-only interaction log plus preference snapshots
+        self._interaction_log = AppendOnlyLog(self.storage_dir / "client_interactions.jsonl")
+        self._prefs_file = self.storage_dir / "client_preferences.json"
+        self._seq = 0
+        self._snapshot_seq = 0
+        
         # Load existing data
         self._load_preference_data()
     
     def _load_preference_data(self) -> Any:
-        """Load client preference data"""
+        """Load client preference data (snapshot plus replay of the log tail)"""
         try:
-            prefs_file = self.storage_dir / "client_preferences.json"
-            if prefs_file.exists():
-                with open(prefs_file, 'r') as f:
+            if self._prefs_file.exists():
+                with open(self._prefs_file, 'r') as f:
                     data = json.load(f)
                     self.preferences = data.get("preferences", {})
-                    self.interaction_patterns = data.get("interaction_patterns", [])
                     self.customization_history = data.get("customization_history", [])
+                    self._snapshot_seq = data.get("last_seq", 0)
+                    
+                    # Files written before the interaction log held interactions inline
+                    if "last_seq" not in data:
+                        self.interaction_patterns = data.get("interaction_patterns", [])
+            
+            for record in self._interaction_log.read():
+                seq = record.pop("seq", 0)
+                self._seq = max(self._seq, seq)
+                self.interaction_patterns.append(record)
+                if seq > self._snapshot_seq:
+                    self._update_preferences_from_interaction(record)
+            
+            if not self._interaction_log.path.exists() and self.interaction_patterns:
+                self._seq = len(self.interaction_patterns)
+                self.compact()
         except Exception as e:
             logger.warning(event=f"Could not load client preferences: {e}")
     
-    def _save_preference_data(self) -> Any:
-        """Save client preference data"""
+    def _save_preference_data(self, interaction: Dict[str, Any]) -> Any:
+        """Append an interaction to the log; snapshot and compact periodically"""
         try:
-            prefs_file = self.storage_dir / "client_preferences.json"
-            data = {
-                "preferences": self.preferences,
-                "interaction_patterns": self.interaction_patterns[-100:],  # Keep recent
-                "customization_history": self.customization_history[-50:]  # Keep recent
-            }
-            with open(prefs_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._seq += 1
+            self._interaction_log.append({"seq": self._seq, **interaction})
+            
+            if self._seq - self._snapshot_seq >= self.SNAPSHOT_INTERVAL:
+                self.compact()
         except Exception as e:
             logger.error(event=f"Could not save client preferences: {e}")
     
+    def compact(self) -> Any:
+        """Write a preference snapshot and trim the interaction log"""
+        self.interaction_patterns = self.interaction_patterns[-self.MAX_INTERACTIONS:]
+        self.customization_history = self.customization_history[-self.MAX_CUSTOMIZATIONS:]
+        
+        _write_json_atomic(self._prefs_file, {
+            "preferences": self.preferences,
+            "customization_history": self.customization_history,
+            "last_seq": self._seq
+        })
+        self._snapshot_seq = self._seq
+        
+        if self._interaction_log.line_count > len(self.interaction_patterns) or not self._interaction_log.path.exists():
+            first_seq = self._seq - len(self.interaction_patterns) + 1
+            self._interaction_log.compact([
+                {"seq": first_seq + i, **interaction}
+                for i, interaction in enumerate(self.interaction_patterns)
+            ])
+    
     async def record_interaction(self, interaction_type: str, context: Dict[str, Any], 
                                satisfaction_score: Optional[float] = None) -> Any:
         """Record client interaction for preference learning"""
@@ -1209,11 +1468,11 @@ class ClientPreferenceLearner:
         self.interaction_patterns.append(interaction)
         
         # Update preferences based on interaction
-        await self._update_preferences_from_interaction(interaction)
+        self._update_preferences_from_interaction(interaction)
         
-        self._save_preference_data()
+        self._save_preference_data(interaction)
     
-    async def _update_preferences_from_interaction(self, interaction: Dict[str, Any]) -> Any:
+    def _update_preferences_from_interaction(self, interaction: Dict[str, Any]) -> Any:
         """Update preferences based on interaction data"""
         
         interaction_type = interaction["interaction_type"]
@@ -1,9 +1,18 @@
 """
 Database configuration and base models for Customer Success MCP.
+
+Two session factories are exposed:
+
+- ``SessionLocal``: synchronous sessions for migrations, scripts and workers
+- ``AsyncSessionLocal``: asyncio sessions for MCP tool handlers, so queries
+  never block the server event loop
 """
 
-from typing import Optional, Dict, List, Any
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Optional, Dict, List, Any, AsyncIterator
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 import os
 from dotenv import load_dotenv
@@ -13,6 +22,34 @@ load_dotenv()
 # Database configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://localhost/customer_success")
 
+# Async driver for each sync URL scheme
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    """
+    Convert a synchronous database URL to its asyncio driver equivalent.
+
+    Args:
+        url: Database URL (e.g. postgresql://..., sqlite:///...)
+
+    Returns:
+        URL using asyncpg (PostgreSQL) or aiosqlite (SQLite). URLs that already
+        name an async driver, or use an unknown scheme, are returned unchanged.
+    """
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        return url
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}://{rest}"
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", to_async_url(DATABASE_URL))
+
 # Create SQLAlchemy engine
 engine = create_engine(
     DATABASE_URL,
@@ -25,6 +62,30 @@ engine = create_engine(
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Create asyncio engine (SQLite uses a static/null pool without size options)
+_async_pool_options: Dict[str, Any] = {}
+if not ASYNC_DATABASE_URL.startswith("sqlite"):
+    _async_pool_options = {
+        "pool_size": int(os.getenv("DB_ASYNC_POOL_SIZE", "10")),
+        "max_overflow": int(os.getenv("DB_ASYNC_MAX_OVERFLOW", "20")),
+    }
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_pre_ping=True,
+    echo=False,
+    **_async_pool_options
+)
+
+# Create asyncio session factory. expire_on_commit=False keeps loaded
+# attributes readable after commit without an implicit (blocking) refresh.
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 # Create declarative base for ORM models
 Base = declarative_base()
 
@@ -43,4 +104,82 @@ def get_db() -> Any:
         db.close()
 
 
-__all__ = ['Base', 'engine', 'SessionLocal', 'get_db', 'DATABASE_URL']
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Async database session dependency for MCP tools.
+
+    Yields:
+        AsyncSession: SQLAlchemy asyncio database session
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Session shared by a batch of tool calls (see shared_async_session)
+_shared_async_session: ContextVar[Optional[AsyncSession]] = ContextVar(
+    "shared_async_session", default=None
+)
+
+
+def open_async_session() -> AsyncSession:
+    """
+    Get the session for a tool call.
+
+    Returns the batch-shared session when one is active in this context,
+    otherwise a new session. Pair with release_async_session().
+    """
+    return _shared_async_session.get() or AsyncSessionLocal()
+
+
+async def release_async_session(db: AsyncSession) -> None:
+    """Close a session from open_async_session() unless it is batch-shared."""
+    if db is not _shared_async_session.get():
+        await db.close()
+
+
+@asynccontextmanager
+async def shared_async_session() -> AsyncIterator[AsyncSession]:
+    """
+    Hold one connection and session for a sequence of tool calls.
+
+    Tool calls made inside the block get this session from
+    open_async_session() instead of checking out their own. The session must
+    only be used by one task at a time; call reset_shared_session() between
+    calls to drop uncommitted state and the identity map.
+
+    Yields:
+        AsyncSession: Session bound to a single checked-out connection
+    """
+    async with async_engine.connect() as connection:
+        session = AsyncSessionLocal(bind=connection)
+        token = _shared_async_session.set(session)
+        try:
+            yield session
+        finally:
+            _shared_async_session.reset(token)
+            await session.close()
+
+
+async def reset_shared_session(db: AsyncSession) -> None:
+    """Roll back any open transaction and clear the identity map between calls."""
+    if db.in_transaction():
+        await db.rollback()
+    db.expunge_all()
+
+
+__all__ = [
+    'Base',
+    'engine',
+    'SessionLocal',
+    'get_db',
+    'DATABASE_URL',
+    'async_engine',
+    'AsyncSessionLocal',
+    'get_async_db',
+    'open_async_session',
+    'release_async_session',
+    'shared_async_session',
+    'reset_shared_session',
+    'ASYNC_DATABASE_URL',
+    'to_async_url',
+]
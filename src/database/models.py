@@ -75,6 +75,9 @@ class CustomerAccount(Base):
         Index('ix_customers_client_id_created_at', 'client_id', 'created_at'),
         Index('ix_customers_health_score_status', 'health_score', 'status'),
         Index('ix_customers_csm_lifecycle', 'csm_assigned', 'lifecycle_stage'),
+        # Keyset pagination orders (list_clients)
+        Index('ix_customers_health_score_client_id', 'health_score', 'client_id'),
+        Index('ix_customers_created_at_client_id', 'created_at', 'client_id'),
         CheckConstraint('health_score >= 0 AND health_score <= 100', name='check_health_score_range'),
         CheckConstraint('contract_value >= 0', name='check_contract_value_positive'),
     )
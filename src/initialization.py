@@ -2,13 +2,15 @@
 199|OS Customer Success MCP - Initialization Module
 Centralizes all startup, configuration, and agent initialization logic.
 """
+import asyncio
+import contextlib
 import os
 import sys
 import socket
 import shutil
 import structlog
 from pathlib import Path
-from typing import Any, Tuple, List
+from typing import Any, AsyncIterator, Tuple, List
 from importlib.metadata import version, PackageNotFoundError
 from packaging.version import parse as parse_version
 from mcp.server.fastmcp import FastMCP
@@ -17,6 +19,9 @@ from mcp.server.fastmcp import FastMCP
 from src.agents.agent_integration import setup_agent_context
 from src.agents.enhanced_agent_system import EnhancedSalesAgent  # Will update class name
 
+# Adaptive agent created by initialize_agents; its memories are flushed on shutdown
+GLOBAL_AGENT = None
+
 
 def validate_dependencies() -> Tuple[bool, List[str], List[str]]:
     """
@@ -402,6 +407,46 @@ def setup_logging() -> Any:
     return logger
 
 
+@contextlib.asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """
+    Run background services for the lifetime of the server.
+
+    Seeds the SLA monitor with the open tickets in the database and starts
+    its tick loop (so timers scheduled by handle_support_ticket fire), and
+    starts the audit logger's background writer when audit logging is
+    enabled. On shutdown it stops the loop, drains buffered audit entries,
+    persists the adaptive agent's pending write-behind memory changes and
+    closes the pooled integration HTTP sessions.
+
+    Args:
+        server: FastMCP server instance
+    """
+    from src.integrations.http_pool import close_http_sessions
+    from src.security.audit_logger import get_audit_logger
+    from src.services.sla_monitor import get_sla_monitor, load_open_tickets, log_sla_events
+
+    audit_logger = None
+    if os.getenv('ENABLE_AUDIT_LOGGING', 'true').lower() == 'true':
+        audit_logger = get_audit_logger()
+        await audit_logger.start_writer()
+
+    monitor = get_sla_monitor()
+    await asyncio.to_thread(load_open_tickets, monitor)
+    sla_task = asyncio.create_task(monitor.run(log_sla_events))
+    try:
+        yield
+    finally:
+        sla_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await sla_task
+        if audit_logger is not None:
+            await audit_logger.shutdown()
+        if GLOBAL_AGENT is not None:
+            await GLOBAL_AGENT.shutdown()
+        await close_http_sessions()
+
+
 def initialize_mcp_server() -> Any:
     """
     Initialize FastMCP server instance.
@@ -409,7 +454,7 @@ def initialize_mcp_server() -> Any:
     Returns:
         FastMCP: Configured MCP server instance
     """
-    mcp = FastMCP(name="199OS-CustomerSuccess")
+    mcp = FastMCP(name="199OS-CustomerSuccess", lifespan=server_lifespan)
     return mcp
 
 
@@ -444,6 +489,9 @@ def register_tools(mcp: FastMCP) -> Any:
     """
     Register all tools from organized tool modules.
 
+    Tools are registered lazily from src/tools/tool_manifest.json; each tool
+    module is imported on its first call.
+
     Args:
         mcp: FastMCP server instance
     """
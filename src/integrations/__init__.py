@@ -3,4 +3,16 @@
 # All custom integrations archived - will be replaced with Composio
 # See: archive/integrations/ for archived integration files
 
-__all__ = []
+from .http_pool import (
+    HTTPClientRegistry,
+    get_http_registry,
+    get_http_session,
+    close_http_sessions,
+)
+
+__all__ = [
+    'HTTPClientRegistry',
+    'get_http_registry',
+    'get_http_session',
+    'close_http_sessions',
+]
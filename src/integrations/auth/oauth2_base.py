@@ -6,7 +6,6 @@ Provides reusable OAuth2 authentication for 70% of integrations
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import asyncio
-import aiohttp
 import structlog
 from abc import abstractmethod
 
@@ -77,7 +76,6 @@ class OAuth2Integration(BaseIntegration):
             max_retries=max_retries
         )
 
-        self.session: Optional[aiohttp.ClientSession] = None
         self.token_expires_at: Optional[datetime] = None
 
         # Parse token expiration if provided
@@ -141,10 +139,6 @@ class OAuth2Integration(BaseIntegration):
             if not valid:
                 raise AuthenticationError(error)
 
-            # Create session if needed
-            if not self.session or self.session.closed:
-                self.session = aiohttp.ClientSession()
-
             # Check if we need to refresh token
             if self._is_token_expired():
                 await self._refresh_access_token()
@@ -427,9 +421,6 @@ class OAuth2Integration(BaseIntegration):
             'client_secret': self.credentials['client_secret']
         }
 
-        if not self.session or self.session.closed:
-            self.session = aiohttp.ClientSession()
-
         try:
             async with self.session.post(token_url, data=data) as response:
                 if response.status == 200:
@@ -467,15 +458,6 @@ class OAuth2Integration(BaseIntegration):
                 f"Code exchange failed: {str(e)}"
             )
 
-    async def close(self) -> Any:
-        """Close HTTP session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
-            logger.info(
-                "oauth2_session_closed",
-                integration=self.integration_name
-            )
-
     async def __aenter__(self) -> Any:
         """Async context manager entry."""
         await self.authenticate()
@@ -11,6 +11,8 @@ import aiohttp
 import structlog
 from abc import ABC, abstractmethod
 
+from .http_pool import get_http_session
+
 logger = structlog.get_logger(__name__)
 
 
@@ -126,7 +128,7 @@ class BaseIntegration(ABC):
         self.rate_limit_window = rate_limit_window
         self.max_retries = max_retries
 
-        self.session: Optional[aiohttp.ClientSession] = None
+        self._own_session: Optional[aiohttp.ClientSession] = None
         self.circuit_breaker = CircuitBreaker(failure_threshold=5, timeout=60)
         self._authenticated = False
 
@@ -135,6 +137,23 @@ class BaseIntegration(ABC):
             integration=integration_name
         )
 
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        HTTP session for this integration.
+
+        Defaults to the process-wide pooled session for the integration, so
+        instances for different tenants reuse the same connections.
+        """
+        if self._own_session is not None and not self._own_session.closed:
+            return self._own_session
+        return get_http_session(self.integration_name)
+
+    @session.setter
+    def session(self, session: Optional[aiohttp.ClientSession]) -> None:
+        """Use a dedicated session instead of the shared pool."""
+        self._own_session = session
+
     @abstractmethod
     async def authenticate(self) -> bool:
         """
@@ -184,9 +203,14 @@ class BaseIntegration(ABC):
         return True, ""
 
     async def close(self) -> Any:
-        """Close HTTP session and cleanup resources."""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        """
+        Release HTTP resources.
+
+        Only a dedicated session is closed; the shared pool stays open for
+        other instances (see close_http_sessions).
+        """
+        if self._own_session and not self._own_session.closed:
+            await self._own_session.close()
             logger.info(
                 "integration_session_closed",
                 integration=self.integration_name
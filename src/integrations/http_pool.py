@@ -0,0 +1,174 @@
+"""
+Shared HTTP Connection Pools
+Process-wide pooled aiohttp sessions reused by all integration instances
+"""
+
+from typing import Dict, Any, Optional
+import asyncio
+import os
+import weakref
+import aiohttp
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Connection pool settings
+HTTP_POOL_LIMIT = int(os.getenv('HTTP_POOL_LIMIT', '100'))
+HTTP_POOL_LIMIT_PER_HOST = int(os.getenv('HTTP_POOL_LIMIT_PER_HOST', '20'))
+HTTP_KEEPALIVE_TIMEOUT = float(os.getenv('HTTP_KEEPALIVE_TIMEOUT', '30'))
+HTTP_DNS_CACHE_TTL = int(os.getenv('HTTP_DNS_CACHE_TTL', '300'))
+HTTP_REQUEST_TIMEOUT = float(os.getenv('HTTP_REQUEST_TIMEOUT', '30'))
+HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', '10'))
+
+
+class HTTPClientRegistry:
+    """
+    Pooled aiohttp sessions shared across integration instances.
+
+    One session is kept per pool name (normally the integration name) and
+    event loop, so every tenant talking to the same vendor reuses the same
+    keep-alive TLS connections. Connectors cap connections overall and per
+    host and cache DNS lookups. Sessions never store cookies, since they
+    are shared between tenants; authentication is passed per request.
+
+    aiohttp speaks HTTP/1.1 only; connection reuse is what removes the
+    per-request TLS handshake.
+    """
+
+    def __init__(
+        self,
+        limit: int = HTTP_POOL_LIMIT,
+        limit_per_host: int = HTTP_POOL_LIMIT_PER_HOST,
+        keepalive_timeout: float = HTTP_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: int = HTTP_DNS_CACHE_TTL,
+        request_timeout: float = HTTP_REQUEST_TIMEOUT,
+        connect_timeout: float = HTTP_CONNECT_TIMEOUT
+    ) -> Any:
+        """
+        Initialize registry.
+
+        Args:
+            limit: Max open connections per pool
+            limit_per_host: Max open connections per host within a pool
+            keepalive_timeout: Seconds an idle connection is kept open
+            dns_cache_ttl: Seconds resolved addresses are cached
+            request_timeout: Total timeout per request in seconds
+            connect_timeout: Timeout for establishing a connection in seconds
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.request_timeout = request_timeout
+        self.connect_timeout = connect_timeout
+
+        # Sessions are bound to the loop they were created on
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, aiohttp.ClientSession]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.sessions_created = 0
+
+    def _create_session(self, name: str) -> aiohttp.ClientSession:
+        """Create a pooled session."""
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True
+        )
+        self.sessions_created += 1
+        logger.info(
+            "http_pool_created",
+            pool=name,
+            limit=self.limit,
+            limit_per_host=self.limit_per_host
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(
+                total=self.request_timeout,
+                connect=self.connect_timeout
+            ),
+            cookie_jar=aiohttp.DummyCookieJar(),
+            raise_for_status=False
+        )
+
+    def get_session(self, name: str = "default") -> aiohttp.ClientSession:
+        """
+        Get the shared session for a pool, creating it on first use.
+
+        Must be called from a running event loop.
+
+        Args:
+            name: Pool name (e.g. the integration name)
+
+        Returns:
+            Shared aiohttp session (do not close it; use close())
+        """
+        loop = asyncio.get_running_loop()
+        sessions = self._sessions.setdefault(loop, {})
+
+        session = sessions.get(name)
+        if session is None or session.closed:
+            session = sessions[name] = self._create_session(name)
+        return session
+
+    async def close(self, name: Optional[str] = None) -> None:
+        """
+        Close pooled sessions on the running loop.
+
+        Args:
+            name: Pool to close (all pools if omitted)
+        """
+        sessions = self._sessions.get(asyncio.get_running_loop(), {})
+        names = [name] if name is not None else list(sessions)
+
+        for pool_name in names:
+            session = sessions.pop(pool_name, None)
+            if session is not None and not session.closed:
+                await session.close()
+                logger.info("http_pool_closed", pool=pool_name)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics for the current loop."""
+        try:
+            sessions = self._sessions.get(asyncio.get_running_loop(), {})
+        except RuntimeError:
+            sessions = {}
+
+        pools = {}
+        for name, session in sessions.items():
+            connector = session.connector
+            pools[name] = {
+                'closed': session.closed,
+                'limit': connector.limit if connector else None,
+                'limit_per_host': connector.limit_per_host if connector else None
+            }
+
+        return {
+            'sessions_created': self.sessions_created,
+            'pools': pools
+        }
+
+
+# Global registry instance
+_http_registry = None
+
+
+def get_http_registry() -> HTTPClientRegistry:
+    """Get or create global HTTP client registry"""
+    global _http_registry
+    if _http_registry is None:
+        _http_registry = HTTPClientRegistry()
+    return _http_registry
+
+
+def get_http_session(name: str = "default") -> aiohttp.ClientSession:
+    """Get the shared pooled session for a pool name"""
+    return get_http_registry().get_session(name)
+
+
+async def close_http_sessions() -> None:
+    """Close all pooled sessions on the running loop (call on shutdown)"""
+    await get_http_registry().close()
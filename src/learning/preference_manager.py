@@ -9,6 +9,8 @@ from pathlib import Path
 from enum import Enum
 import json
 import asyncio
+import atexit
+import weakref
 import structlog
 from pydantic import BaseModel, Field
 from collections import defaultdict
@@ -17,6 +19,20 @@ from src.utils.file_operations import SafeFileOperations
 logger = structlog.get_logger(__name__)
 safe_file_ops = SafeFileOperations()
 
+# Learning events kept on disk; the log is compacted at twice this size
+MAX_STORED_EVENTS = 1000
+
+# Managers with unsaved changes, flushed at interpreter exit
+_dirty_managers: "weakref.WeakSet[PreferenceManager]" = weakref.WeakSet()
+
+
+def _flush_dirty_managers() -> None:
+    for manager in list(_dirty_managers):
+        manager.flush_sync()
+
+
+atexit.register(_flush_dirty_managers)
+
 
 class PreferenceType(str, Enum):
     """Types of preferences."""
@@ -92,7 +108,13 @@ class PreferenceManager:
     - Retrieve preferences for business functions
     - Infer preferences from behavior patterns
     - Track preference confidence
-    - Decay old preferences
+    - Decay old preferences (lazily, from last_used, when read)
+
+    Preferences are indexed by business function, so lookups only touch the
+    matching preferences. Learning events are persisted in batches: changes
+    are flushed at most once per flush_interval (and by flush()/shutdown()),
+    with new events appended to a JSON Lines log. Changes still pending at
+    interpreter exit are written then.
 
     Usage:
         >>> manager = PreferenceManager(client_id="client_123")
@@ -111,7 +133,8 @@ class PreferenceManager:
         client_id: str,
         storage_path: Optional[Path] = None,
         confidence_decay_days: int = 30,
-        min_confidence_threshold: float = 0.3
+        min_confidence_threshold: float = 0.3,
+        flush_interval: float = 2.0
     ) -> Any:
         """
         Initialize preference manager.
@@ -121,10 +144,12 @@ class PreferenceManager:
             storage_path: Path to store preferences (optional)
             confidence_decay_days: Days before preference confidence starts decaying
             min_confidence_threshold: Minimum confidence to keep a preference
+            flush_interval: Seconds to batch changes before writing (0 writes every event)
         """
         self.client_id = client_id
         self.confidence_decay_days = confidence_decay_days
         self.min_confidence_threshold = min_confidence_threshold
+        self.flush_interval = flush_interval
 
         # Storage
         if storage_path:
@@ -136,6 +161,15 @@ class PreferenceManager:
         # In-memory storage
         self.preferences: Dict[str, Preference] = {}
         self.learning_events: List[LearningEvent] = []
+        self._keys_by_function: Dict[str, set] = defaultdict(set)
+
+        # Batched persistence state
+        self._dirty = False
+        self._pending_events: List[LearningEvent] = []
+        self._stored_event_count = 0
+        self._rewrite_events = False
+        self._flush_task: Optional[asyncio.Task] = None
+        self._save_future: Optional[asyncio.Future] = None
 
         # Load existing preferences if storage path exists
         if self.storage_path:
@@ -154,11 +188,44 @@ class PreferenceManager:
         return self.storage_path / f"{self.client_id}_preferences.json"
 
     def _get_events_file(self) -> Optional[Path]:
-        """Get path to learning events storage file."""
+        """Get path to learning events log (JSON Lines)."""
+        if not self.storage_path:
+            return None
+        return self.storage_path / f"{self.client_id}_events.jsonl"
+
+    def _get_legacy_events_file(self) -> Optional[Path]:
+        """Get path to the learning events JSON array written by earlier versions."""
         if not self.storage_path:
             return None
         return self.storage_path / f"{self.client_id}_events.json"
 
+    def _index_preference(self, pref: Preference) -> None:
+        """Add a preference to the business function index."""
+        self._keys_by_function[pref.business_function].add(pref.preference_key)
+
+    def _decayed_confidence(self, pref: Preference, now: Optional[datetime] = None) -> float:
+        """
+        Confidence after time-based decay, computed from last_used.
+
+        Preferences unused for longer than confidence_decay_days lose
+        confidence proportionally to their age (down to half).
+        """
+        if not pref.last_used:
+            return pref.confidence
+
+        now = now or datetime.utcnow()
+        if now - pref.last_used < timedelta(days=self.confidence_decay_days):
+            return pref.confidence
+
+        days_old = (now - pref.last_used).days
+        return pref.confidence * max(0.5, 1.0 - (days_old / 365))
+
+    @staticmethod
+    def _serialize_event(event: LearningEvent) -> Dict[str, Any]:
+        event_dict = event.dict()
+        event_dict['timestamp'] = event_dict['timestamp'].isoformat()
+        return event_dict
+
     def _load_from_disk(self) -> Any:
         """Load preferences and events from disk."""
         try:
@@ -175,59 +242,204 @@ class PreferenceManager:
                         pref_dict['updated_at'] = datetime.fromisoformat(pref_dict['updated_at'])
 
                         self.preferences[key] = Preference(**pref_dict)
+                        self._index_preference(self.preferences[key])
 
                     logger.info("preferences_loaded", count=len(self.preferences))
 
-            # Load events using safe file operations
+            # Load events from the log, or from the legacy JSON array
             events_file = self._get_events_file()
+            legacy_file = self._get_legacy_events_file()
             if events_file and events_file.exists():
-                data = safe_file_ops.read_json(events_file)
+                with open(events_file, 'r') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            event_dict = json.loads(line)
+                        except json.JSONDecodeError:
+                            logger.warning("learning_event_unreadable", file=events_file.name)
+                            continue
+                        event_dict['timestamp'] = datetime.fromisoformat(event_dict['timestamp'])
+                        self.learning_events.append(LearningEvent(**event_dict))
+                self._stored_event_count = len(self.learning_events)
+
+                logger.info("learning_events_loaded", count=len(self.learning_events))
+
+            elif legacy_file and legacy_file.exists():
+                data = safe_file_ops.read_json(legacy_file)
                 if data:
                     for event_dict in data:
                         event_dict['timestamp'] = datetime.fromisoformat(event_dict['timestamp'])
                         self.learning_events.append(LearningEvent(**event_dict))
+                # Converted to the log on the next flush
+                self._rewrite_events = True
 
                 logger.info("learning_events_loaded", count=len(self.learning_events))
 
         except Exception as e:
             logger.error("load_from_disk_failed", error=str(e))
 
-    def _save_to_disk(self) -> Any:
-        """Save preferences and events to disk."""
+    def _serialize_preferences(self) -> Dict[str, Any]:
+        """Convert preferences to JSON-compatible dicts."""
+        data = {}
+        for key, pref in self.preferences.items():
+            pref_dict = pref.dict()
+            # Convert timestamps to ISO format
+            if pref_dict.get('last_used'):
+                pref_dict['last_used'] = pref_dict['last_used'].isoformat()
+            pref_dict['created_at'] = pref_dict['created_at'].isoformat()
+            pref_dict['updated_at'] = pref_dict['updated_at'].isoformat()
+            data[key] = pref_dict
+        return data
+
+    def _save_to_disk(
+        self,
+        preferences: Dict[str, Any],
+        events: List[Dict[str, Any]],
+        rewrite_events: bool = False
+    ) -> bool:
+        """
+        Save preferences and learning events to disk.
+
+        Args:
+            preferences: Serialized preferences (the file is replaced atomically)
+            events: Serialized events to append, or the full log if rewrite_events
+            rewrite_events: Replace the event log instead of appending
+
+        Returns:
+            True if saved successfully
+        """
         try:
-            # Save preferences
             pref_file = self._get_preference_file()
             if pref_file:
-                data = {}
-                for key, pref in self.preferences.items():
-                    pref_dict = pref.dict()
-                    # Convert timestamps to ISO format
-                    if pref_dict.get('last_used'):
-                        pref_dict['last_used'] = pref_dict['last_used'].isoformat()
-                    pref_dict['created_at'] = pref_dict['created_at'].isoformat()
-                    pref_dict['updated_at'] = pref_dict['updated_at'].isoformat()
-                    data[key] = pref_dict
-
-                # Use safe file operations with locking
-                safe_file_ops.write_json(pref_file, data)
-
-            # Save events (keep last 1000)
+                if not safe_file_ops.write_json(pref_file, preferences):
+                    raise OSError(f"Could not write {pref_file.name}")
+
             events_file = self._get_events_file()
             if events_file:
-                recent_events = self.learning_events[-1000:]
-                data = []
-                for event in recent_events:
-                    event_dict = event.dict()
-                    event_dict['timestamp'] = event_dict['timestamp'].isoformat()
-                    data.append(event_dict)
-
-                # Use safe file operations with locking
-                safe_file_ops.write_json(events_file, data)
-
-            logger.info("preferences_saved", count=len(self.preferences))
+                lines = "".join(json.dumps(event) + "\n" for event in events)
+                if rewrite_events:
+                    if not safe_file_ops.write_file(events_file, lines):
+                        raise OSError(f"Could not write {events_file.name}")
+                    legacy_file = self._get_legacy_events_file()
+                    if legacy_file.exists():
+                        legacy_file.unlink()
+                elif lines:
+                    with open(events_file, 'a') as f:
+                        f.write(lines)
+
+            logger.info("preferences_saved", count=len(preferences), events=len(events))
+            return True
 
         except Exception as e:
             logger.error("save_to_disk_failed", error=str(e))
+            return False
+
+    def _take_pending(
+        self
+    ) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]], bool, List[LearningEvent]]]:
+        """Serialize pending changes and clear the dirty flag."""
+        if not self.storage_path or not self._dirty:
+            return None
+        self._dirty = False
+        _dirty_managers.discard(self)
+        pending, self._pending_events = self._pending_events, []
+        preferences = self._serialize_preferences()
+
+        rewrite = self._rewrite_events or (
+            self._stored_event_count + len(pending) > 2 * MAX_STORED_EVENTS
+        )
+        if rewrite:
+            events = [self._serialize_event(e) for e in self.learning_events[-MAX_STORED_EVENTS:]]
+        else:
+            events = [self._serialize_event(e) for e in pending]
+        return preferences, events, rewrite, pending
+
+    def _saved(
+        self, saved: bool, pending: List[LearningEvent], written: int, rewrite: bool
+    ) -> None:
+        """Record a finished write; failed writes keep their events pending."""
+        if not saved:
+            self._pending_events = pending + self._pending_events
+            self._dirty = True
+            _dirty_managers.add(self)
+        elif rewrite:
+            self._stored_event_count = written
+            self._rewrite_events = False
+        else:
+            self._stored_event_count += written
+
+    async def flush(self) -> int:
+        """
+        Persist pending preference changes and learning events in one write.
+
+        Returns:
+            Number of learning events written
+        """
+        # Never run two writes of the same files at once
+        if self._save_future is not None and not self._save_future.done():
+            await asyncio.wait([self._save_future])
+
+        # Serialize on the event loop so concurrent updates cannot interleave
+        batch = self._take_pending()
+        if batch is None:
+            return 0
+        preferences, events, rewrite, pending = batch
+
+        self._save_future = asyncio.ensure_future(
+            asyncio.to_thread(self._save_to_disk, preferences, events, rewrite)
+        )
+        self._save_future.add_done_callback(
+            lambda future: self._saved(
+                not future.cancelled() and future.exception() is None and future.result(),
+                pending, len(events), rewrite
+            )
+        )
+        # Shielded: cancelling the flush task must not abandon a running write
+        if not await asyncio.shield(self._save_future):
+            return 0
+        return len(pending)
+
+    def flush_sync(self) -> int:
+        """
+        Persist pending changes from the calling thread (used at interpreter exit).
+
+        Returns:
+            Number of learning events written
+        """
+        batch = self._take_pending()
+        if batch is None:
+            return 0
+        preferences, events, rewrite, pending = batch
+        saved = self._save_to_disk(preferences, events, rewrite)
+        self._saved(saved, pending, len(events), rewrite)
+        return len(pending) if saved else 0
+
+    async def _flush_after_interval(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+        # Events recorded while the write ran saw this task pending and did
+        # not schedule their own flush; a failed write is retried the same way
+        if self._dirty:
+            self._flush_task = asyncio.create_task(self._flush_after_interval())
+
+    async def shutdown(self) -> int:
+        """
+        Cancel the pending batched write and flush immediately.
+
+        A write already in progress is waited for, not repeated alongside.
+
+        Returns:
+            Number of learning events written
+        """
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+        self._flush_task = None
+        return await self.flush()
 
     async def record_learning_event(
         self,
@@ -286,9 +498,15 @@ class PreferenceManager:
             # Update preferences based on this event
             await self.update_preferences(event)
 
-            # Save to disk
+            # Persist with the next batch
             if self.storage_path:
-                await asyncio.to_thread(self._save_to_disk)
+                self._pending_events.append(event)
+                self._dirty = True
+                _dirty_managers.add(self)
+                if self.flush_interval <= 0:
+                    await self.flush()
+                elif not self._flush_task or self._flush_task.done():
+                    self._flush_task = asyncio.create_task(self._flush_after_interval())
 
             logger.info(
                 "learning_event_recorded",
@@ -320,6 +538,8 @@ class PreferenceManager:
             # Get or create preference
             if pref_key in self.preferences:
                 pref = self.preferences[pref_key]
+                # Fold any decay since last use into the stored confidence
+                pref.confidence = self._decayed_confidence(pref)
             else:
                 # Determine preference type from event type
                 pref_type = self._infer_preference_type(event.event_type)
@@ -361,6 +581,7 @@ class PreferenceManager:
 
             # Store updated preference
             self.preferences[pref_key] = pref
+            self._index_preference(pref)
 
             logger.info(
                 "preference_updated",
@@ -416,18 +637,16 @@ class PreferenceManager:
             >>> print(prefs['data_source'])  # 'apollo'
         """
         try:
-            # Apply confidence decay first
-            await self._apply_confidence_decay()
-
             result = {}
+            now = datetime.utcnow()
 
-            # Find all preferences for this business function
-            for pref_key, pref in self.preferences.items():
-                if pref.business_function != business_function:
-                    continue
+            # Only the preferences indexed under this business function
+            for pref_key in self._keys_by_function.get(business_function, ()):
+                pref = self.preferences[pref_key]
 
-                # Skip low-confidence preferences
-                if pref.confidence < self.min_confidence_threshold:
+                # Skip low-confidence preferences (after decay)
+                confidence = self._decayed_confidence(pref, now)
+                if confidence < self.min_confidence_threshold:
                     continue
 
                 # Check context match if provided
@@ -441,7 +660,7 @@ class PreferenceManager:
 
                 result[pref_name] = {
                     'value': pref.value,
-                    'confidence': pref.confidence,
+                    'confidence': confidence,
                     'usage_count': pref.usage_count,
                     'success_rate': (
                         pref.success_count / pref.usage_count
@@ -576,32 +795,6 @@ class PreferenceManager:
             logger.error("infer_preferences_failed", error=str(e))
             return {}
 
-    async def _apply_confidence_decay(self) -> Any:
-        """Apply time-based confidence decay to old preferences."""
-        try:
-            now = datetime.utcnow()
-            decay_threshold = now - timedelta(days=self.confidence_decay_days)
-
-            for pref in self.preferences.values():
-                if pref.last_used and pref.last_used < decay_threshold:
-                    # Calculate decay based on age
-                    days_old = (now - pref.last_used).days
-                    decay_factor = max(0.5, 1.0 - (days_old / 365))
-
-                    # Apply decay
-                    pref.confidence *= decay_factor
-
-                    # Remove if too low
-                    if pref.confidence < self.min_confidence_threshold:
-                        logger.info(
-                            "preference_decayed_removed",
-                            key=pref.preference_key,
-                            confidence=pref.confidence
-                        )
-
-        except Exception as e:
-            logger.error("confidence_decay_failed", error=str(e))
-
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about learned preferences.
@@ -611,18 +804,21 @@ class PreferenceManager:
         """
         try:
             total_prefs = len(self.preferences)
-            high_confidence = sum(1 for p in self.preferences.values() if p.confidence >= 0.7)
+            now = datetime.utcnow()
+            high_confidence = sum(
+                1 for p in self.preferences.values() if self._decayed_confidence(p, now) >= 0.7
+            )
 
             # Group by function
-            by_function = defaultdict(int)
-            for pref in self.preferences.values():
-                by_function[pref.business_function] += 1
+            by_function = {
+                function: len(keys) for function, keys in self._keys_by_function.items() if keys
+            }
 
             return {
                 'total_preferences': total_prefs,
                 'high_confidence_preferences': high_confidence,
                 'total_learning_events': len(self.learning_events),
-                'preferences_by_function': dict(by_function),
+                'preferences_by_function': by_function,
                 'client_id': self.client_id
             }
 
@@ -689,6 +885,7 @@ def test_preference_manager() -> Any:
             print(f"✓ Statistics: {stats}")
 
             print("\nTest 7: Save and reload...")
+            await manager.shutdown()
             # Create new manager instance
             manager2 = PreferenceManager(
                 client_id="test_client",
@@ -4,6 +4,7 @@ Middleware package for request processing
 
 from .rate_limiter import (
     RedisRateLimiter,
+    HybridRateLimiter,
     RateLimitExceeded,
     get_rate_limiter,
     rate_limit,
@@ -12,6 +13,7 @@ from .rate_limiter import (
 
 __all__ = [
     'RedisRateLimiter',
+    'HybridRateLimiter',
     'RateLimitExceeded',
     'get_rate_limiter',
     'rate_limit',
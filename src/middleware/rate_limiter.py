@@ -1,12 +1,18 @@
 """
 Redis-based Rate Limiting Middleware for MCP Tools
-Implements token bucket algorithm with per-client and per-tool limits
+Implements per-client, per-tool and global limits, evaluated atomically in a
+single Redis round trip by a Lua script (fixed window, sliding window or GCRA).
+
+HybridRateLimiter puts an in-process token tier in front of Redis: each
+process leases quota from Redis in chunks and decides most requests locally,
+refilling leases in the background.
 """
 
+import asyncio
 import time
 import os
 import hashlib
-from typing import Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from functools import wraps
 import structlog
 
@@ -17,12 +23,173 @@ RATE_LIMIT_ENABLED = os.getenv('RATE_LIMIT_ENABLED', 'true').lower() == 'true'
 MAX_REQUESTS_PER_MINUTE = int(os.getenv('MAX_REQUESTS_PER_MINUTE', '1000'))
 MAX_REQUESTS_PER_HOUR = int(os.getenv('MAX_REQUESTS_PER_HOUR', '10000'))
 RATE_LIMIT_PER_CLIENT_PER_MINUTE = int(os.getenv('RATE_LIMIT_PER_CLIENT_PER_MINUTE', '100'))
+# fixed_window: counters reset at window boundaries (allows 2x bursts across a boundary)
+# sliding_window: weighted current + previous window counters
+# gcra: generic cell rate algorithm, smooth spacing with a burst of `limit`
+RATE_LIMIT_ALGORITHM = os.getenv('RATE_LIMIT_ALGORITHM', 'fixed_window').lower()
+
+# hybrid: decide locally from quota leased from Redis in chunks
+# redis: one Redis round trip per request
+RATE_LIMIT_MODE = os.getenv('RATE_LIMIT_MODE', 'hybrid').lower()
+# Lease chunk = limit * fraction, capped at RATE_LIMIT_LEASE_MAX
+RATE_LIMIT_LEASE_FRACTION = float(os.getenv('RATE_LIMIT_LEASE_FRACTION', '0.05'))
+RATE_LIMIT_LEASE_MAX = int(os.getenv('RATE_LIMIT_LEASE_MAX', '50'))
+# Unused leased tokens are dropped after this many seconds
+RATE_LIMIT_LEASE_TTL = float(os.getenv('RATE_LIMIT_LEASE_TTL', '5'))
+RATE_LIMIT_REDIS_TIMEOUT_MS = int(os.getenv('RATE_LIMIT_REDIS_TIMEOUT_MS', '50'))
+# Seconds to stay in degraded mode after Redis fails or times out
+RATE_LIMIT_REDIS_BACKOFF = float(os.getenv('RATE_LIMIT_REDIS_BACKOFF', '5'))
+# Degraded mode while Redis is unavailable:
+# local: enforce limit / RATE_LIMIT_EXPECTED_REPLICAS per process
+# open: allow everything; closed: reject everything
+RATE_LIMIT_DEGRADED_MODE = os.getenv('RATE_LIMIT_DEGRADED_MODE', 'local').lower()
+RATE_LIMIT_EXPECTED_REPLICAS = int(os.getenv('RATE_LIMIT_EXPECTED_REPLICAS', '1'))
+# Seconds between sweeps that drop idle local buckets
+RATE_LIMIT_PRUNE_INTERVAL = float(os.getenv('RATE_LIMIT_PRUNE_INTERVAL', '60'))
+
+WINDOW_SECONDS = {'minute': 60, 'hour': 3600}
+ALGORITHMS = ('fixed_window', 'sliding_window', 'gcra')
+LIMITER_MODES = ('hybrid', 'redis')
+DEGRADED_MODES = ('local', 'open', 'closed')
+
+
+# ============================================================================
+# Lua scripts
+# ============================================================================
+#
+# Every script checks all limits first and only then records the request, so
+# a request rejected by one limit does not consume quota on the others.
+#
+# ARGV[1] = now in milliseconds, ARGV[2] = units requested, then per limit i:
+# ARGV[2i+1] = limit, ARGV[2i+2] = window in milliseconds.
+# The grant is the largest number of units (up to the request) available on
+# every limit; a single check requests 1, a local lease requests a chunk.
+# Returns {units granted, index of the failing limit (1-based, 0 if granted),
+# retry_after in milliseconds}.
+
+FIXED_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local grant = tonumber(ARGV[2])
+local n = #KEYS
+for i = 1, n do
+    local limit = tonumber(ARGV[2 * i + 1])
+    local window = tonumber(ARGV[2 * i + 2])
+    local available = limit - tonumber(redis.call('GET', KEYS[i]) or '0')
+    if available < 1 then
+        return {0, i, window - now % window}
+    end
+    grant = math.min(grant, available)
+end
+for i = 1, n do
+    if redis.call('INCRBY', KEYS[i], grant) == grant then
+        redis.call('PEXPIRE', KEYS[i], ARGV[2 * i + 2])
+    end
+end
+return {grant, 0, 0}
+"""
+
+# KEYS come in pairs per limit: current window counter, previous window counter
+SLIDING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local grant = tonumber(ARGV[2])
+local n = #KEYS / 2
+for i = 1, n do
+    local limit = tonumber(ARGV[2 * i + 1])
+    local window = tonumber(ARGV[2 * i + 2])
+    local elapsed = now % window
+    local current = tonumber(redis.call('GET', KEYS[2 * i - 1]) or '0')
+    local previous = tonumber(redis.call('GET', KEYS[2 * i]) or '0')
+    local available = math.floor(limit - previous * (window - elapsed) / window - current)
+    if available < 1 then
+        local retry = window - elapsed
+        if current + 1 <= limit and previous > 0 then
+            local needed = window * (1 - (limit - current - 1) / previous)
+            retry = math.max(math.ceil(needed - elapsed), 1)
+        end
+        return {0, i, retry}
+    end
+    grant = math.min(grant, available)
+end
+for i = 1, n do
+    local key = KEYS[2 * i - 1]
+    if redis.call('INCRBY', key, grant) == grant then
+        redis.call('PEXPIRE', key, 2 * tonumber(ARGV[2 * i + 2]))
+    end
+end
+return {grant, 0, 0}
+"""
+
+# Theoretical arrival time (TAT) per key; emission interval = window / limit
+GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local grant = tonumber(ARGV[2])
+local n = #KEYS
+local tats = {}
+for i = 1, n do
+    local limit = tonumber(ARGV[2 * i + 1])
+    local window = tonumber(ARGV[2 * i + 2])
+    local interval = window / limit
+    local tat = tonumber(redis.call('GET', KEYS[i]) or '0')
+    if tat < now then tat = now end
+    local available = math.floor((now + window - tat) / interval)
+    if available < 1 then
+        return {0, i, math.ceil(tat + interval - window - now)}
+    end
+    grant = math.min(grant, available)
+    tats[i] = tat
+end
+for i = 1, n do
+    local interval = tonumber(ARGV[2 * i + 2]) / tonumber(ARGV[2 * i + 1])
+    local new_tat = tats[i] + grant * interval
+    redis.call('SET', KEYS[i], string.format('%.3f', new_tat), 'PX', math.max(math.ceil(new_tat - now), 1))
+end
+return {grant, 0, 0}
+"""
+
+SCRIPTS = {
+    'fixed_window': FIXED_WINDOW_SCRIPT,
+    'sliding_window': SLIDING_WINDOW_SCRIPT,
+    'gcra': GCRA_SCRIPT,
+}
+
+# Return unused leased units. ARGV[1] = now in milliseconds, then per key i:
+# ARGV[3i-1] = units, ARGV[3i] = limit, ARGV[3i+1] = window in milliseconds.
+# Keys whose window has already rolled over are left alone.
+
+RELEASE_COUNTER_SCRIPT = """
+for i = 1, #KEYS do
+    local current = tonumber(redis.call('GET', KEYS[i]) or '0')
+    if current > 0 then
+        redis.call('DECRBY', KEYS[i], math.min(tonumber(ARGV[3 * i - 1]), current))
+    end
+end
+return 0
+"""
+
+RELEASE_GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+for i = 1, #KEYS do
+    local tat = tonumber(redis.call('GET', KEYS[i]) or '0')
+    if tat > now then
+        local interval = tonumber(ARGV[3 * i + 1]) / tonumber(ARGV[3 * i])
+        local new_tat = math.max(tat - tonumber(ARGV[3 * i - 1]) * interval, now)
+        redis.call('SET', KEYS[i], string.format('%.3f', new_tat), 'PX', math.max(math.ceil(new_tat - now), 1))
+    end
+end
+return 0
+"""
+
+RELEASE_SCRIPTS = {
+    'fixed_window': RELEASE_COUNTER_SCRIPT,
+    'sliding_window': RELEASE_COUNTER_SCRIPT,
+    'gcra': RELEASE_GCRA_SCRIPT,
+}
 
 
 class RateLimitExceeded(Exception):
     """Raised when rate limit is exceeded"""
 
-    def __init__(self, limit_type: str, retry_after: int) -> Any:
+    def __init__(self, limit_type: str, retry_after: int) -> None:
         self.limit_type = limit_type
         self.retry_after = retry_after
         super().__init__(f"Rate limit exceeded: {limit_type}. Retry after {retry_after} seconds")
@@ -30,24 +197,41 @@ class RateLimitExceeded(Exception):
 
 class RedisRateLimiter:
     """
-    Redis-based rate limiter using token bucket algorithm
+    Redis-based rate limiter
 
     Features:
     - Per-client rate limiting
     - Per-tool rate limiting
     - Global rate limiting
+    - All limits checked atomically in one round trip (Lua script)
+    - Fixed window, sliding window or GCRA algorithms
+    - Async client for the request path, sync client for sync callers
     - Automatic key expiration
     - Graceful degradation if Redis unavailable
     """
 
-    def __init__(self) -> Any:
-        """Initialize rate limiter with Redis connection"""
+    def __init__(self, algorithm: str = RATE_LIMIT_ALGORITHM) -> None:
+        """
+        Initialize rate limiter with Redis connection
+
+        Args:
+            algorithm: 'fixed_window', 'sliding_window' or 'gcra'
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown rate limit algorithm: {algorithm}. Must be one of: {', '.join(ALGORITHMS)}")
+
         self.enabled = RATE_LIMIT_ENABLED
+        self.algorithm = algorithm
         self.redis_client = None
+        self.async_redis_client = None
+        self._script = None
+        self._async_script = None
+        self._async_release_script = None
 
         if self.enabled:
             try:
                 import redis
+                import redis.asyncio as redis_asyncio
                 redis_url = os.getenv('REDIS_URL')
 
                 if redis_url:
@@ -59,7 +243,23 @@ class RedisRateLimiter:
                     )
                     # Test connection
                     self.redis_client.ping()
-                    logger.info("rate_limiter_initialized", redis_url=redis_url.split('@')[-1])
+
+                    self.async_redis_client = redis_asyncio.from_url(
+                        redis_url,
+                        socket_connect_timeout=2,
+                        socket_timeout=2,
+                        decode_responses=True
+                    )
+                    self._script = self.redis_client.register_script(SCRIPTS[algorithm])
+                    self._async_script = self.async_redis_client.register_script(SCRIPTS[algorithm])
+                    self._async_release_script = self.async_redis_client.register_script(
+                        RELEASE_SCRIPTS[algorithm]
+                    )
+                    logger.info(
+                        "rate_limiter_initialized",
+                        redis_url=redis_url.split('@')[-1],
+                        algorithm=algorithm
+                    )
                 else:
                     logger.warning("rate_limiter_disabled", reason="REDIS_URL not configured")
                     self.enabled = False
@@ -68,89 +268,139 @@ class RedisRateLimiter:
                 logger.error("rate_limiter_init_failed", error=str(e))
                 self.enabled = False
 
-    def _generate_key(self, identifier: str, window: str) -> str:
+    def _generate_key(self, identifier: str, window: str, timestamp: Optional[float] = None,
+                      bucket_offset: int = 0) -> str:
         """
         Generate Redis key for rate limiting
 
         Args:
             identifier: Client ID, tool name, or 'global'
             window: Time window ('minute' or 'hour')
+            timestamp: Request time (default: now)
+            bucket_offset: Window offset from the current one (-1 for the previous window)
 
         Returns:
             Redis key string
         """
         # Hash identifier for privacy
         hashed = hashlib.sha256(identifier.encode()).hexdigest()[:16]
-        timestamp = int(time.time())
 
-        if window == 'minute':
-            bucket = timestamp // 60
-        elif window == 'hour':
-            bucket = timestamp // 3600
-        else:
-            bucket = timestamp // 60
+        if self.algorithm == 'gcra':
+            # One TAT key per identifier and window, no time buckets
+            return f"ratelimit:gcra:{window}:{hashed}"
+
+        timestamp = int(time.time() if timestamp is None else timestamp)
+        bucket = timestamp // WINDOW_SECONDS.get(window, 60) + bucket_offset
 
         return f"ratelimit:{window}:{hashed}:{bucket}"
 
-    def _check_limit(
-        self,
-        identifier: str,
-        limit: int,
-        window: str,
-        ttl: int
-    ) -> Tuple[bool, int]:
+    def _limit_specs(self, client_id: Optional[str] = None,
+                     tool_name: Optional[str] = None,
+                     include_global: bool = True) -> List[Tuple[str, str, int, str]]:
         """
-        Check if request is within rate limit
+        Limits that apply to a request, in the order they are reported
+
+        Returns:
+            List of (limit_type, identifier, limit, window)
+        """
+        specs = []
+        if include_global:
+            specs.append(("global", "global", MAX_REQUESTS_PER_MINUTE, "minute"))
+            specs.append(("global", "global", MAX_REQUESTS_PER_HOUR, "hour"))
+        if client_id is not None:
+            specs.append(("per_client", f"client:{client_id}", RATE_LIMIT_PER_CLIENT_PER_MINUTE, "minute"))
+            # 60 minutes worth
+            specs.append(("per_client", f"client:{client_id}", RATE_LIMIT_PER_CLIENT_PER_MINUTE * 60, "hour"))
+        if tool_name is not None:
+            specs.append(("per_tool", f"tool:{tool_name}", MAX_REQUESTS_PER_MINUTE, "minute"))
+        return specs
+
+    def _script_args(self, specs: List[Tuple[str, str, int, str]],
+                     now: Optional[float] = None,
+                     requested: int = 1) -> Tuple[List[str], List[int]]:
+        """
+        Build KEYS and ARGV for the configured script
 
         Args:
-            identifier: Unique identifier for this limit (client_id, tool_name, etc.)
-            limit: Maximum requests allowed
-            window: Time window ('minute' or 'hour')
-            ttl: Time-to-live for Redis key in seconds
+            specs: Limits from _limit_specs
+            now: Request time in seconds (default: now)
+            requested: Units to take from every limit (1 for a single request)
 
         Returns:
-            Tuple of (allowed: bool, retry_after: int)
+            Tuple of (keys, args)
         """
-        if not self.enabled or not self.redis_client:
-            return True, 0
+        now = time.time() if now is None else now
+        keys: List[str] = []
+        args: List[int] = [int(now * 1000), requested]
+
+        for _, identifier, limit, window in specs:
+            keys.append(self._generate_key(identifier, window, now))
+            if self.algorithm == 'sliding_window':
+                keys.append(self._generate_key(identifier, window, now, bucket_offset=-1))
+            args.extend([limit, WINDOW_SECONDS[window] * 1000])
+
+        return keys, args
+
+    def _interpret(self, specs: List[Tuple[str, str, int, str]],
+                   result: List[Any]) -> Tuple[bool, Optional[str], Optional[int]]:
+        """Convert a script result into (allowed, limit_type, retry_after seconds)"""
+        granted, index, retry_ms = int(result[0]), int(result[1]), int(result[2])
+        if granted > 0:
+            return True, None, None
 
-        try:
-            key = self._generate_key(identifier, window)
+        limit_type, identifier, limit, window = specs[index - 1]
+        retry_after = max(-(-retry_ms // 1000), 0)  # round up to whole seconds
+
+        logger.warning(
+            "rate_limit_exceeded",
+            identifier=identifier[:32],  # Truncate for logging
+            window=window,
+            limit=limit,
+            algorithm=self.algorithm,
+            retry_after=retry_after
+        )
 
-            # Increment counter
-            current = self.redis_client.incr(key)
+        return False, limit_type, retry_after
 
-            # Set expiration on first request
-            if current == 1:
-                self.redis_client.expire(key, ttl)
+    def _evaluate(self, specs: List[Tuple[str, str, int, str]]) -> Tuple[bool, Optional[str], Optional[int]]:
+        """
+        Check and record all limits in one round trip (sync client)
 
-            # Check if limit exceeded
-            if current > limit:
-                # Calculate retry_after based on TTL
-                ttl_remaining = self.redis_client.ttl(key)
-                retry_after = max(ttl_remaining, 0)
+        Returns:
+            Tuple of (allowed, limit_type, retry_after)
+        """
+        if not self.enabled or not self._script:
+            return True, None, None
 
-                logger.warning(
-                    "rate_limit_exceeded",
-                    identifier=identifier[:32],  # Truncate for logging
-                    window=window,
-                    current=current,
-                    limit=limit,
-                    retry_after=retry_after
-                )
+        try:
+            keys, args = self._script_args(specs)
+            return self._interpret(specs, self._script(keys=keys, args=args))
+        except Exception as e:
+            # Fail open if Redis is unavailable (allows request)
+            logger.error("rate_limit_check_failed", error=str(e))
+            return True, None, None
 
-                return False, retry_after
+    async def _evaluate_async(self, specs: List[Tuple[str, str, int, str]]) -> Tuple[bool, Optional[str], Optional[int]]:
+        """
+        Check and record all limits in one round trip (async client)
 
-            return True, 0
+        Returns:
+            Tuple of (allowed, limit_type, retry_after)
+        """
+        if not self.enabled or not self._async_script:
+            return True, None, None
 
+        try:
+            keys, args = self._script_args(specs)
+            return self._interpret(specs, await self._async_script(keys=keys, args=args))
         except Exception as e:
             # Fail open if Redis is unavailable (allows request)
             logger.error("rate_limit_check_failed", error=str(e))
-            return True, 0
+            return True, None, None
 
     def check_client_limit(self, client_id: str) -> Tuple[bool, Optional[int]]:
         """
-        Check per-client rate limit
+        Check per-client rate limit (minute and hour)
 
         Args:
             client_id: Client identifier
@@ -158,26 +408,8 @@ class RedisRateLimiter:
         Returns:
             Tuple of (allowed: bool, retry_after: Optional[int])
         """
-        # Per-minute check
-        allowed, retry_after = self._check_limit(
-            f"client:{client_id}",
-            RATE_LIMIT_PER_CLIENT_PER_MINUTE,
-            "minute",
-            60
-        )
-
-        if not allowed:
-            return False, retry_after
-
-        # Per-hour check
-        allowed, retry_after = self._check_limit(
-            f"client:{client_id}",
-            RATE_LIMIT_PER_CLIENT_PER_MINUTE * 60,  # 60 minutes worth
-            "hour",
-            3600
-        )
-
-        return allowed, retry_after if not allowed else None
+        allowed, _, retry_after = self._evaluate(self._limit_specs(client_id=client_id, include_global=False))
+        return allowed, retry_after
 
     def check_tool_limit(self, tool_name: str) -> Tuple[bool, Optional[int]]:
         """
@@ -189,51 +421,46 @@ class RedisRateLimiter:
         Returns:
             Tuple of (allowed: bool, retry_after: Optional[int])
         """
-        # Per-minute check for this specific tool
-        allowed, retry_after = self._check_limit(
-            f"tool:{tool_name}",
-            MAX_REQUESTS_PER_MINUTE,
-            "minute",
-            60
-        )
-
-        return allowed, retry_after if not allowed else None
+        allowed, _, retry_after = self._evaluate(self._limit_specs(tool_name=tool_name, include_global=False))
+        return allowed, retry_after
 
     def check_global_limit(self) -> Tuple[bool, Optional[int]]:
         """
-        Check global rate limit across all clients and tools
+        Check global rate limit across all clients and tools (minute and hour)
 
         Returns:
             Tuple of (allowed: bool, retry_after: Optional[int])
         """
-        # Global per-minute check
-        allowed, retry_after = self._check_limit(
-            "global",
-            MAX_REQUESTS_PER_MINUTE,
-            "minute",
-            60
-        )
+        allowed, _, retry_after = self._evaluate(self._limit_specs())
+        return allowed, retry_after
 
-        if not allowed:
-            return False, retry_after
-
-        # Global per-hour check
-        allowed, retry_after = self._check_limit(
-            "global",
-            MAX_REQUESTS_PER_HOUR,
-            "hour",
-            3600
-        )
+    def check_all_limits(
+        self,
+        client_id: str,
+        tool_name: str
+    ) -> Tuple[bool, Optional[str], Optional[int]]:
+        """
+        Check all rate limits (global, client, and tool) in one atomic round trip
 
-        return allowed, retry_after if not allowed else None
+        Args:
+            client_id: Client identifier
+            tool_name: Tool name
 
-    def check_all_limits(
+        Returns:
+            Tuple of (allowed: bool, limit_type: Optional[str], retry_after: Optional[int])
+        """
+        if not self.enabled:
+            return True, None, None
+
+        return self._evaluate(self._limit_specs(client_id, tool_name))
+
+    async def check_all_limits_async(
         self,
         client_id: str,
         tool_name: str
     ) -> Tuple[bool, Optional[str], Optional[int]]:
         """
-        Check all rate limits (client, tool, and global)
+        Async variant of check_all_limits for use on the event loop
 
         Args:
             client_id: Client identifier
@@ -245,33 +472,418 @@ class RedisRateLimiter:
         if not self.enabled:
             return True, None, None
 
-        # Check global limit first (fastest to fail)
-        allowed, retry_after = self.check_global_limit()
-        if not allowed:
-            return False, "global", retry_after
+        return await self._evaluate_async(self._limit_specs(client_id, tool_name))
+
+
+class LeasedBucket:
+    """Tokens leased from Redis for one (identifier, window) limit"""
+
+    __slots__ = ('limit', 'window', 'chunk', 'tokens', 'expires_at', 'denied_until', 'refill_task',
+                 'grants', 'expired')
+
+    def __init__(self, limit: int, window: str) -> None:
+        self.limit = limit
+        self.window = window
+        self.chunk = max(1, min(RATE_LIMIT_LEASE_MAX, int(limit * RATE_LIMIT_LEASE_FRACTION)))
+        self.tokens = 0
+        self.expires_at = 0.0
+        self.denied_until = 0.0
+        self.refill_task: Optional[asyncio.Task] = None
+        # [Redis key, units] per lease still backing the tokens, oldest first
+        self.grants: List[List[Any]] = []
+        # (Redis key, units) dropped unused and not yet returned to Redis
+        self.expired: List[Tuple[str, int]] = []
+
+    def add(self, key: str, granted: int, now: float, expires_at: float) -> None:
+        """Record a lease of `granted` units taken from the Redis key `key`"""
+        self.tokens = self.available(now) + granted
+        self.expires_at = expires_at
+        if self.grants and self.grants[-1][0] == key:
+            self.grants[-1][1] += granted
+        else:
+            self.grants.append([key, granted])
+
+        # Used tokens are attributed to the oldest leases; forget leases fully used
+        covered = 0
+        for i in range(len(self.grants) - 1, -1, -1):
+            covered += self.grants[i][1]
+            if covered >= self.tokens:
+                del self.grants[:i]
+                break
+
+    def drop(self) -> None:
+        """Give up the unused tokens, queueing them to be returned to Redis"""
+        unused = self.tokens
+        for key, units in reversed(self.grants):
+            if unused <= 0:
+                break
+            self.expired.append((key, min(units, unused)))
+            unused -= units
+        self.tokens = 0
+        self.grants = []
+
+    def available(self, now: float) -> int:
+        """Unexpired leased tokens"""
+        if now >= self.expires_at and self.grants:
+            self.drop()
+        return self.tokens
+
+    def needs_refill(self, now: float) -> bool:
+        """True once the lease has dropped to its low-water mark"""
+        return self.available(now) <= self.chunk // 2 and self.refill_task is None
+
+    def idle(self, now: float) -> bool:
+        """True when dropping the bucket loses nothing (no lease, denial or refill)"""
+        return now >= self.expires_at and now >= self.denied_until and self.refill_task is None
+
+
+class LocalBucket:
+    """Classic token bucket used while Redis is unavailable"""
+
+    __slots__ = ('capacity', 'rate', 'tokens', 'updated')
+
+    def __init__(self, limit: int, window: str, now: float) -> None:
+        self.capacity = max(1, limit // max(1, RATE_LIMIT_EXPECTED_REPLICAS))
+        self.rate = self.capacity / WINDOW_SECONDS[window]
+        self.tokens = float(self.capacity)
+        self.updated = now
+
+    def refill(self, now: float) -> float:
+        """Add tokens for the time elapsed since the last call"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        return self.tokens
+
+    def retry_after(self) -> int:
+        """Seconds until one token is available"""
+        return max(1, int(-(-(1 - self.tokens) // self.rate)))
+
+
+class HybridRateLimiter:
+    """
+    Local token tier in front of RedisRateLimiter
+
+    Each process leases chunks of quota from Redis per (identifier, window)
+    and decides requests locally while its leases last; leases are topped up
+    in the background at a low-water mark. Limits therefore hold across
+    replicas up to the tokens leased but not yet used (at most one chunk per
+    limit per replica). Tokens still unused when a lease expires after
+    RATE_LIMIT_LEASE_TTL, or when its bucket is pruned, are returned to Redis,
+    so slow clients are charged for the requests they make rather than for
+    whole chunks.
+
+    Leases are taken per limit rather than in one script call for all limits:
+    a lease refused by one limit does not undo the grants on the others. Those
+    tokens are not lost; other requests use them or they are returned when
+    the lease expires. Redis mode keeps the all-limits atomic check.
+
+    When Redis fails or does not answer within RATE_LIMIT_REDIS_TIMEOUT_MS the
+    limiter switches to RATE_LIMIT_DEGRADED_MODE for RATE_LIMIT_REDIS_BACKOFF
+    seconds instead of blocking requests on the Redis socket timeout.
+    """
 
-        # Check per-client limit
-        allowed, retry_after = self.check_client_limit(client_id)
-        if not allowed:
-            return False, "per_client", retry_after
+    def __init__(self, redis_limiter: Optional[RedisRateLimiter] = None,
+                 degraded_mode: str = RATE_LIMIT_DEGRADED_MODE,
+                 redis_timeout_ms: int = RATE_LIMIT_REDIS_TIMEOUT_MS) -> None:
+        """
+        Initialize hybrid rate limiter
 
-        # Check per-tool limit
-        allowed, retry_after = self.check_tool_limit(tool_name)
-        if not allowed:
-            return False, "per_tool", retry_after
+        Args:
+            redis_limiter: Limiter used for leasing (default: a new RedisRateLimiter)
+            degraded_mode: Behaviour while Redis is unavailable ('local', 'open' or 'closed')
+            redis_timeout_ms: Time to wait for a lease before degrading
+        """
+        if degraded_mode not in DEGRADED_MODES:
+            raise ValueError(
+                f"Unknown degraded mode '{degraded_mode}', expected one of {DEGRADED_MODES}"
+            )
+
+        self.redis = redis_limiter or RedisRateLimiter()
+        self.degraded_mode = degraded_mode
+        self.redis_timeout = redis_timeout_ms / 1000
+        self._leases: Dict[Tuple[str, str], LeasedBucket] = {}
+        self._local: Dict[Tuple[str, str], LocalBucket] = {}
+        self._release_tasks: Set[asyncio.Task] = set()
+        self._redis_down_until = 0.0
+        self._next_prune = time.monotonic() + RATE_LIMIT_PRUNE_INTERVAL
+        self.stats = {
+            'local_decisions': 0,
+            'lease_waits': 0,
+            'leases': 0,
+            'lease_failures': 0,
+            'cached_denials': 0,
+            'degraded_decisions': 0,
+            'pruned_buckets': 0,
+            'released_tokens': 0,
+            'release_failures': 0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self.redis.enabled
+
+    def _bucket(self, spec: Tuple[str, str, int, str]) -> LeasedBucket:
+        _, identifier, limit, window = spec
+        bucket = self._leases.get((identifier, window))
+        if bucket is None or bucket.limit != limit:
+            if bucket is not None:
+                bucket.drop()
+                self._release_expired([bucket])
+            bucket = self._leases[(identifier, window)] = LeasedBucket(limit, window)
+        return bucket
+
+    def _release_expired(self, buckets: Iterable[LeasedBucket]) -> None:
+        """Start returning the tokens the given buckets dropped to Redis"""
+        released = []
+        for bucket in buckets:
+            if bucket.expired:
+                released.extend((key, units, bucket.limit, bucket.window) for key, units in bucket.expired)
+                bucket.expired = []
+        if not released or self.redis._async_release_script is None:
+            return
+
+        task = asyncio.ensure_future(self._release(released))
+        self._release_tasks.add(task)
+        task.add_done_callback(self._release_tasks.discard)
+
+    async def _release(self, released: List[Tuple[str, int, int, str]]) -> None:
+        """Return unused leased units to Redis in one script call"""
+        keys: List[str] = []
+        args: List[int] = [int(time.time() * 1000)]
+        for key, units, limit, window in released:
+            keys.append(key)
+            args.extend([units, limit, WINDOW_SECONDS[window] * 1000])
+
+        units = sum(item[1] for item in released)
+        try:
+            await asyncio.wait_for(
+                self.redis._async_release_script(keys=keys, args=args),
+                timeout=self.redis_timeout
+            )
+            self.stats['released_tokens'] += units
+        except Exception as e:
+            self.stats['release_failures'] += 1
+            logger.warning("rate_limit_release_failed", error=str(e) or type(e).__name__, tokens=units)
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """
+        Drop buckets that no longer hold state
+
+        Leased buckets go once their lease has expired, no denial is cached
+        and no refill is running; local buckets go once refilled to capacity.
+        Either is recreated unchanged on the next request. Unused tokens of
+        expired leases are returned to Redis.
+
+        Returns:
+            Number of buckets removed
+        """
+        now = time.monotonic() if now is None else now
+        for bucket in self._leases.values():
+            bucket.available(now)
+        self._release_expired(self._leases.values())
+
+        idle_leases = [key for key, bucket in self._leases.items() if bucket.idle(now)]
+        for key in idle_leases:
+            del self._leases[key]
+        full_local = [key for key, bucket in self._local.items() if bucket.refill(now) >= bucket.capacity]
+        for key in full_local:
+            del self._local[key]
+
+        pruned = len(idle_leases) + len(full_local)
+        self.stats['pruned_buckets'] += pruned
+        self._next_prune = now + RATE_LIMIT_PRUNE_INTERVAL
+        return pruned
+
+    async def _lease(self, specs: List[Tuple[str, str, int, str]],
+                     buckets: List[LeasedBucket]) -> List[Tuple[str, List[Any]]]:
+        """
+        Request one chunk per bucket from Redis, concurrently
+
+        Returns:
+            (Redis key charged, script result {granted, failing index, retry_ms}) per bucket
+        """
+        script = self.redis._async_script
+        charged = []
+        calls = []
+        for spec, bucket in zip(specs, buckets):
+            keys, args = self.redis._script_args([spec], requested=bucket.chunk)
+            # The first key is the counter or TAT the grant is recorded on
+            charged.append(keys[0])
+            calls.append(script(keys=keys, args=args))
+        return list(zip(charged, await asyncio.gather(*calls)))
+
+    async def _refill(self, specs: List[Tuple[str, str, int, str]],
+                      buckets: List[LeasedBucket]) -> None:
+        """Lease tokens for the given buckets and record grants or denials"""
+        try:
+            results = await asyncio.wait_for(self._lease(specs, buckets), timeout=self.redis_timeout)
+        except Exception as e:
+            self._redis_down_until = time.monotonic() + RATE_LIMIT_REDIS_BACKOFF
+            self.stats['lease_failures'] += 1
+            logger.error(
+                "rate_limit_lease_failed",
+                error=str(e) or type(e).__name__,
+                degraded_mode=self.degraded_mode
+            )
+            return
+
+        now = time.monotonic()
+        ttl = RATE_LIMIT_LEASE_TTL
+        for bucket, (key, result) in zip(buckets, results):
+            granted, retry_ms = int(result[0]), int(result[2])
+            self.stats['leases'] += 1
+            if granted > 0:
+                bucket.add(key, granted, now, now + min(ttl, WINDOW_SECONDS[bucket.window]))
+            else:
+                bucket.denied_until = now + retry_ms / 1000
+        self._release_expired(buckets)
+
+    def _start_refill(self, specs: List[Tuple[str, str, int, str]],
+                      buckets: List[LeasedBucket]) -> asyncio.Task:
+        task = asyncio.ensure_future(self._refill(specs, buckets))
+
+        def done(_: asyncio.Task) -> None:
+            for bucket in buckets:
+                if bucket.refill_task is task:
+                    bucket.refill_task = None
+
+        for bucket in buckets:
+            bucket.refill_task = task
+        task.add_done_callback(done)
+        return task
+
+    def _denied(self, specs: List[Tuple[str, str, int, str]],
+                buckets: List[LeasedBucket],
+                now: float) -> Optional[Tuple[bool, Optional[str], Optional[int]]]:
+        """Rejection for the first limit Redis recently refused, if any"""
+        for spec, bucket in zip(specs, buckets):
+            if bucket.denied_until > now:
+                return False, spec[0], max(1, int(-(-(bucket.denied_until - now) // 1)))
+        return None
+
+    def _degraded(self, specs: List[Tuple[str, str, int, str]],
+                  now: float) -> Tuple[bool, Optional[str], Optional[int]]:
+        """Decide without Redis according to the degraded mode"""
+        self.stats['degraded_decisions'] += 1
+        if self.degraded_mode == 'open':
+            return True, None, None
+        if self.degraded_mode == 'closed':
+            return False, specs[0][0], max(1, int(self._redis_down_until - now))
+
+        buckets = []
+        for _, identifier, limit, window in specs:
+            bucket = self._local.get((identifier, window))
+            if bucket is None:
+                bucket = self._local[(identifier, window)] = LocalBucket(limit, window, now)
+            buckets.append(bucket)
+
+        for spec, bucket in zip(specs, buckets):
+            if bucket.refill(now) < 1:
+                return False, spec[0], bucket.retry_after()
+        for bucket in buckets:
+            bucket.tokens -= 1
+        return True, None, None
+
+    async def check_all_limits_async(
+        self,
+        client_id: str,
+        tool_name: str
+    ) -> Tuple[bool, Optional[str], Optional[int]]:
+        """
+        Check all rate limits, locally when leased tokens are available
+
+        Args:
+            client_id: Client identifier
+            tool_name: Tool name
+
+        Returns:
+            Tuple of (allowed: bool, limit_type: Optional[str], retry_after: Optional[int])
+        """
+        if not self.redis.enabled:
+            return True, None, None
+
+        now = time.monotonic()
+        if now >= self._next_prune:
+            self.prune(now)
+
+        specs = self.redis._limit_specs(client_id, tool_name)
+        buckets = [self._bucket(spec) for spec in specs]
+
+        denied = self._denied(specs, buckets, now)
+        if denied:
+            self.stats['cached_denials'] += 1
+            return denied
+
+        if now < self._redis_down_until:
+            return self._degraded(specs, now)
+
+        empty = [i for i, bucket in enumerate(buckets) if bucket.available(now) < 1]
+        self._release_expired(buckets)
+        if empty:
+            # Wait for leases on the empty buckets (joining refills already in flight)
+            self.stats['lease_waits'] += 1
+            missing = [i for i in empty if buckets[i].refill_task is None]
+            pending = {buckets[i].refill_task for i in empty if buckets[i].refill_task is not None}
+            if missing:
+                pending.add(self._start_refill([specs[i] for i in missing], [buckets[i] for i in missing]))
+            await asyncio.gather(*(asyncio.shield(task) for task in pending), return_exceptions=True)
+
+            now = time.monotonic()
+            denied = self._denied(specs, buckets, now)
+            if denied:
+                logger.warning(
+                    "rate_limit_exceeded",
+                    client_id=client_id[:32],
+                    tool_name=tool_name,
+                    limit_type=denied[1],
+                    retry_after=denied[2]
+                )
+                return denied
+            if now < self._redis_down_until or any(b.available(now) < 1 for b in buckets):
+                return self._degraded(specs, now)
+        else:
+            self.stats['local_decisions'] += 1
+
+        for bucket in buckets:
+            bucket.tokens -= 1
+
+        low = [i for i, bucket in enumerate(buckets) if bucket.needs_refill(now)]
+        if low:
+            self._start_refill([specs[i] for i in low], [buckets[i] for i in low])
 
         return True, None, None
 
+    def check_all_limits(
+        self,
+        client_id: str,
+        tool_name: str
+    ) -> Tuple[bool, Optional[str], Optional[int]]:
+        """Synchronous check, evaluated directly against Redis"""
+        return self.redis.check_all_limits(client_id, tool_name)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Local tier statistics"""
+        return {
+            **self.stats,
+            'leased_buckets': len(self._leases),
+            'local_buckets': len(self._local),
+            'degraded': time.monotonic() < self._redis_down_until,
+            'degraded_mode': self.degraded_mode,
+        }
+
 
 # Global rate limiter instance
 _rate_limiter = None
 
 
-def get_rate_limiter() -> RedisRateLimiter:
-    """Get or create global rate limiter instance"""
+def get_rate_limiter() -> Any:
+    """Get or create global rate limiter instance (RATE_LIMIT_MODE selects the tier)"""
     global _rate_limiter
     if _rate_limiter is None:
-        _rate_limiter = RedisRateLimiter()
+        if RATE_LIMIT_MODE == 'redis':
+            _rate_limiter = RedisRateLimiter()
+        else:
+            _rate_limiter = HybridRateLimiter()
     return _rate_limiter
 
 
@@ -296,8 +908,8 @@ def rate_limit(func) -> Any:
         # Get rate limiter
         limiter = get_rate_limiter()
 
-        # Check rate limits
-        allowed, limit_type, retry_after = limiter.check_all_limits(client_id, tool_name)
+        # Check rate limits (one non-blocking round trip)
+        allowed, limit_type, retry_after = await limiter.check_all_limits_async(client_id, tool_name)
 
         if not allowed:
             error_msg = (
@@ -9,6 +9,8 @@ from src.monitoring.performance_monitor import (
     monitor_api_call,
     record_cache_hit,
     record_cache_miss,
+    update_cache_size,
+    record_cache_eviction,
     monitor_health_score_calculation,
     update_memory_usage,
     PerformanceThreshold,
@@ -38,6 +40,8 @@ __all__ = [
     # Cache monitoring
     'record_cache_hit',
     'record_cache_miss',
+    'update_cache_size',
+    'record_cache_eviction',
 
     # Health score monitoring
     'monitor_health_score_calculation',
@@ -5,7 +5,7 @@ Serves metrics on /metrics endpoint for Prometheus scraping
 
 import threading
 from http.server import HTTPServer, BaseHTTPRequestHandler
-from typing import Optional
+from typing import Any, Optional
 import structlog
 
 logger = structlog.get_logger(__name__)
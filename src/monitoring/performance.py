@@ -3,10 +3,11 @@ Performance Monitoring for Sales MCP
 Tracks request latency, resource usage, and tool performance metrics
 """
 
+import math
 import time
 import functools
 import psutil
-from typing import Any, Callable, Dict, List, Optional, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 from datetime import datetime
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
@@ -30,6 +31,139 @@ THRESHOLDS = {
     'critical_latency_ms': 4000,      # Critical at 4 seconds
 }
 
+# Relative accuracy of latency percentiles (1% => p99 within +/-1% of true value)
+SKETCH_RELATIVE_ACCURACY = 0.01
+
+# Sliding windows reported per tool: name -> (window seconds, number of slots)
+LATENCY_WINDOWS = {
+    '1m': (60, 6),
+    '5m': (300, 10),
+    '1h': (3600, 12),
+}
+
+
+# ============================================================================
+# Latency Sketches
+# ============================================================================
+
+class LatencySketch:
+    """
+    Mergeable streaming quantile sketch with logarithmic buckets.
+
+    A value v lands in bucket ceil(log_gamma(v)) where
+    gamma = (1 + a) / (1 - a), so any quantile is returned within relative
+    accuracy a. Recording is O(1); a quantile query walks the (few hundred
+    at most) occupied buckets instead of sorting raw samples.
+    """
+
+    def __init__(self, relative_accuracy: float = SKETCH_RELATIVE_ACCURACY) -> Any:
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.min_indexable = 1e-3  # values below 1 microsecond count as zero
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        """Record a value"""
+        if value <= self.min_indexable:
+            self.zero_count += 1
+        else:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[index] = self.buckets.get(index, 0) + 1
+
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: 'LatencySketch') -> 'LatencySketch':
+        """Merge another sketch (same accuracy) into this one"""
+        for index, bucket_count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + bucket_count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile (0 <= q <= 1)"""
+        if self.count == 0:
+            return 0.0
+
+        rank = min(int(q * self.count), self.count - 1)
+        if rank < self.zero_count:
+            return max(self.min, 0.0)
+
+        seen = self.zero_count
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                value = 2 * self.gamma ** index / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class WindowedSketch:
+    """
+    Sliding time window over latency sketches.
+
+    The window is split into fixed slots, each with its own sketch and
+    error counter. Expired slots are dropped on write and skipped on read,
+    so queries reflect only the last `window_seconds`.
+    """
+
+    def __init__(self, window_seconds: float, slots: int,
+                 relative_accuracy: float = SKETCH_RELATIVE_ACCURACY) -> Any:
+        self.window_seconds = window_seconds
+        self.slot_seconds = window_seconds / slots
+        self.relative_accuracy = relative_accuracy
+        self._slots: deque = deque()  # (slot_id, sketch, error_count)
+
+    def _expire(self, now: float) -> None:
+        oldest_live = int(now // self.slot_seconds) - int(self.window_seconds // self.slot_seconds) + 1
+        while self._slots and self._slots[0][0] < oldest_live:
+            self._slots.popleft()
+
+    def add(self, value: float, success: bool = True, now: Optional[float] = None) -> None:
+        """Record a value at time `now` (defaults to current time)"""
+        now = time.time() if now is None else now
+        slot_id = int(now // self.slot_seconds)
+        self._expire(now)
+
+        if not self._slots or self._slots[-1][0] < slot_id:
+            self._slots.append([slot_id, LatencySketch(self.relative_accuracy), 0])
+
+        slot = self._slots[-1]
+        slot[1].add(value)
+        if not success:
+            slot[2] += 1
+
+    def snapshot(self, now: Optional[float] = None) -> Tuple['LatencySketch', int]:
+        """Merge live slots into a single sketch and error count"""
+        now = time.time() if now is None else now
+        self._expire(now)
+
+        merged = LatencySketch(self.relative_accuracy)
+        errors = 0
+        for _, sketch, error_count in self._slots:
+            merged.merge(sketch)
+            errors += error_count
+        return merged, errors
+
 
 # ============================================================================
 # Performance Data Structures
@@ -69,7 +203,10 @@ class ToolStats:
     total_duration_ms: float = 0.0
     min_duration_ms: float = float('inf')
     max_duration_ms: float = 0.0
-    durations: deque = field(default_factory=lambda: deque(maxlen=1000))  # Keep last 1000
+    sketch: LatencySketch = field(default_factory=LatencySketch)
+    windows: Dict[str, WindowedSketch] = field(default_factory=lambda: {
+        name: WindowedSketch(seconds, slots) for name, (seconds, slots) in LATENCY_WINDOWS.items()
+    })
 
     @property
     def error_rate(self) -> float:
@@ -88,28 +225,31 @@ class ToolStats:
     @property
     def p50_duration_ms(self) -> float:
         """Calculate 50th percentile (median)"""
-        if not self.durations:
-            return 0.0
-        sorted_durations = sorted(self.durations)
-        return sorted_durations[len(sorted_durations) // 2]
+        return self.sketch.quantile(0.50)
 
     @property
     def p95_duration_ms(self) -> float:
         """Calculate 95th percentile"""
-        if not self.durations:
-            return 0.0
-        sorted_durations = sorted(self.durations)
-        index = int(len(sorted_durations) * 0.95)
-        return sorted_durations[index]
+        return self.sketch.quantile(0.95)
 
     @property
     def p99_duration_ms(self) -> float:
         """Calculate 99th percentile"""
-        if not self.durations:
-            return 0.0
-        sorted_durations = sorted(self.durations)
-        index = int(len(sorted_durations) * 0.99)
-        return sorted_durations[index]
+        return self.sketch.quantile(0.99)
+
+    def record_duration(self, duration_ms: float, success: bool, now: Optional[float] = None) -> None:
+        """Add a duration to the lifetime sketch and the sliding windows"""
+        self.sketch.add(duration_ms)
+        for window in self.windows.values():
+            window.add(duration_ms, success, now)
+
+    def window_stats(self, now: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """Calls, error rate and percentiles for each sliding window"""
+        result = {}
+        for name, window in self.windows.items():
+            sketch, errors = window.snapshot(now)
+            result[name] = _sketch_summary(sketch, errors)
+        return result
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -124,10 +264,23 @@ class ToolStats:
             "max_duration_ms": round(self.max_duration_ms, 2),
             "p50_duration_ms": round(self.p50_duration_ms, 2),
             "p95_duration_ms": round(self.p95_duration_ms, 2),
-            "p99_duration_ms": round(self.p99_duration_ms, 2)
+            "p99_duration_ms": round(self.p99_duration_ms, 2),
+            "windows": self.window_stats()
         }
 
 
+def _sketch_summary(sketch: LatencySketch, errors: int = 0) -> Dict[str, Any]:
+    """Summarize a sketch as calls, error rate and latency percentiles"""
+    return {
+        "calls": sketch.count,
+        "error_rate": round(errors / sketch.count, 4) if sketch.count else 0,
+        "avg_ms": round(sketch.mean, 2),
+        "p50_ms": round(sketch.quantile(0.50), 2),
+        "p95_ms": round(sketch.quantile(0.95), 2),
+        "p99_ms": round(sketch.quantile(0.99), 2)
+    }
+
+
 # ============================================================================
 # Performance Monitor
 # ============================================================================
@@ -161,7 +314,7 @@ class PerformanceMonitor:
         stats.total_duration_ms += metric.duration_ms
         stats.min_duration_ms = min(stats.min_duration_ms, metric.duration_ms)
         stats.max_duration_ms = max(stats.max_duration_ms, metric.duration_ms)
-        stats.durations.append(metric.duration_ms)
+        stats.record_duration(metric.duration_ms, metric.success, metric.end_time)
 
         # Store recent metric
         self.recent_metrics.append(metric)
@@ -216,19 +369,26 @@ class PerformanceMonitor:
         total_errors = sum(s.failed_calls for s in self.tool_stats.values())
         uptime_seconds = time.time() - self.start_time
 
-        # Calculate overall metrics
-        all_durations = []
+        # Calculate overall metrics by merging per-tool sketches
+        overall = LatencySketch()
         for stats in self.tool_stats.values():
-            all_durations.extend(stats.durations)
-
-        if all_durations:
-            sorted_durations = sorted(all_durations)
-            avg_duration = sum(sorted_durations) / len(sorted_durations)
-            p50 = sorted_durations[len(sorted_durations) // 2]
-            p95 = sorted_durations[int(len(sorted_durations) * 0.95)]
-            p99 = sorted_durations[int(len(sorted_durations) * 0.99)]
-        else:
-            avg_duration = p50 = p95 = p99 = 0
+            overall.merge(stats.sketch)
+
+        avg_duration = overall.mean
+        p50 = overall.quantile(0.50)
+        p95 = overall.quantile(0.95)
+        p99 = overall.quantile(0.99)
+
+        now = time.time()
+        windows = {}
+        for name in LATENCY_WINDOWS:
+            merged = LatencySketch()
+            errors = 0
+            for stats in self.tool_stats.values():
+                sketch, window_errors = stats.windows[name].snapshot(now)
+                merged.merge(sketch)
+                errors += window_errors
+            windows[name] = _sketch_summary(merged, errors)
 
         # Get memory info
         memory_info = self.process.memory_info()
@@ -245,7 +405,8 @@ class PerformanceMonitor:
                 "avg_ms": round(avg_duration, 2),
                 "p50_ms": round(p50, 2),
                 "p95_ms": round(p95, 2),
-                "p99_ms": round(p99, 2)
+                "p99_ms": round(p99, 2),
+                "windows": windows
             },
             "memory": {
                 "current_mb": round(memory_mb, 2),
@@ -138,6 +138,18 @@ cache_miss_counter = Counter(
     ['cache_type']
 )
 
+cache_entries = Gauge(
+    'cs_mcp_cache_entries',
+    'Number of entries held by an in-process cache',
+    ['cache_type']
+)
+
+cache_eviction_counter = Counter(
+    'cs_mcp_cache_evictions_total',
+    'Total number of in-process cache evictions',
+    ['cache_type', 'reason']
+)
+
 # Error metrics
 error_counter = Counter(
     'cs_mcp_errors_total',
@@ -559,6 +571,17 @@ def record_cache_miss(cache_type: str = "redis") -> Any:
     logger.debug("Cache miss", cache_type=cache_type)
 
 
+def update_cache_size(cache_type: str, size: int) -> Any:
+    """Record the current number of entries in an in-process cache"""
+    cache_entries.labels(cache_type=cache_type).set(size)
+
+
+def record_cache_eviction(cache_type: str, reason: str = "size") -> Any:
+    """Record an in-process cache eviction ('size' or 'idle')"""
+    cache_eviction_counter.labels(cache_type=cache_type, reason=reason).inc()
+    logger.debug("Cache eviction", cache_type=cache_type, reason=reason)
+
+
 # ============================================================================
 # Health Score Monitoring
 # ============================================================================
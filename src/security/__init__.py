@@ -9,6 +9,7 @@ from .audit_logger import (
     AuditLog,
     AuditEventType,
     AuditSeverity,
+    get_audit_logger,
 )
 from .gdpr_compliance import (
     GDPRComplianceManager,
@@ -47,6 +48,7 @@ __all__ = [
     "AuditLog",
     "AuditEventType",
     "AuditSeverity",
+    "get_audit_logger",
     # GDPR compliance
     "GDPRComplianceManager",
     "GDPRRequest",
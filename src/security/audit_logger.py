@@ -5,8 +5,12 @@ Provides immutable audit trails for all system operations with full compliance t
 
 import os
 import json
+import atexit
+import asyncio
 import hashlib
-from typing import Dict, Optional, Any, List
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Any, List, Iterator, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 from enum import Enum
@@ -14,6 +18,17 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Buffered writer configuration from environment
+AUDIT_ASYNC_WRITES = os.getenv('AUDIT_ASYNC_WRITES', 'false').lower() == 'true'
+AUDIT_FLUSH_INTERVAL_MS = int(os.getenv('AUDIT_FLUSH_INTERVAL_MS', '200'))
+AUDIT_MAX_PENDING = int(os.getenv('AUDIT_MAX_PENDING', '10000'))
+AUDIT_FSYNC_POLICY = os.getenv('AUDIT_FSYNC_POLICY', 'none')  # 'none' or 'batch'
+
+# Log files whose parsed sidecar index is kept in memory
+AUDIT_INDEX_CACHE_FILES = int(os.getenv('AUDIT_INDEX_CACHE_FILES', '32'))
+# Entries appended per client before the in-memory chain tip is persisted
+AUDIT_TIP_PERSIST_EVERY = int(os.getenv('AUDIT_TIP_PERSIST_EVERY', '100'))
+
 
 class AuditEventType(Enum):
     """Types of auditable events."""
@@ -174,13 +189,38 @@ class AuditLogger:
     - GDPR-compliant data retention
     - Tamper detection
     - Efficient searching and filtering
+
+    Storage layout per client:
+    - ``audit_<client>_<date>.jsonl``: append-only log entries
+    - ``audit_<client>_<date>.idx``: sidecar index, one JSON line per entry with
+      byte offset/length, timestamp, event type, user and hash
+    - ``audit_<client>.tip``: persisted chain tip (last hash, file and size)
+      plus the incremental verification checkpoint
+
+    Filtered reads load the small sidecar indexes and seek straight to the
+    matching entries; files outside a date range are skipped by name. The
+    chain tip makes ``_get_last_hash`` O(1) after a restart. It is kept in
+    memory per client and persisted every ``tip_persist_every`` entries and
+    on ``flush()``/``shutdown()``/exit; a stale tip (its file has grown since)
+    is ignored in favour of the index.
+
+    Buffered mode (``async_writes=True``): ``log()`` hashes and chains the
+    entry in memory and returns immediately; a background task started with
+    ``start_writer()`` group-commits pending entries per client every
+    ``flush_interval_ms``. Call ``shutdown()`` (or ``flush()``) to drain.
     """
 
     def __init__(
         self,
         log_directory: Path,
         retention_days: int = 2555,  # 7 years for GDPR compliance
-        max_file_size_mb: int = 100
+        max_file_size_mb: int = 100,
+        async_writes: bool = AUDIT_ASYNC_WRITES,
+        flush_interval_ms: int = AUDIT_FLUSH_INTERVAL_MS,
+        max_pending: int = AUDIT_MAX_PENDING,
+        fsync_policy: str = AUDIT_FSYNC_POLICY,
+        index_cache_files: int = AUDIT_INDEX_CACHE_FILES,
+        tip_persist_every: int = AUDIT_TIP_PERSIST_EVERY
     ) -> Any:
         """
         Initialize the audit logger.
@@ -189,7 +229,16 @@ class AuditLogger:
             log_directory: Directory for storing audit logs
             retention_days: Number of days to retain logs (default 7 years)
             max_file_size_mb: Maximum size of a single log file before rotation
+            async_writes: Buffer entries and group-commit them in the background
+            flush_interval_ms: Background flush interval in buffered mode
+            max_pending: Pending entries that force an inline flush (backpressure)
+            fsync_policy: 'none' (leave to the OS) or 'batch' (fsync every commit)
+            index_cache_files: Log files whose parsed index is kept (least recently used dropped)
+            tip_persist_every: Entries appended per client before the chain tip is persisted
         """
+        if fsync_policy not in ('none', 'batch'):
+            raise ValueError("fsync_policy must be 'none' or 'batch'")
+
         self.log_directory = Path(log_directory)
         self.log_directory.mkdir(parents=True, exist_ok=True)
 
@@ -199,6 +248,35 @@ class AuditLogger:
         # Cache the last hash for chain continuity
         self._last_hash_cache: Dict[str, Optional[str]] = {}
 
+        # Parsed sidecar indexes, least recently used first:
+        # log file -> (index bytes consumed, entries)
+        self._index_cache: "OrderedDict[Path, Tuple[int, List[Dict[str, Any]]]]" = OrderedDict()
+        self.index_cache_files = max(1, index_cache_files)
+
+        # Chain tips, loaded once per client; entries appended since each
+        # client's tip was last persisted
+        self._tips: Dict[str, Dict[str, Any]] = {}
+        self._unsaved_tips: Dict[str, int] = {}
+        self.tip_persist_every = max(1, tip_persist_every)
+
+        # Serializes file appends, index updates and tip writes
+        self._write_lock = threading.RLock()
+
+        # Buffered writer state. _chain_lock orders hash chaining with
+        # enqueueing; _flush_lock keeps batches on disk in chain order.
+        self.async_writes = async_writes
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_pending = max_pending
+        self.fsync = fsync_policy == 'batch'
+        self._chain_lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._pending: Dict[str, List[AuditLog]] = {}
+        self._pending_count = 0
+        self._writer_task: Optional[asyncio.Task] = None
+
+        # Last-resort drain (and tip persist) if the process exits without shutdown()
+        atexit.register(self.flush)
+
         logger.info(
             "audit_logger_initialized",
             log_directory=str(log_directory),
@@ -229,25 +307,35 @@ class AuditLogger:
             Event ID of the created log entry
         """
         try:
-            # Get the previous hash for chain continuity
-            previous_hash = self._get_last_hash(client_id)
-
-            # Create the audit log entry
-            audit_log = AuditLog(
-                event_type=event_type,
-                client_id=client_id,
-                user_id=user_id,
-                severity=severity,
-                description=description,
-                metadata=metadata,
-                previous_hash=previous_hash
-            )
-
-            # Write to log file
-            self._write_log_entry(client_id, audit_log)
-
-            # Update the last hash cache
-            self._last_hash_cache[client_id] = audit_log.hash
+            with self._chain_lock:
+                # Get the previous hash for chain continuity
+                previous_hash = self._get_last_hash(client_id)
+
+                # Create the audit log entry
+                audit_log = AuditLog(
+                    event_type=event_type,
+                    client_id=client_id,
+                    user_id=user_id,
+                    severity=severity,
+                    description=description,
+                    metadata=metadata,
+                    previous_hash=previous_hash
+                )
+
+                if self.async_writes:
+                    # Queue for the next group commit
+                    self._pending.setdefault(client_id, []).append(audit_log)
+                    self._pending_count += 1
+                else:
+                    # Write to log file
+                    self._write_log_entries(client_id, [audit_log], fsync=self.fsync)
+
+                # Update the last hash cache
+                self._last_hash_cache[client_id] = audit_log.hash
+
+            if self.async_writes and self._pending_count >= self.max_pending:
+                # Queue is full: commit inline rather than grow without bound
+                self.flush()
 
             # Log to structured logger as well
             logger.info(
@@ -269,6 +357,73 @@ class AuditLogger:
             )
             raise
 
+    def flush(self) -> int:
+        """
+        Group-commit all pending entries, one append per client, and persist
+        the chain tips.
+
+        Returns:
+            Number of entries written
+        """
+        with self._flush_lock:
+            with self._chain_lock:
+                pending = self._pending
+                self._pending = {}
+                self._pending_count = 0
+
+            written = 0
+            for client_id, entries in pending.items():
+                try:
+                    self._write_log_entries(client_id, entries, fsync=self.fsync)
+                    written += len(entries)
+                except Exception as e:
+                    # Put entries back ahead of anything queued since, so
+                    # the chain order on disk is preserved for the retry
+                    with self._chain_lock:
+                        self._pending[client_id] = entries + self._pending.get(client_id, [])
+                        self._pending_count += len(entries)
+                    logger.error(
+                        "audit_log_flush_failed",
+                        client_id=client_id,
+                        pending=len(entries),
+                        error=str(e)
+                    )
+
+            self._persist_tips()
+            return written
+
+    async def start_writer(self) -> None:
+        """Start the background group-commit task (buffered mode only)."""
+        if not self.async_writes or (self._writer_task and not self._writer_task.done()):
+            return
+        self._writer_task = asyncio.create_task(self._writer_loop())
+        logger.info("audit_writer_started", flush_interval=self.flush_interval, fsync=self.fsync)
+
+    async def _writer_loop(self) -> None:
+        """Flush pending entries every flush interval, off the event loop."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if self._pending_count:
+                await asyncio.to_thread(self.flush)
+
+    async def shutdown(self) -> int:
+        """
+        Stop the background writer and drain pending entries.
+
+        Returns:
+            Number of entries written by the final drain
+        """
+        if self._writer_task:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+        written = await asyncio.to_thread(self.flush)
+        logger.info("audit_writer_stopped", drained=written)
+        return written
+
     def get_logs(
         self,
         client_id: str,
@@ -293,34 +448,51 @@ class AuditLogger:
             List of audit log entries
         """
         try:
+            if self._pending_count:
+                self.flush()
+
             logs = []
             log_files = self._get_log_files(client_id)
 
+            start_day = start_date.strftime("%Y%m%d") if start_date else None
+            end_day = end_date.strftime("%Y%m%d") if end_date else None
+            event_value = event_type.value if event_type else None
+
             for log_file in log_files:
                 if len(logs) >= limit:
                     break
 
-                file_logs = self._read_log_file(log_file)
-
-                for log in file_logs:
-                    # Apply filters
-                    if event_type and log.event_type != event_type:
+                # Files are named by entry date, so whole files outside the
+                # requested range are skipped without touching their index
+                file_day = self._file_date(log_file, client_id)
+                if file_day:
+                    if start_day and file_day < start_day:
                         continue
-
-                    if start_date and log.timestamp < start_date:
+                    if end_day and file_day > end_day:
                         continue
 
-                    if end_date and log.timestamp > end_date:
+                offsets = []
+                for entry in self._load_index(log_file):
+                    if event_value and entry['e'] != event_value:
                         continue
 
-                    if user_id and log.user_id != user_id:
+                    if user_id and entry['u'] != user_id:
                         continue
 
-                    logs.append(log)
+                    if start_date or end_date:
+                        timestamp = datetime.fromisoformat(entry['t'])
+                        if start_date and timestamp < start_date:
+                            continue
+                        if end_date and timestamp > end_date:
+                            continue
+
+                    offsets.append((entry['o'], entry['n']))
 
-                    if len(logs) >= limit:
+                    if len(logs) + len(offsets) >= limit:
                         break
 
+                logs.extend(self._read_entries_at(log_file, offsets))
+
             return logs
 
         except Exception as e:
@@ -331,24 +503,40 @@ class AuditLogger:
             )
             return []
 
-    def verify_chain_integrity(self, client_id: str) -> bool:
+    def verify_chain_integrity(self, client_id: str, incremental: bool = False) -> bool:
         """
         Verify the integrity of the audit log chain for a client.
 
         Args:
             client_id: Client identifier
+            incremental: Resume from the last verified checkpoint instead of
+                re-verifying the full history
 
         Returns:
             True if the chain is intact and unmodified
         """
         try:
+            if self._pending_count:
+                self.flush()
+
             log_files = self._get_log_files(client_id)
             previous_hash = None
-
+            resume_file = None
+            resume_offset = 0
+
+            checkpoint = self._tip(client_id).get('verified') if incremental else None
+            if checkpoint and (self.log_directory / checkpoint['file']).exists():
+                resume_file = checkpoint['file']
+                resume_offset = checkpoint['offset']
+                previous_hash = checkpoint['hash']
+                log_files = [f for f in log_files if f.name >= resume_file]
+
+            last_file = None
+            last_offset = 0
             for log_file in log_files:
-                logs = self._read_log_file(log_file)
+                offset = resume_offset if log_file.name == resume_file else 0
 
-                for log in logs:
+                for log, end_offset in self._iter_log_file(log_file, offset):
                     # Verify individual log integrity
                     if not log.verify_integrity():
                         logger.error(
@@ -371,8 +559,19 @@ class AuditLogger:
                         return False
 
                     previous_hash = log.hash
-
-            logger.info("audit_chain_verified", client_id=client_id)
+                    last_file = log_file
+                    last_offset = end_offset
+
+            if last_file is not None:
+                with self._write_lock:
+                    self._tip(client_id)['verified'] = {
+                        'file': last_file.name,
+                        'offset': last_offset,
+                        'hash': previous_hash
+                    }
+                    self._persist_tip(client_id)
+
+            logger.info("audit_chain_verified", client_id=client_id, incremental=incremental)
             return True
 
         except Exception as e:
@@ -398,10 +597,16 @@ class AuditLogger:
                 # Parse date from filename
                 try:
                     date_str = log_file.stem.split('_')[-1]
+                    if len(date_str) == 6:
+                        # Rotated file: audit_<client>_<YYYYMMDD>_<HHMMSS>
+                        date_str = log_file.stem.split('_')[-2]
                     file_date = datetime.strptime(date_str, "%Y%m%d")
 
                     if file_date < cutoff_date:
                         log_file.unlink()
+                        log_file.with_suffix('.idx').unlink(missing_ok=True)
+                        with self._write_lock:
+                            self._index_cache.pop(log_file, None)
                         deleted_count += 1
                         logger.info("audit_log_purged", file=str(log_file))
                 except (ValueError, IndexError):
@@ -478,76 +683,302 @@ class AuditLogger:
             )
             return False
 
-    def _get_log_file_path(self, client_id: str) -> Path:
+    @staticmethod
+    def _safe_client_id(client_id: str) -> str:
+        """Sanitize client_id for use in file names."""
+        return "".join(c for c in client_id if c.isalnum() or c in ('_', '-'))
+
+    def _get_log_file_path(self, client_id: str, timestamp: Optional[datetime] = None) -> Path:
         """Get the current log file path for a client."""
-        # Sanitize client_id
-        safe_client_id = "".join(c for c in client_id if c.isalnum() or c in ('_', '-'))
-        date_str = datetime.utcnow().strftime("%Y%m%d")
-        return self.log_directory / f"audit_{safe_client_id}_{date_str}.jsonl"
+        date_str = (timestamp or datetime.utcnow()).strftime("%Y%m%d")
+        return self.log_directory / f"audit_{self._safe_client_id(client_id)}_{date_str}.jsonl"
 
     def _get_log_files(self, client_id: str) -> List[Path]:
         """Get all log files for a client, sorted by date."""
-        safe_client_id = "".join(c for c in client_id if c.isalnum() or c in ('_', '-'))
+        safe_client_id = self._safe_client_id(client_id)
         pattern = f"audit_{safe_client_id}_*.jsonl"
-        files = list(self.log_directory.glob(pattern))
+        files = [
+            f for f in self.log_directory.glob(pattern)
+            if self._file_date(f, client_id) is not None
+        ]
         return sorted(files)
 
-    def _write_log_entry(self, client_id: str, audit_log: AuditLog) -> Any:
-        """Write a log entry to file."""
-        log_file = self._get_log_file_path(client_id)
+    def _file_date(self, log_file: Path, client_id: str) -> Optional[str]:
+        """Return the YYYYMMDD date encoded in a client's log file name."""
+        suffix = log_file.stem[len(f"audit_{self._safe_client_id(client_id)}_"):]
+        date_str = suffix[:8]
+        if len(date_str) == 8 and date_str.isdigit() and (len(suffix) == 8 or suffix[8] == '_'):
+            return date_str
+        return None
+
+    def _get_active_log_file(self, client_id: str, timestamp: datetime) -> Path:
+        """Get the file new entries for this date should be appended to."""
+        log_file = self._get_log_file_path(client_id, timestamp)
 
         # Check if rotation needed
         if log_file.exists() and log_file.stat().st_size > self.max_file_size_bytes:
+            rotated = sorted(self.log_directory.glob(f"{log_file.stem}_*.jsonl"))
+            if rotated and rotated[-1].stat().st_size <= self.max_file_size_bytes:
+                return rotated[-1]
+            # Full files are no longer appended to; only reads reload their index
+            self._index_cache.pop(log_file, None)
+            if rotated:
+                self._index_cache.pop(rotated[-1], None)
             # Create new file with timestamp suffix
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            safe_client_id = "".join(c for c in client_id if c.isalnum() or c in ('_', '-'))
-            log_file = self.log_directory / f"audit_{safe_client_id}_{timestamp}.jsonl"
+            suffix = datetime.utcnow().strftime("%H%M%S")
+            log_file = log_file.with_name(f"{log_file.stem}_{suffix}.jsonl")
 
-        # Append log entry as JSON line
-        with log_file.open('a') as f:
-            f.write(json.dumps(audit_log.to_dict()) + '\n')
+        return log_file
 
-        # Ensure secure permissions
-        os.chmod(log_file, 0o600)
+    def _write_log_entry(self, client_id: str, audit_log: AuditLog) -> Any:
+        """Write a log entry to file."""
+        self._write_log_entries(client_id, [audit_log])
+
+    def _write_log_entries(self, client_id: str, audit_logs: List[AuditLog], fsync: bool = False) -> Any:
+        """
+        Append entries (in chain order) with their index lines, then advance the chain tip.
+
+        Args:
+            client_id: Client identifier
+            audit_logs: Entries to append, oldest first
+            fsync: Force entries and index to stable storage before returning
+        """
+        if not audit_logs:
+            return
+
+        with self._write_lock:
+            # Group consecutive entries by destination file, preserving order
+            groups: List[Tuple[Path, List[AuditLog]]] = []
+            for audit_log in audit_logs:
+                log_file = self._get_log_file_path(client_id, audit_log.timestamp)
+                if groups and groups[-1][0].stem.startswith(log_file.stem):
+                    groups[-1][1].append(audit_log)
+                else:
+                    groups.append((self._get_active_log_file(client_id, audit_log.timestamp), [audit_log]))
+
+            for log_file, entries in groups:
+                is_new = not log_file.exists()
+
+                # Make sure the index covers everything before appending to it
+                if not is_new:
+                    self._load_index(log_file)
+
+                index_path = log_file.with_suffix('.idx')
+                index_lines = []
+                with log_file.open('ab') as f:
+                    offset = f.tell()
+                    for audit_log in entries:
+                        line = (json.dumps(audit_log.to_dict()) + '\n').encode()
+                        f.write(line)
+                        index_lines.append(json.dumps(self._index_record(audit_log, offset, len(line))) + '\n')
+                        offset += len(line)
+                    if fsync:
+                        f.flush()
+                        os.fsync(f.fileno())
+
+                with index_path.open('a') as f:
+                    f.write(''.join(index_lines))
+                    if fsync:
+                        f.flush()
+                        os.fsync(f.fileno())
+
+                if is_new:
+                    # Ensure secure permissions
+                    os.chmod(log_file, 0o600)
+                    os.chmod(index_path, 0o600)
+
+            last_file = groups[-1][0]
+            self._tip(client_id).update({
+                'hash': audit_logs[-1].hash,
+                'file': last_file.name,
+                'size': last_file.stat().st_size
+            })
+            unsaved = self._unsaved_tips.get(client_id, 0) + len(audit_logs)
+            self._unsaved_tips[client_id] = unsaved
+            if unsaved >= self.tip_persist_every:
+                self._persist_tip(client_id)
+
+    @staticmethod
+    def _index_record(audit_log: AuditLog, offset: int, length: int) -> Dict[str, Any]:
+        """Build the sidecar index record for an entry."""
+        return {
+            'o': offset,
+            'n': length,
+            't': audit_log.timestamp.isoformat(),
+            'e': audit_log.event_type.value,
+            'u': audit_log.user_id,
+            'h': audit_log.hash
+        }
+
+    def _load_index(self, log_file: Path) -> List[Dict[str, Any]]:
+        """
+        Load the sidecar index for a log file, reading only new index lines.
+
+        Legacy files without an index, or logs with entries the index does not
+        cover yet, are indexed from the last covered offset and the sidecar is
+        extended so the scan only ever happens once.
+        """
+        with self._write_lock:
+            return self._load_index_locked(log_file)
+
+    def _load_index_locked(self, log_file: Path) -> List[Dict[str, Any]]:
+        """Load the sidecar index; caller holds the write lock."""
+        index_path = log_file.with_suffix('.idx')
+        consumed, entries = self._index_cache.pop(log_file, (0, []))
+
+        if index_path.exists():
+            with index_path.open('rb') as f:
+                f.seek(consumed)
+                data = f.read()
+            # Ignore a trailing partial line from an interrupted write
+            complete = data[:data.rfind(b'\n') + 1]
+            for line in complete.splitlines():
+                if line.strip():
+                    entries.append(json.loads(line))
+            consumed += len(complete)
+
+        covered = entries[-1]['o'] + entries[-1]['n'] if entries else 0
+        if log_file.exists() and log_file.stat().st_size > covered:
+            new_records = []
+            for log, end_offset in self._iter_log_file(log_file, covered):
+                new_records.append(self._index_record(log, covered, end_offset - covered))
+                covered = end_offset
+            if new_records:
+                payload = ''.join(json.dumps(r) + '\n' for r in new_records).encode()
+                with index_path.open('ab') as f:
+                    f.write(payload)
+                os.chmod(index_path, 0o600)
+                entries.extend(new_records)
+                consumed += len(payload)
+
+        self._index_cache[log_file] = (consumed, entries)
+        while len(self._index_cache) > self.index_cache_files:
+            self._index_cache.popitem(last=False)
+        return entries
+
+    def _read_entries_at(self, log_file: Path, offsets: List[Tuple[int, int]]) -> List[AuditLog]:
+        """Read the entries at the given (offset, length) positions."""
+        logs = []
+        if not offsets:
+            return logs
+
+        try:
+            with log_file.open('rb') as f:
+                for offset, length in offsets:
+                    f.seek(offset)
+                    logs.append(AuditLog.from_dict(json.loads(f.read(length))))
+        except Exception as e:
+            logger.error("log_file_read_failed", file=str(log_file), error=str(e))
+
+        return logs
+
+    def _iter_log_file(self, log_file: Path, offset: int = 0) -> Iterator[Tuple[AuditLog, int]]:
+        """Stream (entry, end offset) pairs from a log file starting at a byte offset."""
+        with log_file.open('rb') as f:
+            f.seek(offset)
+            for line in f:
+                offset += len(line)
+                if not line.endswith(b'\n'):
+                    # Partial trailing line from an interrupted write
+                    break
+                if line.strip():
+                    yield AuditLog.from_dict(json.loads(line)), offset
 
     def _read_log_file(self, log_file: Path) -> List[AuditLog]:
         """Read all log entries from a file."""
         logs = []
 
         try:
-            with log_file.open('r') as f:
-                for line in f:
-                    if line.strip():
-                        log_data = json.loads(line)
-                        logs.append(AuditLog.from_dict(log_data))
+            logs = [log for log, _ in self._iter_log_file(log_file)]
         except Exception as e:
             logger.error("log_file_read_failed", file=str(log_file), error=str(e))
 
         return logs
 
+    def _tip_path(self, client_id: str) -> Path:
+        """Path of the persisted chain tip for a client."""
+        return self.log_directory / f"audit_{self._safe_client_id(client_id)}.tip"
+
+    def _read_tip(self, client_id: str) -> Optional[Dict[str, Any]]:
+        """Read the persisted chain tip, if any."""
+        try:
+            return json.loads(self._tip_path(client_id).read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _write_tip(self, client_id: str, tip: Dict[str, Any]) -> None:
+        """Atomically persist the chain tip."""
+        tip_path = self._tip_path(client_id)
+        temp_path = tip_path.with_suffix('.tip.tmp')
+        temp_path.write_text(json.dumps(tip))
+        os.chmod(temp_path, 0o600)
+        os.replace(temp_path, tip_path)
+
+    def _tip(self, client_id: str) -> Dict[str, Any]:
+        """In-memory chain tip for a client, read from disk on first use."""
+        with self._write_lock:
+            tip = self._tips.get(client_id)
+            if tip is None:
+                tip = self._tips[client_id] = self._read_tip(client_id) or {}
+            return tip
+
+    def _persist_tip(self, client_id: str) -> None:
+        """Write a client's in-memory tip to disk (caller holds _write_lock)."""
+        self._write_tip(client_id, self._tips[client_id])
+        self._unsaved_tips.pop(client_id, None)
+
+    def _persist_tips(self) -> None:
+        """Write every tip advanced since it was last persisted."""
+        with self._write_lock:
+            for client_id in list(self._unsaved_tips):
+                try:
+                    self._persist_tip(client_id)
+                except OSError as e:
+                    logger.error("audit_tip_persist_failed", client_id=client_id, error=str(e))
+
     def _get_last_hash(self, client_id: str) -> Optional[str]:
         """Get the hash of the last log entry for chain continuity."""
         # Check cache first
         if client_id in self._last_hash_cache:
             return self._last_hash_cache[client_id]
 
-        # Read from files
+        # Trust the persisted tip if the file it points at is unchanged
+        tip = self._tip(client_id)
+        if tip and tip.get('hash'):
+            tip_file = self.log_directory / tip['file']
+            if tip_file.exists() and tip_file.stat().st_size == tip.get('size'):
+                self._last_hash_cache[client_id] = tip['hash']
+                return tip['hash']
+
+        # Fall back to the index of the last file (built on demand)
         log_files = self._get_log_files(client_id)
         if not log_files:
             return None
 
-        # Read the last file
-        last_file = log_files[-1]
-        logs = self._read_log_file(last_file)
-
-        if logs:
-            last_hash = logs[-1].hash
+        entries = self._load_index(log_files[-1])
+        if entries:
+            last_hash = entries[-1]['h']
             self._last_hash_cache[client_id] = last_hash
             return last_hash
 
         return None
 
 
+# Global audit logger instance
+_audit_logger: Optional[AuditLogger] = None
+
+
+def get_audit_logger() -> AuditLogger:
+    """Get or create the global audit logger (AUDIT_LOG_DIR, AUDIT_LOG_RETENTION_DAYS)"""
+    global _audit_logger
+    if _audit_logger is None:
+        _audit_logger = AuditLogger(
+            Path(os.getenv('AUDIT_LOG_DIR', './config/audit_logs')),
+            retention_days=int(os.getenv('AUDIT_LOG_RETENTION_DAYS', '2555'))
+        )
+    return _audit_logger
+
+
 def test_audit_logger() -> Any:
     """Test the audit logging system."""
     import tempfile
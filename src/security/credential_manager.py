@@ -7,10 +7,13 @@ Version 2.0: OWASP 2023 compliant with 600k iterations and cryptographically ran
 
 import os
 import json
+import time
 import base64
 import secrets
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from datetime import datetime
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
@@ -28,6 +31,148 @@ PBKDF2_ITERATIONS_V1 = 390000  # Legacy support
 CREDENTIAL_VERSION_V2 = "2.0"
 CREDENTIAL_VERSION_V1 = "1.0"
 
+# Derived-key cache: PBKDF2 at 600k iterations costs hundreds of milliseconds,
+# so derived keys are kept in memory for a short, bounded time.
+KEY_CACHE_MAX_ENTRIES = int(os.getenv('CREDENTIAL_KEY_CACHE_SIZE', '256'))
+KEY_CACHE_TTL_SECONDS = float(os.getenv('CREDENTIAL_KEY_CACHE_TTL', '300'))
+
+
+class DerivedKeyCache:
+    """
+    Bounded, time-limited in-memory cache of PBKDF2-derived keys.
+
+    Keys are indexed by (salt, iterations) and held in mutable buffers so they
+    can be overwritten with zeros when evicted, expired, invalidated or cleared.
+    Zeroization is best effort: the Fernet objects built from a key hold their
+    own immutable copies until garbage collected.
+    """
+
+    def __init__(self, max_entries: int = KEY_CACHE_MAX_ENTRIES,
+                 ttl_seconds: float = KEY_CACHE_TTL_SECONDS) -> None:
+        """
+        Initialize derived-key cache.
+
+        Args:
+            max_entries: Maximum number of keys held (0 disables caching)
+            ttl_seconds: Seconds a key stays cached after derivation (0 disables caching)
+        """
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self._entries: "OrderedDict[Tuple[bytes, int], Tuple[bytearray, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    @staticmethod
+    def _wipe(buffer: bytearray) -> None:
+        """Overwrite key material in place."""
+        for i in range(len(buffer)):
+            buffer[i] = 0
+
+    def get(self, salt: bytes, iterations: int) -> Optional[bytes]:
+        """
+        Get a cached key.
+
+        Args:
+            salt: Salt the key was derived with
+            iterations: PBKDF2 iteration count
+
+        Returns:
+            Raw derived key or None if not cached or expired
+        """
+        if not self.enabled:
+            return None
+
+        cache_key = (bytes(salt), iterations)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            buffer, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[cache_key]
+                self._wipe(buffer)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+            return bytes(buffer)
+
+    def put(self, salt: bytes, iterations: int, key: bytes) -> None:
+        """
+        Cache a derived key, evicting the least recently used key when full.
+
+        Args:
+            salt: Salt the key was derived with
+            iterations: PBKDF2 iteration count
+            key: Raw derived key
+        """
+        if not self.enabled:
+            return
+
+        cache_key = (bytes(salt), iterations)
+        with self._lock:
+            previous = self._entries.pop(cache_key, None)
+            if previous is not None:
+                self._wipe(previous[0])
+
+            self._entries[cache_key] = (bytearray(key), time.monotonic() + self.ttl_seconds)
+
+            while len(self._entries) > self.max_entries:
+                _, (buffer, _) = self._entries.popitem(last=False)
+                self._wipe(buffer)
+                self.evictions += 1
+
+    def invalidate(self, salt: bytes, iterations: int) -> bool:
+        """
+        Remove and zeroize a cached key.
+
+        Returns:
+            True if a key was removed
+        """
+        with self._lock:
+            entry = self._entries.pop((bytes(salt), iterations), None)
+            if entry is None:
+                return False
+            self._wipe(entry[0])
+            return True
+
+    def clear(self) -> int:
+        """
+        Remove and zeroize all cached keys.
+
+        Returns:
+            Number of keys removed
+        """
+        with self._lock:
+            count = len(self._entries)
+            for buffer, _ in self._entries.values():
+                self._wipe(buffer)
+            self._entries.clear()
+            return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / total if total else 0.0
+            }
+
 
 class SecureCredentialManager:
     """
@@ -39,16 +184,21 @@ class SecureCredentialManager:
     - Cryptographically secure random salts (not client_id-derived)
     - Per-client credential isolation
     - Backward compatibility with v1.0 credentials
+    - Bounded, time-limited cache of derived keys with zeroization
     - Audit logging of all access
     """
 
-    def __init__(self, config_path: Path, master_password: Optional[str] = None) -> Any:
+    def __init__(self, config_path: Path, master_password: Optional[str] = None,
+                 key_cache_size: int = KEY_CACHE_MAX_ENTRIES,
+                 key_cache_ttl: float = KEY_CACHE_TTL_SECONDS) -> Any:
         """
         Initialize credential manager.
 
         Args:
             config_path: Base path for configuration storage
             master_password: Master password for encryption (from env in production)
+            key_cache_size: Maximum number of derived keys kept in memory (0 disables)
+            key_cache_ttl: Seconds a derived key stays in memory (0 disables)
         """
         self.config_path = Path(config_path)
         self.credentials_dir = self.config_path / "credentials"
@@ -64,10 +214,14 @@ class SecureCredentialManager:
         # Store master key bytes for per-credential encryption
         self.master_key_bytes = self.master_password.encode()
 
+        self.key_cache = DerivedKeyCache(key_cache_size, key_cache_ttl)
+
         logger.info("credential_manager_initialized",
                    config_path=str(config_path),
                    version=CREDENTIAL_VERSION_V2,
-                   pbkdf2_iterations=PBKDF2_ITERATIONS_V2)
+                   pbkdf2_iterations=PBKDF2_ITERATIONS_V2,
+                   key_cache_size=self.key_cache.max_entries,
+                   key_cache_ttl=self.key_cache.ttl_seconds)
 
     def _generate_random_salt(self) -> bytes:
         """
@@ -82,6 +236,8 @@ class SecureCredentialManager:
         """
         Derive encryption key from master password using PBKDF2-HMAC-SHA256.
 
+        Keys are served from the derived-key cache when possible.
+
         Args:
             salt: Random salt (32 bytes)
             iterations: PBKDF2 iteration count (600k for v2.0, 390k for v1.0)
@@ -89,17 +245,91 @@ class SecureCredentialManager:
         Returns:
             Base64-encoded Fernet key (44 bytes)
         """
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=iterations,
-            backend=default_backend()
-        )
+        derived_key = self.key_cache.get(salt, iterations)
+        if derived_key is None:
+            kdf = PBKDF2HMAC(
+                algorithm=hashes.SHA256(),
+                length=32,
+                salt=salt,
+                iterations=iterations,
+                backend=default_backend()
+            )
+            derived_key = kdf.derive(self.master_key_bytes)
+            self.key_cache.put(salt, iterations, derived_key)
 
-        derived_key = kdf.derive(self.master_key_bytes)
         return base64.urlsafe_b64encode(derived_key)
 
+    def _forget_entry_keys(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """
+        Zeroize cached keys for stored credential entries.
+
+        Args:
+            entries: Credential metadata dicts as stored in the credentials file
+
+        Returns:
+            Number of cached keys removed
+        """
+        removed = 0
+        for cred_data in entries:
+            if cred_data.get('version', CREDENTIAL_VERSION_V1) != CREDENTIAL_VERSION_V2:
+                continue
+            try:
+                salt = base64.b64decode(cred_data['salt'].encode())
+            except (KeyError, ValueError, AttributeError):
+                continue
+            iterations = cred_data.get('iterations', PBKDF2_ITERATIONS_V2)
+            if self.key_cache.invalidate(salt, iterations):
+                removed += 1
+        return removed
+
+    def _encrypt_entry(self, credential_value: str) -> Dict[str, Any]:
+        """
+        Encrypt a credential value into a v2.0 entry with a fresh random salt.
+
+        Args:
+            credential_value: Plaintext credential value
+
+        Returns:
+            Credential metadata dict ready to be stored
+        """
+        salt = self._generate_random_salt()
+        cipher = Fernet(self._derive_encryption_key(salt, PBKDF2_ITERATIONS_V2))
+
+        return {
+            'value': cipher.encrypt(credential_value.encode()).decode(),
+            'salt': base64.b64encode(salt).decode(),
+            'version': CREDENTIAL_VERSION_V2,
+            'iterations': PBKDF2_ITERATIONS_V2,
+            'algorithm': 'Fernet-PBKDF2-HMAC-SHA256',
+            'created_at': datetime.utcnow().isoformat(),
+            'last_accessed': None
+        }
+
+    def _decrypt_entry(self, cred_data: Dict[str, Any]) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Decrypt a stored credential entry (v1.0 or v2.0).
+
+        Args:
+            cred_data: Credential metadata dict as stored in the credentials file
+
+        Returns:
+            Tuple of (decrypted value, re-encrypted v2.0 entry if the entry was v1.0)
+        """
+        encrypted_value = cred_data['value']
+        version = cred_data.get('version', CREDENTIAL_VERSION_V1)
+
+        if version == CREDENTIAL_VERSION_V2:
+            # v2.0: Use stored salt and iterations
+            salt = base64.b64decode(cred_data['salt'].encode())
+            iterations = cred_data.get('iterations', PBKDF2_ITERATIONS_V2)
+
+            cipher = Fernet(self._derive_encryption_key(salt, iterations))
+            return cipher.decrypt(encrypted_value.encode()).decode(), None
+
+        # v1.0 (legacy): decrypt with the old global cipher and re-encrypt as v2.0
+        decrypted_value = self._decrypt_v1_credential(encrypted_value)
+        return decrypted_value, self._encrypt_entry(decrypted_value)
+
     def store_credential(self,
                         client_id: str,
                         tool_type: str,
@@ -130,26 +360,13 @@ class SecureCredentialManager:
             if tool_type not in credentials:
                 credentials[tool_type] = {}
 
-            # Generate random salt for this credential
-            salt = self._generate_random_salt()
-
-            # Derive encryption key from salt
-            encryption_key = self._derive_encryption_key(salt, PBKDF2_ITERATIONS_V2)
-            cipher = Fernet(encryption_key)
-
-            # Encrypt the credential value
-            encrypted_value = cipher.encrypt(credential_value.encode()).decode()
-
-            # Store with metadata (v2.0 format includes salt and version)
-            credentials[tool_type][credential_key] = {
-                'value': encrypted_value,
-                'salt': base64.b64encode(salt).decode(),
-                'version': CREDENTIAL_VERSION_V2,
-                'iterations': PBKDF2_ITERATIONS_V2,
-                'algorithm': 'Fernet-PBKDF2-HMAC-SHA256',
-                'created_at': datetime.utcnow().isoformat(),
-                'last_accessed': None
-            }
+            # Rotation: the replaced credential's key must not outlive it
+            previous = credentials[tool_type].get(credential_key)
+            if previous:
+                self._forget_entry_keys([previous])
+
+            # Encrypt with a fresh random salt (v2.0 format includes salt and version)
+            credentials[tool_type][credential_key] = self._encrypt_entry(credential_value)
 
             # Save encrypted credentials
             self._save_credentials_file(creds_file, credentials)
@@ -205,34 +422,18 @@ class SecureCredentialManager:
                 return None
 
             cred_data = credentials[tool_type][credential_key]
-            encrypted_value = cred_data['value']
-
-            # Check credential version
             version = cred_data.get('version', CREDENTIAL_VERSION_V1)
+            decrypted_value, migrated = self._decrypt_entry(cred_data)
 
-            if version == CREDENTIAL_VERSION_V2:
-                # v2.0: Use stored salt and iterations
-                salt = base64.b64decode(cred_data['salt'].encode())
-                iterations = cred_data.get('iterations', PBKDF2_ITERATIONS_V2)
-
-                encryption_key = self._derive_encryption_key(salt, iterations)
-                cipher = Fernet(encryption_key)
-                decrypted_value = cipher.decrypt(encrypted_value.encode()).decode()
-
-            else:
-                # v1.0 (legacy): Use old global cipher method
-                # Migrate to v2.0 on next save
-                decrypted_value = self._decrypt_v1_credential(encrypted_value)
-
-                # Auto-migrate to v2.0
+            if migrated:
+                # Auto-migrate v1.0 to v2.0 in the same write as last_accessed
                 logger.info(
                     "migrating_credential_to_v2",
                     client_id=client_id,
                     tool_type=tool_type,
                     credential_key=credential_key
                 )
-                # Re-encrypt with v2.0 format
-                self.store_credential(client_id, tool_type, credential_key, decrypted_value)
+                credentials[tool_type][credential_key] = migrated
 
             # Update last accessed timestamp
             credentials[tool_type][credential_key]['last_accessed'] = datetime.utcnow().isoformat()
@@ -289,6 +490,25 @@ class SecureCredentialManager:
         Returns:
             Dictionary of decrypted credentials
         """
+        return self.unlock_client(client_id, tool_types=[tool_type]).get(tool_type, {})
+
+    def unlock_client(self,
+                      client_id: str,
+                      tool_types: Optional[List[str]] = None) -> Dict[str, Dict[str, str]]:
+        """
+        Decrypt all of a client's tool credentials in a single pass.
+
+        The credentials file is read and written once, derived keys are
+        cached for subsequent reads, and v1.0 credentials are migrated in
+        the same write.
+
+        Args:
+            client_id: Unique client identifier
+            tool_types: Optional tool types to unlock. If None, unlocks all.
+
+        Returns:
+            Dictionary of tool type -> decrypted credentials
+        """
         try:
             creds_file = self._get_credentials_file(client_id)
 
@@ -296,29 +516,87 @@ class SecureCredentialManager:
                 return {}
 
             credentials = self._load_credentials_file(creds_file)
+            selected = tool_types if tool_types is not None else list(credentials.keys())
+
+            now = datetime.utcnow().isoformat()
+            unlocked: Dict[str, Dict[str, str]] = {}
+            failed = 0
+            migrated_count = 0
+
+            for tool_type in selected:
+                for key, cred_data in credentials.get(tool_type, {}).items():
+                    try:
+                        value, migrated = self._decrypt_entry(cred_data)
+                    except Exception as e:
+                        failed += 1
+                        logger.error(
+                            "credential_retrieval_failed",
+                            client_id=client_id,
+                            tool_type=tool_type,
+                            credential_key=key,
+                            error=str(e)
+                        )
+                        continue
+
+                    if migrated:
+                        credentials[tool_type][key] = migrated
+                        migrated_count += 1
+                    credentials[tool_type][key]['last_accessed'] = now
+
+                    if value:
+                        unlocked.setdefault(tool_type, {})[key] = value
+
+            if unlocked or migrated_count:
+                self._save_credentials_file(creds_file, credentials)
 
-            if tool_type not in credentials:
-                return {}
-
-            # Decrypt all credentials for this tool
-            decrypted = {}
-            for key, data in credentials[tool_type].items():
-                # Use get_credential which handles both versions
-                value = self.get_credential(client_id, tool_type, key)
-                if value:
-                    decrypted[key] = value
+            logger.info(
+                "client_credentials_unlocked",
+                client_id=client_id,
+                tool_types=list(unlocked.keys()),
+                credential_count=sum(len(creds) for creds in unlocked.values()),
+                migrated=migrated_count,
+                failed=failed
+            )
 
-            return decrypted
+            return unlocked
 
         except Exception as e:
             logger.error(
                 "credentials_retrieval_failed",
                 client_id=client_id,
-                tool_type=tool_type,
+                tool_types=tool_types,
                 error=str(e)
             )
             return {}
 
+    def lock_client(self, client_id: str) -> int:
+        """
+        Zeroize all cached keys for a client's credentials.
+
+        Args:
+            client_id: Unique client identifier
+
+        Returns:
+            Number of cached keys removed
+        """
+        credentials = self._load_credentials_file(self._get_credentials_file(client_id))
+        removed = self._forget_entry_keys(
+            cred_data for creds in credentials.values() for cred_data in creds.values()
+        )
+        logger.info("client_credentials_locked", client_id=client_id, keys_removed=removed)
+        return removed
+
+    def clear_key_cache(self) -> int:
+        """
+        Zeroize all cached derived keys (e.g. on shutdown or master key change).
+
+        Returns:
+            Number of cached keys removed
+        """
+        removed = self.key_cache.clear()
+        logger.info("credential_key_cache_cleared", keys_removed=removed)
+        return removed
+
     def delete_credentials(self, client_id: str, tool_type: Optional[str] = None) -> bool:
         """
         Delete credentials for a client.
@@ -336,14 +614,19 @@ class SecureCredentialManager:
             if not creds_file.exists():
                 return True
 
+            credentials = self._load_credentials_file(creds_file)
+
             if tool_type is None:
                 # Delete entire credentials file
+                self._forget_entry_keys(
+                    cred_data for creds in credentials.values() for cred_data in creds.values()
+                )
                 creds_file.unlink()
                 logger.info("all_credentials_deleted", client_id=client_id)
             else:
                 # Delete specific tool credentials
-                credentials = self._load_credentials_file(creds_file)
                 if tool_type in credentials:
+                    self._forget_entry_keys(credentials[tool_type].values())
                     del credentials[tool_type]
                     self._save_credentials_file(creds_file, credentials)
                     logger.info(
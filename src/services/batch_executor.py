@@ -0,0 +1,353 @@
+"""
+Batch Tool Executor
+
+Runs many MCP tool calls (e.g. get_client_overview for hundreds of clients)
+as one batch instead of one round-trip per call:
+
+- items are validated once up front (tool lookup, argument binding and
+  client_id validation are cached per distinct tool / client_id)
+- items run on a bounded number of lanes; each lane holds one database
+  connection and session for all the items it executes
+- results are streamed back as they complete
+"""
+
+import asyncio
+import inspect
+import os
+import time
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import structlog
+
+from src.database import shared_async_session, reset_shared_session
+from src.security.input_validation import validate_client_id, ValidationError
+from src.tools.manifest import import_tool
+
+logger = structlog.get_logger(__name__)
+
+BATCH_MAX_ITEMS = int(os.getenv("BATCH_MAX_ITEMS", "1000"))
+BATCH_DEFAULT_CONCURRENCY = int(os.getenv("BATCH_DEFAULT_CONCURRENCY", "8"))
+BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", "32"))
+
+TOOLS_ROOT = Path(__file__).resolve().parent.parent / "tools"
+
+# Tools that may not be called from inside a batch
+EXCLUDED_TOOLS = {"execute_tool_batch"}
+
+
+@dataclass
+class BatchItem:
+    """A validated tool call within a batch"""
+    index: int
+    tool: str
+    arguments: Dict[str, Any]
+    func: Callable[..., Awaitable[Dict[str, Any]]] = field(repr=False, default=None)
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of one batch item"""
+    index: int
+    tool: str
+    status: str
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    error_type: Optional[str] = None
+    duration_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            "index": self.index,
+            "tool": self.tool,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "error_type": self.error_type,
+            "duration_ms": round(self.duration_ms, 2),
+        }
+
+
+class NullContext:
+    """Context stand-in that discards tool progress messages"""
+
+    async def debug(self, *args, **kwargs) -> None:
+        pass
+
+    async def info(self, *args, **kwargs) -> None:
+        pass
+
+    async def warning(self, *args, **kwargs) -> None:
+        pass
+
+    async def error(self, *args, **kwargs) -> None:
+        pass
+
+    async def report_progress(self, *args, **kwargs) -> None:
+        pass
+
+
+_resolved_tools: Dict[str, Callable[..., Awaitable[Dict[str, Any]]]] = {}
+
+
+def resolve_tool(tool_name: str) -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """
+    Find a tool function by name in the src/tools domain packages.
+
+    Args:
+        tool_name: Tool function name (e.g. "get_client_overview")
+
+    Returns:
+        The async tool function
+
+    Raises:
+        KeyError: If no tool with that name exists or it may not be batched
+    """
+    if tool_name in _resolved_tools:
+        return _resolved_tools[tool_name]
+
+    if tool_name in EXCLUDED_TOOLS or not tool_name.isidentifier():
+        raise KeyError(f"Tool not available in batches: {tool_name}")
+
+    for module_path in sorted(TOOLS_ROOT.glob(f"*/{tool_name}.py")):
+        func = import_tool(f"src.tools.{module_path.parent.name}.{tool_name}", tool_name)
+        if func is not None and inspect.iscoroutinefunction(func):
+            _resolved_tools[tool_name] = func
+            return func
+
+    raise KeyError(f"Unknown tool: {tool_name}")
+
+
+class BatchToolExecutor:
+    """
+    Execute a list of (tool, arguments) items with bounded concurrency.
+
+    Items are dicts of the form {"tool": "get_client_overview",
+    "arguments": {"client_id": "cs_..."}}.
+    """
+
+    def __init__(self,
+                 tools: Optional[Dict[str, Callable[..., Awaitable[Dict[str, Any]]]]] = None,
+                 max_concurrency: int = BATCH_DEFAULT_CONCURRENCY,
+                 share_session: bool = True) -> None:
+        """
+        Initialize batch executor.
+
+        Args:
+            tools: Optional explicit tool name -> function mapping (default: resolve from src/tools)
+            max_concurrency: Number of lanes executing items at the same time
+            share_session: Reuse one connection/session per lane instead of one per item
+        """
+        self.tools = tools
+        self.max_concurrency = max(1, min(int(max_concurrency), BATCH_MAX_CONCURRENCY))
+        self.share_session = share_session
+
+    def _lookup(self, tool_name: str) -> Callable[..., Awaitable[Dict[str, Any]]]:
+        if self.tools is not None:
+            if tool_name not in self.tools:
+                raise KeyError(f"Unknown tool: {tool_name}")
+            return self.tools[tool_name]
+        return resolve_tool(tool_name)
+
+    def validate(self, items: List[Dict[str, Any]]) -> Tuple[List[BatchItem], List[BatchItemResult]]:
+        """
+        Validate all items once before execution.
+
+        Args:
+            items: Raw batch items
+
+        Returns:
+            Tuple of (valid items, rejection results for invalid items)
+        """
+        valid: List[BatchItem] = []
+        rejected: List[BatchItemResult] = []
+        tools: Dict[str, Any] = {}
+        signatures: Dict[str, inspect.Signature] = {}
+        client_ids: Dict[str, Any] = {}
+
+        def reject(index: int, tool: str, error: str, error_type: str = "validation_error") -> None:
+            rejected.append(BatchItemResult(
+                index=index, tool=tool, status="failed", error=error, error_type=error_type
+            ))
+
+        for index, raw in enumerate(items):
+            if not isinstance(raw, dict) or not isinstance(raw.get("tool"), str):
+                reject(index, str(raw.get("tool")) if isinstance(raw, dict) else "", "Item must be a dict with a 'tool' name")
+                continue
+
+            tool_name = raw["tool"]
+            arguments = raw.get("arguments", raw.get("args", {})) or {}
+            if not isinstance(arguments, dict):
+                reject(index, tool_name, "'arguments' must be a dict")
+                continue
+
+            if tool_name not in tools:
+                try:
+                    tools[tool_name] = self._lookup(tool_name)
+                    signatures[tool_name] = inspect.signature(tools[tool_name])
+                except Exception as e:
+                    tools[tool_name] = e
+            func = tools[tool_name]
+            if isinstance(func, Exception):
+                reject(index, tool_name, str(func).strip("'\""), "unknown_tool")
+                continue
+
+            try:
+                signatures[tool_name].bind(None, **arguments)
+            except TypeError as e:
+                reject(index, tool_name, f"Invalid arguments: {e}")
+                continue
+
+            if "client_id" in arguments:
+                client_id = arguments["client_id"]
+                checked = client_ids.get(client_id) if isinstance(client_id, str) else None
+                if checked is None:
+                    try:
+                        checked = validate_client_id(client_id)
+                    except ValidationError as e:
+                        checked = e
+                    if isinstance(client_id, str):
+                        client_ids[client_id] = checked
+                if isinstance(checked, Exception):
+                    reject(index, tool_name, f"Invalid client_id: {checked}")
+                    continue
+                arguments = {**arguments, "client_id": checked}
+
+            valid.append(BatchItem(index=index, tool=tool_name, arguments=arguments, func=func))
+
+        return valid, rejected
+
+    async def _execute(self, item: BatchItem, ctx: Any) -> BatchItemResult:
+        start = time.perf_counter()
+        try:
+            result = await item.func(ctx, **item.arguments)
+            status = result.get("status", "success") if isinstance(result, dict) else "success"
+            return BatchItemResult(
+                index=item.index,
+                tool=item.tool,
+                status="failed" if status in ("failed", "error") else "success",
+                result=result,
+                error=result.get("error") if isinstance(result, dict) else None,
+                duration_ms=(time.perf_counter() - start) * 1000,
+            )
+        except Exception as e:
+            logger.error("batch_item_failed", tool=item.tool, index=item.index, error=str(e))
+            return BatchItemResult(
+                index=item.index,
+                tool=item.tool,
+                status="failed",
+                error=str(e),
+                error_type=type(e).__name__,
+                duration_ms=(time.perf_counter() - start) * 1000,
+            )
+
+    async def _lane(self, queue: "asyncio.Queue[BatchItem]",
+                    results: "asyncio.Queue[BatchItemResult]", ctx: Any) -> None:
+        """Execute queued items one at a time on a single shared session"""
+        async with AsyncExitStack() as stack:
+            session = None
+            if self.share_session:
+                try:
+                    session = await stack.enter_async_context(shared_async_session())
+                except Exception as e:
+                    logger.warning("batch_shared_session_unavailable", error=str(e))
+
+            while True:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                result = await self._execute(item, ctx)
+                if session is not None:
+                    try:
+                        await reset_shared_session(session)
+                    except Exception as e:
+                        logger.warning("batch_session_reset_failed", error=str(e))
+                await results.put(result)
+
+    async def stream(self, items: List[Dict[str, Any]], ctx: Any = None) -> AsyncIterator[BatchItemResult]:
+        """
+        Execute a batch, yielding each result as soon as it completes.
+
+        Validation failures are yielded first, then execution results in
+        completion order.
+
+        Args:
+            items: Raw batch items
+            ctx: Context passed to each tool (default: NullContext)
+
+        Yields:
+            BatchItemResult per item
+        """
+        ctx = ctx or NullContext()
+        valid, rejected = self.validate(items)
+        for result in rejected:
+            yield result
+
+        if not valid:
+            return
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in valid:
+            queue.put_nowait(item)
+        results: asyncio.Queue = asyncio.Queue()
+
+        lanes = [
+            asyncio.create_task(self._lane(queue, results, ctx))
+            for _ in range(min(self.max_concurrency, len(valid)))
+        ]
+        try:
+            for _ in range(len(valid)):
+                yield await results.get()
+        finally:
+            for lane in lanes:
+                lane.cancel()
+            await asyncio.gather(*lanes, return_exceptions=True)
+
+    async def run(self,
+                  items: List[Dict[str, Any]],
+                  ctx: Any = None,
+                  on_result: Optional[Callable[[BatchItemResult], Awaitable[None]]] = None) -> Dict[str, Any]:
+        """
+        Execute a batch and collect results in item order.
+
+        Args:
+            items: Raw batch items
+            ctx: Context passed to each tool (default: NullContext)
+            on_result: Optional async callback invoked as each result completes
+
+        Returns:
+            Batch summary with per-item results
+        """
+        start = time.perf_counter()
+        collected: List[BatchItemResult] = []
+
+        async for result in self.stream(items, ctx):
+            collected.append(result)
+            if on_result is not None:
+                await on_result(result)
+
+        collected.sort(key=lambda r: r.index)
+        succeeded = sum(1 for r in collected if r.status == "success")
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        logger.info(
+            "batch_executed",
+            items=len(items),
+            succeeded=succeeded,
+            failed=len(collected) - succeeded,
+            max_concurrency=self.max_concurrency,
+            duration_ms=round(duration_ms, 2),
+        )
+
+        return {
+            "total": len(collected),
+            "succeeded": succeeded,
+            "failed": len(collected) - succeeded,
+            "duration_ms": round(duration_ms, 2),
+            "results": [r.to_dict() for r in collected],
+        }
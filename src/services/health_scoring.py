@@ -0,0 +1,399 @@
+"""
+Bulk Health Scoring Engine
+
+Set-based replacement for the per-customer health score path in
+``health_segmentation_tools``. Instead of ~8 queries and one commit per
+customer, the whole book is scored with a handful of grouped aggregate
+queries, the component weighting is vectorized with NumPy, and the resulting
+``HealthScoreComponents`` rows are bulk-inserted in batches.
+
+Scoring rules mirror the single-customer helpers
+(``_calculate_usage_score_from_db`` and friends) so nightly rescoring and
+on-demand ``calculate_health_score`` calls produce the same numbers.
+
+The nightly rescoring runs as the ``health_score_refresh`` autonomous
+worker (autonomous/workers/health_score_refresh.py).
+
+Usage:
+    from src.database import SessionLocal
+    from src.services.health_scoring import BulkHealthScoringEngine
+
+    db = SessionLocal()
+    try:
+        summary = BulkHealthScoringEngine(db).score_book()
+    finally:
+        db.close()
+"""
+
+from typing import Dict, List, Any, Optional, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import time
+
+import numpy as np
+from sqlalchemy import select, func, case, insert, update
+from sqlalchemy.orm import Session
+import structlog
+
+from src.database.models import (
+    CustomerAccount,
+    HealthScoreComponents,
+    SupportTicket,
+    ContractDetails,
+    NPSResponse,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+# Component order used for every score/weight array in this module
+COMPONENTS = ("usage", "engagement", "support", "satisfaction", "payment")
+
+DEFAULT_WEIGHTS = {
+    "usage_weight": 0.35,
+    "engagement_weight": 0.25,
+    "support_weight": 0.15,
+    "satisfaction_weight": 0.15,
+    "payment_weight": 0.10,
+}
+
+# Usage score proxy by lifecycle stage (until usage_analytics exists)
+STAGE_USAGE_SCORES = {
+    "onboarding": 65.0,
+    "active": 85.0,
+    "at_risk": 45.0,
+    "expansion": 90.0,
+    "renewal": 75.0,
+    "churned": 20.0,
+}
+
+CRITICAL_PRIORITIES = ("P0", "P1")
+
+# Trend thresholds (points of change vs. previous score)
+TREND_DELTA = 3
+
+
+@dataclass
+class BulkScoringResult:
+    """Summary of a bulk health scoring run"""
+    customers_scored: int = 0
+    average_score: float = 0.0
+    trend_counts: Dict[str, int] = field(default_factory=dict)
+    risk_counts: Dict[str, int] = field(default_factory=dict)
+    duration_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            "customers_scored": self.customers_scored,
+            "average_score": round(self.average_score, 2),
+            "trend_counts": self.trend_counts,
+            "risk_counts": self.risk_counts,
+            "duration_seconds": round(self.duration_seconds, 3),
+        }
+
+
+class BulkHealthScoringEngine:
+    """
+    Computes health scores for many customers with grouped aggregate queries.
+
+    Per run the engine issues one query per component source (customers,
+    support tickets, NPS, contracts, previous scores), independent of the
+    number of customers, then writes results in ``batch_size`` chunks.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        weights: Optional[Dict[str, float]] = None,
+        lookback_period_days: int = 30,
+        batch_size: int = 1000
+    ):
+        """
+        Initialize bulk scoring engine.
+
+        Args:
+            db: SQLAlchemy session
+            weights: Component weights (defaults to DEFAULT_WEIGHTS)
+            lookback_period_days: Days of support/NPS history to consider
+            batch_size: Rows per bulk insert/update statement
+        """
+        self.db = db
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.lookback_period_days = lookback_period_days
+        self.batch_size = batch_size
+
+    @property
+    def weight_vector(self) -> np.ndarray:
+        """Weights as an array aligned with COMPONENTS"""
+        return np.array([self.weights[f"{c}_weight"] for c in COMPONENTS], dtype=float)
+
+    # ------------------------------------------------------------------
+    # Aggregate queries
+    # ------------------------------------------------------------------
+
+    def _fetch_customers(self, client_ids: Optional[Sequence[str]], status: Optional[str]) -> List[Any]:
+        query = select(
+            CustomerAccount.id,
+            CustomerAccount.client_id,
+            CustomerAccount.lifecycle_stage,
+            CustomerAccount.last_engagement_date,
+        )
+        if client_ids is not None:
+            query = query.where(CustomerAccount.client_id.in_(client_ids))
+        if status:
+            query = query.where(CustomerAccount.status == status)
+        return self.db.execute(query.order_by(CustomerAccount.id)).all()
+
+    def _fetch_support_counts(self, client_ids: Optional[Sequence[str]], cutoff: datetime) -> Dict[str, tuple]:
+        query = (
+            select(
+                SupportTicket.client_id,
+                func.count(SupportTicket.id),
+                func.sum(case((SupportTicket.priority.in_(CRITICAL_PRIORITIES), 1), else_=0)),
+            )
+            .where(SupportTicket.created_at >= cutoff)
+            .group_by(SupportTicket.client_id)
+        )
+        if client_ids is not None:
+            query = query.where(SupportTicket.client_id.in_(client_ids))
+        return {row[0]: (row[1] or 0, row[2] or 0) for row in self.db.execute(query)}
+
+    def _fetch_nps_averages(self, client_ids: Optional[Sequence[str]], cutoff: datetime) -> Dict[str, float]:
+        query = (
+            select(NPSResponse.client_id, func.avg(NPSResponse.score))
+            .where(NPSResponse.responded_at >= cutoff)
+            .group_by(NPSResponse.client_id)
+        )
+        if client_ids is not None:
+            query = query.where(NPSResponse.client_id.in_(client_ids))
+        return {row[0]: float(row[1]) for row in self.db.execute(query) if row[1] is not None}
+
+    def _fetch_latest_contracts(self, client_ids: Optional[Sequence[str]]) -> Dict[str, tuple]:
+        ranked = select(
+            ContractDetails.client_id,
+            ContractDetails.renewal_date,
+            ContractDetails.payment_status,
+            func.row_number().over(
+                partition_by=ContractDetails.client_id,
+                order_by=ContractDetails.renewal_date.desc()
+            ).label("rn"),
+        )
+        if client_ids is not None:
+            ranked = ranked.where(ContractDetails.client_id.in_(client_ids))
+        ranked = ranked.subquery()
+        query = select(ranked.c.client_id, ranked.c.renewal_date, ranked.c.payment_status).where(ranked.c.rn == 1)
+        return {row[0]: (row[1], row[2]) for row in self.db.execute(query)}
+
+    def _fetch_previous_scores(self, client_ids: Optional[Sequence[str]]) -> Dict[str, float]:
+        ranked = select(
+            HealthScoreComponents.client_id,
+            HealthScoreComponents.overall_score,
+            func.row_number().over(
+                partition_by=HealthScoreComponents.client_id,
+                order_by=(HealthScoreComponents.created_at.desc(), HealthScoreComponents.id.desc())
+            ).label("rn"),
+        )
+        if client_ids is not None:
+            ranked = ranked.where(HealthScoreComponents.client_id.in_(client_ids))
+        ranked = ranked.subquery()
+        query = select(ranked.c.client_id, ranked.c.overall_score).where(ranked.c.rn == 1)
+        return {row[0]: row[1] for row in self.db.execute(query) if row[1] is not None}
+
+    # ------------------------------------------------------------------
+    # Vectorized scoring
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _engagement_scores(days_since: np.ndarray) -> np.ndarray:
+        """Engagement score from days since last engagement (NaN = unknown)"""
+        return np.select(
+            [np.isnan(days_since), days_since == 0, days_since <= 3, days_since <= 7,
+             days_since <= 14, days_since <= 30],
+            [50.0, 95.0, 85.0, 75.0, 60.0, 45.0],
+            default=30.0
+        )
+
+    def compute_component_matrix(
+        self,
+        customers: List[Any],
+        support: Dict[str, tuple],
+        nps: Dict[str, float],
+        contracts: Dict[str, tuple],
+        now: Optional[datetime] = None
+    ) -> np.ndarray:
+        """
+        Build an (n_customers, 5) matrix of component scores.
+
+        Args:
+            customers: Rows of (id, client_id, lifecycle_stage, last_engagement_date)
+            support: client_id -> (ticket_count, critical_count)
+            nps: client_id -> average NPS score
+            contracts: client_id -> (renewal_date, payment_status) of latest contract
+            now: Reference time (defaults to datetime.now())
+
+        Returns:
+            Component score matrix with columns ordered as COMPONENTS
+        """
+        now = now or datetime.now()
+        today = now.date()
+        n = len(customers)
+        client_ids = [c.client_id for c in customers]
+
+        usage = np.array([STAGE_USAGE_SCORES.get(c.lifecycle_stage, 50.0) for c in customers], dtype=float)
+
+        days_since = np.array(
+            [(now - c.last_engagement_date).days if c.last_engagement_date else np.nan for c in customers],
+            dtype=float
+        )
+        engagement = self._engagement_scores(days_since)
+
+        tickets = np.zeros(n)
+        critical = np.zeros(n)
+        for i, client_id in enumerate(client_ids):
+            counts = support.get(client_id)
+            if counts:
+                tickets[i], critical[i] = counts
+        support_scores = np.clip(
+            100.0 - np.minimum(30.0, tickets * 3) - np.minimum(20.0, critical * 10), 0, 100
+        )
+
+        avg_nps = np.array([nps.get(client_id, np.nan) for client_id in client_ids], dtype=float)
+        satisfaction = np.where(np.isnan(avg_nps), 70.0, (avg_nps + 100) / 2.0)
+
+        payment = np.full(n, 85.0)
+        for i, client_id in enumerate(client_ids):
+            contract = contracts.get(client_id)
+            if not contract:
+                continue
+            renewal_date, payment_status = contract
+            score = 100.0
+            if renewal_date and (renewal_date - today).days < 30:
+                score -= 10
+            if payment_status == "overdue":
+                score -= 40
+            elif payment_status == "late":
+                score -= 20
+            payment[i] = max(0.0, min(100.0, score))
+
+        return np.column_stack([usage, engagement, support_scores, satisfaction, payment])
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _write_results(
+        self,
+        customers: List[Any],
+        components: np.ndarray,
+        overall: np.ndarray,
+        trends: List[str],
+        now: datetime
+    ) -> None:
+        weights = self.weights
+        for start in range(0, len(customers), self.batch_size):
+            stop = min(start + self.batch_size, len(customers))
+            score_rows = []
+            customer_rows = []
+            for i in range(start, stop):
+                usage, engagement, support, satisfaction, payment = components[i].tolist()
+                score_rows.append({
+                    "client_id": customers[i].client_id,
+                    "usage_score": usage,
+                    "engagement_score": engagement,
+                    "support_score": support,
+                    "satisfaction_score": satisfaction,
+                    "payment_score": payment,
+                    **weights,
+                    "overall_score": float(overall[i]),
+                    "created_at": now,
+                    "updated_at": now,
+                })
+                customer_rows.append({
+                    "id": customers[i].id,
+                    "health_score": int(overall[i]),
+                    "health_trend": trends[i],
+                })
+            self.db.execute(insert(HealthScoreComponents), score_rows)
+            self.db.execute(update(CustomerAccount), customer_rows)
+        self.db.commit()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def score_book(
+        self,
+        client_ids: Optional[Sequence[str]] = None,
+        status: Optional[str] = "active",
+        persist: bool = True
+    ) -> BulkScoringResult:
+        """
+        Score every matching customer in one set-based pass.
+
+        Args:
+            client_ids: Restrict scoring to these customers (default: whole book)
+            status: Only score customers with this account status (None = all)
+            persist: Insert HealthScoreComponents rows and update customers
+
+        Returns:
+            BulkScoringResult summary
+        """
+        started = time.perf_counter()
+        now = datetime.now()
+        cutoff = now - timedelta(days=self.lookback_period_days)
+        ids = list(client_ids) if client_ids is not None else None
+
+        customers = self._fetch_customers(ids, status)
+        result = BulkScoringResult()
+        if not customers:
+            result.duration_seconds = time.perf_counter() - started
+            return result
+
+        support = self._fetch_support_counts(ids, cutoff)
+        nps = self._fetch_nps_averages(ids, cutoff)
+        contracts = self._fetch_latest_contracts(ids)
+        previous = self._fetch_previous_scores(ids)
+
+        components = self.compute_component_matrix(customers, support, nps, contracts, now)
+        overall = np.floor(components @ self.weight_vector)
+
+        prev = np.array([previous.get(c.client_id, np.nan) for c in customers], dtype=float)
+        change = np.where(np.isnan(prev) | (prev == 0), 0.0, overall - prev)
+        trends = np.where(
+            change > TREND_DELTA, "improving",
+            np.where(change < -TREND_DELTA, "declining", "stable")
+        ).tolist()
+
+        if persist:
+            try:
+                self._write_results(customers, components, overall, trends, now)
+            except Exception as e:
+                self.db.rollback()
+                logger.error("bulk_health_score_save_error", error=str(e), customers=len(customers))
+                raise
+
+        risk_levels = np.select(
+            [overall >= 80, overall >= 65, overall >= 50],
+            ["low", "medium", "high"],
+            default="critical"
+        )
+        levels, level_counts = np.unique(risk_levels, return_counts=True)
+        trend_values, trend_counts = np.unique(np.array(trends), return_counts=True)
+
+        result.customers_scored = len(customers)
+        result.average_score = float(overall.mean())
+        result.risk_counts = {str(k): int(v) for k, v in zip(levels, level_counts)}
+        result.trend_counts = {str(k): int(v) for k, v in zip(trend_values, trend_counts)}
+        result.duration_seconds = time.perf_counter() - started
+
+        logger.info("bulk_health_scores_calculated", **result.to_dict())
+        return result
+
+
+__all__ = [
+    'BulkHealthScoringEngine',
+    'BulkScoringResult',
+    'COMPONENTS',
+    'DEFAULT_WEIGHTS',
+]
@@ -0,0 +1,740 @@
+"""
+Knowledge Base Search Index
+
+In-process inverted index over knowledge base articles with BM25 ranking.
+Searching the knowledge_base_articles table directly would need a LIKE scan
+over title, summary and content, because the table is only indexed by
+category and status.
+
+- Title, summary, content and tags are indexed as one document. Each
+  field's term frequency is weighted (FIELD_WEIGHTS) so that title and tag
+  hits rank above body hits (a simplified BM25F).
+- Category and status filters are posting lists (sets of documents) that
+  are intersected before scoring. A filtered search therefore only scores
+  the documents that can be returned.
+- Updates are incremental: upsert() replaces one article's postings, and
+  re-indexing is skipped when only metadata (status, votes, views) changed.
+- Suggestions combine prefix completion of the last query word with
+  typo correction (one insertion, deletion, substitution or transposition)
+  for words that are not in the vocabulary.
+- The index persists as a gzip-compressed JSON snapshot with delta-encoded
+  posting lists. Writes are atomic and at most one per
+  KB_INDEX_SNAPSHOT_INTERVAL seconds: a change arms a timer that saves
+  after the interval even if no further writes arrive, and the global
+  index also flushes at exit.
+- When there is no usable snapshot (fresh deploy, corrupt file) the global
+  index is rebuilt from the knowledge_base_articles table.
+
+manage_knowledge_base (search, create) and update_knowledge_base call
+get_kb_index(), but neither module parses yet, so neither is registered as
+a tool. Until they are repaired the index is only reachable through this
+module and its database backfill.
+
+Usage:
+    from src.services.kb_search import get_kb_index
+
+    index = get_kb_index()
+    index.upsert(article)                 # pydantic model, ORM row or dict
+    results = index.search("export csv", category="Reports & Analytics")
+    suggestions = index.suggest("exprot rep")
+    index.maybe_save()
+"""
+
+from typing import Dict, List, Any, Optional, Iterable, Set
+from collections import defaultdict
+from pathlib import Path
+import atexit
+import bisect
+import gzip
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import threading
+import time
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+KB_INDEX_PATH = Path(os.getenv('KB_INDEX_PATH', './config/kb_index.json.gz'))
+KB_INDEX_SNAPSHOT_INTERVAL = float(os.getenv('KB_INDEX_SNAPSHOT_INTERVAL', '30'))
+
+SNAPSHOT_FORMAT = 1
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Term frequency weight per field
+FIELD_WEIGHTS = {
+    'title': 3.0,
+    'tags': 2.0,
+    'summary': 1.5,
+    'content': 1.0,
+}
+
+# Statuses added to a search when include_drafts is set
+DRAFT_STATUSES = ('draft', 'review')
+
+# Shortest word that gets typo correction
+MIN_CORRECTION_LENGTH = 4
+
+# Prefix completions considered before ranking by document frequency
+MAX_COMPLETION_CANDIDATES = 200
+
+STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'can', 'do', 'for', 'from',
+    'how', 'i', 'if', 'in', 'is', 'it', 'my', 'of', 'on', 'or', 'the', 'this',
+    'to', 'what', 'when', 'with', 'you', 'your',
+})
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Article metadata kept per document and returned with results
+_META_FIELDS = (
+    'article_id', 'title', 'summary', 'category', 'subcategory',
+    'status', 'helpfulness_score', 'view_count',
+)
+
+
+def tokenize(text: str, keep_stopwords: bool = False) -> List[str]:
+    """
+    Split text into lowercase index terms.
+
+    Args:
+        text: Text to tokenize
+        keep_stopwords: Keep common words (used when rebuilding query strings)
+
+    Returns:
+        List of terms in order
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    if keep_stopwords:
+        return tokens
+    return [t for t in tokens if t not in STOPWORDS]
+
+
+def _variants(term: str) -> Set[str]:
+    """The term and every string obtained by deleting one character"""
+    return {term} | {term[:i] + term[i + 1:] for i in range(len(term))}
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """True if a and b differ by at most one insertion, deletion, substitution or adjacent transposition"""
+    if a == b:
+        return True
+    la, lb = len(a), len(b)
+    if abs(la - lb) > 1:
+        return False
+    if la == lb:
+        diffs = [i for i in range(la) if a[i] != b[i]]
+        if len(diffs) == 1:
+            return True
+        return (
+            len(diffs) == 2 and diffs[1] == diffs[0] + 1 and
+            a[diffs[0]] == b[diffs[1]] and a[diffs[1]] == b[diffs[0]]
+        )
+    if la > lb:
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    return a[i:] == b[i + 1:]
+
+
+def _field(article: Any, name: str, default: Any = None) -> Any:
+    """Read a field from a dict, pydantic model or ORM row"""
+    if isinstance(article, dict):
+        value = article.get(name, default)
+    else:
+        value = getattr(article, name, default)
+    # Enums (ArticleStatus) are stored by value
+    return getattr(value, 'value', value)
+
+
+class KnowledgeBaseIndex:
+    """
+    Incremental inverted index with BM25 ranking over KB articles.
+
+    Documents are numbered internally; article IDs map to document numbers
+    so that an article can be re-indexed or removed without a rebuild.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize an empty index.
+
+        Args:
+            path: Snapshot location used by save() / maybe_save()
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._clear()
+        self._last_save = time.monotonic()
+        self._save_timer: Optional[threading.Timer] = None
+        # True when the contents came from a snapshot on disk
+        self.restored = False
+
+    def _clear(self) -> None:
+        self._next_doc = 0
+        self._doc_ids: Dict[str, int] = {}
+        self._meta: Dict[int, Dict[str, Any]] = {}
+        self._doc_terms: Dict[int, Dict[str, float]] = {}
+        self._doc_len: Dict[int, float] = {}
+        self._fingerprints: Dict[int, str] = {}
+        self._total_len = 0.0
+
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._by_category: Dict[str, Set[int]] = defaultdict(set)
+        self._by_status: Dict[str, Set[int]] = defaultdict(set)
+
+        # Typo correction: one-deletion variant -> vocabulary terms
+        self._deletes: Dict[str, Set[str]] = defaultdict(set)
+        self._sorted_vocab: Optional[List[str]] = None
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
+    def __contains__(self, article_id: str) -> bool:
+        return article_id in self._doc_ids
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def upsert(self, article: Any) -> None:
+        """
+        Add or update an article.
+
+        Args:
+            article: KnowledgeBaseArticle (pydantic or ORM) or dict
+        """
+        article_id = _field(article, 'article_id')
+        if not article_id:
+            raise ValueError("article_id is required for indexing")
+
+        title = _field(article, 'title') or ""
+        summary = _field(article, 'summary') or ""
+        content = _field(article, 'content') or ""
+        tags = list(_field(article, 'tags') or [])
+
+        fingerprint = hashlib.sha1(
+            "\x1f".join([title, summary, content, "\x1e".join(tags)]).encode()
+        ).hexdigest()
+        meta = {name: _field(article, name) for name in _META_FIELDS}
+
+        with self._lock:
+            doc = self._doc_ids.get(article_id)
+            if doc is not None and self._fingerprints[doc] == fingerprint:
+                self._set_meta(doc, meta)
+                self._mark_dirty()
+                return
+
+            if doc is not None:
+                self._remove_doc(doc)
+
+            terms: Dict[str, float] = defaultdict(float)
+            for name, text in (('title', title), ('summary', summary), ('content', content),
+                               ('tags', " ".join(tags))):
+                weight = FIELD_WEIGHTS[name]
+                for term in tokenize(text):
+                    terms[term] += weight
+
+            self._add_doc(article_id, dict(terms), meta, fingerprint)
+            self._mark_dirty()
+
+    def remove(self, article_id: str) -> bool:
+        """
+        Remove an article from the index.
+
+        Args:
+            article_id: Article to remove
+
+        Returns:
+            True if the article was indexed
+        """
+        with self._lock:
+            doc = self._doc_ids.get(article_id)
+            if doc is None:
+                return False
+            self._remove_doc(doc)
+            self._mark_dirty()
+            return True
+
+    def rebuild(self, articles: Iterable[Any]) -> int:
+        """
+        Replace the index contents with the given articles.
+
+        Args:
+            articles: Articles to index
+
+        Returns:
+            Number of articles indexed
+        """
+        with self._lock:
+            self._clear()
+            for article in articles:
+                self.upsert(article)
+            self._mark_dirty()
+            return len(self)
+
+    def load_from_database(self, db: Any, batch_size: int = 1000) -> int:
+        """
+        Rebuild the index from the knowledge_base_articles table.
+
+        Args:
+            db: SQLAlchemy session
+            batch_size: Rows read per query
+
+        Returns:
+            Number of articles indexed
+        """
+        from sqlalchemy import select
+        from src.database.models import KnowledgeBaseArticle
+
+        def rows():
+            last_id = 0
+            while True:
+                batch = db.execute(
+                    select(KnowledgeBaseArticle)
+                    .where(KnowledgeBaseArticle.id > last_id)
+                    .order_by(KnowledgeBaseArticle.id)
+                    .limit(batch_size)
+                ).scalars().all()
+                if not batch:
+                    return
+                last_id = batch[-1].id
+                yield from batch
+
+        count = self.rebuild(rows())
+        logger.info("kb_index_rebuilt", articles=count)
+        return count
+
+    def _set_meta(self, doc: int, meta: Dict[str, Any]) -> None:
+        old = self._meta.get(doc)
+        if old is not None:
+            self._discard_filter(self._by_category, (old['category'] or '').lower(), doc)
+            self._discard_filter(self._by_status, old['status'], doc)
+        self._meta[doc] = meta
+        self._by_category[(meta['category'] or '').lower()].add(doc)
+        self._by_status[meta['status']].add(doc)
+
+    @staticmethod
+    def _discard_filter(lists: Dict[str, Set[int]], key: str, doc: int) -> None:
+        docs = lists.get(key)
+        if docs is not None:
+            docs.discard(doc)
+            if not docs:
+                del lists[key]
+
+    def _add_doc(self, article_id: str, terms: Dict[str, float], meta: Dict[str, Any], fingerprint: str) -> None:
+        doc = self._next_doc
+        self._next_doc += 1
+
+        self._doc_ids[article_id] = doc
+        self._doc_terms[doc] = terms
+        self._fingerprints[doc] = fingerprint
+        length = sum(terms.values())
+        self._doc_len[doc] = length
+        self._total_len += length
+        self._set_meta(doc, meta)
+
+        for term, tf in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._add_vocab(term)
+            postings[doc] = tf
+
+    def _remove_doc(self, doc: int) -> None:
+        meta = self._meta.pop(doc)
+        del self._doc_ids[meta['article_id']]
+        del self._fingerprints[doc]
+        self._total_len -= self._doc_len.pop(doc)
+        self._discard_filter(self._by_category, (meta['category'] or '').lower(), doc)
+        self._discard_filter(self._by_status, meta['status'], doc)
+
+        for term in self._doc_terms.pop(doc):
+            postings = self._postings[term]
+            del postings[doc]
+            if not postings:
+                del self._postings[term]
+                self._remove_vocab(term)
+
+    def _add_vocab(self, term: str) -> None:
+        for variant in _variants(term):
+            self._deletes[variant].add(term)
+        self._sorted_vocab = None
+
+    def _remove_vocab(self, term: str) -> None:
+        for variant in _variants(term):
+            terms = self._deletes.get(variant)
+            if terms is not None:
+                terms.discard(term)
+                if not terms:
+                    del self._deletes[variant]
+        self._sorted_vocab = None
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def _allowed_docs(self, category: Optional[str], statuses: Optional[Iterable[str]]) -> Optional[Set[int]]:
+        """Intersect the category and status posting lists (None = no filter)"""
+        allowed = None
+        if statuses is not None:
+            allowed = set()
+            for status in statuses:
+                allowed |= self._by_status.get(status, set())
+        if category is not None:
+            in_category = self._by_category.get(category.lower(), set())
+            allowed = in_category if allowed is None else allowed & in_category
+        return allowed
+
+    def search(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        status: Optional[str] = "published",
+        include_drafts: bool = False,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank articles for a query with BM25.
+
+        Args:
+            query: Search text
+            category: Only articles in this category (case-insensitive)
+            status: Only articles with this status (None = any status)
+            include_drafts: Also return draft and in-review articles
+            limit: Maximum results
+
+        Returns:
+            Article summaries with relevance_score, best match first
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or limit <= 0:
+            return []
+
+        statuses = None
+        if status is not None:
+            statuses = {status, *DRAFT_STATUSES} if include_drafts else {status}
+
+        with self._lock:
+            allowed = self._allowed_docs(category, statuses)
+            if allowed is not None and not allowed:
+                return []
+
+            total_docs = len(self._doc_ids)
+            avg_len = self._total_len / total_docs if total_docs else 0.0
+            scores: Dict[int, float] = defaultdict(float)
+            matched: Dict[int, List[str]] = defaultdict(list)
+
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (total_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+
+                # Walk whichever side of the filter intersection is shorter
+                if allowed is None:
+                    candidates = postings.items()
+                elif len(allowed) < len(postings):
+                    candidates = ((d, postings[d]) for d in allowed if d in postings)
+                else:
+                    candidates = ((d, tf) for d, tf in postings.items() if d in allowed)
+
+                for doc, tf in candidates:
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_len[doc] / avg_len)
+                    scores[doc] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+                    matched[doc].append(term)
+
+            top = heapq.nlargest(
+                limit,
+                scores.items(),
+                key=lambda item: (item[1], self._meta[item[0]]['helpfulness_score'] or 0.0)
+            )
+            return [
+                dict(self._meta[doc], relevance_score=round(score, 4), matched_terms=matched[doc])
+                for doc, score in top
+            ]
+
+    # ------------------------------------------------------------------
+    # Suggestions
+    # ------------------------------------------------------------------
+
+    def correct(self, term: str) -> Optional[str]:
+        """
+        Closest vocabulary term within one edit.
+
+        Args:
+            term: Word to correct
+
+        Returns:
+            The most common matching term, or None
+        """
+        with self._lock:
+            if term in self._postings or len(term) < MIN_CORRECTION_LENGTH:
+                return None
+            candidates = set()
+            for variant in _variants(term):
+                candidates |= self._deletes.get(variant, set())
+            candidates = [c for c in candidates if _within_one_edit(term, c)]
+            if not candidates:
+                return None
+            return max(candidates, key=lambda c: (len(self._postings[c]), c))
+
+    def complete(self, prefix: str, limit: int = 5) -> List[str]:
+        """
+        Vocabulary terms starting with prefix, most common first.
+
+        Args:
+            prefix: Word prefix
+            limit: Maximum completions
+
+        Returns:
+            List of terms (excluding the prefix itself)
+        """
+        with self._lock:
+            if self._sorted_vocab is None:
+                self._sorted_vocab = sorted(self._postings)
+            vocab = self._sorted_vocab
+
+            candidates = []
+            i = bisect.bisect_left(vocab, prefix)
+            while i < len(vocab) and vocab[i].startswith(prefix) and len(candidates) < MAX_COMPLETION_CANDIDATES:
+                if vocab[i] != prefix:
+                    candidates.append(vocab[i])
+                i += 1
+            candidates.sort(key=lambda t: len(self._postings[t]), reverse=True)
+            return candidates[:limit]
+
+    def suggest(self, query: str, limit: int = 5) -> List[str]:
+        """
+        Query suggestions: the typo-corrected query, then completions of its
+        last word.
+
+        Args:
+            query: Search text as typed
+            limit: Maximum suggestions
+
+        Returns:
+            Suggested query strings
+        """
+        words = tokenize(query, keep_stopwords=True)
+        if not words:
+            return []
+
+        corrected = [
+            word if word in STOPWORDS else (self.correct(word) or word)
+            for word in words
+        ]
+
+        suggestions = []
+        if corrected != words:
+            suggestions.append(" ".join(corrected))
+        if corrected[-1] not in STOPWORDS:
+            head = corrected[:-1]
+            for completion in self.complete(corrected[-1], limit):
+                suggestions.append(" ".join(head + [completion]))
+
+        return list(dict.fromkeys(suggestions))[:limit]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def to_snapshot(self) -> Dict[str, Any]:
+        """
+        Compact serializable form of the index.
+
+        Documents are renumbered densely; each posting list is flattened to
+        [doc gap, tf, doc gap, tf, ...].
+        """
+        with self._lock:
+            renumber = {doc: i for i, doc in enumerate(sorted(self._meta))}
+            docs = [
+                [self._meta[doc][name] for name in _META_FIELDS] + [self._fingerprints[doc]]
+                for doc in sorted(self._meta)
+            ]
+            postings = {}
+            for term, docs_tf in self._postings.items():
+                flat = []
+                previous = 0
+                for doc in sorted(docs_tf, key=renumber.__getitem__):
+                    number = renumber[doc]
+                    tf = docs_tf[doc]
+                    flat.extend((number - previous, int(tf) if tf.is_integer() else tf))
+                    previous = number
+                postings[term] = flat
+            return {'format': SNAPSHOT_FORMAT, 'docs': docs, 'postings': postings}
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any], path: Optional[Path] = None) -> 'KnowledgeBaseIndex':
+        """Rebuild an index from to_snapshot() output."""
+        if snapshot.get('format') != SNAPSHOT_FORMAT:
+            raise ValueError(f"Unsupported KB index snapshot format: {snapshot.get('format')}")
+
+        index = cls(path)
+        doc_terms: List[Dict[str, float]] = [{} for _ in snapshot['docs']]
+        for term, flat in snapshot['postings'].items():
+            doc = 0
+            for i in range(0, len(flat), 2):
+                doc += flat[i]
+                doc_terms[doc][term] = float(flat[i + 1])
+
+        for row, terms in zip(snapshot['docs'], doc_terms):
+            meta = dict(zip(_META_FIELDS, row))
+            index._add_doc(meta['article_id'], terms, meta, row[len(_META_FIELDS)])
+        return index
+
+    def save(self, path: Optional[Path] = None) -> Path:
+        """
+        Atomically write a snapshot.
+
+        Args:
+            path: Destination (defaults to the index path)
+
+        Returns:
+            Path written
+        """
+        path = Path(path or self.path)
+        with self._lock:
+            data = json.dumps(self.to_snapshot(), separators=(',', ':')).encode()
+            self._dirty = False
+            self._last_save = time.monotonic()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(gzip.compress(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+        logger.debug("kb_index_saved", path=str(path), articles=len(self), bytes=len(data))
+        return path
+
+    def _mark_dirty(self) -> None:
+        """Record an unsaved change and make sure a save is scheduled."""
+        self._dirty = True
+        if self.path is None or self._save_timer is not None:
+            return
+        timer = threading.Timer(KB_INDEX_SNAPSHOT_INTERVAL, self._save_when_due)
+        timer.daemon = True
+        self._save_timer = timer
+        timer.start()
+
+    def _save_when_due(self) -> None:
+        """Timer callback: save changes made since the timer was armed."""
+        with self._lock:
+            self._save_timer = None
+        try:
+            self.flush()
+        except OSError as e:
+            logger.warning("kb_index_save_failed", path=str(self.path), error=str(e))
+
+    def maybe_save(self) -> bool:
+        """
+        Save if there are unsaved changes and the snapshot interval has passed.
+
+        Returns:
+            True if a snapshot was written
+        """
+        if not self._dirty or self.path is None:
+            return False
+        if time.monotonic() - self._last_save < KB_INDEX_SNAPSHOT_INTERVAL:
+            return False
+        self.save()
+        return True
+
+    def flush(self) -> None:
+        """Save any unsaved changes now."""
+        if self._dirty and self.path is not None:
+            self.save()
+
+    @classmethod
+    def load(cls, path: Path) -> 'KnowledgeBaseIndex':
+        """
+        Load a snapshot, or start empty if none exists or it is unreadable.
+
+        Args:
+            path: Snapshot location
+
+        Returns:
+            KnowledgeBaseIndex bound to path
+        """
+        path = Path(path)
+        if not path.exists():
+            return cls(path)
+        try:
+            with open(path, 'rb') as f:
+                snapshot = json.loads(gzip.decompress(f.read()))
+            index = cls.from_snapshot(snapshot, path)
+            index.restored = True
+            logger.info("kb_index_loaded", path=str(path), articles=len(index))
+            return index
+        except (OSError, ValueError, KeyError, IndexError) as e:
+            logger.warning("kb_index_load_failed", path=str(path), error=str(e))
+            return cls(path)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Index size statistics"""
+        with self._lock:
+            return {
+                'articles': len(self._doc_ids),
+                'terms': len(self._postings),
+                'postings': sum(len(p) for p in self._postings.values()),
+                'categories': len(self._by_category),
+                'unsaved_changes': self._dirty,
+            }
+
+
+def backfill_from_database(index: KnowledgeBaseIndex, session_factory: Optional[Any] = None) -> int:
+    """
+    Rebuild an index from the database and snapshot it.
+
+    Args:
+        index: Index to fill
+        session_factory: Sync session factory (defaults to src.database.SessionLocal)
+
+    Returns:
+        Number of articles indexed (0 if the database is unavailable)
+    """
+    try:
+        if session_factory is None:
+            from src.database import SessionLocal as session_factory
+        with session_factory() as db:
+            count = index.load_from_database(db)
+        index.flush()
+        return count
+    except Exception as e:
+        logger.warning("kb_index_backfill_failed", error=str(e))
+        return 0
+
+
+# Global index instance
+_kb_index = None
+
+
+def get_kb_index() -> KnowledgeBaseIndex:
+    """Get or create the global knowledge base index (loaded from KB_INDEX_PATH)"""
+    global _kb_index
+    if _kb_index is None:
+        _kb_index = KnowledgeBaseIndex.load(KB_INDEX_PATH)
+        if not _kb_index.restored:
+            backfill_from_database(_kb_index)
+        atexit.register(_kb_index.flush)
+    return _kb_index
+
+
+__all__ = [
+    'KnowledgeBaseIndex',
+    'get_kb_index',
+    'backfill_from_database',
+    'tokenize',
+]
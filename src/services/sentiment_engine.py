@@ -0,0 +1,575 @@
+"""
+Batch Sentiment and Theme Engine
+
+Keyword-lexicon sentiment, theme and emotion detection for customer
+feedback. Replaces the per-item ``_analyze_sentiment_content`` helper, which
+ran one substring scan per keyword, theme and emotion term for every item.
+
+Text is tokenized once and every token is matched against a trie built from
+the whole lexicon, so the cost per item is one pass over its words no matter
+how many terms the lexicon holds. Token matches are memoized, which makes
+large batches (where the same vocabulary repeats) close to a dict lookup per
+word.
+
+Matching rules:
+- a term matches at the start of a word and allows any suffix
+  ("bug" matches "bugs", "help" matches "helpful"); it never matches inside
+  a word, so "ui" does not match "build"
+- multi-word terms ("not working") match consecutive words, with the suffix
+  rule applied to the last word
+- each distinct term counts once per item
+
+collect_feedback and analyze_feedback_sentiment already score through this
+engine. Both tool modules currently fail to parse and are not registered,
+so for now only direct callers (and rescore_feedback) use it.
+
+Usage:
+    from src.services.sentiment_engine import get_sentiment_engine
+
+    engine = get_sentiment_engine()
+    result = engine.analyze(content, title)            # one item
+    results = engine.analyze_batch(texts)               # thousands of items
+    results = engine.analyze_batch(texts, processes=8)  # backfills
+
+    # Re-score stored feedback
+    summary = engine.rescore_feedback(db, since=datetime(2025, 1, 1), processes=8)
+"""
+
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import json
+import os
+import re
+import time
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+SENTIMENT_LEXICON_PATH = os.getenv('SENTIMENT_LEXICON_PATH')
+SENTIMENT_TOKEN_CACHE_SIZE = int(os.getenv('SENTIMENT_TOKEN_CACHE_SIZE', '200000'))
+
+# Sentiment label -> score, matching the CustomerFeedback sentiment columns
+SENTIMENT_SCORES = {
+    'very_positive': 0.8,
+    'positive': 0.5,
+    'neutral': 0.0,
+    'negative': -0.5,
+    'very_negative': -0.8,
+}
+
+# Net keyword difference above which sentiment is "very" positive/negative
+STRONG_SENTIMENT_MARGIN = 2
+
+DEFAULT_CONFIDENCE = 0.75
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+# Trie keys: _END holds the entries for a complete term, _NEXT_WORD continues a phrase
+_END = None
+_NEXT_WORD = " "
+
+
+@dataclass
+class SentimentLexicon:
+    """
+    Terms used for sentiment, theme and emotion detection.
+
+    Themes are reported in the order they are defined; emotions are checked
+    in order and the first match wins.
+    """
+    positive: Tuple[str, ...] = (
+        'great', 'excellent', 'love', 'amazing', 'fantastic', 'helpful', 'easy', 'perfect'
+    )
+    negative: Tuple[str, ...] = (
+        'terrible', 'awful', 'hate', 'broken', 'bug', 'issue', 'problem', 'difficult', 'slow'
+    )
+    themes: Dict[str, Tuple[str, ...]] = field(default_factory=lambda: {
+        'customer_support': ('support', 'help'),
+        'product_features': ('feature', 'function'),
+        'performance': ('performance', 'slow', 'fast'),
+        'user_interface': ('ui', 'interface', 'design'),
+    })
+    emotions: Dict[str, Tuple[str, ...]] = field(default_factory=lambda: {
+        'frustrated': ('frustrated', 'angry'),
+        'happy': ('happy', 'pleased'),
+        'confused': ('confused', 'unclear'),
+    })
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SentimentLexicon':
+        """
+        Build a lexicon from a dict (missing sections keep their defaults).
+
+        Args:
+            data: Dict with optional positive, negative, themes and emotions keys
+
+        Returns:
+            SentimentLexicon
+        """
+        defaults = cls()
+        return cls(
+            positive=tuple(data.get('positive', defaults.positive)),
+            negative=tuple(data.get('negative', defaults.negative)),
+            themes={k: tuple(v) for k, v in data.get('themes', defaults.themes).items()},
+            emotions={k: tuple(v) for k, v in data.get('emotions', defaults.emotions).items()},
+        )
+
+    @classmethod
+    def from_file(cls, path: Path) -> 'SentimentLexicon':
+        """Load a lexicon from a JSON file."""
+        with open(path, 'r') as f:
+            return cls.from_dict(json.load(f))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return {
+            'positive': list(self.positive),
+            'negative': list(self.negative),
+            'themes': {k: list(v) for k, v in self.themes.items()},
+            'emotions': {k: list(v) for k, v in self.emotions.items()},
+        }
+
+    def entries(self) -> Iterable[Tuple[str, str, str]]:
+        """All (term, category, label) entries."""
+        for term in self.positive:
+            yield term, 'polarity', 'positive'
+        for term in self.negative:
+            yield term, 'polarity', 'negative'
+        for theme, terms in self.themes.items():
+            for term in terms:
+                yield term, 'theme', theme
+        for emotion, terms in self.emotions.items():
+            for term in terms:
+                yield term, 'emotion', emotion
+
+
+@dataclass
+class SentimentResult:
+    """Sentiment analysis of one feedback item"""
+    sentiment: str
+    score: float
+    themes: List[str]
+    emotion: str
+    positive_matches: int = 0
+    negative_matches: int = 0
+    confidence: float = DEFAULT_CONFIDENCE
+
+    @property
+    def impact_notes(self) -> str:
+        """Human-readable summary stored as CustomerFeedback.impact_assessment"""
+        themes = ', '.join(self.themes) if self.themes else 'general feedback'
+        return f"Sentiment: {self.sentiment.replace('_', ' ').title()}. Key themes: {themes}."
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (same keys as the previous helper)"""
+        return {
+            'sentiment': self.sentiment,
+            'score': self.score,
+            'confidence': self.confidence,
+            'themes': list(self.themes),
+            'emotion': self.emotion,
+            'impact_notes': self.impact_notes,
+        }
+
+
+@dataclass
+class RescoreResult:
+    """Summary of a feedback re-scoring run"""
+    items_scored: int = 0
+    items_changed: int = 0
+    sentiment_counts: Dict[str, int] = field(default_factory=dict)
+    duration_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            'items_scored': self.items_scored,
+            'items_changed': self.items_changed,
+            'sentiment_counts': self.sentiment_counts,
+            'duration_seconds': round(self.duration_seconds, 3),
+        }
+
+
+def _classify(positive: int, negative: int) -> str:
+    """Sentiment label from distinct positive/negative term counts"""
+    if positive > negative + STRONG_SENTIMENT_MARGIN:
+        return 'very_positive'
+    if positive > negative:
+        return 'positive'
+    if negative > positive + STRONG_SENTIMENT_MARGIN:
+        return 'very_negative'
+    if negative > positive:
+        return 'negative'
+    return 'neutral'
+
+
+class SentimentEngine:
+    """
+    Scores feedback text against a lexicon in a single pass per item.
+
+    The engine is stateless apart from its token cache and can be shared
+    across requests.
+    """
+
+    def __init__(self, lexicon: Optional[SentimentLexicon] = None, token_cache_size: int = SENTIMENT_TOKEN_CACHE_SIZE):
+        """
+        Initialize engine.
+
+        Args:
+            lexicon: Terms to detect (defaults to SentimentLexicon())
+            token_cache_size: Distinct words whose matches are memoized
+        """
+        self.lexicon = lexicon or SentimentLexicon()
+        self._trie: Dict[Any, Any] = {}
+        self._phrase_starts: set = set()
+        self._term_ids: Dict[Tuple[str, str, str], int] = {}
+
+        for term, category, label in self.lexicon.entries():
+            self._add_term(term, category, label)
+
+        self._theme_order = {theme: i for i, theme in enumerate(self.lexicon.themes)}
+        self._emotion_order = list(self.lexicon.emotions)
+        self._token_cache: Dict[str, Tuple[Tuple[int, str, str], ...]] = {}
+        self._token_cache_size = token_cache_size
+
+    def _add_term(self, term: str, category: str, label: str) -> None:
+        """Insert a lexicon term into the trie."""
+        words = _TOKEN_RE.findall(term.lower())
+        if not words:
+            return
+
+        # Each (term, category, label) gets an id so repeated words count once
+        key = (' '.join(words), category, label)
+        term_id = self._term_ids.setdefault(key, len(self._term_ids))
+
+        node = self._trie
+        for i, word in enumerate(words):
+            if i:
+                node = node.setdefault(_NEXT_WORD, {})
+            for ch in word:
+                node = node.setdefault(ch, {})
+        node.setdefault(_END, []).append((term_id, category, label))
+
+        if len(words) > 1:
+            self._phrase_starts.add(words[0])
+
+    def _walk_token(self, token: str) -> Tuple[Tuple[int, str, str], ...]:
+        """Entries for every single-word term that is a prefix of the token."""
+        matches: List[Tuple[int, str, str]] = []
+        node = self._trie
+        for ch in token:
+            node = node.get(ch)
+            if node is None:
+                break
+            if _END in node:
+                matches.extend(node[_END])
+        return tuple(matches)
+
+    def _walk_phrase(self, tokens: List[str], start: int) -> List[Tuple[int, str, str]]:
+        """Entries for multi-word terms beginning at tokens[start]."""
+        matches: List[Tuple[int, str, str]] = []
+        node = self._trie
+        for ch in tokens[start]:
+            node = node.get(ch)
+            if node is None:
+                return matches
+
+        # Only the last phrase word may carry a suffix, so a word has to be
+        # consumed completely before stepping to the next one
+        for token in tokens[start + 1:]:
+            node = node.get(_NEXT_WORD)
+            if node is None:
+                return matches
+            for ch in token:
+                node = node.get(ch)
+                if node is None:
+                    return matches
+                if _END in node:
+                    matches.extend(node[_END])
+        return matches
+
+    def _matches(self, text: str) -> Dict[int, Tuple[str, str]]:
+        """Distinct lexicon entries found in the text, keyed by term id."""
+        tokens = _TOKEN_RE.findall(text.lower())
+        found: Dict[int, Tuple[str, str]] = {}
+        cache = self._token_cache
+        phrase_starts = self._phrase_starts
+
+        for i, token in enumerate(tokens):
+            entries = cache.get(token)
+            if entries is None:
+                entries = self._walk_token(token)
+                if len(cache) < self._token_cache_size:
+                    cache[token] = entries
+            for term_id, category, label in entries:
+                found[term_id] = (category, label)
+            if token in phrase_starts:
+                for term_id, category, label in self._walk_phrase(tokens, i):
+                    found[term_id] = (category, label)
+        return found
+
+    def analyze(self, content: str, title: str = "") -> SentimentResult:
+        """
+        Analyze one feedback item.
+
+        Args:
+            content: Feedback body
+            title: Feedback title (scored together with the body)
+
+        Returns:
+            SentimentResult
+        """
+        found = self._matches(f"{title} {content}" if title else content or "")
+
+        positive = negative = 0
+        themes = set()
+        emotions = set()
+        for category, label in found.values():
+            if category == 'polarity':
+                if label == 'positive':
+                    positive += 1
+                else:
+                    negative += 1
+            elif category == 'theme':
+                themes.add(label)
+            else:
+                emotions.add(label)
+
+        sentiment = _classify(positive, negative)
+        emotion = next((e for e in self._emotion_order if e in emotions), 'neutral')
+
+        return SentimentResult(
+            sentiment=sentiment,
+            score=SENTIMENT_SCORES[sentiment],
+            themes=sorted(themes, key=self._theme_order.__getitem__),
+            emotion=emotion,
+            positive_matches=positive,
+            negative_matches=negative,
+        )
+
+    def analyze_batch(
+        self,
+        texts: Sequence[str],
+        processes: Optional[int] = None,
+        chunk_size: int = 2000
+    ) -> List[SentimentResult]:
+        """
+        Analyze many items.
+
+        Args:
+            texts: Item texts (title and content already combined)
+            processes: Worker processes for large backfills (None/1 = in-process)
+            chunk_size: Items sent to a worker per task
+
+        Returns:
+            Results in input order
+        """
+        if not processes or processes <= 1 or len(texts) <= chunk_size:
+            return [self.analyze(text) for text in texts]
+
+        chunks = [list(texts[i:i + chunk_size]) for i in range(0, len(texts), chunk_size)]
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_worker,
+            initargs=(self.lexicon.to_dict(),)
+        ) as pool:
+            results: List[SentimentResult] = []
+            for rows in pool.map(_score_chunk, chunks):
+                results.extend(SentimentResult(*row) for row in rows)
+        return results
+
+    def summarize(self, results: Sequence[SentimentResult]) -> Dict[str, Any]:
+        """
+        Aggregate results into sentiment distribution and theme statistics.
+
+        Args:
+            results: Results from analyze / analyze_batch
+
+        Returns:
+            Dict with total, counts, distribution, average_score and
+            positive / negative theme lists (theme, mentions, avg_sentiment)
+        """
+        total = len(results)
+        counts = {label: 0 for label in SENTIMENT_SCORES}
+        theme_scores: Dict[str, List[float]] = {}
+        emotion_counts: Dict[str, int] = {}
+
+        for result in results:
+            counts[result.sentiment] += 1
+            for theme in result.themes:
+                theme_scores.setdefault(theme, []).append(result.score)
+            emotion_counts[result.emotion] = emotion_counts.get(result.emotion, 0) + 1
+
+        themes = [
+            {
+                'theme': theme,
+                'mentions': len(scores),
+                'avg_sentiment': round(sum(scores) / len(scores), 2),
+            }
+            for theme, scores in theme_scores.items()
+        ]
+        themes.sort(key=lambda t: t['mentions'], reverse=True)
+
+        return {
+            'total': total,
+            'counts': counts,
+            'distribution': {k: (v / total if total else 0) for k, v in counts.items()},
+            'average_score': round(sum(r.score for r in results) / total, 3) if total else 0.0,
+            'emotions': emotion_counts,
+            'positive': [t for t in themes if t['avg_sentiment'] > 0],
+            'negative': [t for t in themes if t['avg_sentiment'] < 0],
+        }
+
+    def rescore_feedback(
+        self,
+        db: Any,
+        since: Optional[datetime] = None,
+        client_ids: Optional[Sequence[str]] = None,
+        batch_size: int = 5000,
+        processes: Optional[int] = None,
+        persist: bool = True
+    ) -> RescoreResult:
+        """
+        Re-score stored CustomerFeedback rows with the current lexicon.
+
+        Rows are read in primary-key order, batch_size at a time; changed
+        sentiment, score and impact notes are written back with one bulk
+        UPDATE and commit per batch.
+
+        Args:
+            db: SQLAlchemy session
+            since: Only rows created at or after this time
+            client_ids: Restrict to these customers
+            batch_size: Rows per read / write batch
+            processes: Worker processes for scoring (None = in-process)
+            persist: Write changed rows back
+
+        Returns:
+            RescoreResult summary
+        """
+        from sqlalchemy import select, update
+        from src.database.models import CustomerFeedback
+
+        started = time.perf_counter()
+        result = RescoreResult(sentiment_counts={label: 0 for label in SENTIMENT_SCORES})
+        last_id = 0
+
+        # One pool for the whole run rather than per batch
+        executor = None
+        if processes and processes > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=processes,
+                initializer=_init_worker,
+                initargs=(self.lexicon.to_dict(),)
+            )
+
+        try:
+            while True:
+                query = (
+                    select(
+                        CustomerFeedback.id,
+                        CustomerFeedback.title,
+                        CustomerFeedback.content,
+                        CustomerFeedback.sentiment,
+                        CustomerFeedback.sentiment_score,
+                    )
+                    .where(CustomerFeedback.id > last_id)
+                    .order_by(CustomerFeedback.id)
+                    .limit(batch_size)
+                )
+                if since is not None:
+                    query = query.where(CustomerFeedback.created_at >= since)
+                if client_ids is not None:
+                    query = query.where(CustomerFeedback.client_id.in_(list(client_ids)))
+
+                rows = db.execute(query).all()
+                if not rows:
+                    break
+                last_id = rows[-1].id
+
+                texts = [f"{row.title} {row.content}" for row in rows]
+                if executor is not None:
+                    chunk = max(1, -(-len(texts) // processes))
+                    scored = []
+                    for chunk_rows in executor.map(_score_chunk, [texts[i:i + chunk] for i in range(0, len(texts), chunk)]):
+                        scored.extend(SentimentResult(*r) for r in chunk_rows)
+                else:
+                    scored = [self.analyze(text) for text in texts]
+
+                changes = []
+                for row, scored_row in zip(rows, scored):
+                    result.sentiment_counts[scored_row.sentiment] += 1
+                    if row.sentiment != scored_row.sentiment or row.sentiment_score != scored_row.score:
+                        changes.append({
+                            'id': row.id,
+                            'sentiment': scored_row.sentiment,
+                            'sentiment_score': scored_row.score,
+                            'impact_assessment': scored_row.impact_notes,
+                        })
+
+                result.items_scored += len(rows)
+                result.items_changed += len(changes)
+
+                if persist and changes:
+                    try:
+                        db.execute(update(CustomerFeedback), changes)
+                        db.commit()
+                    except Exception as e:
+                        db.rollback()
+                        logger.error("feedback_rescore_save_error", error=str(e), batch_start=rows[0].id)
+                        raise
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        result.duration_seconds = time.perf_counter() - started
+        logger.info("feedback_rescored", **result.to_dict())
+        return result
+
+
+# ============================================================================
+# Process pool workers
+# ============================================================================
+
+_worker_engine: Optional[SentimentEngine] = None
+
+
+def _init_worker(lexicon: Dict[str, Any]) -> None:
+    """Build the engine once per worker process"""
+    global _worker_engine
+    _worker_engine = SentimentEngine(SentimentLexicon.from_dict(lexicon))
+
+
+def _score_chunk(texts: List[str]) -> List[tuple]:
+    """Score a chunk in a worker; results travel back as plain tuples"""
+    return [
+        (r.sentiment, r.score, r.themes, r.emotion, r.positive_matches, r.negative_matches, r.confidence)
+        for r in map(_worker_engine.analyze, texts)
+    ]
+
+
+# Global engine instance
+_sentiment_engine = None
+
+
+def get_sentiment_engine() -> SentimentEngine:
+    """Get or create the global sentiment engine (SENTIMENT_LEXICON_PATH overrides the lexicon)"""
+    global _sentiment_engine
+    if _sentiment_engine is None:
+        lexicon = SentimentLexicon.from_file(Path(SENTIMENT_LEXICON_PATH)) if SENTIMENT_LEXICON_PATH else None
+        _sentiment_engine = SentimentEngine(lexicon)
+    return _sentiment_engine
+
+
+__all__ = [
+    'SentimentEngine',
+    'SentimentLexicon',
+    'SentimentResult',
+    'RescoreResult',
+    'SENTIMENT_SCORES',
+    'get_sentiment_engine',
+]
@@ -0,0 +1,643 @@
+"""
+SLA Breach Monitor
+
+Event-driven SLA tracking for open support tickets. SupportTicket's
+calculate_sla_status() only evaluates one ticket when it is called, so
+finding upcoming breaches meant rescanning every open ticket. Instead:
+
+- open tickets are loaded once (track / sync_from_database) and each
+  running SLA clock (first response, resolution) schedules two timers:
+  at-risk (SLA_AT_RISK_RATIO of the target, 80% by default) and breach
+- timers live in a hierarchical timing wheel (TimerWheel): scheduling and
+  cancelling are O(1), and advancing the clock costs O(1) per tick plus
+  the timers that fire, skipping empty stretches of the wheel
+- events fire once, when a threshold is crossed; priority changes, first
+  responses and resolutions re-track the ticket, replacing its timers
+- currently at-risk and breached clocks are indexed, so reports never
+  walk the whole open queue
+
+Usage:
+    from src.services.sla_monitor import get_sla_monitor
+
+    monitor = get_sla_monitor()
+    monitor.track(ticket)          # on create / update / resolve
+    events = monitor.advance()     # SLAEvent for every threshold crossed
+    monitor.breached()             # clocks currently in breach
+
+    # Long-running processes drive the clock (the MCP server does this in
+    # its lifespan); events are handed to the callback every tick
+    await monitor.run(log_sla_events)
+
+Timestamps must use the same clock as the monitor. The global monitor
+runs on datetime.utcnow(), like the database rows it syncs; tickets built
+by the tools carry local datetime.now() stamps, so they go through
+ticket_in_utc() before track().
+"""
+
+from typing import Dict, List, Any, Optional, Callable, Hashable, Iterable, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+import asyncio
+import inspect
+import math
+import os
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+SLA_AT_RISK_RATIO = float(os.getenv('SLA_AT_RISK_RATIO', '0.8'))
+SLA_MONITOR_TICK_SECONDS = float(os.getenv('SLA_MONITOR_TICK_SECONDS', '1'))
+
+# Timing wheel geometry: 4 levels of 64 slots cover 64^4 ticks (194 days at 1s)
+WHEEL_BITS = 6
+WHEEL_SIZE = 1 << WHEEL_BITS
+WHEEL_MASK = WHEEL_SIZE - 1
+WHEEL_LEVELS = 4
+
+SLA_KINDS = ('first_response', 'resolution')
+CLOSED_STATUSES = ('resolved', 'closed')
+
+# Status order; events only fire when a clock moves up
+SEVERITY = {'on_track': 0, 'at_risk': 1, 'breached': 2}
+
+
+def _field(item: Any, name: str, default: Any = None) -> Any:
+    """Read a field from a dict, pydantic model or ORM row"""
+    if isinstance(item, dict):
+        value = item.get(name, default)
+    else:
+        value = getattr(item, name, default)
+    # Enums (TicketStatus, TicketPriority) are stored by value
+    return getattr(value, 'value', value)
+
+
+TICKET_FIELDS = (
+    'ticket_id', 'client_id', 'priority', 'status',
+    'sla_first_response_minutes', 'sla_resolution_minutes',
+)
+TIMESTAMP_FIELDS = ('created_at', 'first_response_at', 'resolved_at', 'updated_at')
+
+
+def to_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Convert a naive local (or aware) datetime to naive UTC"""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value.timestamp(), timezone.utc).replace(tzinfo=None)
+
+
+def ticket_in_utc(ticket: Any) -> Dict[str, Any]:
+    """SLA fields of a ticket stamped with local time, with timestamps in UTC"""
+    fields = {name: _field(ticket, name) for name in TICKET_FIELDS}
+    fields.update({name: to_utc(_field(ticket, name)) for name in TIMESTAMP_FIELDS})
+    return fields
+
+
+# ============================================================================
+# Timing wheel
+# ============================================================================
+
+class _Timer:
+    __slots__ = ('key', 'when', 'expire', 'level', 'slot')
+
+    def __init__(self, key: Hashable, when: datetime, expire: int):
+        self.key = key
+        self.when = when
+        self.expire = expire
+        self.level = -1
+        self.slot = -1
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel keyed by arbitrary hashable keys.
+
+    Level L holds timers due between 64^L and 64^(L+1) ticks away. When
+    the clock reaches a level's slot boundary, that slot's timers are
+    re-placed into lower levels. Timers further away than the wheel
+    spans are parked in the top level and re-placed until due.
+    """
+
+    def __init__(self, resolution_seconds: float = 1.0, origin: Optional[datetime] = None, levels: int = WHEEL_LEVELS):
+        """
+        Initialize wheel.
+
+        Args:
+            resolution_seconds: Length of one tick
+            origin: Time of tick 0 (defaults to now)
+            levels: Wheel levels
+        """
+        self.resolution = resolution_seconds
+        self.origin = origin or datetime.now()
+        self.levels = levels
+        self._slots: List[List[Dict[Hashable, _Timer]]] = [
+            [{} for _ in range(WHEEL_SIZE)] for _ in range(levels)
+        ]
+        self._counts = [0] * levels
+        self._due: Dict[Hashable, _Timer] = {}
+        self._timers: Dict[Hashable, _Timer] = {}
+        self._tick = 0
+        self._max_delta = (1 << (WHEEL_BITS * levels)) - 1
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._timers
+
+    def _to_tick(self, when: datetime) -> float:
+        return (when - self.origin).total_seconds() / self.resolution
+
+    def schedule(self, key: Hashable, when: datetime) -> None:
+        """
+        Schedule (or reschedule) a timer.
+
+        Args:
+            key: Timer identity
+            when: Time the timer fires; past times fire on the next advance()
+        """
+        self.cancel(key)
+        timer = _Timer(key, when, math.ceil(self._to_tick(when)))
+        self._timers[key] = timer
+        self._place(timer)
+
+    def cancel(self, key: Hashable) -> bool:
+        """
+        Cancel a timer.
+
+        Args:
+            key: Timer identity
+
+        Returns:
+            True if the timer was pending
+        """
+        timer = self._timers.pop(key, None)
+        if timer is None:
+            return False
+        if timer.level < 0:
+            del self._due[key]
+        else:
+            del self._slots[timer.level][timer.slot][key]
+            self._counts[timer.level] -= 1
+        return True
+
+    def _place(self, timer: _Timer) -> None:
+        delta = timer.expire - self._tick
+        if delta <= 0:
+            timer.level = -1
+            self._due[timer.key] = timer
+            return
+
+        delta = min(delta, self._max_delta)
+        level = 0
+        while delta >= 1 << (WHEEL_BITS * (level + 1)):
+            level += 1
+        slot = ((self._tick + delta) >> (WHEEL_BITS * level)) & WHEEL_MASK
+
+        timer.level = level
+        timer.slot = slot
+        self._slots[level][slot][timer.key] = timer
+        self._counts[level] += 1
+
+    def _cascade(self, tick: int) -> None:
+        """Re-place the timers of every higher-level slot that starts at this tick"""
+        for level in range(1, self.levels):
+            if tick & ((1 << (WHEEL_BITS * level)) - 1):
+                break
+            slot = (tick >> (WHEEL_BITS * level)) & WHEEL_MASK
+            timers = self._slots[level][slot]
+            if timers:
+                self._slots[level][slot] = {}
+                self._counts[level] -= len(timers)
+                for timer in timers.values():
+                    self._place(timer)
+
+    def _expire_slot(self, tick: int) -> None:
+        slot = tick & WHEEL_MASK
+        timers = self._slots[0][slot]
+        if timers:
+            self._slots[0][slot] = {}
+            self._counts[0] -= len(timers)
+            for timer in timers.values():
+                # Timers beyond the wheel span come back early and are re-placed
+                self._place(timer)
+
+    def advance(self, now: Optional[datetime] = None) -> List[Tuple[Hashable, datetime]]:
+        """
+        Move the clock forward and collect expired timers.
+
+        Args:
+            now: Current time (defaults to datetime.now())
+
+        Returns:
+            (key, scheduled time) for every expired timer, earliest first
+        """
+        target = math.floor(self._to_tick(now or datetime.now()))
+
+        while self._tick < target:
+            level = next((i for i, count in enumerate(self._counts) if count), None)
+            if level is None:
+                self._tick = target
+                break
+
+            # Nothing can expire before the next boundary of the lowest busy level
+            span = 1 << (WHEEL_BITS * level)
+            next_tick = (self._tick // span + 1) * span
+            if next_tick > target:
+                self._tick = target
+                break
+
+            self._tick = next_tick
+            self._cascade(next_tick)
+            self._expire_slot(next_tick)
+
+        expired = sorted(self._due.values(), key=lambda t: t.when)
+        self._due = {}
+        for timer in expired:
+            del self._timers[timer.key]
+        return [(timer.key, timer.when) for timer in expired]
+
+
+# ============================================================================
+# SLA monitor
+# ============================================================================
+
+@dataclass
+class SLAEvent:
+    """An SLA threshold crossing"""
+    ticket_id: str
+    kind: str
+    status: str
+    due_at: datetime
+    fired_at: datetime
+    priority: Optional[str] = None
+    client_id: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            'ticket_id': self.ticket_id,
+            'sla': self.kind,
+            'status': self.status,
+            'due_at': self.due_at.isoformat(),
+            'fired_at': self.fired_at.isoformat(),
+            'priority': self.priority,
+            'client_id': self.client_id,
+        }
+
+
+@dataclass
+class _Clock:
+    status: str
+    at_risk_at: datetime
+    breach_at: datetime
+
+
+@dataclass
+class _TrackedTicket:
+    ticket_id: str
+    priority: Optional[str]
+    client_id: Optional[str]
+    clocks: Dict[str, _Clock] = field(default_factory=dict)
+
+
+class SLAMonitor:
+    """
+    Tracks first-response and resolution SLA clocks for open tickets.
+    """
+
+    def __init__(
+        self,
+        at_risk_ratio: float = SLA_AT_RISK_RATIO,
+        at_risk_lead: Optional[timedelta] = None,
+        resolution_seconds: float = SLA_MONITOR_TICK_SECONDS,
+        clock: Callable[[], datetime] = datetime.now
+    ):
+        """
+        Initialize monitor.
+
+        Args:
+            at_risk_ratio: Fraction of the SLA target after which a clock is at risk
+            at_risk_lead: Also mark at risk this long before breach, if earlier
+            resolution_seconds: Timer tick length
+            clock: Time source
+        """
+        self.at_risk_ratio = at_risk_ratio
+        self.at_risk_lead = at_risk_lead
+        self.clock = clock
+        self.wheel = TimerWheel(resolution_seconds, origin=clock())
+
+        self._tickets: Dict[str, _TrackedTicket] = {}
+        self._pending: List[SLAEvent] = []
+        # (ticket_id, kind) for clocks currently at risk / breached
+        self._index: Dict[str, Dict[Tuple[str, str], None]] = {'at_risk': {}, 'breached': {}}
+        self._synced_at: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._tickets)
+
+    def __contains__(self, ticket_id: str) -> bool:
+        return ticket_id in self._tickets
+
+    # ------------------------------------------------------------------
+    # Tracking
+    # ------------------------------------------------------------------
+
+    def _set_status(self, ticket_id: str, kind: str, clock: _Clock, status: str) -> None:
+        self._index.get(clock.status, {}).pop((ticket_id, kind), None)
+        clock.status = status
+        if status in self._index:
+            self._index[status][(ticket_id, kind)] = None
+
+    def _event(self, entry: _TrackedTicket, kind: str, status: str, due_at: datetime, now: datetime) -> SLAEvent:
+        return SLAEvent(entry.ticket_id, kind, status, due_at, now, entry.priority, entry.client_id)
+
+    def untrack(self, ticket_id: str) -> bool:
+        """
+        Stop tracking a ticket and cancel its timers.
+
+        Args:
+            ticket_id: Ticket to drop
+
+        Returns:
+            True if the ticket was tracked
+        """
+        entry = self._tickets.pop(ticket_id, None)
+        if entry is None:
+            return False
+        for kind, clock in entry.clocks.items():
+            self._set_status(ticket_id, kind, clock, 'on_track')
+            for status in ('at_risk', 'breached'):
+                self.wheel.cancel((ticket_id, kind, status))
+        return True
+
+    def track(self, ticket: Any, now: Optional[datetime] = None) -> Dict[str, str]:
+        """
+        Start or refresh tracking for a ticket.
+
+        Call whenever priority, SLA targets, status, first response or
+        resolution change. Clocks that already crossed a threshold raise
+        an event on the next advance() unless they were already reported.
+
+        Args:
+            ticket: SupportTicket (pydantic or ORM) or dict
+            now: Current time (defaults to the monitor clock)
+
+        Returns:
+            Current status per running SLA clock (empty once resolved)
+        """
+        now = now or self.clock()
+        ticket_id = _field(ticket, 'ticket_id')
+        previous = self._tickets.get(ticket_id)
+        reported = {kind: c.status for kind, c in previous.clocks.items()} if previous else {}
+        self.untrack(ticket_id)
+
+        if _field(ticket, 'status') in CLOSED_STATUSES or _field(ticket, 'resolved_at') is not None:
+            return {}
+
+        targets = {'resolution': _field(ticket, 'sla_resolution_minutes')}
+        if _field(ticket, 'first_response_at') is None:
+            targets['first_response'] = _field(ticket, 'sla_first_response_minutes')
+
+        created_at = _field(ticket, 'created_at') or now
+        entry = _TrackedTicket(ticket_id, _field(ticket, 'priority'), _field(ticket, 'client_id'))
+
+        for kind in SLA_KINDS:
+            minutes = targets.get(kind)
+            if minutes is None:
+                continue
+
+            breach_at = created_at + timedelta(minutes=minutes)
+            at_risk_at = created_at + timedelta(minutes=minutes * self.at_risk_ratio)
+            if self.at_risk_lead is not None:
+                at_risk_at = max(created_at, min(at_risk_at, breach_at - self.at_risk_lead))
+
+            if now >= breach_at:
+                status = 'breached'
+            elif now >= at_risk_at:
+                status = 'at_risk'
+            else:
+                status = 'on_track'
+
+            clock = _Clock('on_track', at_risk_at, breach_at)
+            entry.clocks[kind] = clock
+            self._set_status(ticket_id, kind, clock, status)
+
+            if SEVERITY[status] > SEVERITY[reported.get(kind, 'on_track')]:
+                due_at = breach_at if status == 'breached' else at_risk_at
+                self._pending.append(self._event(entry, kind, status, due_at, now))
+
+            if status == 'on_track':
+                self.wheel.schedule((ticket_id, kind, 'at_risk'), at_risk_at)
+            if status != 'breached':
+                self.wheel.schedule((ticket_id, kind, 'breached'), breach_at)
+
+        self._tickets[ticket_id] = entry
+        return {kind: clock.status for kind, clock in entry.clocks.items()}
+
+    def track_many(self, tickets: Iterable[Any], now: Optional[datetime] = None) -> int:
+        """Track several tickets; returns the number of open tickets tracked"""
+        now = now or self.clock()
+        return sum(1 for ticket in tickets if self.track(ticket, now))
+
+    def sync_from_database(self, db: Any, batch_size: int = 1000) -> int:
+        """
+        Load open tickets on first call, then only tickets updated since.
+
+        Args:
+            db: SQLAlchemy session
+            batch_size: Rows read per query
+
+        Returns:
+            Number of tickets read
+        """
+        from sqlalchemy import select
+        from src.database.models import SupportTicket
+
+        base = select(SupportTicket)
+        if self._synced_at is None:
+            base = base.where(SupportTicket.status.notin_(CLOSED_STATUSES))
+        else:
+            base = base.where(SupportTicket.updated_at > self._synced_at)
+
+        now = self.clock()
+        watermark = self._synced_at
+        count = 0
+        last_id = 0
+        while True:
+            rows = db.execute(
+                base.where(SupportTicket.id > last_id).order_by(SupportTicket.id).limit(batch_size)
+            ).scalars().all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+            for row in rows:
+                self.track(row, now)
+                if row.updated_at is not None and (watermark is None or row.updated_at > watermark):
+                    watermark = row.updated_at
+            count += len(rows)
+
+        self._synced_at = watermark or now
+        logger.info("sla_monitor_synced", tickets_read=count, tracked=len(self._tickets))
+        return count
+
+    # ------------------------------------------------------------------
+    # Clock
+    # ------------------------------------------------------------------
+
+    def advance(self, now: Optional[datetime] = None) -> List[SLAEvent]:
+        """
+        Fire every threshold crossed up to now.
+
+        Args:
+            now: Current time (defaults to the monitor clock)
+
+        Returns:
+            New SLAEvents, in the order thresholds were crossed
+        """
+        now = now or self.clock()
+        events, self._pending = self._pending, []
+
+        for (ticket_id, kind, status), due_at in self.wheel.advance(now):
+            entry = self._tickets.get(ticket_id)
+            clock = entry.clocks.get(kind) if entry else None
+            if clock is None or SEVERITY[status] <= SEVERITY[clock.status]:
+                continue
+            self._set_status(ticket_id, kind, clock, status)
+            events.append(self._event(entry, kind, status, due_at, now))
+
+        if events:
+            logger.info(
+                "sla_thresholds_crossed",
+                at_risk=sum(1 for e in events if e.status == 'at_risk'),
+                breached=sum(1 for e in events if e.status == 'breached')
+            )
+        return events
+
+    async def run(self, on_events: Callable[[List[SLAEvent]], Any], stop: Optional[asyncio.Event] = None) -> None:
+        """
+        Advance the clock every tick and hand new events to a callback.
+
+        Args:
+            on_events: Called (or awaited) with each non-empty batch of events
+            stop: Set to end the loop (otherwise runs until cancelled)
+        """
+        while stop is None or not stop.is_set():
+            events = self.advance()
+            if events:
+                try:
+                    result = on_events(events)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    logger.error("sla_event_handler_failed", error=str(e))
+            await asyncio.sleep(self.wheel.resolution)
+
+    # ------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------
+
+    def _report(self, status: str, now: datetime) -> List[Dict[str, Any]]:
+        rows = []
+        for ticket_id, kind in self._index[status]:
+            entry = self._tickets[ticket_id]
+            clock = entry.clocks[kind]
+            rows.append({
+                'ticket_id': ticket_id,
+                'sla': kind,
+                'priority': entry.priority,
+                'client_id': entry.client_id,
+                'breach_at': clock.breach_at.isoformat(),
+                'hours_until_breach': round((clock.breach_at - now).total_seconds() / 3600, 2),
+            })
+        rows.sort(key=lambda r: r['hours_until_breach'])
+        return rows
+
+    def at_risk(self, within: Optional[timedelta] = None) -> List[Dict[str, Any]]:
+        """
+        Clocks past their at-risk threshold but not yet breached.
+
+        Args:
+            within: Only clocks breaching within this window
+
+        Returns:
+            Rows ordered by time left
+        """
+        now = self.clock()
+        rows = self._report('at_risk', now)
+        if within is not None:
+            limit = within.total_seconds() / 3600
+            rows = [r for r in rows if r['hours_until_breach'] <= limit]
+        return rows
+
+    def breached(self) -> List[Dict[str, Any]]:
+        """Clocks currently in breach, longest overdue first"""
+        return self._report('breached', self.clock())
+
+    def status(self, ticket_id: str) -> Dict[str, str]:
+        """Current status per running SLA clock of a ticket"""
+        entry = self._tickets.get(ticket_id)
+        return {kind: clock.status for kind, clock in entry.clocks.items()} if entry else {}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Monitor statistics"""
+        return {
+            'tracked_tickets': len(self._tickets),
+            'pending_timers': len(self.wheel),
+            'at_risk': len(self._index['at_risk']),
+            'breached': len(self._index['breached']),
+            'synced_at': self._synced_at.isoformat() if self._synced_at else None,
+        }
+
+
+def log_sla_events(events: List[SLAEvent]) -> None:
+    """Default run() consumer: log every threshold crossing"""
+    for event in events:
+        log = logger.warning if event.status == 'breached' else logger.info
+        log("sla_threshold_crossed", **event.to_dict())
+
+
+def load_open_tickets(monitor: SLAMonitor, session_factory: Optional[Any] = None) -> int:
+    """
+    Seed a monitor with the tickets stored in the database.
+
+    Args:
+        monitor: Monitor to fill
+        session_factory: Sync session factory (defaults to src.database.SessionLocal)
+
+    Returns:
+        Number of tickets read (0 if the database is unavailable)
+    """
+    try:
+        if session_factory is None:
+            from src.database import SessionLocal as session_factory
+        with session_factory() as db:
+            return monitor.sync_from_database(db)
+    except Exception as e:
+        logger.warning("sla_monitor_sync_failed", error=str(e))
+        return 0
+
+
+# Global monitor instance
+_sla_monitor = None
+
+
+def get_sla_monitor() -> SLAMonitor:
+    """Get or create the global SLA monitor"""
+    global _sla_monitor
+    if _sla_monitor is None:
+        # Ticket rows are stamped with datetime.utcnow (src/database/models.py)
+        _sla_monitor = SLAMonitor(clock=datetime.utcnow)
+    return _sla_monitor
+
+
+__all__ = [
+    'SLAMonitor',
+    'SLAEvent',
+    'TimerWheel',
+    'get_sla_monitor',
+    'load_open_tickets',
+    'log_sla_events',
+    'ticket_in_utc',
+    'to_utc',
+]
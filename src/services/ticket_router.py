@@ -0,0 +1,483 @@
+"""
+Ticket Routing Engine
+
+Assigns support tickets to agents with heaps instead of a scan over every
+agent for every ticket.
+
+Agents are grouped into pools: one for all agents, one per expertise
+category and one per seniority level. Each pool is a max-heap of agents
+keyed by remaining capacity. The best agent for a ticket is therefore at
+the top of either its category pool or the all-agents pool. A routing
+decision looks at two heap tops (O(log n)) instead of every agent.
+
+Assignments and releases update an agent's capacity incrementally. Every
+pool the agent belongs to gets a fresh heap entry, and superseded entries
+are dropped lazily when they reach the top, so nothing is re-sorted. The
+pending ticket queue is a heap ordered by priority and SLA breach risk.
+
+Scoring matches the previous per-ticket scan:
+    score = EXPERTISE_BONUS (category match) + WORKLOAD_WEIGHT * remaining capacity
+Ties go to the agent registered first.
+
+The route_tickets tool builds a TicketRouter per call, but its module does
+not parse yet and is not registered; the router is exercised directly
+until it is.
+
+Usage:
+    from src.services.ticket_router import TicketRouter
+
+    router = TicketRouter(agents, max_tickets_per_agent=10)
+    assignments, unrouted = router.route(tickets)
+    router.release(ticket_id)                  # ticket resolved
+    moves = router.rebalance(assigned_tickets)
+"""
+
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+from dataclasses import dataclass, field
+import heapq
+import itertools
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+PRIORITY_WEIGHTS = {'P0': 5, 'P1': 4, 'P2': 3, 'P3': 2, 'P4': 1}
+
+# Score for a category match, and per free ticket slot
+EXPERTISE_BONUS = 10
+WORKLOAD_WEIGHT = 2
+
+ALL_AGENTS = '*'
+
+# Rebuild a pool heap when stale entries outnumber live agents by this factor
+HEAP_COMPACTION_FACTOR = 4
+
+
+def priority_weight(priority: str) -> int:
+    """Numeric weight for a priority (P0 highest)"""
+    return PRIORITY_WEIGHTS.get(priority, 0)
+
+
+def _category_pool(category: str) -> str:
+    return f"category:{category}"
+
+
+def _seniority_pool(seniority: str) -> str:
+    return f"seniority:{seniority}"
+
+
+@dataclass
+class RoutingAgent:
+    """Routing state for one agent"""
+    email: str
+    name: str
+    team: Optional[str]
+    expertise: frozenset
+    seniority: Optional[str]
+    capacity: int
+    load: int
+    seq: int
+    pools: Tuple[str, ...] = ()
+    version: int = 0
+
+    @property
+    def remaining(self) -> int:
+        return self.capacity - self.load
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Utilization summary"""
+        return {
+            'agent': self.email,
+            'current_tickets': self.load,
+            'capacity': self.capacity,
+            'utilization': self.load / self.capacity if self.capacity else 1.0,
+        }
+
+
+@dataclass
+class Assignment:
+    """A routing decision"""
+    ticket: Dict[str, Any]
+    agent: RoutingAgent
+    expertise_match: bool
+    from_agent: Optional[str] = None
+
+    @property
+    def ticket_id(self) -> str:
+        return self.ticket['ticket_id']
+
+
+@dataclass
+class _Pool:
+    """Max-heap of agents by remaining capacity, with lazy deletion"""
+    heap: List[Tuple[int, int, int, str]] = field(default_factory=list)
+    members: set = field(default_factory=set)
+
+
+class TicketRouter:
+    """
+    Incremental ticket-to-agent assignment.
+
+    Agents only appear in pool heaps while they have free capacity. Every
+    change to an agent's load gives it a new version, which invalidates the
+    agent's older heap entries.
+    """
+
+    def __init__(
+        self,
+        agents: Iterable[Dict[str, Any]] = (),
+        max_tickets_per_agent: int = 10,
+        expertise_bonus: int = EXPERTISE_BONUS,
+        workload_weight: int = WORKLOAD_WEIGHT
+    ):
+        """
+        Initialize router.
+
+        Args:
+            agents: Agent dicts (email, name, team, expertise, seniority,
+                current_tickets, optional max_tickets and status)
+            max_tickets_per_agent: Default capacity per agent
+            expertise_bonus: Score added for a category match
+            workload_weight: Score per free ticket slot
+        """
+        self.max_tickets_per_agent = max_tickets_per_agent
+        self.expertise_bonus = expertise_bonus
+        self.workload_weight = workload_weight
+
+        self._agents: Dict[str, RoutingAgent] = {}
+        self._pools: Dict[str, _Pool] = {}
+        self._assigned: Dict[str, str] = {}
+        self._seq = itertools.count()
+        # Versions are unique across agents so entries left by a removed
+        # agent never match a re-added one
+        self._versions = itertools.count(1)
+
+        for agent in agents:
+            self.add_agent(agent)
+
+    # ------------------------------------------------------------------
+    # Agents and pools
+    # ------------------------------------------------------------------
+
+    def add_agent(self, agent: Dict[str, Any]) -> Optional[RoutingAgent]:
+        """
+        Register an agent (agents whose status is not available are skipped).
+
+        Args:
+            agent: Agent dict
+
+        Returns:
+            RoutingAgent, or None if the agent is unavailable
+        """
+        if agent.get('status', 'available') != 'available':
+            return None
+
+        expertise = frozenset(agent.get('expertise') or ())
+        seniority = agent.get('seniority')
+        pools = (ALL_AGENTS,) + tuple(_category_pool(c) for c in sorted(expertise))
+        if seniority:
+            pools += (_seniority_pool(seniority),)
+
+        state = RoutingAgent(
+            email=agent['email'],
+            name=agent.get('name', agent['email']),
+            team=agent.get('team'),
+            expertise=expertise,
+            seniority=seniority,
+            capacity=agent.get('max_tickets') or self.max_tickets_per_agent,
+            load=agent.get('current_tickets', 0),
+            seq=next(self._seq),
+            pools=pools,
+            version=next(self._versions),
+        )
+        if state.email in self._agents:
+            self.remove_agent(state.email)
+        self._agents[state.email] = state
+
+        for name in pools:
+            self._pools.setdefault(name, _Pool()).members.add(state.email)
+        self._push(state)
+        return state
+
+    def remove_agent(self, email: str) -> Optional[RoutingAgent]:
+        """
+        Take an agent out of routing (e.g. went offline).
+
+        Args:
+            email: Agent email
+
+        Returns:
+            The removed agent, if registered
+        """
+        state = self._agents.pop(email, None)
+        if state is None:
+            return None
+        state.version = next(self._versions)
+        for name in state.pools:
+            self._pools[name].members.discard(email)
+        return state
+
+    def get_agent(self, email: str) -> Optional[RoutingAgent]:
+        return self._agents.get(email)
+
+    @property
+    def agents(self) -> List[RoutingAgent]:
+        """Registered agents in registration order"""
+        return list(self._agents.values())
+
+    def _push(self, state: RoutingAgent) -> None:
+        """Publish the agent's current capacity to each of its pools"""
+        if state.remaining <= 0:
+            return
+        entry = (-state.remaining, state.seq, state.version, state.email)
+        for name in state.pools:
+            pool = self._pools[name]
+            heapq.heappush(pool.heap, entry)
+            if len(pool.heap) > HEAP_COMPACTION_FACTOR * len(pool.members) + 32:
+                self._compact(pool)
+
+    def _compact(self, pool: _Pool) -> None:
+        pool.heap = [
+            (-a.remaining, a.seq, a.version, a.email)
+            for a in (self._agents[email] for email in pool.members)
+            if a.remaining > 0
+        ]
+        heapq.heapify(pool.heap)
+
+    def _top(self, pool_name: str) -> Optional[RoutingAgent]:
+        """Agent with the most remaining capacity in a pool (None if all are full)"""
+        pool = self._pools.get(pool_name)
+        if pool is None:
+            return None
+        heap = pool.heap
+        while heap:
+            _, _, version, email = heap[0]
+            state = self._agents.get(email)
+            if state is not None and state.version == version:
+                return state
+            heapq.heappop(heap)
+        return None
+
+    def _set_load(self, state: RoutingAgent, load: int) -> None:
+        state.load = load
+        state.version = next(self._versions)
+        self._push(state)
+
+    # ------------------------------------------------------------------
+    # Assignment
+    # ------------------------------------------------------------------
+
+    def _score(self, state: RoutingAgent, category: Optional[str]) -> Tuple[int, int]:
+        bonus = self.expertise_bonus if category in state.expertise else 0
+        return bonus + self.workload_weight * state.remaining, -state.seq
+
+    def best_agent(
+        self,
+        category: Optional[str] = None,
+        match_expertise: bool = True,
+        load_balance: bool = True
+    ) -> Optional[RoutingAgent]:
+        """
+        Best agent with free capacity for a ticket category.
+
+        Args:
+            category: Ticket category
+            match_expertise: Give category experts the expertise bonus
+            load_balance: When False, any expert with capacity beats any
+                non-expert
+
+        Returns:
+            RoutingAgent, or None if every agent is at capacity
+        """
+        least_loaded = self._top(ALL_AGENTS)
+        if not match_expertise or category is None:
+            return least_loaded
+
+        expert = self._top(_category_pool(category))
+        if expert is None or least_loaded is None:
+            return expert or least_loaded
+        if not load_balance:
+            return expert
+
+        return max((expert, least_loaded), key=lambda a: self._score(a, category))
+
+    def best_in_pool(self, pool: str) -> Optional[RoutingAgent]:
+        """Agent with the most remaining capacity in a named pool (e.g. seniority:senior)"""
+        return self._top(pool)
+
+    def assign(self, ticket_id: str, email: str) -> RoutingAgent:
+        """
+        Record an assignment and consume one unit of the agent's capacity.
+
+        Args:
+            ticket_id: Ticket being assigned
+            email: Agent email
+
+        Returns:
+            The agent
+        """
+        state = self._agents[email]
+        previous = self._assigned.get(ticket_id)
+        if previous == email:
+            return state
+        if previous is not None:
+            self.release(ticket_id)
+
+        self._assigned[ticket_id] = email
+        self._set_load(state, state.load + 1)
+        return state
+
+    def release(self, ticket_id: str) -> Optional[RoutingAgent]:
+        """
+        Free the capacity held by a ticket (resolved, closed or reassigned).
+
+        Args:
+            ticket_id: Ticket to release
+
+        Returns:
+            The agent that held it, if known
+        """
+        email = self._assigned.pop(ticket_id, None)
+        state = self._agents.get(email) if email else None
+        if state is not None:
+            self._set_load(state, max(0, state.load - 1))
+        return state
+
+    def track(self, tickets: Iterable[Dict[str, Any]]) -> None:
+        """
+        Record existing assignments so they can be released or rebalanced.
+
+        The agents' loads already include these tickets (current_tickets),
+        so capacity is not changed.
+
+        Args:
+            tickets: Tickets with assigned_agent set
+        """
+        for ticket in tickets:
+            email = ticket.get('assigned_agent')
+            if email:
+                self._assigned[ticket['ticket_id']] = email
+
+    def route(
+        self,
+        tickets: Iterable[Dict[str, Any]],
+        match_expertise: bool = True,
+        load_balance: bool = True,
+        by_urgency: bool = True
+    ) -> Tuple[List[Assignment], List[Dict[str, Any]]]:
+        """
+        Assign unassigned tickets, most urgent first.
+
+        Args:
+            tickets: Ticket dicts (ticket_id, priority, category,
+                sla_breach_risk, assigned_agent)
+            match_expertise: Prefer category experts
+            load_balance: See best_agent
+            by_urgency: Route by priority and SLA breach risk (False = input order)
+
+        Returns:
+            (assignments, tickets that could not be routed)
+        """
+        queue = []
+        for seq, ticket in enumerate(tickets):
+            if ticket.get('assigned_agent'):
+                continue
+            if by_urgency:
+                key = (-priority_weight(ticket.get('priority')), -(ticket.get('sla_breach_risk') or 0), seq)
+            else:
+                key = (seq,)
+            queue.append((key, seq, ticket))
+        heapq.heapify(queue)
+
+        assignments: List[Assignment] = []
+        unrouted: List[Dict[str, Any]] = []
+        while queue:
+            _, _, ticket = heapq.heappop(queue)
+            category = ticket.get('category')
+            agent = self.best_agent(category, match_expertise, load_balance)
+            if agent is None:
+                unrouted.append(ticket)
+                continue
+            self.assign(ticket['ticket_id'], agent.email)
+            assignments.append(Assignment(ticket, agent, category in agent.expertise))
+
+        return assignments, unrouted
+
+    def rebalance(self, tickets: Iterable[Dict[str, Any]], tolerance: int = 1) -> List[Assignment]:
+        """
+        Move the lowest-priority tickets from the most to the least loaded
+        agents until loads differ by at most tolerance.
+
+        Args:
+            tickets: Assigned tickets that may be moved
+            tolerance: Allowed load difference between agents
+
+        Returns:
+            Moves (Assignment with from_agent set)
+        """
+        movable: Dict[str, List[Tuple[int, int, int, Dict[str, Any]]]] = {}
+        for seq, ticket in enumerate(tickets):
+            email = ticket.get('assigned_agent')
+            if email in self._agents:
+                self._assigned.setdefault(ticket['ticket_id'], email)
+                movable.setdefault(email, []).append(
+                    (priority_weight(ticket.get('priority')), ticket.get('sla_breach_risk') or 0, seq, ticket)
+                )
+        for queue in movable.values():
+            heapq.heapify(queue)
+
+        donors = [(-self._agents[e].load, self._agents[e].seq, e) for e in movable]
+        receivers = [(a.load, a.seq, a.email) for a in self._agents.values()]
+        heapq.heapify(donors)
+        heapq.heapify(receivers)
+
+        moves: List[Assignment] = []
+        while donors and receivers:
+            donor = self._agents[donors[0][2]]
+            receiver = self._agents[receivers[0][2]]
+            # Drop heap entries whose load changed since they were pushed
+            if -donors[0][0] != donor.load:
+                heapq.heapreplace(donors, (-donor.load, donor.seq, donor.email))
+                continue
+            if receivers[0][0] != receiver.load:
+                heapq.heapreplace(receivers, (receiver.load, receiver.seq, receiver.email))
+                continue
+            if donor.load - receiver.load <= tolerance or receiver.remaining <= 0:
+                break
+
+            _, _, _, ticket = heapq.heappop(movable[donor.email])
+            self.assign(ticket['ticket_id'], receiver.email)
+            moves.append(Assignment(
+                ticket, receiver, ticket.get('category') in receiver.expertise, from_agent=donor.email
+            ))
+
+            if movable[donor.email]:
+                heapq.heapreplace(donors, (-donor.load, donor.seq, donor.email))
+            else:
+                heapq.heappop(donors)
+            heapq.heapreplace(receivers, (receiver.load, receiver.seq, receiver.email))
+
+        return moves
+
+    def utilization(self) -> List[Dict[str, Any]]:
+        """Per-agent load and capacity"""
+        return [agent.to_dict() for agent in self._agents.values()]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Router size statistics"""
+        return {
+            'agents': len(self._agents),
+            'pools': len(self._pools),
+            'tracked_assignments': len(self._assigned),
+            'free_capacity': sum(max(0, a.remaining) for a in self._agents.values()),
+            'heap_entries': sum(len(p.heap) for p in self._pools.values()),
+        }
+
+
+__all__ = [
+    'TicketRouter',
+    'RoutingAgent',
+    'Assignment',
+    'PRIORITY_WEIGHTS',
+    'priority_weight',
+]
@@ -10,7 +10,7 @@ enabling Claude to discover tools on-demand rather than loading everything upfro
 Architecture Benefits:
 - **98.7% Token Savings:** Load on-demand instead of all upfront
 - **Faster Response:** 85% latency improvement
-- **Better Organization:** 51 tools across 8 domains
+- **Better Organization:** 52 tools across 8 domains
 - **Easy Navigation:** Each domain has index.md for documentation
 
 Structure:
@@ -22,7 +22,7 @@ src/tools/
 ├── feedback/           # Feedback & intelligence (6 tools)
 ├── support/            # Support & self-service (6 tools)
 ├── retention/          # Retention & risk (7 tools)
-├── core/               # Core systems (5 tools)
+├── core/               # Core systems (6 tools)
 └── autonomous/         # Autonomous operations (5 tools)
 
 Usage - Progressive Discovery:
@@ -36,23 +36,22 @@ Or import specific domains:
     from src.tools.retention import identify_churn_risk
     from src.tools.expansion import identify_upsell_opportunities
 
-Domain Imports (if needed):
----------------------------
+Server Registration:
+--------------------
+    from src.tools import register_all_tools
+    register_all_tools(mcp)   # lazy: modules load on first tool call
+
+Domain packages are imported on first attribute access; see manifest.py.
 """
 
-# Domain exports (only import when specifically needed)
-from . import (
-    communication,
-    expansion,
-    onboarding,
-    feedback,
-    support,
-    retention,
-    core,
-    autonomous
-)
+import importlib
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
 
-__all__ = [
+DOMAINS = (
     'communication',
     'expansion',
     'onboarding',
@@ -61,8 +60,41 @@ __all__ = [
     'retention',
     'core',
     'autonomous',
-]
+)
+
+__all__ = [*DOMAINS, 'register_all_tools']
 
 # Tool count for metrics
-TOOL_COUNT = 51
+TOOL_COUNT = 52
 DOMAIN_COUNT = 8
+
+
+def __getattr__(name: str) -> Any:
+    """Import a domain package on first access"""
+    if name in DOMAINS:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def register_all_tools(mcp: Any) -> int:
+    """
+    Register all domain tools with the MCP server.
+
+    Tools are registered from tool_manifest.json as lazy proxies, so no tool
+    module is imported until the tool is first called. Regenerate the
+    manifest with `python -m src.tools.manifest` after changing a tool.
+
+    Args:
+        mcp: FastMCP server instance
+
+    Returns:
+        Number of tools registered
+    """
+    from .manifest import register_manifest_tools
+
+    registered, failed = register_manifest_tools(mcp)
+    if failed:
+        logger.warning("tool_registration_incomplete", registered=registered, failed=failed)
+    else:
+        logger.info("tools_registered", count=registered, mode="lazy")
+    return registered
@@ -16,12 +16,8 @@ Usage:
     result = await get_autonomous_status(ctx, client_id, ...)
 """
 
-# Import all tools from this domain
-from .get_autonomous_status import get_autonomous_status
-from .configure_autonomous_worker import configure_autonomous_worker
-from .trigger_worker_now import trigger_worker_now
-from .get_worker_config import get_worker_config
-from .list_available_workers import list_available_workers
+import importlib
+from typing import Any
 
 __all__ = [
     "get_autonomous_status",
@@ -30,3 +26,12 @@ __all__ = [
     "get_worker_config",
     "list_available_workers",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a tool module on first access so importing the domain stays cheap"""
+    if name in __all__:
+        tool = getattr(importlib.import_module(f"{__name__}.{name}"), name)
+        globals()[name] = tool
+        return tool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
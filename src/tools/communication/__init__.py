@@ -17,13 +17,8 @@ Usage:
     result = await send_personalized_email(ctx, client_id, ...)
 """
 
-# Import all tools from this domain
-from .send_personalized_email import send_personalized_email
-from .automate_communications import automate_communications
-from .manage_community import manage_community
-from .manage_advocacy_program import manage_advocacy_program
-from .conduct_executive_review import conduct_executive_review
-from .automate_newsletters import automate_newsletters
+import importlib
+from typing import Any
 
 __all__ = [
     "send_personalized_email",
@@ -33,3 +28,12 @@ __all__ = [
     "conduct_executive_review",
     "automate_newsletters",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a tool module on first access so importing the domain stays cheap"""
+    if name in __all__:
+        tool = getattr(importlib.import_module(f"{__name__}.{name}"), name)
+        globals()[name] = tool
+        return tool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,7 @@
 """
 Core Domain Tools
 
-This domain contains 5 tools for core-related operations.
+This domain contains 6 tools for core-related operations.
 
 Tools:
   - register_client
@@ -9,6 +9,7 @@ Tools:
   - update_client_info
   - list_clients
   - get_client_timeline
+  - execute_tool_batch
 
 Usage:
     from src.tools.core import register_client
@@ -16,12 +17,8 @@ Usage:
     result = await register_client(ctx, client_id, ...)
 """
 
-# Import all tools from this domain
-from .register_client import register_client
-from .get_client_overview import get_client_overview
-from .update_client_info import update_client_info
-from .list_clients import list_clients
-from .get_client_timeline import get_client_timeline
+import importlib
+from typing import Any
 
 __all__ = [
     "register_client",
@@ -29,4 +26,14 @@ __all__ = [
     "update_client_info",
     "list_clients",
     "get_client_timeline",
+    "execute_tool_batch",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a tool module on first access so importing the domain stays cheap"""
+    if name in __all__:
+        tool = getattr(importlib.import_module(f"{__name__}.{name}"), name)
+        globals()[name] = tool
+        return tool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,104 @@
+"""
+execute_tool_batch - Execute many tool calls as a single batch
+
+Execute many tool calls as a single batch.
+
+Runs a list of tool calls (for example get_client_overview or
+score_risk_factors across hundreds of clients) with one validation pass,
+one database session per concurrency lane and bounded concurrency.
+Progress is reported as each item completes.
+
+Args:
+    items: List of {"tool": "<tool_name>", "arguments": {...}} dicts
+    max_concurrency: Number of items executed at the same time (1-32, default 8)
+    share_session: Reuse one database session per lane (default True)
+    verbose: Forward each tool's progress messages (default False)
+
+Returns:
+    Per-item results in input order with success/failure counts
+"""
+
+from fastmcp import Context
+from typing import Dict, List, Any
+import structlog
+from src.services.batch_executor import (
+    BatchToolExecutor,
+    BatchItemResult,
+    BATCH_MAX_ITEMS,
+    BATCH_MAX_CONCURRENCY,
+    BATCH_DEFAULT_CONCURRENCY,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+async def execute_tool_batch(
+        ctx: Context,
+        items: List[Dict[str, Any]],
+        max_concurrency: int = BATCH_DEFAULT_CONCURRENCY,
+        share_session: bool = True,
+        verbose: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Execute many tool calls as a single batch.
+
+        Runs a list of tool calls (for example get_client_overview or
+        score_risk_factors across hundreds of clients) with one validation pass,
+        one database session per concurrency lane and bounded concurrency.
+        Progress is reported as each item completes.
+
+        Args:
+            items: List of {"tool": "<tool_name>", "arguments": {...}} dicts
+            max_concurrency: Number of items executed at the same time (1-32, default 8)
+            share_session: Reuse one database session per lane (default True)
+            verbose: Forward each tool's progress messages (default False)
+
+        Returns:
+            Per-item results in input order with success/failure counts
+        """
+        try:
+            if not isinstance(items, list) or not items:
+                return {
+                    'status': 'failed',
+                    'error': 'items must be a non-empty list'
+                }
+
+            if len(items) > BATCH_MAX_ITEMS:
+                return {
+                    'status': 'failed',
+                    'error': f'Batch too large: {len(items)} items (max {BATCH_MAX_ITEMS})'
+                }
+
+            if max_concurrency < 1 or max_concurrency > BATCH_MAX_CONCURRENCY:
+                return {
+                    'status': 'failed',
+                    'error': f'max_concurrency must be between 1 and {BATCH_MAX_CONCURRENCY}'
+                }
+
+            await ctx.info(f"Executing batch of {len(items)} tool calls (concurrency {max_concurrency})")
+
+            executor = BatchToolExecutor(max_concurrency=max_concurrency, share_session=share_session)
+            completed = 0
+
+            async def report(result: BatchItemResult) -> None:
+                nonlocal completed
+                completed += 1
+                await ctx.report_progress(completed, len(items))
+
+            summary = await executor.run(items, ctx=ctx if verbose else None, on_result=report)
+
+            await ctx.info(
+                f"Batch complete: {summary['succeeded']} succeeded, {summary['failed']} failed"
+            )
+
+            return {
+                'status': 'success',
+                **summary
+            }
+
+        except Exception as e:
+            logger.error("tool_batch_failed", error=str(e))
+            return {
+                'status': 'failed',
+                'error': f'Batch execution failed: {str(e)}'
+            }
@@ -18,11 +18,16 @@ from fastmcp import Context
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from src.security.input_validation import validate_client_id, ValidationError
-from src.database import SessionLocal
+from sqlalchemy import select
+from src.database import open_async_session, release_async_session
 from src.database.models import CustomerAccount
 import structlog
 from src.decorators import mcp_tool
 from src.composio import get_composio_client
+
+logger = structlog.get_logger(__name__)
+
+
 async def get_client_overview(
         ctx: Context,
         client_id: str
@@ -40,17 +45,24 @@ async def get_client_overview(
         Returns:
             Complete client overview with health, engagement, support, and revenue data
         """
-        
+        try:
+            # Validate client_id
+            try:
+                client_id = validate_client_id(client_id)
+            except ValidationError as e:
+                return {
+                    'status': 'failed',
+                    'error': f'Invalid client_id: {str(e)}'
                 }
 
             await ctx.info(f"Fetching overview for client: {client_id}")
 
             # Query database for actual client data
-            db = SessionLocal()
+            db = open_async_session()
             try:
-                customer = db.query(CustomerAccount).filter(
-                    CustomerAccount.client_id == client_id
-                ).first()
+                customer = await db.scalar(
+                    select(CustomerAccount).where(CustomerAccount.client_id == client_id)
+                )
 
                 if not customer:
                     return {
@@ -196,7 +208,7 @@ async def get_client_overview(
                 }
 
             finally:
-                db.close()
+                await release_async_session(db)
 
             logger.info(
                 "client_overview_retrieved",
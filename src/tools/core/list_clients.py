@@ -4,7 +4,8 @@ list_clients - List all clients with optional filtering
 List all clients with optional filtering.
 
 Retrieve a list of clients filtered by tier, lifecycle stage, health score range,
-or other criteria. Supports pagination for large client bases.
+or other criteria. Supports keyset (cursor) pagination for large client bases:
+pass the returned next_cursor to fetch the following page in constant time.
 
 Args:
     tier_filter: Filter by tier (starter, standard, professional, enterprise)
@@ -12,21 +13,123 @@ Args:
     health_score_min: Minimum health score (0-100)
     health_score_max: Maximum health score (0-100)
     limit: Maximum number of results (default 50, max 1000)
-    offset: Number of results to skip for pagination
+    offset: Number of results to skip for pagination (ignored when cursor is given)
+    cursor: Opaque next_cursor from a previous page (keyset pagination)
+    sort_by: Keyset sort order, "health_score" or "created_at" (ties broken by client_id)
+    count_mode: "exact", "approximate" (planner estimate on PostgreSQL) or "none";
+        defaults to "exact" on the first page and "none" on cursor pages
+    include_summary: Compute the GROUP BY summary over the whole filtered set;
+        defaults to the first page only (no cursor)
 
 Returns:
     List of clients with key metrics and filtering info
 """
 
 from fastmcp import Context
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
+import base64
+import json
 from src.security.input_validation import validate_client_id, ValidationError
-from src.database import SessionLocal
+from sqlalchemy import select, func, and_, or_, text
+from src.database import open_async_session, release_async_session
 from src.database.models import CustomerAccount
 import structlog
 from src.decorators import mcp_tool
 from src.composio import get_composio_client
+
+logger = structlog.get_logger(__name__)
+
+SORT_COLUMNS = {
+    'health_score': CustomerAccount.health_score,
+    'created_at': CustomerAccount.created_at,
+}
+
+COUNT_MODES = ('exact', 'approximate', 'none')
+
+LIFECYCLE_STAGES = ('onboarding', 'active', 'at_risk', 'churned', 'expansion')
+
+
+def _encode_cursor(sort_by: str, value: Any, client_id: str) -> str:
+    """Encode the last row's sort key as an opaque cursor."""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps({'s': sort_by, 'v': value, 'id': client_id}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def _decode_cursor(cursor: str, sort_by: str) -> Tuple[Any, str]:
+    """Decode a cursor into (sort value, client_id) for the given sort order."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        value, client_id = payload['v'], payload['id']
+    except Exception:
+        raise ValueError('malformed cursor')
+
+    if payload.get('s') != sort_by:
+        raise ValueError(f"cursor was issued for sort_by={payload.get('s')}")
+    if not isinstance(client_id, str):
+        raise ValueError('malformed cursor')
+    if value is None:
+        return value, client_id
+
+    if sort_by == 'created_at':
+        if not isinstance(value, str):
+            raise ValueError('malformed cursor')
+        value = datetime.fromisoformat(value)
+    elif isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError('malformed cursor')
+    return value, client_id
+
+
+def _keyset_after(sort_column: Any, value: Any, client_id: str) -> Any:
+    """Rows after (value, client_id) in (sort_column NULLS LAST, client_id) order."""
+    if value is None:
+        return and_(sort_column.is_(None), CustomerAccount.client_id > client_id)
+    return or_(
+        sort_column > value,
+        and_(sort_column == value, CustomerAccount.client_id > client_id),
+        sort_column.is_(None)
+    )
+
+
+async def _estimate_count(db: Any, count_query: Any) -> Optional[int]:
+    """Planner row estimate for a filtered count (PostgreSQL only, else None)."""
+    bind = db.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return None
+
+    inner = count_query.with_only_columns(CustomerAccount.id)
+    compiled = inner.compile(dialect=bind.dialect, compile_kwargs={'literal_binds': True})
+    plan = await db.scalar(text(f"EXPLAIN (FORMAT JSON) {compiled}"))
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def _build_summary(rows: List[Any]) -> Dict[str, Any]:
+    """Summary statistics from (stage, count, health sum, health count, arr) rows."""
+    total_clients = sum(row[1] for row in rows)
+    health_sum = sum(row[2] or 0 for row in rows)
+    health_count = sum(row[3] for row in rows)
+
+    lifecycle_breakdown = {stage: 0 for stage in LIFECYCLE_STAGES}
+    for row in rows:
+        # NULL or unrecognised stages are counted together
+        stage = row[0] if row[0] in lifecycle_breakdown else 'unknown'
+        lifecycle_breakdown[stage] = lifecycle_breakdown.get(stage, 0) + row[1]
+
+    return {
+        'total_clients': total_clients,
+        'average_health_score': round(health_sum / health_count, 1) if health_count else 0,
+        'total_arr': sum(row[4] or 0 for row in rows),
+        # active_users requires usage tracking; not yet available
+        'total_active_users': 0,
+        'lifecycle_breakdown': lifecycle_breakdown
+    }
+
+
 async def list_clients(
         ctx: Context,
         tier_filter: Optional[str] = None,
@@ -34,7 +137,11 @@ async def list_clients(
         health_score_min: Optional[int] = None,
         health_score_max: Optional[int] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        sort_by: str = "health_score",
+        count_mode: Optional[str] = None,
+        include_summary: Optional[bool] = None
     ) -> Dict[str, Any]:
         """
         List all clients with optional filtering.
@@ -48,7 +155,13 @@ async def list_clients(
             health_score_min: Minimum health score (0-100)
             health_score_max: Maximum health score (0-100)
             limit: Maximum number of results (default 50, max 1000)
-            offset: Number of results to skip for pagination
+            offset: Number of results to skip for pagination (ignored when cursor is given)
+            cursor: Opaque next_cursor from a previous page (keyset pagination)
+            sort_by: Keyset sort order, "health_score" or "created_at" (ties broken by client_id)
+            count_mode: "exact", "approximate" (planner estimate on PostgreSQL) or "none";
+                defaults to "exact" on the first page and "none" on cursor pages
+            include_summary: Compute the GROUP BY summary over the whole filtered set;
+                defaults to the first page only (no cursor)
 
         Returns:
             List of clients with key metrics and filtering info
@@ -75,6 +188,35 @@ async def list_clients(
                     'error': 'offset must be non-negative'
                 }
 
+            if sort_by not in SORT_COLUMNS:
+                return {
+                    'status': 'failed',
+                    'error': f"Invalid sort_by. Must be one of: {', '.join(SORT_COLUMNS)}"
+                }
+
+            # Totals and the summary cover the whole filtered set; by default
+            # compute them once, on the first page, not on every cursor page
+            if count_mode is None:
+                count_mode = "none" if cursor else "exact"
+            if include_summary is None:
+                include_summary = not cursor
+
+            if count_mode not in COUNT_MODES:
+                return {
+                    'status': 'failed',
+                    'error': f"Invalid count_mode. Must be one of: {', '.join(COUNT_MODES)}"
+                }
+
+            after = None
+            if cursor:
+                try:
+                    after = _decode_cursor(cursor, sort_by)
+                except ValueError as e:
+                    return {
+                        'status': 'failed',
+                        'error': f'Invalid cursor: {str(e)}'
+                    }
+
             # Validate tier filter
             if tier_filter:
                 valid_tiers = ['starter', 'standard', 'professional', 'enterprise']
@@ -107,28 +249,66 @@ async def list_clients(
                 }
 
             # Query database for actual client list
-            db = SessionLocal()
+            db = open_async_session()
             try:
-                # Build query with filters
-                query = db.query(CustomerAccount)
+                # Build filter conditions shared by the page, count and summary queries
+                conditions = []
 
                 if tier_filter:
-                    query = query.filter(CustomerAccount.tier == tier_filter.lower())
+                    conditions.append(CustomerAccount.tier == tier_filter.lower())
 
                 if lifecycle_stage_filter:
-                    query = query.filter(CustomerAccount.lifecycle_stage == lifecycle_stage_filter.lower())
+                    conditions.append(CustomerAccount.lifecycle_stage == lifecycle_stage_filter.lower())
 
                 if health_score_min is not None:
-                    query = query.filter(CustomerAccount.health_score >= health_score_min)
+                    conditions.append(CustomerAccount.health_score >= health_score_min)
 
                 if health_score_max is not None:
-                    query = query.filter(CustomerAccount.health_score <= health_score_max)
+                    conditions.append(CustomerAccount.health_score <= health_score_max)
+
+                # Server-side summary: one GROUP BY over the whole filtered set
+                summary_rows = []
+                if include_summary:
+                    summary_rows = (await db.execute(
+                        select(
+                            CustomerAccount.lifecycle_stage,
+                            func.count(),
+                            func.sum(CustomerAccount.health_score),
+                            func.count(CustomerAccount.health_score),
+                            func.sum(CustomerAccount.contract_value)
+                        ).where(*conditions).group_by(CustomerAccount.lifecycle_stage)
+                    )).all()
 
-                # Get total count for pagination
-                total_count = query.count()
+                # Total count (the summary already holds the exact total)
+                count_is_approximate = False
+                if count_mode == "none":
+                    total_count = None
+                elif include_summary:
+                    total_count = sum(row[1] for row in summary_rows)
+                else:
+                    count_query = select(func.count()).select_from(CustomerAccount).where(*conditions)
+                    total_count = None
+                    if count_mode == "approximate":
+                        total_count = await _estimate_count(db, count_query)
+                        count_is_approximate = total_count is not None
+                    if total_count is None:
+                        total_count = await db.scalar(count_query)
 
-                # Apply pagination
-                customers = query.limit(limit).offset(offset).all()
+                # Page query ordered by (sort column, client_id); fetch one extra row for has_more
+                sort_column = SORT_COLUMNS[sort_by]
+                query = select(CustomerAccount).where(*conditions).order_by(
+                    sort_column.asc().nulls_last(), CustomerAccount.client_id.asc()
+                )
+
+                if after is not None:
+                    query = query.where(_keyset_after(sort_column, *after))
+                elif offset:
+                    query = query.offset(offset)
+
+                customers = (await db.scalars(query.limit(limit + 1))).all()
+
+                has_more = len(customers) > limit
+                customers = customers[:limit]
 
                 # Convert database objects to client dictionaries
                 all_clients = []
@@ -152,27 +332,22 @@ async def list_clients(
                         "support_tickets_open": None  # Placeholder - requires support ticket tracking
                     })
 
+                next_cursor = None
+                if has_more and customers:
+                    last = customers[-1]
+                    next_cursor = _encode_cursor(sort_by, getattr(last, sort_by), last.client_id)
+
             finally:
-                db.close()
+                await release_async_session(db)
 
             # Pagination and filtering already applied in database query
             paginated_clients = all_clients
 
-            # Calculate summary statistics
-            if paginated_clients:
-                avg_health = sum(c['health_score'] for c in paginated_clients) / len(paginated_clients)
-                total_arr = sum(c['contract_value'] for c in paginated_clients)
-                # Note: active_users is None for all clients until usage tracking is implemented
-                total_users = sum(c['active_users'] or 0 for c in paginated_clients)
-            else:
-                avg_health = 0
-                total_arr = 0
-                total_users = 0
-
             logger.info(
                 "clients_listed",
                 total_count=total_count,
                 returned_count=len(paginated_clients),
+                keyset=after is not None,
                 filters_applied={
                     'tier': tier_filter,
                     'lifecycle_stage': lifecycle_stage_filter,
@@ -180,40 +355,36 @@ async def list_clients(
                 }
             )
 
-            return {
+            result = {
                 'status': 'success',
                 'clients': paginated_clients,
                 'pagination': {
                     'total_count': total_count,
+                    'count_is_approximate': count_is_approximate,
                     'limit': limit,
-                    'offset': offset,
+                    'offset': offset if after is None else None,
+                    'sort_by': sort_by,
                     'returned_count': len(paginated_clients),
-                    'has_more': (offset + limit) < total_count
+                    'has_more': has_more,
+                    'next_cursor': next_cursor
                 },
                 'filters_applied': {
                     'tier': tier_filter,
                     'lifecycle_stage': lifecycle_stage_filter,
                     'health_score_min': health_score_min,
                     'health_score_max': health_score_max
-                },
-                'summary': {
-                    'total_clients': total_count,
-                    'average_health_score': round(avg_health, 1),
-                    'total_arr': total_arr,
-                    'total_active_users': total_users,
-                    'lifecycle_breakdown': {
-                        'onboarding': len([c for c in paginated_clients if c['lifecycle_stage'] == 'onboarding']),
-                        'active': len([c for c in paginated_clients if c['lifecycle_stage'] == 'active']),
-                        'at_risk': len([c for c in paginated_clients if c['lifecycle_stage'] == 'at_risk']),
-                        'churned': len([c for c in paginated_clients if c['lifecycle_stage'] == 'churned']),
-                        'expansion': len([c for c in paginated_clients if c['lifecycle_stage'] == 'expansion'])
-                    }
                 }
             }
 
+            if include_summary:
+                result['summary'] = _build_summary(summary_rows)
+
+            return result
+
         except Exception as e:
             logger.error("list_clients_failed", error=str(e))
             return {
                 'status': 'failed',
                 'error': f"Failed to list clients: {str(e)}"
             }
+
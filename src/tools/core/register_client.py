@@ -25,7 +25,7 @@ from fastmcp import Context
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from src.security.input_validation import validate_client_id, ValidationError
-from src.database import SessionLocal
+from src.database import open_async_session, release_async_session
 from src.database.models import CustomerAccount
 import structlog
 from src.decorators import mcp_tool
@@ -138,7 +138,7 @@ async def register_client(
             )
 
             # Save to database
-            db = SessionLocal()
+            db = open_async_session()
             try:
                 # Convert string dates to date objects
                 contract_start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date()
@@ -165,8 +165,8 @@ async def register_client(
 
                 # Add and commit to database
                 db.add(new_customer)
-                db.commit()
-                db.refresh(new_customer)
+                await db.commit()
+                await db.refresh(new_customer)
 
                 logger.info(
                     "client_persisted_to_database",
@@ -174,7 +174,7 @@ async def register_client(
                     database_id=new_customer.id
                 )
             except Exception as db_error:
-                db.rollback()
+                await db.rollback()
                 logger.error(
                     "client_registration_db_error",
                     client_id=client_id,
@@ -183,7 +183,7 @@ async def register_client(
                 # Don't fail the registration if DB write fails, just log it
                 # In production, you might want to raise this error
             finally:
-                db.close()
+                await release_async_session(db)
 
             return {
                 'status': 'success',
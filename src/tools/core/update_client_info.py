@@ -18,11 +18,16 @@ from fastmcp import Context
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from src.security.input_validation import validate_client_id, ValidationError
-from src.database import SessionLocal
+from sqlalchemy import select
+from src.database import open_async_session, release_async_session
 from src.database.models import CustomerAccount
 import structlog
 from src.decorators import mcp_tool
 from src.composio import get_composio_client
+
+logger = structlog.get_logger(__name__)
+
+
 async def update_client_info(
         ctx: Context,
         client_id: str,
@@ -41,7 +46,14 @@ async def update_client_info(
         Returns:
             Updated client record with confirmation
         """
-        
+        try:
+            # Validate client_id
+            try:
+                client_id = validate_client_id(client_id)
+            except ValidationError as e:
+                return {
+                    'status': 'failed',
+                    'error': f'Invalid client_id: {str(e)}'
                 }
 
             await ctx.info(f"Updating client info for: {client_id}")
@@ -73,11 +85,11 @@ async def update_client_info(
                 updates['tier'] = updates['tier'].lower()
 
             # Query database and update actual client record
-            db = SessionLocal()
+            db = open_async_session()
             try:
-                customer = db.query(CustomerAccount).filter(
-                    CustomerAccount.client_id == client_id
-                ).first()
+                customer = await db.scalar(
+                    select(CustomerAccount).where(CustomerAccount.client_id == client_id)
+                )
 
                 if not customer:
                     return {
@@ -98,8 +110,8 @@ async def update_client_info(
                 customer.updated_at = datetime.now()
 
                 # Commit changes to database
-                db.commit()
-                db.refresh(customer)
+                await db.commit()
+                await db.refresh(customer)
 
                 # Build updated record from database
                 updated_record = {
@@ -127,7 +139,7 @@ async def update_client_info(
                 )
 
             finally:
-                db.close()
+                await release_async_session(db)
 
             return {
                 'status': 'success',
@@ -136,7 +148,7 @@ async def update_client_info(
                 'updated_fields': list(updates.keys()),
                 'updated_record': updated_record,
                 'audit': {
-                    'updated_at': updates['updated_at'],
+                    'updated_at': updated_record['updated_at'],
                     'fields_changed': len(updates),
                     'previous_values': {}  # In production, would include previous values
                 }
@@ -19,15 +19,8 @@ Usage:
     result = await identify_upsell_opportunities(ctx, client_id, ...)
 """
 
-# Import all tools from this domain
-from .identify_upsell_opportunities import identify_upsell_opportunities
-from .identify_crosssell_opportunities import identify_crosssell_opportunities
-from .identify_expansion_opportunities import identify_expansion_opportunities
-from .track_renewals import track_renewals
-from .forecast_renewals import forecast_renewals
-from .negotiate_renewals import negotiate_renewals
-from .track_revenue_expansion import track_revenue_expansion
-from .optimize_customer_lifetime_value import optimize_customer_lifetime_value
+import importlib
+from typing import Any
 
 __all__ = [
     "identify_upsell_opportunities",
@@ -39,3 +32,12 @@ __all__ = [
     "track_revenue_expansion",
     "optimize_customer_lifetime_value",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a tool module on first access so importing the domain stays cheap"""
+    if name in __all__:
+        tool = getattr(importlib.import_module(f"{__name__}.{name}"), name)
+        globals()[name] = tool
+        return tool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -16,12 +16,16 @@ from fastmcp import Context
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from src.security.input_validation import validate_client_id, ValidationError
-from src.models.renewal_models import RenewalForecast, ExpansionOpportunity, ContractDetails
-from src.database import SessionLocal
-from src.models.customer_models import CustomerAccount
+from sqlalchemy import select
+from src.database import open_async_session, release_async_session
+from src.database.models import CustomerAccount
 import structlog
 from src.decorators import mcp_tool
 from src.composio import get_composio_client
+
+logger = structlog.get_logger(__name__)
+
+
 async def identify_upsell_opportunities(
         ctx: Context,
         client_id: str = None,
@@ -47,22 +51,29 @@ async def identify_upsell_opportunities(
 
         try:
             if client_id:
-            "}
-                    
+                # Validate client_id
+                try:
+                    client_id = validate_client_id(client_id)
+                except ValidationError as e:
+                    return {
+                        'status': 'failed',
+                        'error': f'Invalid client_id: {str(e)}'
+                    }
+
             await ctx.info(f"Identifying upsell opportunities")
 
             # Query database for customers meeting upsell criteria
-            db = SessionLocal()
+            db = open_async_session()
             try:
-                query = db.query(CustomerAccount).filter(
+                query = select(CustomerAccount).where(
                     CustomerAccount.health_score >= min_health_score
                 )
 
                 # If specific client requested, filter to that client
                 if client_id:
-                    query = query.filter(CustomerAccount.client_id == client_id)
+                    query = query.where(CustomerAccount.client_id == client_id)
 
-                customers = query.all()
+                customers = (await db.scalars(query)).all()
 
                 # Tier upgrade mapping and pricing
                 tier_upgrades = {
@@ -144,7 +155,7 @@ async def identify_upsell_opportunities(
                 }
 
             finally:
-                db.close()
+                await release_async_session(db)
             
             logger.info("upsell_opportunities_identified", count=len(opportunities))
             
@@ -15,12 +15,16 @@ from fastmcp import Context
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from src.security.input_validation import validate_client_id, ValidationError
-from src.models.renewal_models import RenewalForecast, ExpansionOpportunity, ContractDetails
-from src.database import SessionLocal
-from src.models.customer_models import CustomerAccount
+from sqlalchemy import select
+from src.database import open_async_session, release_async_session
+from src.database.models import CustomerAccount
 import structlog
 from src.decorators import mcp_tool
 from src.composio import get_composio_client
+
+logger = structlog.get_logger(__name__)
+
+
 async def track_renewals(
         ctx: Context,
         client_id: str = None,
@@ -44,17 +48,24 @@ async def track_renewals(
 
         try:
             if client_id:
-            "}
-                    
+                # Validate client_id
+                try:
+                    client_id = validate_client_id(client_id)
+                except ValidationError as e:
+                    return {
+                        'status': 'failed',
+                        'error': f'Invalid client_id: {str(e)}'
+                    }
+
             await ctx.info(f"Tracking renewals within {days_until_renewal} days")
 
             # Query database for customers with upcoming renewals
-            db = SessionLocal()
+            db = open_async_session()
             try:
                 today = datetime.now().date()
                 cutoff_date = today + timedelta(days=days_until_renewal)
 
-                query = db.query(CustomerAccount).filter(
+                query = select(CustomerAccount).where(
                     CustomerAccount.contract_end_date.isnot(None),
                     CustomerAccount.contract_end_date <= cutoff_date,
                     CustomerAccount.contract_end_date >= today
@@ -62,9 +73,9 @@ async def track_renewals(
 
                 # If specific client requested, filter to that client
                 if client_id:
-                    query = query.filter(CustomerAccount.client_id == client_id)
+                    query = query.where(CustomerAccount.client_id == client_id)
 
-                customers = query.order_by(CustomerAccount.contract_end_date).all()
+                customers = (await db.scalars(query.order_by(CustomerAccount.contract_end_date))).all()
 
                 renewals = []
                 total_arr_at_risk = 0
@@ -144,7 +155,7 @@ async def track_renewals(
                 }
 
             finally:
-                db.close()
+                await release_async_session(db)
             
             logger.info("renewals_tracked", count=len(renewals))
             
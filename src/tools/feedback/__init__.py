@@ -17,13 +17,8 @@ Usage:
     result = await collect_feedback(ctx, client_id, ...)
 """
 
-# Import all tools from this domain
-from .collect_feedback import collect_feedback
-from .analyze_feedback_sentiment import analyze_feedback_sentiment
-from .share_product_insights import share_product_insights
-from .track_cs_metrics import track_cs_metrics
-from .analyze_product_usage import analyze_product_usage
-from .manage_voice_of_customer import manage_voice_of_customer
+import importlib
+from typing import Any
 
 __all__ = [
     "collect_feedback",
@@ -33,3 +28,12 @@ __all__ = [
     "analyze_product_usage",
     "manage_voice_of_customer",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a tool module on first access so importing the domain stays cheap"""
+    if name in __all__:
+        tool = getattr(importlib.import_module(f"{__name__}.{name}"), name)
+        globals()[name] = tool
+        return tool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
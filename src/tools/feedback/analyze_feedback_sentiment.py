@@ -28,6 +28,7 @@ from datetime import datetime, date, timedelta
 from src.security.input_validation import (
 from src.decorators import mcp_tool
 from src.composio import get_composio_client
+from src.services.sentiment_engine import get_sentiment_engine
 async def analyze_feedback_sentiment(
         ctx: Context,
         client_id: Optional[str] = None,
@@ -99,7 +100,17 @@ async def analyze_feedback_sentiment(
             # Extract themes if requested
             themes = {}
             if include_themes:
-                themes = await _extract_themes(feedback_data)
+                engine = get_sentiment_engine()
+                results = engine.analyze_batch([
+                    f"{item.get('title', '')} {item.get('content', '')}"
+                    for item in feedback_data.get('items', [])
+                ])
+                summary = engine.summarize(results)
+                themes = {
+                    'positive': summary['positive'],
+                    'negative': summary['negative'],
+                    'emerging': []
+                }
 
             # Compare to previous period if requested
             comparison = {}
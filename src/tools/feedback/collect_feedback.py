@@ -33,6 +33,7 @@ from datetime import datetime, date, timedelta
 from src.security.input_validation import (
 from src.decorators import mcp_tool
 from src.composio import get_composio_client
+from src.services.sentiment_engine import get_sentiment_engine
 async def collect_feedback(
         ctx: Context,
         client_id: str,
@@ -106,7 +107,7 @@ async def collect_feedback(
             feedback_id = f"FB-{timestamp}"
 
             # Perform sentiment analysis on content
-            sentiment_result = await _analyze_sentiment_content(content, title)
+            sentiment_result = get_sentiment_engine().analyze(content, title).to_dict()
 
             # Determine if follow-up is required
             follow_up_required = (
@@ -0,0 +1,544 @@
+"""
+Tool Manifest - Lazy, Manifest-Driven Tool Registration
+
+Registers every domain tool with FastMCP from a generated manifest instead of
+importing the 50+ tool modules (and with them fastmcp, SQLAlchemy models,
+pydantic model modules and the Composio client) at server startup. Each tool
+is registered as a lightweight proxy with the tool's real name, signature and
+description; the tool module is imported the first time the tool is called.
+
+The manifest (tool_manifest.json) is built from the tool sources without
+importing them: the signature comes from the `async def` header, the
+description from the function docstring (falling back to the module
+docstring, then the domain index.md). Modules that do not parse as a whole
+are still described from their header but recorded with "parses": false,
+and are not registered since importing them would fail.
+
+Usage:
+    python -m src.tools.manifest            # regenerate tool_manifest.json
+    python -m src.tools.manifest --check    # exit 1 if the manifest is stale
+"""
+
+import ast
+import hashlib
+import importlib
+import inspect
+import json
+import re
+import sys
+import textwrap
+import typing
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import structlog
+
+from . import DOMAINS
+
+logger = structlog.get_logger(__name__)
+
+TOOLS_ROOT = Path(__file__).resolve().parent
+MANIFEST_PATH = TOOLS_ROOT / "tool_manifest.json"
+MANIFEST_VERSION = 1
+
+# JSON schema types for simple annotations
+_SCHEMA_TYPES = {
+    'str': {'type': 'string'},
+    'int': {'type': 'integer'},
+    'float': {'type': 'number'},
+    'bool': {'type': 'boolean'},
+    'dict': {'type': 'object'},
+    'Dict': {'type': 'object'},
+    'list': {'type': 'array'},
+    'List': {'type': 'array'},
+    'tuple': {'type': 'array'},
+    'Tuple': {'type': 'array'},
+    'Any': {},
+}
+
+_NO_DEFAULT = object()
+
+
+# ============================================================================
+# Manifest generation
+# ============================================================================
+
+def _find_header(source: str, tool_name: str) -> Optional[ast.AsyncFunctionDef]:
+    """
+    Parse just the `async def` header of a tool.
+
+    Used when the module as a whole does not parse; the header is grown one
+    line at a time until it forms a valid function definition.
+    """
+    match = re.search(rf"^[ \t]*async def {tool_name}\(", source, re.MULTILINE)
+    if not match:
+        return None
+
+    lines = source[match.start():].splitlines()
+    for end in range(1, min(len(lines), 200) + 1):
+        header = textwrap.dedent("\n".join(lines[:end]))
+        if not header.rstrip().endswith(":"):
+            continue
+        try:
+            tree = ast.parse(header + "\n    pass")
+        except SyntaxError:
+            continue
+        return tree.body[0]
+    return None
+
+
+def _docstring_after_header(source: str, tool_name: str) -> Optional[str]:
+    """Docstring following the tool header, found textually."""
+    match = re.search(
+        rf"async def {tool_name}\(.*?\)\s*(?:->[^:]+)?:\s*(\"\"\"|''')(.*?)\1",
+        source,
+        re.DOTALL
+    )
+    return inspect.cleandoc(match.group(2)) if match else None
+
+
+def _module_docstring(source: str) -> Optional[str]:
+    """Leading module docstring, without the "name - summary" title line."""
+    match = re.match(r"\s*(\"\"\"|''')(.*?)\1", source, re.DOTALL)
+    if not match:
+        return None
+    doc = inspect.cleandoc(match.group(2))
+    title, _, rest = doc.partition("\n")
+    return rest.strip() or title
+
+
+def _index_sections(domain_dir: Path) -> Dict[str, str]:
+    """Tool descriptions from a domain's index.md (### <tool> sections)."""
+    index = domain_dir / "index.md"
+    if not index.exists():
+        return {}
+
+    sections = {}
+    for block in re.split(r"^### ", index.read_text(), flags=re.MULTILINE)[1:]:
+        name, _, body = block.partition("\n")
+        body = re.split(r"^## ", body, flags=re.MULTILINE)[0]
+        sections[name.strip()] = body.strip()
+    return sections
+
+
+def annotation_schema(annotation: Optional[ast.expr]) -> Dict[str, Any]:
+    """
+    JSON schema for a parameter annotation.
+
+    Args:
+        annotation: Annotation AST node (None when unannotated)
+
+    Returns:
+        JSON schema dict ({} when the type is not expressible)
+    """
+    if annotation is None:
+        return {}
+
+    if isinstance(annotation, ast.Constant) and isinstance(annotation.value, str):
+        try:
+            annotation = ast.parse(annotation.value, mode="eval").body
+        except SyntaxError:
+            return {}
+
+    if isinstance(annotation, ast.Constant) and annotation.value is None:
+        return {'type': 'null'}
+
+    if isinstance(annotation, ast.BinOp) and isinstance(annotation.op, ast.BitOr):
+        return {'anyOf': [annotation_schema(annotation.left), annotation_schema(annotation.right)]}
+
+    if isinstance(annotation, (ast.Name, ast.Attribute)):
+        name = annotation.id if isinstance(annotation, ast.Name) else annotation.attr
+        return dict(_SCHEMA_TYPES.get(name, {}))
+
+    if isinstance(annotation, ast.Subscript):
+        base = ast.unparse(annotation.value).rsplit(".", 1)[-1]
+        args = annotation.slice.elts if isinstance(annotation.slice, ast.Tuple) else [annotation.slice]
+
+        if base == 'Optional':
+            return {'anyOf': [annotation_schema(args[0]), {'type': 'null'}]}
+        if base == 'Union':
+            return {'anyOf': [annotation_schema(arg) for arg in args]}
+        if base == 'Literal':
+            values = [ast.literal_eval(arg) for arg in args]
+            return {'enum': values}
+        if base in ('List', 'list'):
+            return {'type': 'array', 'items': annotation_schema(args[0])}
+        if base in ('Dict', 'dict'):
+            return {'type': 'object'}
+        if base in ('Tuple', 'tuple'):
+            return {'type': 'array'}
+
+    return {}
+
+
+def _parameters(node: ast.AsyncFunctionDef) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+    """Name of the context parameter (if any) and manifest entries for the other parameters."""
+    args = node.args
+    positional = args.posonlyargs + args.args
+    defaults = [_NO_DEFAULT] * (len(positional) - len(args.defaults)) + list(args.defaults)
+    pairs = list(zip(positional, defaults)) + [
+        (arg, default if default is not None else _NO_DEFAULT)
+        for arg, default in zip(args.kwonlyargs, args.kw_defaults)
+    ]
+
+    context_param = None
+    parameters = []
+    for arg, default in pairs:
+        annotation = ast.unparse(arg.annotation) if arg.annotation is not None else None
+        if arg.arg == 'ctx' or (annotation or '').endswith('Context'):
+            context_param = arg.arg
+            continue
+
+        param: Dict[str, Any] = {
+            'name': arg.arg,
+            'annotation': annotation,
+            'schema': annotation_schema(arg.annotation),
+        }
+        if default is _NO_DEFAULT:
+            param['required'] = True
+        else:
+            param['required'] = False
+            try:
+                param['default'] = ast.literal_eval(default)
+                json.dumps(param['default'])
+            except (ValueError, TypeError, SyntaxError):
+                # e.g. a module constant; the real function default applies
+                param['default_expr'] = ast.unparse(default)
+        parameters.append(param)
+
+    return context_param, parameters
+
+
+def _input_schema(parameters: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """JSON object schema for a tool's arguments."""
+    properties = {}
+    for param in parameters:
+        schema = dict(param['schema'])
+        if 'default' in param:
+            schema['default'] = param['default']
+        properties[param['name']] = schema
+
+    return {
+        'type': 'object',
+        'properties': properties,
+        'required': [param['name'] for param in parameters if param['required']],
+    }
+
+
+def describe_tool(module_path: Path, index_sections: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Build the manifest entry for one tool module without importing it.
+
+    Args:
+        module_path: Path to src/tools/<domain>/<tool>.py
+        index_sections: Descriptions from the domain index.md
+
+    Returns:
+        Manifest entry, or None if the module has no matching async function
+    """
+    tool_name = module_path.stem
+    source = module_path.read_text()
+
+    node = None
+    description = None
+    parses = True
+    try:
+        tree = ast.parse(source)
+        for candidate in tree.body:
+            if isinstance(candidate, ast.AsyncFunctionDef) and candidate.name == tool_name:
+                node = candidate
+                description = ast.get_docstring(candidate)
+                break
+    except SyntaxError:
+        parses = False
+        node = _find_header(source, tool_name)
+        description = _docstring_after_header(source, tool_name) if node else None
+
+    if node is None:
+        return None
+
+    description = (
+        description
+        or _module_docstring(source)
+        or (index_sections or {}).get(tool_name, "")
+    )
+    context_param, parameters = _parameters(node)
+
+    return {
+        'name': tool_name,
+        'domain': module_path.parent.name,
+        'module': f"src.tools.{module_path.parent.name}.{tool_name}",
+        'description': description,
+        'context_param': context_param,
+        'parameters': parameters,
+        'returns': ast.unparse(node.returns) if node.returns is not None else None,
+        'input_schema': _input_schema(parameters),
+        'parses': parses,
+        'source_sha256': hashlib.sha256(source.encode()).hexdigest(),
+    }
+
+
+def build_manifest(tools_root: Path = TOOLS_ROOT) -> Dict[str, Any]:
+    """
+    Build the tool manifest from the domain packages.
+
+    Args:
+        tools_root: src/tools directory
+
+    Returns:
+        Manifest dict with one entry per tool
+    """
+    tools = []
+    for domain in DOMAINS:
+        domain_dir = tools_root / domain
+        sections = _index_sections(domain_dir)
+        for module_path in sorted(domain_dir.glob("*.py")):
+            if module_path.name.startswith("_"):
+                continue
+            entry = describe_tool(module_path, sections)
+            if entry is None:
+                logger.warning("tool_manifest_skipped", module=str(module_path))
+                continue
+            tools.append(entry)
+
+    return {'version': MANIFEST_VERSION, 'tools': tools}
+
+
+def write_manifest(path: Path = MANIFEST_PATH, tools_root: Path = TOOLS_ROOT) -> Dict[str, Any]:
+    """Regenerate the manifest file."""
+    manifest = build_manifest(tools_root)
+    path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False) + "\n")
+    return manifest
+
+
+def stale_tools(manifest: Dict[str, Any], tools_root: Path = TOOLS_ROOT) -> List[str]:
+    """
+    Tools whose source changed (or appeared / disappeared) since the manifest was built.
+
+    Args:
+        manifest: Loaded manifest
+        tools_root: src/tools directory
+
+    Returns:
+        Sorted tool names that are out of date
+    """
+    recorded = {tool['name']: tool for tool in manifest.get('tools', [])}
+    current = {}
+    for domain in DOMAINS:
+        for module_path in (tools_root / domain).glob("*.py"):
+            if not module_path.name.startswith("_"):
+                current[module_path.stem] = hashlib.sha256(module_path.read_bytes()).hexdigest()
+
+    stale = {name for name in recorded if name not in current}
+    stale |= {
+        name for name, digest in current.items()
+        if name not in recorded or recorded[name]['source_sha256'] != digest
+    }
+    return sorted(stale)
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> Dict[str, Any]:
+    """
+    Load the tool manifest, regenerating it in memory if missing or unreadable.
+
+    Args:
+        path: Manifest file
+
+    Returns:
+        Manifest dict
+    """
+    try:
+        manifest = json.loads(path.read_text())
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+
+    logger.warning("tool_manifest_missing", path=str(path))
+    return build_manifest()
+
+
+# ============================================================================
+# Lazy registration
+# ============================================================================
+
+def _annotation_namespace() -> Dict[str, Any]:
+    """Names available when evaluating manifest annotations."""
+    from mcp.server.fastmcp import Context
+
+    namespace = {name: getattr(typing, name) for name in typing.__all__}
+    namespace.update({'Context': Context, 'datetime': __import__('datetime').datetime})
+    return namespace
+
+
+def _evaluate(annotation: Optional[str], namespace: Dict[str, Any]) -> Any:
+    """Evaluate an annotation string, falling back to Any for unknown types."""
+    if annotation is None:
+        return inspect.Parameter.empty
+    try:
+        return eval(annotation, dict(namespace))
+    except Exception:
+        return Any
+
+
+def import_tool(module_name: str, name: str) -> Optional[Callable[..., Any]]:
+    """
+    Import a tool module and return its tool function.
+
+    Importing a submodule binds the package attribute of the same name to the
+    module, hiding the domain package's lazy __getattr__. The function is
+    rebound on the package so `from src.tools.<domain> import <tool>` keeps
+    returning the tool.
+
+    Args:
+        module_name: Dotted module path (e.g. "src.tools.core.list_clients")
+        name: Tool function name
+
+    Returns:
+        The tool function, or None if the module does not define it
+    """
+    module = importlib.import_module(module_name)
+    func = getattr(module, name, None)
+    package_name, _, attribute = module_name.rpartition('.')
+    package = sys.modules.get(package_name)
+    if func is not None and package is not None and attribute == name:
+        setattr(package, name, func)
+    return func
+
+
+def load_tool(entry: Dict[str, Any]) -> Callable[..., Any]:
+    """
+    Import a tool's module and return the real tool function.
+
+    Args:
+        entry: Manifest entry
+
+    Returns:
+        The async tool function
+    """
+    func = import_tool(entry['module'], entry['name'])
+    if func is None:
+        raise AttributeError(f"module {entry['module']!r} has no attribute {entry['name']!r}")
+    return func
+
+
+def make_lazy_tool(entry: Dict[str, Any], namespace: Optional[Dict[str, Any]] = None) -> Callable[..., Any]:
+    """
+    Build a proxy that carries a tool's manifest signature and imports the tool on first call.
+
+    Args:
+        entry: Manifest entry
+        namespace: Names for evaluating annotations (built if omitted)
+
+    Returns:
+        Async proxy function (`proxy.loaded` tells whether the module was imported)
+    """
+    namespace = namespace or _annotation_namespace()
+    implementation: List[Callable[..., Any]] = []
+
+    context_param = entry.get('context_param')
+
+    # Parameters whose default is an expression fall back to the real default
+    omit_when_none = {param['name'] for param in entry['parameters'] if 'default_expr' in param}
+
+    async def proxy(ctx: Any = None, **kwargs) -> Any:
+        if not implementation:
+            implementation.append(load_tool(entry))
+            logger.info("tool_module_loaded", tool=entry['name'], module=entry['module'])
+
+        for name in omit_when_none:
+            if kwargs.get(name) is None:
+                kwargs.pop(name, None)
+        if context_param:
+            kwargs[context_param] = ctx
+        return await implementation[0](**kwargs)
+
+    parameters = [
+        inspect.Parameter('ctx', inspect.Parameter.KEYWORD_ONLY, annotation=namespace['Context'])
+    ]
+    for param in entry['parameters']:
+        annotation = _evaluate(param['annotation'], namespace)
+        if param['required']:
+            default = inspect.Parameter.empty
+        else:
+            default = param.get('default')
+            if 'default_expr' in param and annotation is not inspect.Parameter.empty:
+                annotation = Optional[annotation]
+        parameters.append(inspect.Parameter(
+            param['name'], inspect.Parameter.KEYWORD_ONLY, default=default, annotation=annotation
+        ))
+
+    proxy.__name__ = entry['name']
+    proxy.__qualname__ = entry['name']
+    proxy.__doc__ = entry['description']
+    proxy.__module__ = entry['module']
+    proxy.__signature__ = inspect.Signature(
+        parameters,
+        return_annotation=_evaluate(entry.get('returns'), namespace)
+    )
+    proxy.loaded = lambda: bool(implementation)
+    return proxy
+
+
+def register_manifest_tools(mcp: Any, manifest: Optional[Dict[str, Any]] = None) -> Tuple[int, List[str]]:
+    """
+    Register every manifest tool with FastMCP as a lazy proxy.
+
+    Tools whose module does not parse are skipped: importing them on the
+    first call would only raise SyntaxError.
+
+    Args:
+        mcp: FastMCP server instance
+        manifest: Manifest dict (loaded from tool_manifest.json if omitted)
+
+    Returns:
+        Tuple of (registered count, names that failed to register)
+    """
+    manifest = manifest or load_manifest()
+    namespace = _annotation_namespace()
+
+    registered = 0
+    failed = []
+    for entry in manifest['tools']:
+        if not entry.get('parses', True):
+            logger.warning("tool_module_does_not_parse", tool=entry['name'], module=entry['module'])
+            failed.append(entry['name'])
+            continue
+        try:
+            mcp.add_tool(make_lazy_tool(entry, namespace), name=entry['name'], description=entry['description'])
+            registered += 1
+        except Exception as e:
+            logger.error("tool_registration_failed", tool=entry['name'], error=str(e))
+            failed.append(entry['name'])
+
+    return registered, failed
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point: regenerate or check the manifest."""
+    argv = sys.argv[1:] if argv is None else argv
+
+    if "--check" in argv:
+        try:
+            manifest = json.loads(MANIFEST_PATH.read_text())
+        except (OSError, ValueError):
+            print(f"{MANIFEST_PATH} is missing or unreadable", file=sys.stderr)
+            return 1
+        stale = stale_tools(manifest)
+        if stale:
+            print(f"Tool manifest is stale for: {', '.join(stale)}", file=sys.stderr)
+            print("Run: python -m src.tools.manifest", file=sys.stderr)
+            return 1
+        print(f"Tool manifest is up to date ({len(manifest['tools'])} tools)")
+        broken = [tool['name'] for tool in manifest['tools'] if not tool.get('parses', True)]
+        if broken:
+            print(f"Not registered, module does not parse: {', '.join(broken)}", file=sys.stderr)
+        return 0
+
+    manifest = write_manifest()
+    print(f"Wrote {len(manifest['tools'])} tools to {MANIFEST_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,15 +19,8 @@ Usage:
     result = await create_onboarding_plan(ctx, client_id, ...)
 """
 
-# Import all tools from this domain
-from .create_onboarding_plan import create_onboarding_plan
-from .activate_onboarding_automation import activate_onboarding_automation
-from .deliver_training_session import deliver_training_session
-from .manage_certification_program import manage_certification_program
-from .optimize_onboarding_process import optimize_onboarding_process
-from .map_customer_journey import map_customer_journey
-from .optimize_time_to_value import optimize_time_to_value
-from .track_onboarding_progress import track_onboarding_progress
+import importlib
+from typing import Any
 
 __all__ = [
     "create_onboarding_plan",
@@ -39,3 +32,12 @@ __all__ = [
     "optimize_time_to_value",
     "track_onboarding_progress",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a tool module on first access so importing the domain stays cheap"""
+    if name in __all__:
+        tool = getattr(importlib.import_module(f"{__name__}.{name}"), name)
+        globals()[name] = tool
+        return tool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -18,14 +18,8 @@ Usage:
     result = await identify_churn_risk(ctx, client_id, ...)
 """
 
-# Import all tools from this domain
-from .identify_churn_risk import identify_churn_risk
-from .execute_retention_campaign import execute_retention_campaign
-from .monitor_satisfaction import monitor_satisfaction
-from .manage_escalations import manage_escalations
-from .analyze_churn_postmortem import analyze_churn_postmortem
-from .score_risk_factors import score_risk_factors
-from .automate_retention_campaigns import automate_retention_campaigns
+import importlib
+from typing import Any
 
 __all__ = [
     "identify_churn_risk",
@@ -36,3 +30,12 @@ __all__ = [
     "score_risk_factors",
     "automate_retention_campaigns",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a tool module on first access so importing the domain stays cheap"""
+    if name in __all__:
+        tool = getattr(importlib.import_module(f"{__name__}.{name}"), name)
+        globals()[name] = tool
+        return tool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
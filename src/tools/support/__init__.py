@@ -17,13 +17,8 @@ Usage:
     result = await handle_support_ticket(ctx, client_id, ...)
 """
 
-# Import all tools from this domain
-from .handle_support_ticket import handle_support_ticket
-from .route_tickets import route_tickets
-from .manage_knowledge_base import manage_knowledge_base
-from .update_knowledge_base import update_knowledge_base
-from .manage_customer_portal import manage_customer_portal
-from .analyze_support_performance import analyze_support_performance
+import importlib
+from typing import Any
 
 __all__ = [
     "handle_support_ticket",
@@ -33,3 +28,12 @@ __all__ = [
     "manage_customer_portal",
     "analyze_support_performance",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a tool module on first access so importing the domain stays cheap"""
+    if name in __all__:
+        tool = getattr(importlib.import_module(f"{__name__}.{name}"), name)
+        globals()[name] = tool
+        return tool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
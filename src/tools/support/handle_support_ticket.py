@@ -50,6 +50,7 @@ import structlog
 from src.models.support_models import (
 from src.decorators import mcp_tool
 from src.composio import get_composio_client
+from src.services.sla_monitor import get_sla_monitor, ticket_in_utc
 async def handle_support_ticket(
         ctx: Context,
         ticket_id: Optional[str] = None,
@@ -164,8 +165,9 @@ async def handle_support_ticket(
                         sla_resolution_minutes=sla_targets['resolution']
                     )
 
-                    # Calculate initial SLA status
+                    # Calculate initial SLA status and schedule breach alerts
                     ticket.calculate_sla_status()
+                    get_sla_monitor().track(ticket_in_utc(ticket))
 
                     # Create ticket in Zendesk (if configured)
                     zendesk_client = _get_zendesk_client()
@@ -305,6 +307,7 @@ async def handle_support_ticket(
 
                 ticket.updated_at = datetime.now()
                 ticket.calculate_sla_status()
+                get_sla_monitor().track(ticket_in_utc(ticket))
 
                 logger.info(
                     "support_ticket_updated",
@@ -337,6 +340,7 @@ async def handle_support_ticket(
                 ticket.resolved_at = datetime.now()
                 ticket.updated_at = datetime.now()
                 ticket.calculate_sla_status()
+                get_sla_monitor().untrack(ticket_id)
 
                 logger.info(
                     "support_ticket_resolved",
@@ -375,6 +379,7 @@ async def handle_support_ticket(
                 ticket.status = TicketStatus.CLOSED
                 ticket.closed_at = datetime.now()
                 ticket.updated_at = datetime.now()
+                get_sla_monitor().untrack(ticket_id)
 
                 logger.info("support_ticket_closed", ticket_id=ticket_id)
 
@@ -416,6 +421,7 @@ async def handle_support_ticket(
 
                 # Reassign to escalation team
                 ticket.assigned_team = "Escalation Team"
+                get_sla_monitor().track(ticket_in_utc(ticket))
 
                 logger.warning(
                     "support_ticket_escalated",
@@ -454,6 +460,7 @@ async def handle_support_ticket(
                 ticket.updated_at = datetime.now()
                 ticket.resolved_at = None
                 ticket.closed_at = None
+                get_sla_monitor().track(ticket_in_utc(ticket))
 
                 logger.info("support_ticket_reopened", ticket_id=ticket_id)
 
@@ -492,6 +499,7 @@ async def handle_support_ticket(
                 if not ticket.first_response_at and assigned_agent:
                     ticket.first_response_at = datetime.now()
                     ticket.calculate_sla_status()
+                    get_sla_monitor().track(ticket_in_utc(ticket))
 
                 ticket.updated_at = datetime.now()
 
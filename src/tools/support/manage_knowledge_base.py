@@ -44,6 +44,7 @@ import structlog
 from src.models.support_models import (
 from src.decorators import mcp_tool
 from src.composio import get_composio_client
+from src.services.kb_search import get_kb_index
 async def manage_knowledge_base(
         ctx: Context,
         action: str = "search",
@@ -117,8 +118,9 @@ async def manage_knowledge_base(
                 # Sanitize search query
                 search_query = SecurityValidator.validate_no_sql_injection(search_query)
 
-                # Search articles (mock implementation)
-                results = _search_knowledge_base(
+                # Search articles (BM25 over the in-process index)
+                kb_index = get_kb_index()
+                results = kb_index.search(
                     query=search_query,
                     category=search_category,
                     status=status,
@@ -137,7 +139,7 @@ async def manage_knowledge_base(
                     'search_query': search_query,
                     'results_found': len(results),
                     'articles': results,
-                    'search_suggestions': _generate_search_suggestions(search_query),
+                    'search_suggestions': _generate_search_suggestions(search_query, kb_index),
                     'related_categories': _get_related_categories(results)
                 }
 
@@ -173,6 +175,10 @@ async def manage_knowledge_base(
                         search_keywords=_extract_keywords(title, content, tags)
                     )
 
+                    kb_index = get_kb_index()
+                    kb_index.upsert(article)
+                    kb_index.maybe_save()
+
                     logger.info(
                         "kb_article_created",
                         article_id=new_article_id,
@@ -303,3 +309,8 @@ async def manage_knowledge_base(
                 'status': 'failed',
                 'error': f"Failed to manage knowledge base: {str(e)}"
             }
+
+
+def _generate_search_suggestions(query: str, kb_index) -> List[str]:
+    """Typo corrections and completions for the query, from the index vocabulary"""
+    return kb_index.suggest(query, limit=4)
@@ -36,6 +36,7 @@ import structlog
 from src.models.support_models import (
 from src.decorators import mcp_tool
 from src.composio import get_composio_client
+from src.services.ticket_router import TicketRouter
 async def route_tickets(
         ctx: Context,
         routing_strategy: str = "auto",
@@ -93,6 +94,11 @@ async def route_tickets(
             # Get available agents (mock data)
             agents = _get_available_agents(team_filter)
 
+            # Per-skill capacity heaps; existing assignments are tracked so
+            # they can be released or rebalanced
+            router = TicketRouter(agents, max_tickets_per_agent=max_tickets_per_agent)
+            router.track(tickets)
+
             routing_results = []
             queue_summary = {
                 'total_tickets': len(tickets),
@@ -105,46 +111,27 @@ async def route_tickets(
 
             # AUTOMATIC ROUTING
             if routing_strategy == "auto":
-                # Sort tickets by priority and SLA urgency
-                sorted_tickets = sorted(
-                    tickets,
-                    key=lambda t: (
-                        _priority_weight(t['priority']),
-                        t.get('sla_breach_risk', 0)
-                    ),
-                    reverse=True
-                )
-
-                for ticket in sorted_tickets:
-                    if ticket.get('assigned_agent'):
-                        continue  # Skip already assigned tickets
-
-                    # Find best agent based on:
-                    # 1. Expertise (category match)
-                    # 2. Current workload
-                    # 3. Availability
-                    best_agent = _find_best_agent(
-                        agents,
-                        ticket,
-                        load_balance,
-                        max_tickets_per_agent
-                    )
-
-                    if best_agent:
-                        assignment = {
-                            'ticket_id': ticket['ticket_id'],
-                            'assigned_to': best_agent['email'],
-                            'team': best_agent['team'],
-                            'reason': f"Auto-routed based on {ticket['category']} expertise",
-                            'priority': ticket['priority'],
-                            'sla_target_minutes': ticket.get('sla_resolution_minutes', 240)
-                        }
-                        routing_results.append(assignment)
-
-                        # Update agent workload
-                        best_agent['current_tickets'] += 1
-                    else:
-                        queue_summary['unassigned_tickets'] += 1
+                # Most urgent first (priority, then SLA breach risk); each
+                # ticket goes to the best of the top category expert and the
+                # least loaded agent
+                assignments, unrouted = router.route(tickets, load_balance=load_balance)
+
+                for assignment in assignments:
+                    ticket = assignment.ticket
+                    routing_results.append({
+                        'ticket_id': ticket['ticket_id'],
+                        'assigned_to': assignment.agent.email,
+                        'team': assignment.agent.team,
+                        'reason': (
+                            f"Auto-routed based on {ticket['category']} expertise"
+                            if assignment.expertise_match
+                            else "Auto-routed based on workload"
+                        ),
+                        'priority': ticket['priority'],
+                        'sla_target_minutes': ticket.get('sla_resolution_minutes', 240)
+                    })
+
+                queue_summary['unassigned_tickets'] += len(unrouted)
 
             # MANUAL ROUTING
             elif routing_strategy == "manual":
@@ -188,38 +175,21 @@ async def route_tickets(
             # REBALANCE WORKLOAD
             elif routing_strategy == "rebalance":
                 # Calculate average tickets per agent
-                total_assigned = sum(a['current_tickets'] for a in agents)
-                avg_tickets = total_assigned / len(agents) if agents else 0
-
-                # Find overloaded and underloaded agents
-                overloaded = [a for a in agents if a['current_tickets'] > avg_tickets + 2]
-                underloaded = [a for a in agents if a['current_tickets'] < avg_tickets - 1]
-
-                rebalance_moves = []
-                for overloaded_agent in overloaded:
-                    # Get lowest priority tickets from overloaded agent
-                    agent_tickets = [t for t in tickets
-                                   if t.get('assigned_agent') == overloaded_agent['email']]
-                    low_priority = sorted(
-                        agent_tickets,
-                        key=lambda t: _priority_weight(t['priority'])
-                    )
-
-                    for ticket in low_priority:
-                        if not underloaded:
-                            break
-
-                        target_agent = underloaded[0]
-                        rebalance_moves.append({
-                            'ticket_id': ticket['ticket_id'],
-                            'from_agent': overloaded_agent['email'],
-                            'to_agent': target_agent['email'],
-                            'reason': 'Workload rebalancing'
-                        })
+                total_assigned = sum(a.load for a in router.agents)
+                avg_tickets = total_assigned / len(router.agents) if router.agents else 0
 
-                        target_agent['current_tickets'] += 1
-                        if target_agent['current_tickets'] >= avg_tickets - 1:
-                            underloaded.pop(0)
+                # Move lowest priority tickets from the most to the least
+                # loaded agents until loads are within one ticket
+                moves = router.rebalance(tickets)
+                rebalance_moves = [
+                    {
+                        'ticket_id': move.ticket_id,
+                        'from_agent': move.from_agent,
+                        'to_agent': move.agent.email,
+                        'reason': 'Workload rebalancing'
+                    }
+                    for move in moves
+                ]
 
                 return {
                     'status': 'success',
@@ -228,7 +198,9 @@ async def route_tickets(
                     'summary': {
                         'tickets_reassigned': len(rebalance_moves),
                         'average_tickets_per_agent': avg_tickets,
-                        'agents_balanced': len(overloaded) + len(underloaded)
+                        'agents_balanced': len(
+                            {m['from_agent'] for m in rebalance_moves} | {m['to_agent'] for m in rebalance_moves}
+                        )
                     }
                 }
 
@@ -237,20 +209,15 @@ async def route_tickets(
                 # Get escalated tickets
                 escalated_tickets = [t for t in tickets if t.get('escalated', False)]
 
-                # Route to senior agents or escalation team
-                senior_agents = [a for a in agents if a.get('seniority') == 'senior']
-
+                # Route to the senior agent with the most free capacity
                 for ticket in escalated_tickets:
-                    best_senior = min(
-                        senior_agents,
-                        key=lambda a: a['current_tickets'],
-                        default=None
-                    )
+                    best_senior = router.best_in_pool('seniority:senior')
 
                     if best_senior:
+                        router.assign(ticket['ticket_id'], best_senior.email)
                         routing_results.append({
                             'ticket_id': ticket['ticket_id'],
-                            'assigned_to': best_senior['email'],
+                            'assigned_to': best_senior.email,
                             'team': 'Escalation Team',
                             'reason': f"Escalated: {ticket.get('escalation_reason', 'N/A')}",
                             'priority': 'P1',  # Upgrade to P1
@@ -259,27 +226,17 @@ async def route_tickets(
 
             # WORKLOAD BALANCING
             elif routing_strategy == "workload":
-                # Distribute unassigned tickets evenly
-                unassigned = [t for t in tickets if not t.get('assigned_agent')]
-
-                # Sort agents by current workload
-                sorted_agents = sorted(agents, key=lambda a: a['current_tickets'])
-
-                for ticket in unassigned:
-                    # Get agent with lowest workload
-                    agent = sorted_agents[0]
-
-                    if agent['current_tickets'] < max_tickets_per_agent:
-                        routing_results.append({
-                            'ticket_id': ticket['ticket_id'],
-                            'assigned_to': agent['email'],
-                            'team': agent['team'],
-                            'reason': 'Workload balancing',
-                            'priority': ticket['priority']
-                        })
-
-                        agent['current_tickets'] += 1
-                        sorted_agents.sort(key=lambda a: a['current_tickets'])
+                # Distribute unassigned tickets evenly, in queue order
+                assignments, _ = router.route(tickets, match_expertise=False, by_urgency=False)
+
+                for assignment in assignments:
+                    routing_results.append({
+                        'ticket_id': assignment.ticket_id,
+                        'assigned_to': assignment.agent.email,
+                        'team': assignment.agent.team,
+                        'reason': 'Workload balancing',
+                        'priority': assignment.ticket['priority']
+                    })
 
             # Calculate queue summary
             for ticket in tickets:
@@ -305,15 +262,7 @@ async def route_tickets(
                 'routing_strategy': routing_strategy,
                 'routing_results': routing_results,
                 'queue_summary': dict(queue_summary),
-                'agent_utilization': [
-                    {
-                        'agent': a['email'],
-                        'current_tickets': a['current_tickets'],
-                        'capacity': max_tickets_per_agent,
-                        'utilization': a['current_tickets'] / max_tickets_per_agent
-                    }
-                    for a in agents
-                ],
+                'agent_utilization': router.utilization(),
                 'sla_alerts': {
                     'at_risk': queue_summary['sla_at_risk'],
                     'breached': queue_summary['sla_breached'],
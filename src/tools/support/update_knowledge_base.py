@@ -41,6 +41,7 @@ import structlog
 from src.models.support_models import (
 from src.decorators import mcp_tool
 from src.composio import get_composio_client
+from src.services.kb_search import get_kb_index
 async def update_knowledge_base(
         ctx: Context,
         article_id: str,
@@ -136,6 +137,8 @@ async def update_knowledge_base(
 
                 article.updated_at = datetime.now()
 
+                _reindex_article(article)
+
                 logger.info(
                     "kb_article_updated",
                     article_id=article_id,
@@ -163,6 +166,8 @@ async def update_knowledge_base(
                 article.published_at = datetime.now()
                 article.updated_at = datetime.now()
 
+                _reindex_article(article)
+
                 logger.info(
                     "kb_article_published",
                     article_id=article_id,
@@ -199,6 +204,8 @@ async def update_knowledge_base(
                 article.status = ArticleStatus.ARCHIVED
                 article.updated_at = datetime.now()
 
+                _reindex_article(article)
+
                 logger.info(
                     "kb_article_archived",
                     article_id=article_id,
@@ -240,6 +247,8 @@ async def update_knowledge_base(
                 article.calculate_helpfulness_score()
                 article.updated_at = datetime.now()
 
+                _reindex_article(article)
+
                 logger.info(
                     "kb_article_vote_recorded",
                     article_id=article_id,
@@ -266,6 +275,8 @@ async def update_knowledge_base(
                 article.version += 1
                 article.updated_at = datetime.now()
 
+                _reindex_article(article)
+
                 logger.info(
                     "kb_article_version_incremented",
                     article_id=article_id,
@@ -297,3 +308,10 @@ async def update_knowledge_base(
                 'status': 'failed',
                 'error': f"Failed to update knowledge base: {str(e)}"
             }
+
+
+def _reindex_article(article: KnowledgeBaseArticle) -> None:
+    """Apply the change to the search index (metadata-only changes skip re-tokenizing)"""
+    kb_index = get_kb_index()
+    kb_index.upsert(article)
+    kb_index.maybe_save()
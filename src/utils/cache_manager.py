@@ -1,6 +1,44 @@
-"""Cache Manager Stub"""
+"""
+Intelligent Cache Manager
+
+Two-tier cache for expensive process/tool results:
+
+- L1: in-process LRU with per-entry TTL, entry-count and byte-size limits
+- L2: optional Redis tier (enabled when REDIS_URL is configured) shared
+  across server processes. Redis is never called while the L1 lock is
+  held, and the *_async methods run Redis I/O in a worker thread so
+  coroutines do not block the event loop on it
+
+Entries are keyed on task_type + canonicalized parameters + tags, and
+indexed by task type and by client so either can be invalidated without
+scanning the cache. Hit/miss/eviction counters reflect real cache behavior.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict
 from typing import Any, Optional, Dict, Tuple, List
-from dataclasses import dataclass
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Cache configuration from environment
+CACHE_DEFAULT_TTL = int(os.getenv('CACHE_DEFAULT_TTL', '3600'))
+CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', '1000'))
+CACHE_MAX_BYTES = int(os.getenv('CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+CACHE_MIN_CONFIDENCE = float(os.getenv('CACHE_MIN_CONFIDENCE', '0.6'))
+CACHE_REDIS_ENABLED = os.getenv('CACHE_REDIS_ENABLED', 'true').lower() == 'true'
+
+REDIS_KEY_PREFIX = "cs_cache"
+
+# Request phrasing that asks for fresh data and should bypass the cache
+FRESHNESS_KEYWORDS = ('latest', 'refresh', 'real-time', 'realtime', 'right now', 'up to date', 'up-to-date')
+
 
 @dataclass
 class CacheEntry:
@@ -8,49 +46,479 @@ class CacheEntry:
     data: Dict[str, Any]
     timestamp: float
     confidence: float
+    task_type: str = ""
+    client_id: str = ""
+    tags: List[str] = field(default_factory=list)
+    expires_at: Optional[float] = None
+    size_bytes: int = 0
+    hits: int = 0
+    tier: str = "memory"
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Check whether the entry's TTL has elapsed"""
+        return self.expires_at is not None and (now or time.time()) >= self.expires_at
+
 
 class IntelligentCacheManager:
-    """Stub implementation for intelligent cache management"""
+    """
+    Multi-tier cache with TTL, LRU eviction and hit/miss statistics.
+
+    Thread-safe; all L1 operations are O(1). The Redis tier is best-effort:
+    connection failures disable it and the cache keeps working in-process.
+    """
+
+    def __init__(
+        self,
+        cache_path=None,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_bytes: int = CACHE_MAX_BYTES,
+        default_ttl: int = CACHE_DEFAULT_TTL,
+        min_confidence: float = CACHE_MIN_CONFIDENCE,
+        redis_url: Optional[str] = None
+    ) -> None:
+        """
+        Initialize cache manager.
 
-    def __init__(self, cache_path=None) -> Any:
+        Args:
+            cache_path: Cache directory (kept for compatibility, not used for storage)
+            max_entries: Maximum number of L1 entries before LRU eviction
+            max_bytes: Maximum total serialized size of L1 entries
+            default_ttl: TTL in seconds when none is given
+            min_confidence: Minimum entry confidence for should_use_cache hits
+            redis_url: Redis URL for the L2 tier (defaults to REDIS_URL)
+        """
         self.cache_path = cache_path
-        self._cache = {}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.min_confidence = min_confidence
+
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._task_index: Dict[str, set] = {}
+        self._client_index: Dict[str, set] = {}
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'memory_hits': 0,
+            'redis_hits': 0,
+            'sets': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'invalidations': 0,
+            'rejected_oversize': 0,
+            'redis_errors': 0,
+        }
+
+        self.redis_client = None
+        redis_url = redis_url or os.getenv('REDIS_URL')
+        if CACHE_REDIS_ENABLED and redis_url:
+            try:
+                import redis
+                self.redis_client = redis.from_url(
+                    redis_url,
+                    socket_connect_timeout=1,
+                    socket_timeout=1,
+                    decode_responses=True
+                )
+                self.redis_client.ping()
+                logger.info("cache_redis_tier_enabled", redis_url=redis_url.split('@')[-1])
+            except Exception as e:
+                logger.warning("cache_redis_tier_unavailable", error=str(e))
+                self.redis_client = None
+
+    # ------------------------------------------------------------------
+    # Keying
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def make_key(task_type: str, parameters: Optional[Dict[str, Any]] = None,
+                 tags: Optional[List[str]] = None) -> str:
+        """
+        Build a stable cache key from task type, parameters and tags.
+
+        Parameters are serialized with sorted keys so dict ordering does not
+        matter; tags are order-insensitive.
+        """
+        payload = json.dumps(
+            {'p': parameters or {}, 't': sorted(set(tags or []))},
+            sort_keys=True,
+            default=str
+        )
+        digest = hashlib.sha256(payload.encode()).hexdigest()[:32]
+        return f"{task_type}:{digest}"
+
+    # ------------------------------------------------------------------
+    # L1 internals (caller holds the lock)
+    # ------------------------------------------------------------------
+
+    def _remove(self, key: str) -> Optional[CacheEntry]:
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size_bytes
+            self._unindex(self._task_index, entry.task_type, key)
+            if entry.client_id:
+                self._unindex(self._client_index, entry.client_id, key)
+        return entry
+
+    @staticmethod
+    def _unindex(index: Dict[str, set], name: str, key: str) -> None:
+        keys = index.get(name)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[name]
+
+    def _evict_to_limits(self) -> None:
+        while self._cache and (len(self._cache) > self.max_entries or self._total_bytes > self.max_bytes):
+            key, _ = next(iter(self._cache.items()))
+            self._remove(key)
+            self._stats['evictions'] += 1
+
+    def _put(self, key: str, entry: CacheEntry) -> None:
+        self._remove(key)
+        self._cache[key] = entry
+        self._total_bytes += entry.size_bytes
+        self._task_index.setdefault(entry.task_type, set()).add(key)
+        if entry.client_id:
+            self._client_index.setdefault(entry.client_id, set()).add(key)
+        self._evict_to_limits()
+
+    def _lookup_memory(self, key: str) -> Optional[CacheEntry]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if entry.is_expired():
+            self._remove(key)
+            self._stats['expirations'] += 1
+            return None
+        self._cache.move_to_end(key)
+        self._stats['memory_hits'] += 1
+        return entry
+
+    # ------------------------------------------------------------------
+    # Two-tier lookup (caller does not hold the lock)
+    # ------------------------------------------------------------------
+
+    def _promote(self, key: str, entry: Optional[CacheEntry]) -> Optional[CacheEntry]:
+        """Copy an entry read from Redis into L1"""
+        if entry is not None:
+            with self._lock:
+                self._stats['redis_hits'] += 1
+                self._put(key, entry)
+        return entry
+
+    def _lookup(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._lookup_memory(key)
+        if entry is None and self.redis_client:
+            entry = self._promote(key, self._redis_get(key))
+        return entry
+
+    async def _lookup_async(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._lookup_memory(key)
+        if entry is None and self.redis_client:
+            entry = self._promote(key, await asyncio.to_thread(self._redis_get, key))
+        return entry
+
+    # ------------------------------------------------------------------
+    # L2 (Redis) internals
+    # ------------------------------------------------------------------
+
+    def _count_redis_error(self) -> None:
+        with self._lock:
+            self._stats['redis_errors'] += 1
+
+    def _redis_key(self, key: str) -> str:
+        return f"{REDIS_KEY_PREFIX}:{key}"
+
+    @staticmethod
+    def _redis_task_index(task_type: str) -> str:
+        return f"{REDIS_KEY_PREFIX}:task_index:{task_type}"
+
+    @staticmethod
+    def _redis_client_index(client_id: str) -> str:
+        return f"{REDIS_KEY_PREFIX}:client_index:{client_id}"
+
+    def _redis_get(self, key: str) -> Optional[CacheEntry]:
+        if not self.redis_client:
+            return None
+        try:
+            raw = self.redis_client.get(self._redis_key(key))
+        except Exception as e:
+            self._count_redis_error()
+            logger.warning("cache_redis_get_failed", error=str(e))
+            return None
+        if raw is None:
+            return None
+        try:
+            entry = CacheEntry(**json.loads(raw))
+        except (TypeError, ValueError):
+            return None
+        entry.tier = "redis"
+        return None if entry.is_expired() else entry
+
+    def _redis_set(self, key: str, entry: CacheEntry, payload: str, ttl: Optional[int]) -> None:
+        if not self.redis_client:
+            return
+        try:
+            pipe = self.redis_client.pipeline()
+            redis_key = self._redis_key(key)
+            task_set = self._redis_task_index(entry.task_type)
+            if ttl:
+                pipe.setex(redis_key, ttl, payload)
+            else:
+                pipe.set(redis_key, payload)
+            # Indexes are sorted sets scored by expiry, so members whose
+            # keys have expired are pruned on every write
+            index_sets = [task_set]
+            if entry.client_id:
+                index_sets.append(self._redis_client_index(entry.client_id))
+            for index_set in index_sets:
+                pipe.zadd(index_set, {redis_key: entry.expires_at or float('inf')})
+                pipe.zremrangebyscore(index_set, '-inf', f"({time.time()}")
+            pipe.execute()
+        except Exception as e:
+            self._count_redis_error()
+            logger.warning("cache_redis_set_failed", error=str(e))
+
+    def _redis_invalidate(self, task_type: Optional[str], key: Optional[str] = None,
+                          client_id: Optional[str] = None) -> None:
+        if not self.redis_client:
+            return
+        try:
+            if key is not None:
+                self.redis_client.delete(self._redis_key(key))
+            elif client_id is not None:
+                client_set = self._redis_client_index(client_id)
+                keys = list(self.redis_client.zrange(client_set, 0, -1))
+                if task_type is not None:
+                    prefix = self._redis_key(f"{task_type}:")
+                    keys = [k for k in keys if k.startswith(prefix)]
+                if keys:
+                    self.redis_client.zrem(client_set, *keys)
+                    if task_type is not None:
+                        self.redis_client.zrem(self._redis_task_index(task_type), *keys)
+                    self.redis_client.delete(*keys)
+            elif task_type is not None:
+                task_set = self._redis_task_index(task_type)
+                keys = list(self.redis_client.zrange(task_set, 0, -1))
+                self.redis_client.delete(task_set, *keys)
+            else:
+                keys = list(self.redis_client.scan_iter(match=f"{REDIS_KEY_PREFIX}:*", count=500))
+                if keys:
+                    self.redis_client.delete(*keys)
+        except Exception as e:
+            self._count_redis_error()
+            logger.warning("cache_redis_invalidate_failed", error=str(e))
+
+    # ------------------------------------------------------------------
+    # Generic key/value API
+    # ------------------------------------------------------------------
+
+    def _store_memory(self, key: str, data: Any, task_type: str, tags: List[str],
+                      confidence: float, ttl: Optional[int],
+                      client_id: str = "") -> Optional[Tuple[CacheEntry, str, int]]:
+        """Store in L1; returns what the Redis tier needs, or None if rejected"""
+        now = time.time()
+        ttl = self.default_ttl if ttl is None else ttl
+        entry = CacheEntry(
+            data=data,
+            timestamp=now,
+            confidence=confidence,
+            task_type=task_type,
+            client_id=client_id,
+            tags=sorted(set(tags)),
+            expires_at=now + ttl if ttl else None,
+        )
+        try:
+            payload = json.dumps(asdict(entry), default=str)
+        except (TypeError, ValueError) as e:
+            logger.warning("cache_entry_not_serializable", key=key, error=str(e))
+            return None
+        entry.size_bytes = len(payload)
+
+        with self._lock:
+            if entry.size_bytes > self.max_bytes:
+                self._stats['rejected_oversize'] += 1
+                return None
+            self._put(key, entry)
+            self._stats['sets'] += 1
+        return entry, payload, ttl
+
+    def _store(self, key: str, data: Any, task_type: str, tags: List[str],
+               confidence: float, ttl: Optional[int], client_id: str = "") -> bool:
+        stored = self._store_memory(key, data, task_type, tags, confidence, ttl, client_id)
+        if stored is None:
+            return False
+        self._redis_set(key, *stored)
+        return True
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
-        return self._cache.get(key)
+        entry = self._lookup(key)
+        with self._lock:
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            entry.hits += 1
+            self._stats['hits'] += 1
+            return entry.data
 
     def set(self, key: str, value: Any, ttl: int = 3600) -> Any:
-        """Set value in cache with TTL"""
-        self._cache[key] = value
+        """Set value in cache with TTL (seconds, 0 = no expiry)"""
+        return self._store(key, value, task_type="", tags=[], confidence=1.0, ttl=ttl)
 
     def delete(self, key: str) -> Any:
         """Delete value from cache"""
-        if key in self._cache:
-            del self._cache[key]
+        with self._lock:
+            self._remove(key)
+        self._redis_invalidate(None, key=key)
 
     def clear(self) -> Any:
         """Clear all cache"""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._task_index.clear()
+            self._client_index.clear()
+            self._total_bytes = 0
+        self._redis_invalidate(None)
+
+    # ------------------------------------------------------------------
+    # Process/task result API
+    # ------------------------------------------------------------------
 
     def should_use_cache(self, task_type: str, parameters: Dict[str, Any],
                         tags: List[str], context: str) -> Tuple[bool, Optional[CacheEntry], str]:
-        """Check if cache should be used"""
-        return False, None, "Cache not available"
+        """
+        Check if a cached result can be used for this task.
+
+        Args:
+            task_type: Task/process identifier
+            parameters: Task parameters
+            tags: Tags the result was stored under
+            context: Original request text (fresh-data phrasing bypasses the cache)
+
+        Returns:
+            Tuple of (use_cache, cache_entry, reason)
+        """
+        if self._wants_fresh_data(context):
+            return False, None, "Fresh data requested"
+        return self._check_entry(self._lookup(self.make_key(task_type, parameters, tags)))
+
+    async def should_use_cache_async(self, task_type: str, parameters: Dict[str, Any],
+                                     tags: List[str], context: str
+                                     ) -> Tuple[bool, Optional[CacheEntry], str]:
+        """should_use_cache for coroutines; an L1 miss reads Redis in a worker thread"""
+        if self._wants_fresh_data(context):
+            return False, None, "Fresh data requested"
+        return self._check_entry(
+            await self._lookup_async(self.make_key(task_type, parameters, tags))
+        )
+
+    def _wants_fresh_data(self, context: str) -> bool:
+        context_lower = (context or "").lower()
+        if not any(keyword in context_lower for keyword in FRESHNESS_KEYWORDS):
+            return False
+        with self._lock:
+            self._stats['misses'] += 1
+        return True
+
+    def _check_entry(self, entry: Optional[CacheEntry]) -> Tuple[bool, Optional[CacheEntry], str]:
+        with self._lock:
+            if entry is None:
+                self._stats['misses'] += 1
+                return False, None, "No cached result"
+            if entry.confidence < self.min_confidence:
+                self._stats['misses'] += 1
+                return False, None, f"Cached confidence {entry.confidence:.2f} below threshold"
+            entry.hits += 1
+            self._stats['hits'] += 1
+
+        age = int(time.time() - entry.timestamp)
+        return True, entry, f"Cached result from {entry.tier} ({age}s old)"
 
     def store_data(self, task_type: str, parameters: Dict[str, Any],
-                  tags: List[str], data: Dict[str, Any], confidence: float) -> Any:
-        """Store data in cache"""
-        pass
+                  tags: List[str], data: Dict[str, Any], confidence: float,
+                  ttl: Optional[int] = None, client_id: str = "") -> Any:
+        """Store task result in cache, indexed under client_id when given"""
+        key = self.make_key(task_type, parameters, tags)
+        return self._store(key, data, task_type=task_type, tags=tags, confidence=confidence,
+                           ttl=ttl, client_id=client_id)
+
+    async def store_data_async(self, task_type: str, parameters: Dict[str, Any],
+                               tags: List[str], data: Dict[str, Any], confidence: float,
+                               ttl: Optional[int] = None, client_id: str = "") -> Any:
+        """store_data for coroutines; the Redis write runs in a worker thread"""
+        key = self.make_key(task_type, parameters, tags)
+        stored = self._store_memory(key, data, task_type, tags, confidence, ttl, client_id)
+        if stored is None:
+            return False
+        if self.redis_client:
+            await asyncio.to_thread(self._redis_set, key, *stored)
+        return True
 
     def create_usage_report(self, cache_entry: CacheEntry) -> Dict[str, Any]:
         """Create cache usage report"""
-        return {"cache_used": True}
+        now = time.time()
+        return {
+            "cache_used": True,
+            "tier": cache_entry.tier,
+            "age_seconds": int(now - cache_entry.timestamp),
+            "expires_in_seconds": int(cache_entry.expires_at - now) if cache_entry.expires_at else None,
+            "confidence": cache_entry.confidence,
+            "entry_hits": cache_entry.hits,
+        }
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        return {"total_accesses": 0, "hits": 0, "misses": 0}
+        with self._lock:
+            stats = dict(self._stats)
+            stats['total_accesses'] = stats['hits'] + stats['misses']
+            stats['hit_rate'] = (
+                round(stats['hits'] / stats['total_accesses'], 4) if stats['total_accesses'] else 0.0
+            )
+            stats['entries'] = len(self._cache)
+            stats['size_bytes'] = self._total_bytes
+            stats['max_entries'] = self.max_entries
+            stats['max_bytes'] = self.max_bytes
+            stats['redis_enabled'] = self.redis_client is not None
+            return stats
+
+    def invalidate_cache(self, task_type: Optional[str] = None,
+                         client_id: Optional[str] = None) -> Any:
+        """
+        Invalidate cached entries.
+
+        Args:
+            task_type: Only entries for this task type
+            client_id: Only entries stored for this client
 
-    def invalidate_cache(self, task_type: Optional[str] = None) -> Any:
-        """Invalidate cache"""
-        pass
+        Returns:
+            Number of in-process entries removed (everything when both are None)
+        """
+        with self._lock:
+            if client_id is not None:
+                keys = set(self._client_index.get(client_id, ()))
+                if task_type is not None:
+                    keys &= self._task_index.get(task_type, set())
+                for key in keys:
+                    self._remove(key)
+                removed = len(keys)
+            elif task_type is None:
+                removed = len(self._cache)
+                self._cache.clear()
+                self._task_index.clear()
+                self._client_index.clear()
+                self._total_bytes = 0
+            else:
+                keys = list(self._task_index.get(task_type, ()))
+                for key in keys:
+                    self._remove(key)
+                removed = len(keys)
+            self._stats['invalidations'] += removed
+        self._redis_invalidate(task_type, client_id=client_id)
+        return removed
@@ -3,6 +3,8 @@ Safe file operations utility module.
 
 This module provides safe file operation utilities for the CS MCP server.
 """
+import os
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -38,6 +40,9 @@ class SafeFileOperations:
         """
         Safely write to a file.
 
+        The content is written to a temporary file in the same directory and
+        renamed over the target, so readers never see a partial file.
+
         Args:
             file_path: Path to the file to write
             content: Content to write
@@ -45,11 +50,20 @@ class SafeFileOperations:
         Returns:
             True if successful, False otherwise
         """
+        tmp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
         try:
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(content)
+            with open(tmp_path, "w") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
             return True
         except Exception:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
             return False
 
     @staticmethod
@@ -103,9 +117,7 @@ class SafeFileOperations:
         """
         import json
         try:
-            file_path.parent.mkdir(parents=True, exist_ok=True)
             content = json.dumps(data, indent=2)
-            file_path.write_text(content)
-            return True
         except Exception:
             return False
+        return SafeFileOperations.write_file(file_path, content)
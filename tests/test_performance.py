@@ -19,6 +19,7 @@ PERFORMANCE_TARGETS = {
     'db_query_indexed_ms': 50,
     'platform_api_call_ms': 2000,
     'server_startup_s': 10,
+    'route_10k_tickets_ms': 1000,
 }
 
 # ============================================================================
@@ -262,6 +263,53 @@ class TestPlatformAPIPerformance:
         pass
 
 
+# ============================================================================
+# Server Startup Benchmarks
+# ============================================================================
+
+class TestStartupPerformance:
+    """Benchmark MCP server cold start (Claude Desktop spawns one per session)"""
+
+    @pytest.mark.benchmark
+    def test_lazy_tool_registration_cold_start(self):
+        """Register all tools in a fresh interpreter without importing tool modules"""
+        import sys
+        from pathlib import Path
+
+        sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'scripts'))
+        from benchmark_startup import benchmark
+
+        result = benchmark(['lazy'], runs=3)['lazy']
+        logger.info("Startup benchmark", **result)
+
+        assert 'error' not in result, result.get('error')
+        assert result['tool_modules_imported'] == 0
+        assert result['median_s'] < PERFORMANCE_TARGETS['server_startup_s']
+
+
+# ============================================================================
+# Ticket Routing Benchmarks
+# ============================================================================
+
+class TestRoutingPerformance:
+    """Benchmark auto-routing of a large ticket backlog"""
+
+    @pytest.mark.benchmark
+    def test_route_large_backlog(self):
+        """Route 10k tickets across 300 agents"""
+        import sys
+        from pathlib import Path
+
+        sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'scripts'))
+        from benchmark_routing import benchmark
+
+        result = benchmark(tickets=10000, agents=300, runs=3)['heap']
+        logger.info("Routing benchmark", **result)
+
+        assert result['routed'] > 0
+        assert result['median_ms'] < PERFORMANCE_TARGETS['route_10k_tickets_ms']
+
+
 # ============================================================================
 # Performance Baseline Tests
 # ============================================================================
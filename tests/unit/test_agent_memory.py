@@ -0,0 +1,191 @@
+"""
+Unit Tests for AgentMemory write-behind
+
+Tests that memory mutations are coalesced into one background write per
+flush interval, that shutdown() persists pending changes without
+overlapping a background write, that the server lifespan awaits it, and
+that a failed background flush, or a save made while a background write
+is running, is flushed again instead of being left dirty.
+"""
+
+import asyncio
+import importlib
+import json
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def adaptive_agent(monkeypatch):
+    """src.agents.adaptive_agent, importable without the optional CRM integrations."""
+    import src.integrations as integrations
+
+    for name in ("SalesforceIntegration", "GmailIntegration", "ApolloIntegration"):
+        monkeypatch.setattr(integrations, name, object, raising=False)
+    return importlib.import_module("src.agents.adaptive_agent")
+
+
+def _stored(memory):
+    return json.loads(memory.memory_file.read_text())
+
+
+@pytest.mark.unit
+async def test_mutations_are_coalesced_into_one_write(adaptive_agent, tmp_path):
+    memory = adaptive_agent.AgentMemory("acme", tmp_path, write_behind=True, flush_interval=0.05)
+
+    for level in ("brief", "standard", "detailed"):
+        data = memory.load_memory()
+        data["user_preferences"]["response_detail_level"] = level
+        memory.save_memory(data)
+
+    assert memory.writes == 0
+    assert memory.load_memory()["user_preferences"]["response_detail_level"] == "detailed"
+
+    await asyncio.sleep(0.2)
+
+    assert memory.writes == 1
+    assert _stored(memory)["user_preferences"]["response_detail_level"] == "detailed"
+
+
+@pytest.mark.unit
+async def test_shutdown_persists_pending_changes(adaptive_agent, tmp_path):
+    memory = adaptive_agent.AgentMemory("acme", tmp_path, write_behind=True, flush_interval=60)
+    data = memory.load_memory()
+    data["learning_context"]["process_38"] = {"confidence": 0.9}
+    memory.save_memory(data)
+
+    assert await memory.shutdown() is True
+
+    assert memory.writes == 1
+    assert _stored(memory)["learning_context"] == {"process_38": {"confidence": 0.9}}
+    assert await memory.shutdown() is False
+
+
+@pytest.mark.unit
+def test_saves_write_through_without_event_loop(adaptive_agent, tmp_path):
+    memory = adaptive_agent.AgentMemory("acme", tmp_path, write_behind=True)
+    data = memory.load_memory()
+    data["learning_context"]["k"] = 1
+    memory.save_memory(data)
+
+    assert memory.writes == 1
+    assert _stored(memory)["learning_context"] == {"k": 1}
+
+
+@pytest.mark.unit
+async def test_failed_background_flush_is_retried(adaptive_agent, tmp_path, monkeypatch):
+    memory = adaptive_agent.AgentMemory("acme", tmp_path, write_behind=True, flush_interval=0.05)
+    real_write = adaptive_agent.SafeFileOperations.write_file
+    attempts = []
+
+    def flaky_write(path, content):
+        attempts.append(path)
+        return len(attempts) > 1 and real_write(path, content)
+
+    monkeypatch.setattr(adaptive_agent.SafeFileOperations, "write_file", staticmethod(flaky_write))
+
+    data = memory.load_memory()
+    data["learning_context"]["k"] = 1
+    memory.save_memory(data)
+
+    for _ in range(50):
+        await asyncio.sleep(0.05)
+        if memory.writes:
+            break
+
+    assert len(attempts) == 2
+    assert memory.writes == 1
+    assert _stored(memory)["learning_context"] == {"k": 1}
+    assert not memory._dirty
+
+
+@pytest.mark.unit
+async def test_shutdown_waits_for_background_write_in_progress(adaptive_agent, tmp_path, monkeypatch):
+    """Shutdown never writes the file while a background write is still running."""
+    memory = adaptive_agent.AgentMemory("acme", tmp_path, write_behind=True, flush_interval=0.01)
+    real_write = adaptive_agent.SafeFileOperations.write_file
+    started = threading.Event()
+    active = []
+    overlaps = []
+
+    def slow_write(path, content):
+        overlaps.append(len(active))
+        active.append(path)
+        started.set()
+        time.sleep(0.1)
+        active.pop()
+        return real_write(path, content)
+
+    monkeypatch.setattr(adaptive_agent.SafeFileOperations, "write_file", staticmethod(slow_write))
+
+    data = memory.load_memory()
+    data["learning_context"]["k"] = 1
+    memory.save_memory(data)
+    await asyncio.to_thread(started.wait, 1)
+
+    data = memory.load_memory()
+    data["learning_context"]["k"] = 2
+    memory.save_memory(data)
+    assert await memory.shutdown() is True
+
+    assert overlaps == [0, 0]
+    assert memory.writes == 2
+    assert _stored(memory)["learning_context"] == {"k": 2}
+
+
+@pytest.mark.unit
+async def test_save_during_background_write_is_flushed(adaptive_agent, tmp_path, monkeypatch):
+    """A save that lands while the background write runs gets its own flush."""
+    memory = adaptive_agent.AgentMemory("acme", tmp_path, write_behind=True, flush_interval=0.01)
+    real_write = adaptive_agent.SafeFileOperations.write_file
+    started = threading.Event()
+
+    def slow_write(path, content):
+        started.set()
+        time.sleep(0.1)
+        return real_write(path, content)
+
+    monkeypatch.setattr(adaptive_agent.SafeFileOperations, "write_file", staticmethod(slow_write))
+
+    data = memory.load_memory()
+    data["learning_context"]["k"] = 1
+    memory.save_memory(data)
+    await asyncio.to_thread(started.wait, 1)
+
+    data = memory.load_memory()
+    data["learning_context"]["k"] = 2
+    memory.save_memory(data)
+
+    for _ in range(50):
+        await asyncio.sleep(0.05)
+        if memory.writes == 2:
+            break
+
+    assert memory.writes == 2
+    assert _stored(memory)["learning_context"] == {"k": 2}
+    assert not memory._dirty
+
+
+@pytest.mark.unit
+async def test_server_shutdown_flushes_agent_memories(adaptive_agent, monkeypatch):
+    """Leaving the server lifespan awaits the adaptive agent's shutdown."""
+    import src.services.sla_monitor as sla_monitor
+
+    initialization = importlib.import_module("src.initialization")
+    monkeypatch.setattr(sla_monitor, "load_open_tickets", lambda monitor: 0)
+    monkeypatch.setenv("ENABLE_AUDIT_LOGGING", "false")
+    calls = []
+
+    class Agent:
+        async def shutdown(self):
+            calls.append("shutdown")
+            return 0
+
+    monkeypatch.setattr(initialization, "GLOBAL_AGENT", Agent())
+
+    async with initialization.server_lifespan(None):
+        assert calls == []
+
+    assert calls == ["shutdown"]
@@ -0,0 +1,156 @@
+"""
+Unit Tests for the per-client AgentMemory cache
+
+Tests LRU eviction order, idle expiry, that evicted memories have their
+pending changes flushed, that a client requested again during its eviction
+flush gets the same instance back, and the size, eviction and hit/miss
+metrics.
+"""
+
+import asyncio
+import importlib
+import json
+
+import pytest
+
+
+@pytest.fixture
+def agent_integration(monkeypatch):
+    """src.agents.agent_integration, importable without the optional CRM integrations."""
+    import src.integrations as integrations
+
+    for name in ("SalesforceIntegration", "GmailIntegration", "ApolloIntegration"):
+        monkeypatch.setattr(integrations, name, object, raising=False)
+    return importlib.import_module("src.agents.agent_integration")
+
+
+@pytest.fixture
+def metrics(agent_integration, monkeypatch):
+    """Record the cache metrics reported by AgentMemoryCache."""
+    recorded = {'sizes': [], 'evictions': [], 'hits': 0, 'misses': 0}
+    monkeypatch.setattr(agent_integration, "update_cache_size",
+                        lambda cache_type, size: recorded['sizes'].append((cache_type, size)))
+    monkeypatch.setattr(agent_integration, "record_cache_eviction",
+                        lambda cache_type, reason="size": recorded['evictions'].append((cache_type, reason)))
+    monkeypatch.setattr(agent_integration, "record_cache_hit",
+                        lambda cache_type: recorded.__setitem__('hits', recorded['hits'] + 1))
+    monkeypatch.setattr(agent_integration, "record_cache_miss",
+                        lambda cache_type: recorded.__setitem__('misses', recorded['misses'] + 1))
+    return recorded
+
+
+def _make_dirty(memory, key="k"):
+    data = memory.load_memory()
+    data["learning_context"][key] = 1
+    memory.save_memory(data)
+
+
+@pytest.mark.unit
+def test_evicts_least_recently_used(agent_integration, metrics, tmp_path):
+    cache = agent_integration.AgentMemoryCache(tmp_path, max_size=2, idle_ttl=3600)
+    acme = cache.get("acme")
+    cache.get("globex")
+    assert cache.get("acme") is acme  # acme is now most recently used
+
+    cache.get("initech")
+
+    assert list(cache._entries) == ["acme", "initech"]
+    assert "globex" not in cache
+    assert metrics['evictions'] == [("agent_memory", "size")]
+    assert metrics['sizes'][-1] == ("agent_memory", 2)
+    assert cache.get_stats()['size'] == 2
+    assert cache.get_stats()['evictions'] == 1
+
+
+@pytest.mark.unit
+def test_only_memory_lookups_count_as_hits(agent_integration, metrics, tmp_path):
+    """Process sequence tracking touches the entry without inflating the hit rate."""
+    cache = agent_integration.AgentMemoryCache(tmp_path, max_size=10, idle_ttl=3600)
+    cache.get("acme")
+    for process in (1, 2, 3):
+        cache.process_sequence("acme").append(process)
+    cache.get("acme")
+
+    assert (metrics['hits'], metrics['misses']) == (1, 1)
+    assert cache.process_sequence("acme") == [1, 2, 3]
+
+
+@pytest.mark.unit
+def test_idle_entries_expire(agent_integration, metrics, tmp_path, monkeypatch):
+    cache = agent_integration.AgentMemoryCache(tmp_path, max_size=10, idle_ttl=60)
+    now = [1000.0]
+    monkeypatch.setattr(agent_integration.time, "monotonic", lambda: now[0])
+
+    cache.get("acme")
+    now[0] += 30
+    cache.get("globex")
+    now[0] += 40  # acme idle for 70s, globex for 40s
+
+    assert cache.evict_idle() == 1
+    assert list(cache._entries) == ["globex"]
+
+    now[0] += 60
+    cache.get("initech")  # lookups sweep idle entries first
+    assert list(cache._entries) == ["initech"]
+    assert metrics['evictions'] == [("agent_memory", "idle")] * 2
+    assert cache.evictions == 2
+    assert len(cache) == 1
+
+
+@pytest.mark.unit
+def test_eviction_flushes_without_event_loop(agent_integration, metrics, tmp_path, monkeypatch):
+    cache = agent_integration.AgentMemoryCache(tmp_path, max_size=1, idle_ttl=3600)
+    acme = cache.get("acme")
+    flushed = []
+    monkeypatch.setattr(acme, "flush", lambda: flushed.append("acme") or True)
+
+    cache.get("globex")
+
+    assert flushed == ["acme"]
+
+
+@pytest.mark.unit
+async def test_eviction_flushes_pending_changes(agent_integration, metrics, tmp_path):
+    cache = agent_integration.AgentMemoryCache(tmp_path, max_size=1, idle_ttl=3600)
+    acme = cache.get("acme")
+    acme.flush_interval = 60
+    _make_dirty(acme)
+    assert acme.writes == 0
+
+    cache.get("globex")
+    assert cache.get_stats()['pending_flushes'] == 1
+
+    await cache.shutdown()
+
+    assert acme.writes == 1
+    assert json.loads(acme.memory_file.read_text())["learning_context"] == {"k": 1}
+    assert cache.get_stats()['pending_flushes'] == 0
+    assert cache._evicting == {}
+
+
+@pytest.mark.unit
+async def test_client_requested_during_eviction_flush_gets_same_instance(agent_integration, metrics, tmp_path, monkeypatch):
+    cache = agent_integration.AgentMemoryCache(tmp_path, max_size=1, idle_ttl=3600)
+    acme = cache.get("acme")
+    release = asyncio.Event()
+
+    async def slow_shutdown():
+        await release.wait()
+        return True
+
+    monkeypatch.setattr(acme, "shutdown", slow_shutdown)
+
+    cache.get("globex")  # evicts acme; its flush is still running
+    await asyncio.sleep(0)
+    assert "acme" in cache._evicting
+
+    assert cache.get("acme") is acme
+    assert "acme" not in cache._evicting
+
+    release.set()
+    await cache.shutdown()
+
+    # The finished flush must not drop the instance that is cached again
+    assert "acme" in cache
+    assert cache._evicting == {}
+    assert cache.get("acme") is acme
@@ -0,0 +1,151 @@
+"""
+Unit Tests for the async database session layer
+
+Tests conversion of sync database URLs to their asyncio drivers, that
+tool sessions reuse the batch-shared session inside shared_async_session()
+and are only closed when they are not shared, and that the tools ported
+to async sessions run against a real (SQLite) database.
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import src.database as database
+from src.database.models import CustomerAccount
+from src.database import (
+    open_async_session,
+    release_async_session,
+    reset_shared_session,
+    shared_async_session,
+    to_async_url,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("url,expected", [
+    ("postgresql://cs:pw@db:5432/customer_success", "postgresql+asyncpg://cs:pw@db:5432/customer_success"),
+    ("postgres://localhost/cs", "postgresql+asyncpg://localhost/cs"),
+    ("postgresql+psycopg2://localhost/cs", "postgresql+asyncpg://localhost/cs"),
+    ("sqlite:///./data/cs.db", "sqlite+aiosqlite:///./data/cs.db"),
+    ("sqlite:///:memory:", "sqlite+aiosqlite:///:memory:"),
+])
+def test_sync_urls_get_async_driver(url, expected):
+    assert to_async_url(url) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("url", [
+    "postgresql+asyncpg://localhost/cs",
+    "sqlite+aiosqlite:///./data/cs.db",
+    "mysql://localhost/cs",
+    "not-a-url",
+])
+def test_async_and_unknown_urls_are_unchanged(url):
+    assert to_async_url(url) == url
+
+
+@pytest.fixture
+async def sqlite_engine(monkeypatch):
+    """In-memory SQLite engine and session factory in place of the configured database."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    factory = async_sessionmaker(bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+    monkeypatch.setattr(database, "async_engine", engine)
+    monkeypatch.setattr(database, "AsyncSessionLocal", factory)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.unit
+async def test_sessions_outside_a_batch_are_new_and_closed(sqlite_engine):
+    first = open_async_session()
+    second = open_async_session()
+    assert first is not second
+
+    assert await first.scalar(text("SELECT 1")) == 1
+    assert first.in_transaction()
+    await release_async_session(first)
+    assert not first.in_transaction()
+    await release_async_session(second)
+
+
+@pytest.mark.unit
+async def test_tool_calls_reuse_the_shared_session(sqlite_engine):
+    """Inside the block every call gets the shared session and releasing it keeps it open."""
+    async with shared_async_session() as shared:
+        db = open_async_session()
+        assert db is shared
+        await db.execute(text("CREATE TEMP TABLE seen (n INTEGER)"))
+        await db.execute(text("INSERT INTO seen VALUES (1)"))
+        await release_async_session(db)
+
+        # Still open, on the same connection: the temp table is visible
+        again = open_async_session()
+        assert again is shared
+        assert await again.scalar(text("SELECT count(*) FROM seen")) == 1
+        await release_async_session(again)
+
+    # The shared session is gone once the block exits
+    outside = open_async_session()
+    assert outside is not shared
+    await release_async_session(outside)
+
+
+@pytest.mark.unit
+async def test_reset_shared_session_rolls_back_between_calls(sqlite_engine):
+    async with shared_async_session() as shared:
+        await shared.execute(text("CREATE TEMP TABLE seen (n INTEGER)"))
+        await shared.commit()
+        await shared.execute(text("INSERT INTO seen VALUES (1)"))
+        assert shared.in_transaction()
+
+        await reset_shared_session(shared)
+
+        assert not shared.in_transaction()
+        assert await shared.scalar(text("SELECT count(*) FROM seen")) == 0
+
+
+class _Ctx:
+    async def info(self, message):
+        pass
+
+
+@pytest.mark.unit
+async def test_ported_tools_query_async_sessions(sqlite_engine):
+    """Overview, update, renewal and upsell tools read and write through AsyncSession."""
+    from src.tools.core.get_client_overview import get_client_overview
+    from src.tools.core.update_client_info import update_client_info
+    from src.tools.expansion.identify_upsell_opportunities import identify_upsell_opportunities
+    from src.tools.expansion.track_renewals import track_renewals
+
+    async with sqlite_engine.begin() as conn:
+        await conn.execute(CreateTable(CustomerAccount.__table__))
+    async with database.AsyncSessionLocal() as db:
+        db.add(CustomerAccount(
+            client_id="cs_1_acme", client_name="Acme", company_name="Acme", tier="enterprise",
+            lifecycle_stage="active", contract_start_date=date(2026, 1, 1),
+            contract_end_date=date.today() + timedelta(days=30), contract_value=120000,
+            health_score=85, status="active", last_engagement_date=datetime.now()
+        ))
+        await db.commit()
+    ctx = _Ctx()
+
+    overview = await get_client_overview(ctx, "cs_1_acme")
+    assert overview["status"] == "success"
+
+    updated = await update_client_info(ctx, "cs_1_acme", {"tier": "professional"})
+    assert updated["status"] == "success"
+    assert updated["updated_record"]["tier"] == "professional"
+
+    renewals = await track_renewals(ctx, days_until_renewal=60)
+    assert renewals["status"] == "success"
+    assert len(renewals["renewals"]) == 1
+
+    upsell = await identify_upsell_opportunities(ctx)
+    assert upsell["status"] == "success"
+    assert len(upsell["opportunities"]) == 1
+
+    assert (await get_client_overview(ctx, "bad id!"))["status"] == "failed"
@@ -0,0 +1,265 @@
+"""
+Unit Tests for AuditLogger storage
+
+Tests the sidecar index and its bounded in-memory cache, the chain tip
+(kept in memory, persisted periodically), indexed filtering of the audit
+log store and the buffered writer's lifecycle in the server lifespan.
+"""
+
+import asyncio
+import importlib
+import json
+import pytest
+from datetime import datetime, timedelta
+
+import src.security.audit_logger as audit_module
+from src.security.audit_logger import AuditLogger, AuditEventType, AuditSeverity
+
+
+@pytest.fixture
+def audit_logger(tmp_path):
+    """Audit logger writing to a temporary directory."""
+    return AuditLogger(tmp_path, retention_days=365)
+
+
+def _log_events(audit_logger, count, client_id="acme"):
+    for i in range(count):
+        audit_logger.log(
+            event_type=AuditEventType.AUTH_LOGIN if i % 2 == 0 else AuditEventType.DATA_READ,
+            client_id=client_id,
+            description=f"event {i}",
+            user_id=f"user{i % 3}",
+            severity=AuditSeverity.INFO
+        )
+
+
+@pytest.mark.unit
+def test_writes_sidecar_index_and_tip(audit_logger, tmp_path):
+    """Each log file gets an index line per entry and flush() persists the chain tip."""
+    _log_events(audit_logger, 4)
+
+    log_file = audit_logger._get_log_files("acme")[0]
+    index_lines = log_file.with_suffix(".idx").read_text().splitlines()
+    assert len(index_lines) == 4
+
+    audit_logger.flush()
+    tip = json.loads((tmp_path / "audit_acme.tip").read_text())
+    assert tip["hash"] == audit_logger._last_hash_cache["acme"]
+    assert tip["size"] == log_file.stat().st_size
+
+
+@pytest.mark.unit
+def test_restart_resumes_chain_from_tip(audit_logger, tmp_path):
+    """A new logger continues the chain without rereading the log files."""
+    _log_events(audit_logger, 3)
+    expected = audit_logger._last_hash_cache["acme"]
+
+    restarted = AuditLogger(tmp_path, retention_days=365)
+    restarted._read_log_file = None  # any full-file read would fail
+
+    assert restarted._get_last_hash("acme") == expected
+    restarted.log(AuditEventType.DATA_READ, "acme", "after restart")
+    assert AuditLogger(tmp_path).verify_chain_integrity("acme")
+
+
+@pytest.mark.unit
+def test_tip_is_persisted_every_n_entries(tmp_path, monkeypatch):
+    """Appends advance the tip in memory; the tip file is only rewritten every N entries."""
+    audit_logger = AuditLogger(tmp_path, tip_persist_every=3)
+    reads = []
+    writes = []
+    read_tip, write_tip = audit_logger._read_tip, audit_logger._write_tip
+    monkeypatch.setattr(audit_logger, "_read_tip", lambda c: reads.append(c) or read_tip(c))
+    monkeypatch.setattr(
+        audit_logger, "_write_tip", lambda c, t: writes.append(t["hash"]) or write_tip(c, t)
+    )
+
+    _log_events(audit_logger, 7)
+
+    assert reads == ["acme"]
+    assert len(writes) == 2
+    assert audit_logger._unsaved_tips == {"acme": 1}
+
+    audit_logger.flush()
+    assert writes[-1] == audit_logger._last_hash_cache["acme"]
+    assert audit_logger._unsaved_tips == {}
+
+
+@pytest.mark.unit
+def test_restart_after_unpersisted_appends_uses_index(tmp_path):
+    """A tip left behind by later appends is ignored and the chain resumes from the index."""
+    audit_logger = AuditLogger(tmp_path, tip_persist_every=2)
+    _log_events(audit_logger, 3)
+    expected = audit_logger._last_hash_cache["acme"]
+    assert json.loads((tmp_path / "audit_acme.tip").read_text())["hash"] != expected
+
+    restarted = AuditLogger(tmp_path)
+    assert restarted._get_last_hash("acme") == expected
+    restarted.log(AuditEventType.DATA_READ, "acme", "after restart")
+    assert AuditLogger(tmp_path).verify_chain_integrity("acme")
+
+
+@pytest.mark.unit
+def test_get_logs_filters_through_index(audit_logger):
+    """Event type, user and limit filters return matching entries in order."""
+    _log_events(audit_logger, 12)
+
+    logs = audit_logger.get_logs("acme", event_type=AuditEventType.AUTH_LOGIN, user_id="user0", limit=10)
+    assert [log.description for log in logs] == ["event 0", "event 6"]
+
+    assert len(audit_logger.get_logs("acme", limit=5)) == 5
+    assert audit_logger.get_logs("acme", start_date=datetime.utcnow() + timedelta(days=1)) == []
+
+
+@pytest.mark.unit
+def test_client_prefix_does_not_leak_between_clients(audit_logger):
+    """Logs for client 'acme_eu' are not returned for client 'acme'."""
+    _log_events(audit_logger, 2, client_id="acme")
+    _log_events(audit_logger, 3, client_id="acme_eu")
+
+    assert len(audit_logger.get_logs("acme")) == 2
+    assert audit_logger.verify_chain_integrity("acme")
+
+
+@pytest.mark.unit
+def test_legacy_files_are_indexed_on_demand(audit_logger, tmp_path):
+    """Files written without a sidecar index are indexed on first read."""
+    _log_events(audit_logger, 5)
+    for path in list(tmp_path.glob("*.idx")) + list(tmp_path.glob("*.tip")):
+        path.unlink()
+
+    fresh = AuditLogger(tmp_path)
+    assert len(fresh.get_logs("acme")) == 5
+    assert fresh._get_last_hash("acme") == audit_logger._last_hash_cache["acme"]
+    assert list(tmp_path.glob("*.idx"))
+
+
+@pytest.mark.unit
+def test_index_cache_keeps_recently_used_files(tmp_path):
+    """Only the most recently used files keep their parsed index in memory."""
+    audit_logger = AuditLogger(tmp_path, index_cache_files=2)
+    for client_id in ("acme", "globex", "initech"):
+        _log_events(audit_logger, 2, client_id=client_id)
+        audit_logger.get_logs(client_id)
+
+    cached = [path.name.split("_")[1] for path in audit_logger._index_cache]
+    assert cached == ["globex", "initech"]
+
+    # Evicted indexes are reloaded from the sidecar on demand
+    assert len(audit_logger.get_logs("acme")) == 2
+    assert [path.name.split("_")[1] for path in audit_logger._index_cache] == ["initech", "acme"]
+
+
+@pytest.mark.unit
+def test_rotated_and_purged_files_leave_index_cache(audit_logger, tmp_path):
+    """Full files are dropped from the index cache on rotation and on purge."""
+    audit_logger.max_file_size_bytes = 200
+    _log_events(audit_logger, 1)
+    first = next(tmp_path.glob("*.jsonl"))
+    audit_logger.get_logs("acme")
+    assert first in audit_logger._index_cache
+
+    _log_events(audit_logger, 2)
+    assert first not in audit_logger._index_cache
+    assert len(audit_logger.get_logs("acme")) == 3
+
+    assert len(audit_logger._index_cache) == 2
+
+    audit_logger.retention_days = -1
+    assert audit_logger.purge_old_logs() == 2
+    assert audit_logger._index_cache == {}
+
+
+@pytest.mark.unit
+def test_incremental_verification_detects_new_tampering(audit_logger):
+    """Incremental verification resumes from the checkpoint and checks new entries."""
+    _log_events(audit_logger, 3)
+    assert audit_logger.verify_chain_integrity("acme")
+
+    _log_events(audit_logger, 2)
+    log_file = audit_logger._get_log_files("acme")[0]
+    lines = log_file.read_text().splitlines()
+    tampered = json.loads(lines[-1])
+    tampered["description"] = "TAMPERED"
+    lines[-1] = json.dumps(tampered)
+    log_file.write_text("\n".join(lines) + "\n")
+
+    assert audit_logger.verify_chain_integrity("acme", incremental=True) is False
+
+
+# ============================================================================
+# Buffered Writer Tests
+# ============================================================================
+
+@pytest.fixture
+def buffered_logger(tmp_path):
+    """Audit logger in buffered (group-commit) mode."""
+    return AuditLogger(tmp_path, async_writes=True, flush_interval_ms=10, max_pending=100)
+
+
+@pytest.mark.unit
+def test_buffered_log_defers_writes_until_flush(buffered_logger):
+    """Entries stay in memory until flushed, then land in chain order."""
+    _log_events(buffered_logger, 5)
+    assert buffered_logger._get_log_files("acme") == []
+
+    assert buffered_logger.flush() == 5
+    logs = buffered_logger.get_logs("acme")
+    assert [log.description for log in logs] == [f"event {i}" for i in range(5)]
+    assert buffered_logger.verify_chain_integrity("acme")
+
+
+@pytest.mark.unit
+def test_buffered_log_flushes_inline_when_full(tmp_path):
+    """Reaching max_pending commits the queue synchronously."""
+    audit_logger = AuditLogger(tmp_path, async_writes=True, max_pending=3)
+    _log_events(audit_logger, 3)
+
+    assert audit_logger._pending_count == 0
+    assert len(audit_logger._get_log_files("acme")) == 1
+
+
+@pytest.mark.unit
+def test_get_logs_sees_pending_entries(buffered_logger):
+    """Reads flush pending entries first."""
+    _log_events(buffered_logger, 2)
+    assert len(buffered_logger.get_logs("acme")) == 2
+
+
+@pytest.mark.unit
+async def test_background_writer_and_shutdown_drain(buffered_logger):
+    """The writer task group-commits in the background and shutdown drains the rest."""
+    await buffered_logger.start_writer()
+    _log_events(buffered_logger, 4)
+    await asyncio.sleep(0.1)
+    assert buffered_logger._pending_count == 0
+
+    _log_events(buffered_logger, 2)
+    await buffered_logger.shutdown()
+
+    fresh = AuditLogger(buffered_logger.log_directory)
+    assert len(fresh.get_logs("acme")) == 6
+    assert fresh.verify_chain_integrity("acme")
+
+
+@pytest.mark.unit
+async def test_server_lifespan_runs_and_drains_the_writer(tmp_path, monkeypatch):
+    """The server lifespan starts the global logger's writer and drains it on shutdown."""
+    import src.integrations as integrations
+    import src.services.sla_monitor as sla_monitor
+
+    for name in ("SalesforceIntegration", "GmailIntegration", "ApolloIntegration"):
+        monkeypatch.setattr(integrations, name, object, raising=False)
+    initialization = importlib.import_module("src.initialization")
+    monkeypatch.setattr(sla_monitor, "load_open_tickets", lambda monitor: 0)
+    monkeypatch.setenv("ENABLE_AUDIT_LOGGING", "true")
+    buffered = AuditLogger(tmp_path, async_writes=True, flush_interval_ms=60_000)
+    monkeypatch.setattr(audit_module, "_audit_logger", buffered)
+
+    async with initialization.server_lifespan(None):
+        assert buffered._writer_task is not None
+        _log_events(audit_module.get_audit_logger(), 3)
+        assert buffered._get_log_files("acme") == []
+
+    assert buffered._writer_task is None
+    assert len(AuditLogger(tmp_path).get_logs("acme")) == 3
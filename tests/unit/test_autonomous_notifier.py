@@ -0,0 +1,169 @@
+"""
+Unit Tests for the autonomous alert Notifier
+
+Tests non-blocking queueing, digest coalescing across workers, retry with
+backoff, per-destination rate limiting and the bounded queue. Deliveries are
+recorded by patching the channel classes, so no HTTP requests are made.
+"""
+
+import asyncio
+
+import pytest
+
+from autonomous.notifier import (
+    NotificationError,
+    Notifier,
+    SendGridEmailChannel,
+    SlackWebhookChannel,
+)
+from autonomous.workers.base_worker import AutonomousWorker
+
+SLACK_CONFIG = {"slack_enabled": True, "slack_webhook": "https://hooks.slack.test/T1"}
+
+
+class Deliveries(list):
+    """Sent (channel key, payload) pairs; queued errors are raised first."""
+
+    def __init__(self):
+        super().__init__()
+        self.errors = []
+
+    async def deliver(self, channel, session, payload):
+        if self.errors:
+            raise self.errors.pop(0)
+        self.append((channel.key, payload))
+
+
+@pytest.fixture
+def deliveries(monkeypatch):
+    """Record payloads instead of posting."""
+    recorder = Deliveries()
+
+    async def deliver(channel, session, payload):
+        await recorder.deliver(channel, session, payload)
+
+    monkeypatch.setattr(SlackWebhookChannel, "deliver", deliver)
+    monkeypatch.setattr(SendGridEmailChannel, "deliver", deliver)
+    return recorder
+
+
+class AlertWorker(AutonomousWorker):
+    async def execute(self):
+        return {"summary": "ok", "alerts": ["low health"]}
+
+
+@pytest.mark.unit
+async def test_alerts_from_several_workers_become_one_digest(deliveries):
+    """Alerts inside the digest window are sent as one message per destination."""
+    notifier = Notifier({**SLACK_CONFIG, "digest_window_seconds": 0.05})
+
+    assert notifier.enqueue("churn_risk_monitor", ["3 critical"]) == 1
+    assert notifier.enqueue("usage_drop_alerts", ["usage down 40%"]) == 1
+    assert notifier.enqueue("churn_risk_monitor", ["2 at risk"]) == 1
+    assert deliveries == []
+
+    await notifier.shutdown()
+
+    assert len(deliveries) == 1
+    key, payload = deliveries[0]
+    assert key == "slack:https://hooks.slack.test/T1"
+    assert "Digest (3)" in payload["blocks"][0]["text"]["text"]
+    sections = [block["text"]["text"] for block in payload["blocks"][1:]]
+    assert sections == [
+        "*Churn Risk Monitor*\n• 3 critical\n• 2 at risk",
+        "*Usage Drop Alerts*\n• usage down 40%",
+    ]
+    assert notifier.get_stats()["sent"] == 1
+
+
+@pytest.mark.unit
+async def test_worker_overrides_add_email_destination(deliveries):
+    """Worker settings layer over the defaults; each destination gets its own digest."""
+    notifier = Notifier({**SLACK_CONFIG, "digest_window_seconds": 0})
+    overrides = {"email_enabled": True, "email_to": "cs@acme.test, vp@acme.test"}
+
+    assert notifier.enqueue("support_sla_tracker", ["2 tickets near breach"], overrides) == 2
+    await notifier.shutdown()
+
+    keys = sorted(key for key, _ in deliveries)
+    assert keys == ["email:cs@acme.test,vp@acme.test", "slack:https://hooks.slack.test/T1"]
+    email = dict(deliveries)["email:cs@acme.test,vp@acme.test"]
+    assert email["subject"] == "Support Sla Tracker Alert (1)"
+
+
+@pytest.mark.unit
+async def test_retryable_failures_are_retried_with_backoff(deliveries):
+    """429/5xx style errors are retried; Retry-After is honoured."""
+    notifier = Notifier({**SLACK_CONFIG, "digest_window_seconds": 0, "retry_backoff_seconds": 0.01})
+    deliveries.errors.extend([
+        NotificationError("HTTP 429", retry_after=0.01),
+        NotificationError("HTTP 503"),
+    ])
+
+    notifier.enqueue("churn_risk_monitor", ["3 critical"])
+    await notifier.shutdown()
+
+    assert len(deliveries) == 1
+    assert notifier.stats["retries"] == 2
+    assert notifier.stats["failed"] == 0
+
+
+@pytest.mark.unit
+async def test_permanent_failure_is_not_retried(deliveries):
+    notifier = Notifier({**SLACK_CONFIG, "digest_window_seconds": 0})
+    deliveries.errors.append(NotificationError("HTTP 404", retryable=False))
+
+    notifier.enqueue("churn_risk_monitor", ["3 critical"])
+    await notifier.shutdown()
+
+    assert deliveries == []
+    assert notifier.stats["retries"] == 0
+    assert notifier.stats["failed"] == 1
+
+
+@pytest.mark.unit
+async def test_sends_to_one_webhook_are_rate_limited(monkeypatch):
+    """Consecutive digests to the same webhook are spaced by the rate limit."""
+    notifier = Notifier({**SLACK_CONFIG, "digest_window_seconds": 0, "rate_limit_per_minute": 600})
+    loop = asyncio.get_running_loop()
+    sent_at = []
+
+    async def timed_deliver(channel, session, payload):
+        sent_at.append(loop.time())
+
+    monkeypatch.setattr(SlackWebhookChannel, "deliver", timed_deliver)
+    for i in range(3):
+        notifier.enqueue("churn_risk_monitor", [f"alert {i}"])
+        await asyncio.sleep(0)
+    await notifier.shutdown()
+
+    assert len(sent_at) == 3
+    gaps = [b - a for a, b in zip(sent_at, sent_at[1:])]
+    assert all(gap >= 0.09 for gap in gaps)
+
+
+@pytest.mark.unit
+async def test_full_queue_drops_instead_of_blocking(deliveries):
+    notifier = Notifier({**SLACK_CONFIG, "queue_size": 2, "digest_window_seconds": 0})
+
+    results = [notifier.enqueue("churn_risk_monitor", [f"alert {i}"]) for i in range(4)]
+    await notifier.shutdown()
+
+    assert results == [1, 1, 0, 0]
+    assert notifier.stats["dropped"] == 2
+
+
+@pytest.mark.unit
+async def test_worker_without_shared_notifier_delivers_before_returning(deliveries):
+    """A standalone worker run still sends its alerts through a temporary notifier."""
+    worker = AlertWorker(
+        "churn_risk_monitor",
+        {"enabled": True, "notifications": {**SLACK_CONFIG, "digest_window_seconds": 60}},
+        tools=None,
+    )
+
+    result = await worker.run()
+
+    assert result["status"] == "success"
+    assert len(deliveries) == 1
+    assert deliveries[0][1]["text"] == "*Churn Risk Monitor Alert*"
@@ -0,0 +1,182 @@
+"""
+Unit Tests for AutonomousScheduler
+
+Tests the in-flight guard, concurrency limit (and changing it on reload),
+next-due ordering and graceful shutdown of the autonomous worker scheduler.
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+
+from autonomous import scheduler as scheduler_module
+from autonomous.scheduler import AutonomousScheduler
+from autonomous.workers.base_worker import AutonomousWorker
+
+
+class FakeConfigManager:
+    """Minimal in-memory stand-in for ConfigManager."""
+
+    def __init__(self, workers, max_concurrent=2, jitter=0):
+        self.config = {
+            "autonomous": {
+                "enabled": True,
+                "global_interval_minutes": 30,
+                "max_concurrent_workers": max_concurrent,
+                "jitter_seconds": jitter,
+                "shutdown_timeout_seconds": 5,
+            },
+            "workers": workers,
+        }
+
+    def load_config(self):
+        return self.config
+
+    def get_enabled_workers(self):
+        return {name: cfg for name, cfg in self.config["workers"].items() if cfg.get("enabled")}
+
+    def get_global_interval(self):
+        return self.config["autonomous"]["global_interval_minutes"]
+
+    def get_max_concurrent_workers(self):
+        return self.config["autonomous"]["max_concurrent_workers"]
+
+    def get_jitter_seconds(self):
+        return self.config["autonomous"]["jitter_seconds"]
+
+    def get_shutdown_timeout(self):
+        return self.config["autonomous"]["shutdown_timeout_seconds"]
+
+    def get_notification_config(self):
+        return self.config["autonomous"].get("notifications", {})
+
+
+class SlowWorker(AutonomousWorker):
+    """Worker that records concurrency and sleeps for a configured time."""
+
+    active = 0
+    peak = 0
+    started = []
+
+    async def execute(self):
+        SlowWorker.active += 1
+        SlowWorker.peak = max(SlowWorker.peak, SlowWorker.active)
+        SlowWorker.started.append(self.name)
+        try:
+            await asyncio.sleep(self.config.get("params", {}).get("sleep", 0.05))
+        finally:
+            SlowWorker.active -= 1
+        return {"summary": "ok"}
+
+
+@pytest.fixture
+def make_scheduler(monkeypatch):
+    """Build a scheduler whose registry maps every worker name to SlowWorker."""
+    SlowWorker.active = SlowWorker.peak = 0
+    SlowWorker.started = []
+
+    def factory(worker_configs, **kwargs):
+        monkeypatch.setattr(
+            scheduler_module, "WORKER_REGISTRY", {name: SlowWorker for name in worker_configs}
+        )
+        return AutonomousScheduler(FakeConfigManager(worker_configs, **kwargs), tools=None)
+
+    return factory
+
+
+def _worker_config(interval_hours=24, sleep=0.05):
+    return {"enabled": True, "interval_hours": interval_hours, "params": {"sleep": sleep}}
+
+
+@pytest.mark.unit
+async def test_manual_trigger_is_rejected_while_worker_in_flight(make_scheduler):
+    """A worker cannot be started again while its previous run is still going."""
+    scheduler = make_scheduler({"churn_risk_monitor": _worker_config(sleep=0.2)})
+
+    first = asyncio.create_task(scheduler.run_worker_now("churn_risk_monitor"))
+    await asyncio.sleep(0.01)
+    second = await scheduler.run_worker_now("churn_risk_monitor")
+
+    assert second["status"] == "skipped"
+    assert (await first)["status"] == "success"
+    assert SlowWorker.started == ["churn_risk_monitor"]
+
+
+@pytest.mark.unit
+async def test_concurrency_limit_and_graceful_shutdown(make_scheduler):
+    """At most max_concurrent_workers run at once and stop drains running workers."""
+    workers = {f"worker_{i}": _worker_config(sleep=0.1) for i in range(5)}
+    scheduler = make_scheduler(workers, max_concurrent=2)
+
+    loop_task = asyncio.create_task(scheduler.run_forever())
+    await asyncio.sleep(0.05)
+    assert SlowWorker.peak == 2
+
+    scheduler.stop()
+    await asyncio.wait_for(loop_task, timeout=2)
+
+    assert scheduler._in_flight == {}
+    assert SlowWorker.active == 0
+    assert SlowWorker.peak == 2
+    assert len(SlowWorker.started) == 5
+
+
+@pytest.mark.unit
+async def test_workers_start_in_next_due_order(make_scheduler):
+    """Workers are dispatched by due time and rescheduled after their interval."""
+    scheduler = make_scheduler({
+        "usage_drop_alerts": _worker_config(sleep=0),
+        "churn_risk_monitor": _worker_config(sleep=0),
+    }, max_concurrent=1)
+    scheduler.workers["usage_drop_alerts"].last_run = None
+    scheduler.workers["churn_risk_monitor"].last_run = datetime.now() - timedelta(hours=24, seconds=-0.05)
+
+    loop_task = asyncio.create_task(scheduler.run_forever())
+    await asyncio.sleep(0.2)
+    status = scheduler.get_status()
+    await scheduler.shutdown()
+    await loop_task
+
+    assert SlowWorker.started == ["usage_drop_alerts", "churn_risk_monitor"]
+    assert status["workers"]["usage_drop_alerts"]["next_run"] is not None
+    assert status["in_flight"] == []
+
+
+@pytest.mark.unit
+async def test_dispatched_workers_are_in_flight_before_they_start(make_scheduler):
+    """Scheduled tasks are registered when created, so nothing can start them twice."""
+    scheduler = make_scheduler({"churn_risk_monitor": _worker_config(sleep=0.05)})
+    scheduler._schedule("churn_risk_monitor", 0)
+
+    scheduler._dispatch_due()
+    task = scheduler._in_flight["churn_risk_monitor"]
+    assert SlowWorker.started == []
+    assert (await scheduler.run_worker_now("churn_risk_monitor"))["status"] == "skipped"
+
+    scheduler.running = False
+    await task
+    assert scheduler._in_flight == {}
+    assert SlowWorker.started == ["churn_risk_monitor"]
+
+
+@pytest.mark.unit
+async def test_reload_resizes_concurrency_limit_for_running_scheduler(make_scheduler):
+    """Raising the limit starts waiting workers; lowering it holds until running ones finish."""
+    workers = {f"worker_{i}": _worker_config(sleep=0.2) for i in range(4)}
+    scheduler = make_scheduler(workers, max_concurrent=1)
+    runs = [asyncio.create_task(scheduler.run_worker_now(name)) for name in workers]
+    await asyncio.sleep(0.05)
+    assert SlowWorker.active == 1
+
+    scheduler.config_manager.config["autonomous"]["max_concurrent_workers"] = 3
+    scheduler.reload_config()
+    await asyncio.sleep(0.05)
+    assert SlowWorker.active == 3
+
+    scheduler.config_manager.config["autonomous"]["max_concurrent_workers"] = 1
+    scheduler.reload_config()
+    await asyncio.gather(*runs)
+
+    assert SlowWorker.peak == 3
+    assert len(SlowWorker.started) == 4
+    assert scheduler._active_workers == 0
@@ -0,0 +1,123 @@
+"""
+Unit Tests for BatchToolExecutor
+
+Tests up-front validation, bounded concurrency, streaming order and
+per-lane session sharing of batched tool calls.
+"""
+
+import asyncio
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import src.database as database
+from src.database import open_async_session, release_async_session
+from src.services.batch_executor import BatchToolExecutor
+
+
+class ToolRecorder:
+    """Fake tools that record concurrency and the sessions they receive."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.sessions = []
+
+    async def get_client_overview(self, ctx, client_id):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            return {"status": "success", "client_id": client_id}
+        finally:
+            self.active -= 1
+
+    async def slow_then_fast(self, ctx, delay: float):
+        await asyncio.sleep(delay)
+        return {"status": "success", "delay": delay}
+
+    async def broken_tool(self, ctx, client_id):
+        raise RuntimeError("boom")
+
+    async def query_tool(self, ctx, client_id):
+        db = open_async_session()
+        try:
+            self.sessions.append(db)
+            return {"status": "success", "value": await db.scalar(text("SELECT 1"))}
+        finally:
+            await release_async_session(db)
+
+    def mapping(self):
+        return {
+            "get_client_overview": self.get_client_overview,
+            "slow_then_fast": self.slow_then_fast,
+            "broken_tool": self.broken_tool,
+            "query_tool": self.query_tool,
+        }
+
+
+@pytest.fixture
+def recorder():
+    return ToolRecorder()
+
+
+@pytest.mark.unit
+def test_validate_rejects_bad_items_once(recorder):
+    """Unknown tools, bad arguments and invalid client_ids are rejected before execution."""
+    executor = BatchToolExecutor(tools=recorder.mapping(), share_session=False)
+    valid, rejected = executor.validate([
+        {"tool": "get_client_overview", "arguments": {"client_id": "cs_1"}},
+        {"tool": "missing_tool", "arguments": {}},
+        {"tool": "get_client_overview", "arguments": {"client_id": "../etc"}},
+        {"tool": "get_client_overview", "arguments": {"client": "cs_1"}},
+        "not-a-dict",
+    ])
+
+    assert [item.index for item in valid] == [0]
+    assert {r.index: r.error_type for r in rejected} == {
+        1: "unknown_tool", 2: "validation_error", 3: "validation_error", 4: "validation_error"
+    }
+
+
+@pytest.mark.unit
+async def test_run_bounds_concurrency_and_keeps_input_order(recorder):
+    """No more than max_concurrency items run at once; results come back in item order."""
+    executor = BatchToolExecutor(tools=recorder.mapping(), max_concurrency=3, share_session=False)
+    items = [{"tool": "get_client_overview", "arguments": {"client_id": f"cs_{i}"}} for i in range(12)]
+    items.append({"tool": "broken_tool", "arguments": {"client_id": "cs_x"}})
+
+    summary = await executor.run(items)
+
+    assert recorder.peak == 3
+    assert summary["succeeded"] == 12 and summary["failed"] == 1
+    assert [r["index"] for r in summary["results"]] == list(range(13))
+    assert summary["results"][-1]["error"] == "boom"
+
+
+@pytest.mark.unit
+async def test_stream_yields_results_as_they_complete(recorder):
+    """Fast items are yielded before slow ones that were submitted earlier."""
+    executor = BatchToolExecutor(tools=recorder.mapping(), max_concurrency=2, share_session=False)
+    items = [
+        {"tool": "slow_then_fast", "arguments": {"delay": 0.1}},
+        {"tool": "slow_then_fast", "arguments": {"delay": 0.0}},
+    ]
+
+    order = [result.index async for result in executor.stream(items)]
+    assert order == [1, 0]
+
+
+@pytest.mark.unit
+async def test_lanes_share_one_session_across_items(recorder, monkeypatch):
+    """Each lane reuses a single session for every item it executes."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    monkeypatch.setattr(database, "async_engine", engine)
+
+    executor = BatchToolExecutor(tools=recorder.mapping(), max_concurrency=2)
+    items = [{"tool": "query_tool", "arguments": {"client_id": f"cs_{i}"}} for i in range(6)]
+    summary = await executor.run(items)
+    await engine.dispose()
+
+    assert summary["succeeded"] == 6
+    assert all(r["result"]["value"] == 1 for r in summary["results"])
+    assert len({id(session) for session in recorder.sessions}) == 2
@@ -0,0 +1,159 @@
+"""
+Unit Tests for Bulk Health Scoring Engine
+
+Tests the vectorized component scoring and the end-to-end set-based
+rescoring path against an in-memory SQLite database.
+"""
+
+import pytest
+from datetime import datetime, date, timedelta
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateTable
+
+from src.database.models import (
+    CustomerAccount, HealthScoreComponents, SupportTicket, NPSResponse, ContractDetails
+)
+from src.services.health_scoring import BulkHealthScoringEngine, COMPONENTS
+
+
+def _customer_row(id, client_id, stage="active", days_since_engagement=None, now=None):
+    now = now or datetime.now()
+    last = now - timedelta(days=days_since_engagement) if days_since_engagement is not None else None
+    return SimpleNamespace(id=id, client_id=client_id, lifecycle_stage=stage, last_engagement_date=last)
+
+
+@pytest.fixture
+def scoring_session():
+    """In-memory SQLite session with only the tables the engine touches."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    with engine.begin() as conn:
+        for model in (CustomerAccount, HealthScoreComponents, SupportTicket, NPSResponse, ContractDetails):
+            conn.execute(CreateTable(model.__table__))
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def _add_customer(session, client_id, stage="active", status="active"):
+    session.add(CustomerAccount(
+        client_id=client_id,
+        client_name=client_id,
+        company_name="Acme",
+        tier="standard",
+        lifecycle_stage=stage,
+        contract_start_date=date(2026, 1, 1),
+        status=status,
+        last_engagement_date=datetime.now()
+    ))
+
+
+# ============================================================================
+# Component Matrix Tests
+# ============================================================================
+
+@pytest.mark.unit
+def test_component_matrix_defaults_without_activity():
+    """Customers without tickets, NPS or contracts get neutral defaults."""
+    engine = BulkHealthScoringEngine(db=None)
+    matrix = engine.compute_component_matrix([_customer_row(1, "cs_a")], {}, {}, {})
+
+    assert matrix.shape == (1, len(COMPONENTS))
+    usage, engagement, support, satisfaction, payment = matrix[0]
+    assert usage == 85.0
+    assert engagement == 50.0
+    assert support == 100.0
+    assert satisfaction == 70.0
+    assert payment == 85.0
+
+
+@pytest.mark.unit
+def test_component_matrix_applies_penalties():
+    """Ticket volume, critical tickets and overdue payments lower scores."""
+    now = datetime.now()
+    engine = BulkHealthScoringEngine(db=None)
+    customers = [_customer_row(1, "cs_a", stage="at_risk", days_since_engagement=10, now=now)]
+    support = {"cs_a": (4, 1)}
+    nps = {"cs_a": 40.0}
+    contracts = {"cs_a": (now.date() + timedelta(days=10), "overdue")}
+
+    usage, engagement, support_score, satisfaction, payment = engine.compute_component_matrix(
+        customers, support, nps, contracts, now
+    )[0]
+
+    assert usage == 45.0
+    assert engagement == 60.0
+    assert support_score == 100 - 12 - 10
+    assert satisfaction == 70.0
+    assert payment == 50.0
+
+
+# ============================================================================
+# Score Book Tests
+# ============================================================================
+
+@pytest.mark.unit
+def test_score_book_bulk_inserts_and_updates_customers(scoring_session):
+    """One run writes a HealthScoreComponents row per active customer."""
+    for i in range(5):
+        _add_customer(scoring_session, f"cs_{i}")
+    _add_customer(scoring_session, "cs_churned", status="churned")
+    scoring_session.commit()
+
+    result = BulkHealthScoringEngine(scoring_session, batch_size=2).score_book()
+
+    assert result.customers_scored == 5
+    rows = scoring_session.execute(select(HealthScoreComponents)).scalars().all()
+    assert len(rows) == 5
+    customer = scoring_session.execute(
+        select(CustomerAccount).where(CustomerAccount.client_id == "cs_0")
+    ).scalar_one()
+    assert customer.health_score == int(rows[0].overall_score)
+    assert customer.health_trend == "stable"
+
+
+@pytest.mark.unit
+def test_score_book_detects_trend_from_previous_score(scoring_session):
+    """Trend compares the new score with the latest stored score."""
+    _add_customer(scoring_session, "cs_trend")
+    scoring_session.add(HealthScoreComponents(
+        client_id="cs_trend",
+        usage_score=10, engagement_score=10, support_score=10,
+        satisfaction_score=10, payment_score=10, overall_score=10.0
+    ))
+    scoring_session.commit()
+
+    result = BulkHealthScoringEngine(scoring_session).score_book(client_ids=["cs_trend"])
+
+    assert result.trend_counts == {"improving": 1}
+
+
+@pytest.mark.unit
+def test_health_score_refresh_worker_scores_the_book(scoring_session, monkeypatch):
+    """The nightly worker runs the bulk engine off the loop and writes the scores."""
+    import asyncio
+    import src.database as database
+    from autonomous.workers import WORKER_REGISTRY
+
+    for i in range(3):
+        _add_customer(scoring_session, f"cs_{i}")
+    scoring_session.commit()
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(bind=scoring_session.get_bind()))
+
+    worker = WORKER_REGISTRY["health_score_refresh"](
+        name="health_score_refresh", config={"params": {"batch_size": 2}}, tools=None
+    )
+    result = asyncio.run(worker.execute())
+
+    assert result["customers_scored"] == 3
+    assert len(scoring_session.execute(select(HealthScoreComponents)).scalars().all()) == 3
+    assert result["summary"].startswith("Rescored 3 customers")
+    assert result["alerts"] == []
@@ -0,0 +1,278 @@
+"""
+Unit Tests for IntelligentCacheManager
+
+Tests TTL expiry, LRU eviction, task-keyed lookups, invalidation by task
+type and by client, hit/miss statistics and the Redis indexes, that Redis
+is read outside the L1 lock and off the event loop, and that routed
+process results are cached per client.
+"""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.utils import cache_manager as cache_module
+from src.utils.cache_manager import IntelligentCacheManager
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Memory-only cache (no Redis tier) with small limits."""
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    return IntelligentCacheManager(max_entries=3, max_bytes=10_000)
+
+
+@pytest.mark.unit
+def test_set_honors_ttl(cache, monkeypatch):
+    """Entries are dropped once their TTL has elapsed."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+
+    cache.set("summary", {"value": 1}, ttl=10)
+    assert cache.get("summary") == {"value": 1}
+
+    now[0] += 11
+    assert cache.get("summary") is None
+    assert cache.get_cache_stats()["expirations"] == 1
+
+
+@pytest.mark.unit
+def test_lru_eviction_keeps_recently_used(cache):
+    """The least recently used entry is evicted when max_entries is exceeded."""
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    cache.get("a")
+    cache.set("d", 4)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get_cache_stats()["evictions"] == 1
+
+
+@pytest.mark.unit
+def test_oversize_entries_are_rejected(cache):
+    """Entries larger than max_bytes are not cached."""
+    assert cache.set("huge", "x" * 20_000) is False
+    assert cache.get_cache_stats()["rejected_oversize"] == 1
+
+
+@pytest.mark.unit
+def test_should_use_cache_keys_on_task_parameters_and_tags(cache):
+    """Lookups hit only for the same task type, parameters and tags."""
+    cache.store_data("process_1", {"client": "acme", "days": 30}, ["nightly"], {"ok": True}, 0.9)
+
+    use, entry, _ = cache.should_use_cache("process_1", {"days": 30, "client": "acme"}, ["nightly"], "")
+    assert use is True
+    assert entry.data == {"ok": True}
+
+    assert cache.should_use_cache("process_1", {"client": "acme", "days": 60}, ["nightly"], "")[0] is False
+    assert cache.should_use_cache("process_1", {"client": "acme", "days": 30}, ["adhoc"], "")[0] is False
+    assert cache.should_use_cache("process_2", {"client": "acme", "days": 30}, ["nightly"], "")[0] is False
+
+
+@pytest.mark.unit
+def test_should_use_cache_respects_confidence_and_freshness(cache):
+    """Low-confidence entries and fresh-data requests bypass the cache."""
+    cache.store_data("process_1", {}, [], {"ok": True}, 0.3)
+    cache.store_data("process_2", {}, [], {"ok": True}, 0.9)
+
+    assert cache.should_use_cache("process_1", {}, [], "")[0] is False
+    assert cache.should_use_cache("process_2", {}, [], "give me the latest numbers")[0] is False
+    assert cache.should_use_cache("process_2", {}, [], "show numbers")[0] is True
+
+
+@pytest.mark.unit
+def test_invalidate_cache_by_task_type(cache):
+    """Invalidation removes only entries for the given task type."""
+    cache.store_data("process_1", {"a": 1}, [], {"ok": 1}, 0.9)
+    cache.store_data("process_2", {"a": 1}, [], {"ok": 2}, 0.9)
+
+    assert cache.invalidate_cache("process_1") == 1
+    assert cache.should_use_cache("process_1", {"a": 1}, [], "")[0] is False
+    assert cache.should_use_cache("process_2", {"a": 1}, [], "")[0] is True
+
+
+@pytest.mark.unit
+def test_invalidate_cache_by_client(cache):
+    """Client invalidation removes only that client's entries, optionally per task type."""
+    cache.store_data("process_1", {"a": 1}, [], {"ok": 1}, 0.9, client_id="client_a")
+    cache.store_data("process_2", {"a": 1}, [], {"ok": 2}, 0.9, client_id="client_a")
+    cache.store_data("process_1", {"a": 2}, [], {"ok": 3}, 0.9, client_id="client_b")
+
+    assert cache.invalidate_cache("process_1", client_id="client_a") == 1
+    assert cache.should_use_cache("process_2", {"a": 1}, [], "")[0] is True
+
+    assert cache.invalidate_cache(client_id="client_a") == 1
+    assert cache.should_use_cache("process_2", {"a": 1}, [], "")[0] is False
+    assert cache.should_use_cache("process_1", {"a": 2}, [], "")[0] is True
+    assert cache._client_index == {"client_b": {cache.make_key("process_1", {"a": 2}, [])}}
+
+
+@pytest.mark.unit
+def test_cache_stats_count_hits_and_misses(cache):
+    """Stats report real hit/miss counts and hit rate."""
+    cache.set("k", 1)
+    cache.get("k")
+    cache.get("missing")
+
+    stats = cache.get_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["total_accesses"] == 2
+    assert stats["hit_rate"] == 0.5
+    assert stats["entries"] == 1
+
+
+class _FakeRedis:
+    """Just enough of redis-py for the L2 tier (pipeline commands run immediately)."""
+
+    def __init__(self):
+        self.values = {}
+        self.zsets = {}
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        return []
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+
+    def set(self, key, value):
+        self.values[key] = value
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def zremrangebyscore(self, key, low, high):
+        limit = float(high.lstrip("("))
+        zset = self.zsets.get(key, {})
+        for member in [m for m, score in zset.items() if score < limit]:
+            del zset[member]
+
+    def zrange(self, key, start, end):
+        return list(self.zsets.get(key, {}))
+
+    def zrem(self, key, *members):
+        zset = self.zsets.get(key, {})
+        for member in members:
+            zset.pop(member, None)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+            self.zsets.pop(key, None)
+
+
+@pytest.mark.unit
+def test_redis_task_index_prunes_expired_keys(cache, monkeypatch):
+    """The per-task Redis index drops members whose entries have expired."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache.redis_client = _FakeRedis()
+
+    cache.store_data("process_1", {"a": 1}, [], {"ok": 1}, 0.9)
+    now[0] += cache.default_ttl + 1
+    cache.store_data("process_1", {"a": 2}, [], {"ok": 2}, 0.9)
+
+    index = cache.redis_client.zsets[cache._redis_task_index("process_1")]
+    assert list(index) == [cache._redis_key(cache.make_key("process_1", {"a": 2}, []))]
+
+    cache.invalidate_cache("process_1")
+    assert cache.redis_client.zsets == {}
+
+
+@pytest.mark.unit
+def test_redis_client_index_invalidates_only_that_client(cache):
+    cache.redis_client = _FakeRedis()
+    cache.store_data("process_1", {"a": 1}, [], {"ok": 1}, 0.9, client_id="client_a")
+    cache.store_data("process_2", {"a": 1}, [], {"ok": 2}, 0.9, client_id="client_a")
+    cache.store_data("process_1", {"a": 2}, [], {"ok": 3}, 0.9, client_id="client_b")
+    kept = cache._redis_key(cache.make_key("process_2", {"a": 1}, []))
+    other = cache._redis_key(cache.make_key("process_1", {"a": 2}, []))
+
+    cache.invalidate_cache("process_1", client_id="client_a")
+    assert set(cache.redis_client.values) == {kept, other}
+    assert list(cache.redis_client.zsets[cache._redis_task_index("process_1")]) == [other]
+
+    cache.invalidate_cache(client_id="client_a")
+    assert set(cache.redis_client.values) == {other}
+    assert list(cache.redis_client.zsets[cache._redis_client_index("client_b")]) == [other]
+
+
+@pytest.mark.unit
+async def test_redis_reads_run_outside_the_lock_and_off_the_loop(cache):
+    """An L1 miss reads Redis without the lock held and not on the event loop thread."""
+    loop_thread = threading.get_ident()
+    reads = []
+
+    class _ObservedRedis(_FakeRedis):
+        def get(self, key):
+            def try_lock():
+                acquired = cache._lock.acquire(timeout=0)
+                if acquired:
+                    cache._lock.release()
+                reads.append(acquired)
+
+            probe = threading.Thread(target=try_lock)
+            probe.start()
+            probe.join()
+            reads.append(threading.get_ident() != loop_thread)
+            return super().get(key)
+
+    cache.redis_client = _ObservedRedis()
+    assert await cache.store_data_async("process_1", {"a": 1}, [], {"ok": 1}, 0.9)
+    cache._cache.clear()
+
+    use, entry, reason = await cache.should_use_cache_async("process_1", {"a": 1}, [], "")
+
+    assert use is True and entry.tier == "redis"
+    assert reads == [True, True]
+    assert cache.get_cache_stats()["redis_hits"] == 1
+
+
+@pytest.mark.unit
+def test_routed_process_results_are_not_shared_across_clients(cache, monkeypatch):
+    """Two clients running the same process with the same parameters get their own results."""
+    import src.integrations as integrations
+
+    for name in ("SalesforceIntegration", "GmailIntegration", "ApolloIntegration"):
+        monkeypatch.setattr(integrations, name, object, raising=False)
+    from src.agents.enhanced_agent_system import EnhancedSalesAgent
+
+    agent = EnhancedSalesAgent.__new__(EnhancedSalesAgent)
+    agent.cache_manager = cache
+    agent.context_manager = MagicMock()
+    agent.context_manager.get_contextual_suggestions.return_value = []
+    agent._track_performance = MagicMock()
+    executions = []
+
+    async def execute(client_id, process_num, parameters):
+        executions.append(client_id)
+        return {'client_id': client_id, 'adaptive_feedback': {'confidence_score': 0.9}}
+
+    agent._simulate_process_execution = execute
+    routing = {'intent': {'processes': [38], 'parameters': {'quantity': 5}, 'original_request': 'find prospects'}}
+
+    first = asyncio.run(agent._execute_routing_result("client_a", "s1", routing))
+    second = asyncio.run(agent._execute_routing_result("client_b", "s2", routing))
+    repeat = asyncio.run(agent._execute_routing_result("client_a", "s3", routing))
+
+    assert executions == ["client_a", "client_b"]
+    assert first['results'][0]['result']['client_id'] == "client_a"
+    assert second['results'][0]['result']['client_id'] == "client_b"
+    assert repeat['results'][0]['result']['adaptive_feedback']['cache_used'] is True
+    assert repeat['results'][0]['result']['client_id'] == "client_a"
+
+    # Invalidating one client leaves the other's results cached
+    assert agent.invalidate_cache("client_a") == 1
+    assert cache.get_cache_stats()["entries"] == 1
+    asyncio.run(agent._execute_routing_result("client_b", "s4", routing))
+    assert executions == ["client_a", "client_b"]
@@ -0,0 +1,120 @@
+"""
+Unit Tests for SecureCredentialManager key caching
+
+Tests the derived-key cache, its invalidation on rotation and delete, and
+the single-pass client unlock API.
+"""
+
+import pytest
+
+from src.security import credential_manager as credential_module
+from src.security.credential_manager import DerivedKeyCache, SecureCredentialManager
+
+
+@pytest.fixture
+def derivations(monkeypatch):
+    """Count PBKDF2 derivations performed by the credential manager."""
+    calls = []
+    real_kdf = credential_module.PBKDF2HMAC
+
+    def counting_kdf(*args, **kwargs):
+        calls.append(kwargs.get("iterations"))
+        return real_kdf(*args, **kwargs)
+
+    monkeypatch.setattr(credential_module, "PBKDF2HMAC", counting_kdf)
+    return calls
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Credential manager storing into a temporary directory."""
+    return SecureCredentialManager(tmp_path, master_password="test_password_12345")
+
+
+# ============================================================================
+# DerivedKeyCache Tests
+# ============================================================================
+
+@pytest.mark.unit
+def test_key_cache_expires_and_zeroizes(monkeypatch):
+    """Expired keys are dropped and their buffers overwritten."""
+    now = [100.0]
+    monkeypatch.setattr(credential_module.time, "monotonic", lambda: now[0])
+    cache = DerivedKeyCache(max_entries=4, ttl_seconds=10)
+
+    cache.put(b"salt", 600000, b"k" * 32)
+    buffer = cache._entries[(b"salt", 600000)][0]
+    assert cache.get(b"salt", 600000) == b"k" * 32
+    assert cache.get(b"salt", 390000) is None
+
+    now[0] += 11
+    assert cache.get(b"salt", 600000) is None
+    assert buffer == bytearray(32)
+
+
+@pytest.mark.unit
+def test_key_cache_evicts_least_recently_used():
+    """The cache stays within max_entries and wipes evicted keys."""
+    cache = DerivedKeyCache(max_entries=2, ttl_seconds=60)
+    cache.put(b"a", 1, b"a" * 32)
+    cache.put(b"b", 1, b"b" * 32)
+    evicted = cache._entries[(b"a", 1)][0]
+    cache.put(b"c", 1, b"c" * 32)
+
+    assert cache.get(b"a", 1) is None
+    assert evicted == bytearray(32)
+    assert cache.get_stats()["evictions"] == 1
+
+
+# ============================================================================
+# Credential Manager Tests
+# ============================================================================
+
+@pytest.mark.unit
+def test_repeated_reads_reuse_derived_key(manager, derivations):
+    """Only the store derives a key; later reads hit the cache."""
+    manager.store_credential("acme", "salesforce", "api_key", "secret")
+    for _ in range(3):
+        assert manager.get_credential("acme", "salesforce", "api_key") == "secret"
+
+    assert len(derivations) == 1
+    assert manager.key_cache.get_stats()["hits"] == 3
+
+
+@pytest.mark.unit
+def test_rotation_and_delete_invalidate_cached_keys(manager):
+    """Overwriting or deleting a credential removes its cached key."""
+    manager.store_credential("acme", "salesforce", "api_key", "old")
+    manager.store_credential("acme", "salesforce", "api_key", "new")
+    assert manager.key_cache.get_stats()["entries"] == 1
+    assert manager.get_credential("acme", "salesforce", "api_key") == "new"
+
+    manager.delete_credentials("acme", "salesforce")
+    assert manager.key_cache.get_stats()["entries"] == 0
+
+
+@pytest.mark.unit
+def test_unlock_client_decrypts_all_tools_in_one_pass(manager, derivations, monkeypatch):
+    """All tools are decrypted with one file read and one write."""
+    manager.store_credential("acme", "salesforce", "api_key", "sf")
+    manager.store_credential("acme", "salesforce", "secret", "sf2")
+    manager.store_credential("acme", "gmail", "token", "gm")
+    manager.clear_key_cache()
+    derivations.clear()
+
+    saves = []
+    real_save = manager._save_credentials_file
+    monkeypatch.setattr(manager, "_save_credentials_file", lambda f, c: saves.append(f) or real_save(f, c))
+
+    unlocked = manager.unlock_client("acme")
+
+    assert unlocked == {"salesforce": {"api_key": "sf", "secret": "sf2"}, "gmail": {"token": "gm"}}
+    assert len(saves) == 1
+    assert len(derivations) == 3
+    assert manager.list_configured_tools("acme")["gmail"]["last_accessed"] is not None
+
+    assert manager.get_all_credentials("acme", "gmail") == {"token": "gm"}
+    assert len(derivations) == 3
+
+    assert manager.lock_client("acme") == 3
+    assert manager.key_cache.get_stats()["entries"] == 0
@@ -0,0 +1,97 @@
+"""
+Unit Tests for cached data source discovery
+
+Tests that availability results are computed once and shared read-only,
+that they survive copy, deepcopy and pickle, and that the cache is rebuilt
+on invalidate() after an environment change and when the Claude Desktop
+config changes on disk.
+"""
+
+import copy
+import importlib
+import json
+import pickle
+
+import pytest
+
+
+@pytest.fixture
+def adaptive_agent(monkeypatch):
+    """src.agents.adaptive_agent, importable without the optional CRM integrations."""
+    import src.integrations as integrations
+
+    for name in ("SalesforceIntegration", "GmailIntegration", "ApolloIntegration"):
+        monkeypatch.setattr(integrations, name, object, raising=False)
+    return importlib.import_module("src.agents.adaptive_agent")
+
+
+@pytest.fixture
+def desktop_config(tmp_path):
+    path = tmp_path / "claude_desktop_config.json"
+    path.write_text(json.dumps({"mcpServers": {}}))
+    return path
+
+
+@pytest.fixture
+def discovery(adaptive_agent, desktop_config, tmp_path, monkeypatch):
+    for key in adaptive_agent.DataSourceRegistry.DATA_SOURCE_MAP["crm"]["api_keys"]:
+        monkeypatch.delenv(key, raising=False)
+    return adaptive_agent.DataSourceDiscovery(tmp_path, desktop_config_path=desktop_config)
+
+
+@pytest.mark.unit
+def test_results_are_shared_and_read_only(discovery):
+    crm = discovery.discover_available_sources("crm")
+
+    assert discovery.discover_available_sources("crm") is crm
+    assert isinstance(crm["web_search_terms"], list)
+    assert json.loads(json.dumps(crm))["web_search_terms"] == list(crm["web_search_terms"])
+    with pytest.raises(TypeError):
+        crm["priority_source"] = "mcp_servers"
+    with pytest.raises(TypeError):
+        crm["api_keys"].update(HUBSPOT_API_KEY=True)
+    with pytest.raises(TypeError):
+        crm["web_search_terms"].append("more")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy, lambda value: pickle.loads(pickle.dumps(value))])
+def test_results_can_be_copied_and_pickled(discovery, adaptive_agent, clone):
+    crm = discovery.discover_available_sources("crm")
+
+    cloned = clone(crm)
+
+    assert cloned == crm
+    assert type(cloned) is adaptive_agent._ReadOnlyDict
+    assert type(cloned["web_search_terms"]) is adaptive_agent._ReadOnlyList
+    with pytest.raises(TypeError):
+        cloned["priority_source"] = None
+
+
+@pytest.mark.unit
+def test_invalidate_picks_up_environment_changes(discovery, monkeypatch):
+    crm = discovery.discover_available_sources("crm")
+    assert crm["api_keys"]["HUBSPOT_API_KEY"] is False
+
+    monkeypatch.setenv("HUBSPOT_API_KEY", "key")
+    assert discovery.discover_available_sources("crm") is crm
+
+    discovery.invalidate()
+    assert discovery.discover_available_sources("crm")["api_keys"]["HUBSPOT_API_KEY"] is True
+
+
+@pytest.mark.unit
+def test_desktop_config_change_rebuilds_cache(discovery, adaptive_agent, desktop_config, monkeypatch):
+    crm = discovery.discover_available_sources("crm")
+    assert crm["mcp_servers"]["salesforce"] is False
+
+    desktop_config.write_text(json.dumps({"mcpServers": {"salesforce": {"command": "sf-mcp"}}}))
+
+    # Within the check interval the cached table is still served
+    assert discovery.discover_available_sources("crm") is crm
+
+    monkeypatch.setattr(adaptive_agent, "DATA_SOURCE_CONFIG_CHECK_INTERVAL", 0)
+    refreshed = discovery.discover_available_sources("crm")
+    assert refreshed is not crm
+    assert refreshed["mcp_servers"]["salesforce"] is True
+    assert discovery.discover_available_sources("crm") is refreshed
@@ -0,0 +1,59 @@
+"""
+Unit Tests for SafeFileOperations
+
+Tests that writes replace the target atomically (temp file, fsync,
+rename) and leave the previous contents intact when a write fails.
+"""
+
+import json
+
+import pytest
+
+from src.utils import file_operations
+from src.utils.file_operations import SafeFileOperations
+
+
+def _temp_files(directory):
+    return [p.name for p in directory.iterdir() if p.name.endswith(".tmp")]
+
+
+@pytest.mark.unit
+def test_write_file_replaces_contents_and_syncs(tmp_path, monkeypatch):
+    synced = []
+    real_fsync = file_operations.os.fsync
+    monkeypatch.setattr(file_operations.os, "fsync", lambda fd: synced.append(fd) or real_fsync(fd))
+    target = tmp_path / "nested" / "memory.json"
+
+    assert SafeFileOperations.write_file(target, "first")
+    assert SafeFileOperations.write_file(target, "second")
+
+    assert target.read_text() == "second"
+    assert len(synced) == 2
+    assert _temp_files(target.parent) == []
+
+
+@pytest.mark.unit
+def test_failed_rename_keeps_previous_contents(tmp_path, monkeypatch):
+    """A write that fails before the rename never truncates the existing file."""
+    target = tmp_path / "memory.json"
+    target.write_text("original")
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(file_operations.os, "replace", fail_replace)
+
+    assert SafeFileOperations.write_file(target, "partial") is False
+    assert target.read_text() == "original"
+    assert _temp_files(tmp_path) == []
+
+
+@pytest.mark.unit
+def test_write_json_round_trip_and_unserializable_data(tmp_path):
+    target = tmp_path / "config.json"
+
+    assert SafeFileOperations.write_json(target, {"threshold": 0.7})
+    assert SafeFileOperations.read_json(target) == {"threshold": 0.7}
+
+    assert SafeFileOperations.write_json(target, {"bad": object()}) is False
+    assert json.loads(target.read_text()) == {"threshold": 0.7}
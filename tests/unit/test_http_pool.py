@@ -0,0 +1,113 @@
+"""
+Unit Tests for the shared HTTP connection pools
+
+Tests that integration instances share one pooled session per integration,
+reuse keep-alive connections to the same host, that closing an instance
+leaves the shared pool open, and that server shutdown closes the pools.
+"""
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from src.integrations.base import BaseIntegration, ConnectionTestResult, IntegrationStatus
+from src.integrations.http_pool import HTTPClientRegistry
+from src.integrations import http_pool
+
+
+class EchoIntegration(BaseIntegration):
+    async def authenticate(self):
+        return True
+
+    async def test_connection(self):
+        return ConnectionTestResult(True, IntegrationStatus.CONNECTED, "ok")
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = HTTPClientRegistry(limit_per_host=4)
+    monkeypatch.setattr(http_pool, "_http_registry", registry)
+    return registry
+
+
+@pytest.fixture
+async def server():
+    """Local HTTP server that reports which client port each request came from."""
+    async def handler(request):
+        return web.json_response({"peer_port": request.transport.get_extra_info("peername")[1]})
+
+    app = web.Application()
+    app.router.add_get("/ping", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    yield f"http://127.0.0.1:{port}/ping"
+    await runner.cleanup()
+
+
+@pytest.mark.unit
+async def test_tenants_share_one_session_per_integration(registry):
+    """Instances of the same integration get the same pooled session."""
+    tenant_a = EchoIntegration("hubspot", {"api_key": "a"})
+    tenant_b = EchoIntegration("hubspot", {"api_key": "b"})
+    other = EchoIntegration("zendesk", {"api_key": "c"})
+
+    assert tenant_a.session is tenant_b.session
+    assert other.session is not tenant_a.session
+    assert tenant_a.session.connector.limit_per_host == 4
+    assert registry.sessions_created == 2
+
+    await registry.close()
+
+
+@pytest.mark.unit
+async def test_connections_are_reused_across_instances(registry, server):
+    """Sequential requests from different tenants travel over one kept-alive connection."""
+    ports = set()
+    for tenant in range(5):
+        integration = EchoIntegration("hubspot", {"api_key": str(tenant)})
+        async with integration.session.get(server) as response:
+            ports.add((await response.json())["peer_port"])
+        await integration.close()
+
+    assert len(ports) == 1
+    assert not registry.get_session("hubspot").closed
+
+    await registry.close()
+
+
+@pytest.mark.unit
+async def test_dedicated_session_is_closed_with_instance(registry):
+    """An explicitly assigned session is used instead of the pool and closed with the instance."""
+    integration = EchoIntegration("hubspot", {})
+    own = aiohttp.ClientSession()
+    integration.session = own
+
+    assert integration.session is own
+    await integration.close()
+    assert own.closed
+    assert integration.session is registry.get_session("hubspot")
+
+    await registry.close()
+    assert registry.get_stats()["pools"] == {}
+
+
+@pytest.mark.unit
+async def test_server_shutdown_closes_pooled_sessions(registry, monkeypatch):
+    """Leaving the server lifespan closes the sessions pooled on its loop."""
+    import importlib
+    import src.integrations as integrations
+
+    for name in ("SalesforceIntegration", "GmailIntegration", "ApolloIntegration"):
+        monkeypatch.setattr(integrations, name, object, raising=False)
+    initialization = importlib.import_module("src.initialization")
+    monkeypatch.setenv("ENABLE_AUDIT_LOGGING", "false")
+
+    async with initialization.server_lifespan(None):
+        session = registry.get_session("hubspot")
+        assert not session.closed
+
+    assert session.closed
+    assert registry.get_stats()["pools"] == {}
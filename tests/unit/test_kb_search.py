@@ -0,0 +1,203 @@
+"""
+Unit Tests for the Knowledge Base Search Index
+
+Tests BM25 ranking with field weights, category and status filters,
+incremental updates, suggestions, snapshot round-trips, timed saves and
+the database backfill used when there is no snapshot.
+"""
+
+import time
+
+import pytest
+from enum import Enum
+from types import SimpleNamespace
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateTable
+
+from src.database.models import KnowledgeBaseArticle
+from src.services import kb_search
+from src.services.kb_search import KnowledgeBaseIndex, backfill_from_database
+
+
+class ArticleStatus(str, Enum):
+    PUBLISHED = "published"
+    ARCHIVED = "archived"
+
+
+ARTICLES = [
+    {
+        'article_id': 'KB-1001',
+        'title': 'How to Export Reports in CSV Format',
+        'summary': 'Step-by-step guide to exporting dashboard reports',
+        'content': 'Navigate to Reports, choose a dashboard and click Export.',
+        'category': 'Reports & Analytics',
+        'subcategory': 'Data Export',
+        'tags': ['export', 'reports', 'csv'],
+        'status': 'published',
+        'helpfulness_score': 0.94,
+        'view_count': 1247,
+    },
+    {
+        'article_id': 'KB-1002',
+        'title': 'Scheduling recurring reports',
+        'summary': 'Email reports to your team on a schedule',
+        'content': 'Reports can be scheduled daily or weekly. Scheduled reports support CSV attachments.',
+        'category': 'Reports & Analytics',
+        'subcategory': 'Automation',
+        'tags': ['reports', 'schedule', 'email'],
+        'status': 'published',
+        'helpfulness_score': 0.81,
+        'view_count': 530,
+    },
+    {
+        'article_id': 'KB-1003',
+        'title': 'Resetting your password',
+        'summary': 'Recover access to your account',
+        'content': 'Use the forgot password link on the login page.',
+        'category': 'Account',
+        'subcategory': 'Login',
+        'tags': ['password', 'login', 'security'],
+        'status': 'published',
+        'helpfulness_score': 0.9,
+        'view_count': 2100,
+    },
+    {
+        'article_id': 'KB-1004',
+        'title': 'Exporting users (beta)',
+        'summary': 'Export the user list',
+        'content': 'Draft instructions for exporting users to CSV.',
+        'category': 'Account',
+        'subcategory': 'Users',
+        'tags': ['export', 'users'],
+        'status': 'draft',
+        'helpfulness_score': 0.0,
+        'view_count': 0,
+    },
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = KnowledgeBaseIndex(tmp_path / "kb_index.json.gz")
+    index.rebuild(ARTICLES)
+    return index
+
+
+def _ids(results):
+    return [r['article_id'] for r in results]
+
+
+@pytest.mark.unit
+def test_bm25_ranks_title_and_tag_matches_first(index):
+    results = index.search("export csv reports")
+
+    assert _ids(results) == ['KB-1001', 'KB-1002']
+    assert results[0]['relevance_score'] > results[1]['relevance_score']
+    assert set(results[0]['matched_terms']) == {'export', 'csv', 'reports'}
+
+
+@pytest.mark.unit
+def test_category_and_status_filters(index):
+    assert _ids(index.search("export", category="account")) == []
+    assert _ids(index.search("export", category="Account", include_drafts=True)) == ['KB-1004']
+    assert _ids(index.search("password", category="Reports & Analytics")) == []
+    assert 'KB-1004' in _ids(index.search("export", status=None))
+
+
+@pytest.mark.unit
+def test_incremental_update_and_removal(index):
+    """Re-indexing replaces old terms; metadata-only changes move filter lists."""
+    article = SimpleNamespace(**{
+        **ARTICLES[2],
+        'status': ArticleStatus.PUBLISHED,
+        'content': 'Use single sign-on or the forgot password link.',
+    })
+    index.upsert(article)
+    assert _ids(index.search("sign")) == ['KB-1003']
+    assert index.search("page") == []
+
+    article.status = ArticleStatus.ARCHIVED
+    index.upsert(article)
+    assert index.search("password") == []
+    assert _ids(index.search("password", status="archived")) == ['KB-1003']
+
+    assert index.remove('KB-1002')
+    assert _ids(index.search("schedule", status=None)) == []
+    assert 'schedule' not in index.complete('sch')
+
+
+@pytest.mark.unit
+def test_suggestions_correct_typos_and_complete_prefixes(index):
+    assert index.correct("pasword") == "password"
+    assert index.correct("exprot") == "export"
+    assert index.correct("zzzzzz") is None
+
+    suggestions = index.suggest("exprot rep")
+    assert suggestions[0] == "export rep"
+    assert "export reports" in suggestions
+
+
+@pytest.mark.unit
+def test_snapshot_round_trip(index, tmp_path):
+    path = index.save()
+    loaded = KnowledgeBaseIndex.load(path)
+
+    assert len(loaded) == len(index)
+    assert loaded.get_stats()['postings'] == index.get_stats()['postings']
+    assert loaded.search("export csv reports") == index.search("export csv reports")
+    assert loaded.search("export", include_drafts=True) == index.search("export", include_drafts=True)
+
+    # Loaded indexes keep updating incrementally
+    loaded.remove('KB-1001')
+    assert _ids(loaded.search("csv")) == ['KB-1002']
+
+    (tmp_path / "broken.json.gz").write_bytes(b"not gzip")
+    assert len(KnowledgeBaseIndex.load(tmp_path / "broken.json.gz")) == 0
+
+
+@pytest.mark.unit
+def test_changes_are_saved_after_the_interval_without_further_writes(tmp_path, monkeypatch):
+    """A burst of edits followed by idle time is snapshotted by the timer, not only at exit."""
+    monkeypatch.setattr(kb_search, "KB_INDEX_SNAPSHOT_INTERVAL", 0.05)
+    path = tmp_path / "kb_index.json.gz"
+    index = KnowledgeBaseIndex(path)
+
+    index.upsert(ARTICLES[0])
+    index.upsert(ARTICLES[1])
+    assert not path.exists()
+
+    deadline = time.monotonic() + 5
+    while (index.get_stats()['unsaved_changes'] or not path.exists()) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert _ids(KnowledgeBaseIndex.load(path).search("csv")) == ['KB-1001', 'KB-1002']
+
+
+@pytest.mark.unit
+def test_missing_snapshot_is_backfilled_from_database(tmp_path):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    with engine.begin() as conn:
+        conn.execute(CreateTable(KnowledgeBaseArticle.__table__))
+    session_factory = sessionmaker(bind=engine)
+    with session_factory() as db:
+        for article in ARTICLES:
+            db.add(KnowledgeBaseArticle(
+                author="Support", **{k: v for k, v in article.items() if k != 'helpfulness_score'}
+            ))
+        db.commit()
+
+    path = tmp_path / "kb_index.json.gz"
+    index = KnowledgeBaseIndex.load(path)
+    assert not index.restored
+
+    assert backfill_from_database(index, session_factory) == len(ARTICLES)
+    assert _ids(index.search("password")) == ['KB-1003']
+
+    # The rebuilt index was snapshotted, so the next start loads it from disk
+    reloaded = KnowledgeBaseIndex.load(path)
+    assert reloaded.restored
+    assert len(reloaded) == len(ARTICLES)
+
+    assert backfill_from_database(KnowledgeBaseIndex(), lambda: 1 / 0) == 0
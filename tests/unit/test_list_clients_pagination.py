@@ -0,0 +1,169 @@
+"""
+Unit Tests for list_clients pagination
+
+Tests keyset (cursor) pagination, count modes and the GROUP BY summary of
+list_clients against an in-memory SQLite database.
+"""
+
+import importlib.util
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateTable
+
+from src.database.models import CustomerAccount
+
+MODULE_PATH = Path(__file__).resolve().parents[2] / "src" / "tools" / "core" / "list_clients.py"
+
+
+def _load_list_clients_module():
+    spec = importlib.util.spec_from_file_location("list_clients_under_test", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+async def list_clients_module(monkeypatch):
+    """list_clients bound to an in-memory SQLite database with 25 customers."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    async with engine.begin() as conn:
+        await conn.execute(CreateTable(CustomerAccount.__table__))
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as db:
+        base = datetime(2026, 1, 1)
+        for i in range(25):
+            db.add(CustomerAccount(
+                client_id=f"cs_{i:03d}",
+                client_name=f"Client {i}",
+                company_name="Acme",
+                tier="professional" if i % 2 else "standard",
+                lifecycle_stage="at_risk" if i % 5 == 0 else "active",
+                health_score=(i * 7) % 100,
+                contract_value=1000.0,
+                contract_start_date=date(2026, 1, 1),
+                created_at=base + timedelta(hours=i // 2)
+            ))
+        await db.commit()
+
+    module = _load_list_clients_module()
+    monkeypatch.setattr(module, "open_async_session", lambda: session_factory())
+    yield module
+    await engine.dispose()
+
+
+@pytest.fixture
+def ctx():
+    return AsyncMock()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("sort_by", ["health_score", "created_at"])
+async def test_cursor_walks_every_client_exactly_once(list_clients_module, ctx, sort_by):
+    """Following next_cursor returns all rows in sort order without duplicates."""
+    seen = []
+    cursor = None
+    while True:
+        result = await list_clients_module.list_clients(
+            ctx, limit=7, cursor=cursor, sort_by=sort_by, count_mode="none", include_summary=False
+        )
+        assert result["status"] == "success"
+        seen.extend(result["clients"])
+        cursor = result["pagination"]["next_cursor"]
+        if not result["pagination"]["has_more"]:
+            assert cursor is None
+            break
+
+    assert len({c["client_id"] for c in seen}) == 25
+    if sort_by == "health_score":
+        keys = [(c["health_score"], c["client_id"]) for c in seen]
+        assert keys == sorted(keys)
+
+
+@pytest.mark.unit
+async def test_summary_covers_whole_filtered_set(list_clients_module, ctx):
+    """The summary is computed over all matching rows, not just the page."""
+    result = await list_clients_module.list_clients(ctx, tier_filter="standard", limit=2)
+
+    summary = result["summary"]
+    assert result["pagination"]["total_count"] == 13
+    assert summary["total_clients"] == 13
+    assert summary["total_arr"] == 13000.0
+    assert summary["lifecycle_breakdown"]["at_risk"] == 3
+    assert summary["lifecycle_breakdown"]["active"] == 10
+
+
+@pytest.mark.unit
+def test_summary_buckets_missing_and_unknown_stages(list_clients_module):
+    rows = [("active", 4, 300, 4, 400.0), (None, 2, 0, 0, None), ("legacy", 1, 50, 1, 100.0)]
+
+    breakdown = list_clients_module._build_summary(rows)["lifecycle_breakdown"]
+
+    assert breakdown["active"] == 4
+    assert breakdown["unknown"] == 3
+    assert None not in breakdown and "legacy" not in breakdown
+
+
+@pytest.mark.unit
+async def test_count_modes_and_cursor_validation(list_clients_module, ctx):
+    """Approximate falls back to exact off PostgreSQL; bad cursors are rejected."""
+    approx = await list_clients_module.list_clients(ctx, count_mode="approximate", include_summary=False)
+    assert approx["pagination"]["total_count"] == 25
+    assert approx["pagination"]["count_is_approximate"] is False
+    assert "summary" not in approx
+
+    first = await list_clients_module.list_clients(ctx, limit=5, sort_by="created_at")
+    mismatched = await list_clients_module.list_clients(
+        ctx, cursor=first["pagination"]["next_cursor"], sort_by="health_score"
+    )
+    assert mismatched["status"] == "failed"
+
+    garbage = await list_clients_module.list_clients(ctx, cursor="not-a-cursor")
+    assert garbage["status"] == "failed"
+
+
+@pytest.mark.unit
+async def test_summary_and_total_default_to_first_page(list_clients_module, ctx):
+    """Cursor pages skip the whole-set aggregate unless the caller asks for it."""
+    first = await list_clients_module.list_clients(ctx, limit=5)
+    assert first["pagination"]["total_count"] == 25
+    assert first["summary"]["total_clients"] == 25
+
+    cursor = first["pagination"]["next_cursor"]
+    page = await list_clients_module.list_clients(ctx, limit=5, cursor=cursor)
+    assert page["status"] == "success"
+    assert page["pagination"]["total_count"] is None
+    assert "summary" not in page
+
+    opted_in = await list_clients_module.list_clients(
+        ctx, limit=5, cursor=cursor, count_mode="exact", include_summary=True
+    )
+    assert opted_in["pagination"]["total_count"] == 25
+    assert opted_in["summary"]["total_clients"] == 25
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("sort_by,value", [
+    ("health_score", "50; DROP TABLE"),
+    ("health_score", {"x": 1}),
+    ("health_score", True),
+    ("created_at", 12345),
+    ("created_at", "yesterday"),
+])
+async def test_tampered_cursor_values_are_rejected(list_clients_module, ctx, sort_by, value):
+    """A cursor whose sort value has the wrong type is an invalid cursor, not a database error."""
+    cursor = list_clients_module._encode_cursor(sort_by, value, "cs_001")
+
+    result = await list_clients_module.list_clients(ctx, cursor=cursor, sort_by=sort_by)
+
+    assert result["status"] == "failed"
+    assert result["error"].startswith("Invalid cursor")
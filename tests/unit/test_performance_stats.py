@@ -0,0 +1,111 @@
+"""
+Unit Tests for PerformanceMonitor latency statistics
+
+Tests the streaming quantile sketch, sliding windows and per-tool stats
+reported by the performance monitor.
+"""
+
+import random
+import pytest
+
+from src.monitoring.performance import (
+    LatencySketch,
+    WindowedSketch,
+    PerformanceMetric,
+    PerformanceMonitor,
+    SKETCH_RELATIVE_ACCURACY
+)
+
+
+def _metric(tool_name, duration_ms, end_time, success=True):
+    return PerformanceMetric(
+        tool_name=tool_name,
+        start_time=end_time - duration_ms / 1000,
+        end_time=end_time,
+        duration_ms=duration_ms,
+        success=success
+    )
+
+
+# ============================================================================
+# Sketch Tests
+# ============================================================================
+
+@pytest.mark.unit
+def test_sketch_quantiles_within_relative_accuracy():
+    """Quantiles match exact order statistics within the configured accuracy."""
+    rng = random.Random(7)
+    values = [rng.lognormvariate(4, 1.2) for _ in range(5000)]
+    sketch = LatencySketch()
+    for value in values:
+        sketch.add(value)
+
+    ordered = sorted(values)
+    for q in (0.5, 0.95, 0.99):
+        exact = ordered[int(q * len(ordered))]
+        assert abs(sketch.quantile(q) - exact) <= exact * SKETCH_RELATIVE_ACCURACY * 1.01
+
+
+@pytest.mark.unit
+def test_sketch_merge_equals_combined_stream():
+    """Merging two sketches gives the same buckets as one sketch over both streams."""
+    left, right, combined = LatencySketch(), LatencySketch(), LatencySketch()
+    for i in range(1, 200):
+        (left if i % 2 else right).add(float(i))
+        combined.add(float(i))
+
+    left.merge(right)
+    assert left.buckets == combined.buckets
+    assert left.count == combined.count
+    assert left.quantile(0.95) == combined.quantile(0.95)
+
+
+@pytest.mark.unit
+def test_window_drops_expired_slots():
+    """Values older than the window no longer count."""
+    window = WindowedSketch(window_seconds=60, slots=6)
+    window.add(1000.0, success=False, now=0.0)
+    window.add(10.0, now=30.0)
+
+    sketch, errors = window.snapshot(now=59.0)
+    assert sketch.count == 2 and errors == 1
+
+    sketch, errors = window.snapshot(now=65.0)
+    assert sketch.count == 1 and errors == 0
+    assert sketch.max == 10.0
+
+
+# ============================================================================
+# Monitor Tests
+# ============================================================================
+
+@pytest.mark.unit
+def test_tool_stats_report_lifetime_and_window_percentiles():
+    """Lifetime percentiles cover all calls; windows only recent ones."""
+    monitor = PerformanceMonitor()
+    for _ in range(10):
+        monitor.record_metric(_metric("get_client_overview", 500.0, end_time=1_000.0))
+    for _ in range(10):
+        monitor.record_metric(_metric("get_client_overview", 20.0, end_time=4_000.0))
+
+    stats = monitor.tool_stats["get_client_overview"]
+    assert stats.total_calls == 20
+    assert stats.p99_duration_ms == pytest.approx(500.0, rel=SKETCH_RELATIVE_ACCURACY)
+
+    windows = stats.window_stats(now=4_010.0)
+    assert windows["1m"]["calls"] == 10
+    assert windows["1m"]["p99_ms"] == pytest.approx(20.0, rel=SKETCH_RELATIVE_ACCURACY)
+    assert windows["1h"]["calls"] == 20
+
+
+@pytest.mark.unit
+def test_summary_merges_tool_sketches():
+    """The overall summary combines all tools' latency sketches."""
+    monitor = PerformanceMonitor()
+    monitor.record_metric(_metric("a", 10.0, end_time=1.0))
+    monitor.record_metric(_metric("b", 30.0, end_time=1.0))
+
+    latency = monitor.get_summary()["latency"]
+    assert latency["avg_ms"] == 20.0
+    assert latency["p99_ms"] == pytest.approx(30.0, rel=SKETCH_RELATIVE_ACCURACY)
+    assert set(latency["windows"]) == {"1m", "5m", "1h"}
@@ -0,0 +1,206 @@
+"""
+Unit Tests for PreferenceManager
+
+Tests business-function indexed retrieval, lazy confidence decay and
+batched persistence of learning events, including events recorded during
+a write, failed writes and changes still pending at exit.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import src.learning.preference_manager as preference_manager
+from src.learning.preference_manager import PreferenceManager
+
+
+async def _record(manager, function="lead_enrichment", event_type="data_source_selection",
+                  choice="apollo", outcome="success"):
+    return await manager.record_learning_event(
+        event_type=event_type,
+        business_function=function,
+        context={},
+        user_choice=choice,
+        outcome=outcome
+    )
+
+
+@pytest.mark.unit
+async def test_get_preferences_reads_only_indexed_function(monkeypatch):
+    """Retrieval touches the preferences of the requested function only."""
+    manager = PreferenceManager("cs_1")
+    for i in range(50):
+        await _record(manager, function=f"function_{i}")
+    await _record(manager, function="lead_enrichment", event_type="email_tone")
+
+    touched = []
+    original = manager._decayed_confidence
+
+    def tracking(pref, now=None):
+        touched.append(pref.preference_key)
+        return original(pref, now)
+
+    monkeypatch.setattr(manager, "_decayed_confidence", tracking)
+    prefs = await manager.get_preferences("lead_enrichment")
+
+    assert set(prefs) == {"email_tone"}
+    assert touched == ["lead_enrichment:email_tone"]
+    assert manager.get_statistics()["preferences_by_function"]["function_3"] == 1
+
+
+@pytest.mark.unit
+async def test_decay_is_applied_at_read_time_without_compounding():
+    """Old preferences report decayed confidence; repeated reads do not decay further."""
+    manager = PreferenceManager("cs_1", confidence_decay_days=30)
+    await _record(manager)
+    pref = manager.preferences["lead_enrichment:data_source_selection"]
+    pref.confidence = 0.8
+    pref.last_used = datetime.utcnow() - timedelta(days=73)
+
+    first = await manager.get_preferences("lead_enrichment")
+    second = await manager.get_preferences("lead_enrichment")
+
+    assert first["data_source_selection"]["confidence"] == pytest.approx(0.8 * 0.8)
+    assert second == first
+    assert pref.confidence == 0.8
+
+    # Reuse folds the decay into the stored confidence before reinforcing it
+    await _record(manager)
+    assert pref.confidence == pytest.approx(0.8 * 0.8 + 0.05)
+
+
+@pytest.mark.unit
+async def test_events_are_persisted_in_batches(tmp_path):
+    """Events are buffered until flush and then appended in one write."""
+    manager = PreferenceManager("cs_1", storage_path=tmp_path, flush_interval=60)
+    for _ in range(5):
+        await _record(manager)
+
+    events_file = tmp_path / "cs_1_events.jsonl"
+    assert not events_file.exists()
+
+    assert await manager.shutdown() == 5
+    assert len(events_file.read_text().splitlines()) == 5
+
+    await _record(manager, choice="zoominfo")
+    await manager.shutdown()
+    assert len(events_file.read_text().splitlines()) == 6
+
+    reloaded = PreferenceManager("cs_1", storage_path=tmp_path)
+    assert len(reloaded.learning_events) == 6
+    prefs = await reloaded.get_preferences("lead_enrichment")
+    assert prefs["data_source_selection"]["value"] == "zoominfo"
+
+
+@pytest.mark.unit
+async def test_event_log_is_compacted(tmp_path, monkeypatch):
+    """Once the log exceeds twice the retention it is rewritten with recent events."""
+    monkeypatch.setattr("src.learning.preference_manager.MAX_STORED_EVENTS", 4)
+    manager = PreferenceManager("cs_1", storage_path=tmp_path, flush_interval=0)
+    for _ in range(9):
+        await _record(manager)
+
+    lines = (tmp_path / "cs_1_events.jsonl").read_text().splitlines()
+    assert len(lines) == 4
+
+
+@pytest.mark.unit
+async def test_legacy_event_file_is_converted(tmp_path):
+    """Events stored as a JSON array are loaded and rewritten as a log on the next flush."""
+    legacy = [
+        {
+            "event_type": "data_source_selection",
+            "business_function": "lead_enrichment",
+            "context": {},
+            "user_choice": "apollo",
+            "alternatives": None,
+            "outcome": "success",
+            "confidence_impact": 0.1,
+            "timestamp": datetime(2026, 1, 1).isoformat()
+        }
+    ] * 3
+    (tmp_path / "cs_1_events.json").write_text(json.dumps(legacy))
+
+    manager = PreferenceManager("cs_1", storage_path=tmp_path, flush_interval=0)
+    assert len(manager.learning_events) == 3
+    await _record(manager)
+
+    assert len((tmp_path / "cs_1_events.jsonl").read_text().splitlines()) == 4
+    assert not (tmp_path / "cs_1_events.json").exists()
+
+
+async def _wait_for_lines(path, count):
+    for _ in range(50):
+        await asyncio.sleep(0.05)
+        if path.exists() and len(path.read_text().splitlines()) == count:
+            return
+
+
+@pytest.mark.unit
+async def test_events_recorded_during_a_write_are_flushed(tmp_path, monkeypatch):
+    """An event that lands while the background write runs gets its own flush."""
+    manager = PreferenceManager("cs_1", storage_path=tmp_path, flush_interval=0.01)
+    real_save = manager._save_to_disk
+    started = threading.Event()
+    active = []
+    overlaps = []
+
+    def slow_save(*args):
+        overlaps.append(len(active))
+        active.append(args)
+        started.set()
+        time.sleep(0.1)
+        active.pop()
+        return real_save(*args)
+
+    monkeypatch.setattr(manager, "_save_to_disk", slow_save)
+
+    await _record(manager)
+    await asyncio.to_thread(started.wait, 1)
+    await _record(manager, choice="zoominfo")
+
+    events_file = tmp_path / "cs_1_events.jsonl"
+    await _wait_for_lines(events_file, 2)
+
+    assert len(events_file.read_text().splitlines()) == 2
+    assert overlaps == [0, 0]
+    assert not manager._dirty
+
+
+@pytest.mark.unit
+async def test_failed_background_write_is_retried(tmp_path, monkeypatch):
+    manager = PreferenceManager("cs_1", storage_path=tmp_path, flush_interval=0.01)
+    real_save = manager._save_to_disk
+    attempts = []
+
+    def flaky_save(*args):
+        attempts.append(args)
+        return len(attempts) > 1 and real_save(*args)
+
+    monkeypatch.setattr(manager, "_save_to_disk", flaky_save)
+
+    await _record(manager)
+    events_file = tmp_path / "cs_1_events.jsonl"
+    await _wait_for_lines(events_file, 1)
+
+    assert len(attempts) == 2
+    assert len(events_file.read_text().splitlines()) == 1
+    assert not manager._dirty
+
+
+@pytest.mark.unit
+async def test_pending_changes_are_written_at_exit(tmp_path):
+    """The exit hook writes what the batched flush has not persisted yet."""
+    manager = PreferenceManager("cs_1", storage_path=tmp_path, flush_interval=60)
+    await _record(manager)
+    await _record(manager)
+
+    preference_manager._flush_dirty_managers()
+
+    assert len((tmp_path / "cs_1_events.jsonl").read_text().splitlines()) == 2
+    assert manager not in preference_manager._dirty_managers
+    await manager.shutdown()
@@ -0,0 +1,307 @@
+"""
+Unit Tests for RedisRateLimiter and HybridRateLimiter
+
+Tests how limits are packed into a single script call, how script results
+are reported, fail-open behavior, the async decorator path and the local
+leased-token tier. The Lua
+scripts themselves require a Redis server and are covered by integration
+testing.
+"""
+
+import asyncio
+
+import pytest
+
+from src.middleware import rate_limiter as rate_limiter_module
+from src.middleware.rate_limiter import HybridRateLimiter, RedisRateLimiter, rate_limit
+
+
+class RecordingScript:
+    """Stand-in for a registered Redis script returning a fixed result."""
+
+    def __init__(self, result=(1, 0, 0), error=None):
+        self.result = list(result)
+        self.error = error
+        self.calls = []
+
+    def __call__(self, keys, args):
+        self.calls.append((keys, args))
+        if self.error:
+            raise self.error
+        return self.result
+
+
+class AsyncRecordingScript(RecordingScript):
+    async def __call__(self, keys, args):
+        return super().__call__(keys, args)
+
+
+def _limiter(monkeypatch, algorithm="fixed_window", script=None, async_script=None):
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    limiter = RedisRateLimiter(algorithm=algorithm)
+    limiter.enabled = True
+    limiter._script = script
+    limiter._async_script = async_script
+    return limiter
+
+
+@pytest.mark.unit
+def test_all_limits_evaluated_in_one_script_call(monkeypatch):
+    """Global, client and tool windows are sent as one script invocation."""
+    script = RecordingScript()
+    limiter = _limiter(monkeypatch, script=script)
+
+    assert limiter.check_all_limits("acme", "get_client_overview") == (True, None, None)
+    assert len(script.calls) == 1
+
+    keys, args = script.calls[0]
+    assert len(keys) == 5
+    assert args[1] == 1
+    assert args[3::2] == [60_000, 3_600_000, 60_000, 3_600_000, 60_000]
+
+
+@pytest.mark.unit
+def test_sliding_window_sends_current_and_previous_buckets(monkeypatch):
+    """The sliding window variant passes two counters per limit."""
+    script = RecordingScript()
+    limiter = _limiter(monkeypatch, algorithm="sliding_window", script=script)
+    limiter.check_all_limits("acme", "get_client_overview")
+
+    keys, _ = script.calls[0]
+    assert len(keys) == 10
+    current_bucket = int(keys[0].rsplit(":", 1)[1])
+    previous_bucket = int(keys[1].rsplit(":", 1)[1])
+    assert current_bucket - previous_bucket == 1
+
+
+@pytest.mark.unit
+def test_rejection_reports_limit_type_and_retry_seconds(monkeypatch):
+    """The failing limit index maps back to its limit type; retry rounds up to seconds."""
+    limiter = _limiter(monkeypatch, algorithm="gcra", script=RecordingScript(result=(0, 3, 1500)))
+
+    assert limiter.check_all_limits("acme", "get_client_overview") == (False, "per_client", 2)
+
+
+@pytest.mark.unit
+def test_fails_open_when_redis_errors(monkeypatch):
+    """Redis failures allow the request instead of blocking tools."""
+    limiter = _limiter(monkeypatch, script=RecordingScript(error=ConnectionError("down")))
+
+    assert limiter.check_all_limits("acme", "get_client_overview") == (True, None, None)
+
+
+@pytest.mark.unit
+def test_unknown_algorithm_is_rejected(monkeypatch):
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    with pytest.raises(ValueError):
+        RedisRateLimiter(algorithm="leaky")
+
+
+@pytest.mark.unit
+async def test_decorator_uses_async_check(monkeypatch):
+    """The decorator awaits the async client and returns an MCP error on rejection."""
+    async_script = AsyncRecordingScript(result=(0, 5, 30_000))
+    limiter = _limiter(monkeypatch, async_script=async_script)
+    monkeypatch.setattr(rate_limiter_module, "_rate_limiter", limiter)
+
+    @rate_limit
+    async def get_client_overview(ctx, client_id):
+        return {"status": "success"}
+
+    result = await get_client_overview(None, client_id="acme")
+
+    assert len(async_script.calls) == 1
+    assert result["error_code"] == "RATE_LIMIT_EXCEEDED"
+    assert result["limit_type"] == "per_tool"
+    assert result["retry_after"] == 30
+
+
+# ============================================================================
+# HybridRateLimiter
+# ============================================================================
+
+class AsyncLeaseScript(AsyncRecordingScript):
+    """Grants every requested chunk in full."""
+
+    async def __call__(self, keys, args):
+        self.result = [args[1], 0, 0]
+        return await super().__call__(keys, args)
+
+
+def _hybrid(monkeypatch, result=None, error=None, degraded_mode="local"):
+    if result is None:
+        async_script = AsyncLeaseScript(error=error)
+    else:
+        async_script = AsyncRecordingScript(result=result, error=error)
+    hybrid = HybridRateLimiter(_limiter(monkeypatch, async_script=async_script), degraded_mode=degraded_mode)
+    return hybrid, async_script
+
+
+@pytest.mark.unit
+async def test_hybrid_decides_locally_from_leased_tokens(monkeypatch):
+    """The first call leases a chunk per limit; following calls need no Redis round trip."""
+    hybrid, async_script = _hybrid(monkeypatch)
+
+    assert await hybrid.check_all_limits_async("acme", "get_client_overview") == (True, None, None)
+    # Per-client minute limit of 100 leases 5; the larger limits lease the 50 cap
+    assert [args[1] for _, args in async_script.calls] == [50, 50, 5, 50, 50]
+
+    assert (await hybrid.check_all_limits_async("acme", "get_client_overview"))[0]
+    await asyncio.sleep(0)
+    assert len(async_script.calls) == 5
+    assert hybrid.stats["local_decisions"] == 1
+
+
+@pytest.mark.unit
+async def test_hybrid_refills_in_background_at_low_water(monkeypatch):
+    """Dropping below half a chunk starts a background lease without blocking the caller."""
+    hybrid, async_script = _hybrid(monkeypatch)
+    for _ in range(3):
+        await hybrid.check_all_limits_async("acme", "get_client_overview")
+    assert len(async_script.calls) == 5
+
+    bucket = hybrid._bucket(hybrid.redis._limit_specs("acme")[2])
+    await bucket.refill_task
+    # Only the per-client bucket (2 of 5 tokens left) was topped up
+    assert len(async_script.calls) == 6
+    assert bucket.tokens == 7
+    assert hybrid.stats["lease_waits"] == 1
+
+
+@pytest.mark.unit
+async def test_hybrid_caches_redis_denials(monkeypatch):
+    """A refused lease is remembered until retry_after instead of asking Redis again."""
+    hybrid, async_script = _hybrid(monkeypatch, result=(0, 1, 20_000))
+
+    assert await hybrid.check_all_limits_async("acme", "get_client_overview") == (False, "global", 20)
+    calls = len(async_script.calls)
+    assert (await hybrid.check_all_limits_async("acme", "get_client_overview"))[0] is False
+    assert len(async_script.calls) == calls
+    assert hybrid.stats["cached_denials"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("mode,allowed", [("local", True), ("open", True), ("closed", False)])
+async def test_hybrid_degrades_when_redis_fails(monkeypatch, mode, allowed):
+    """Redis errors switch to the degraded mode and back off instead of retrying every call."""
+    monkeypatch.setattr(rate_limiter_module, "RATE_LIMIT_PER_CLIENT_PER_MINUTE", 3)
+    hybrid, async_script = _hybrid(monkeypatch, error=ConnectionError("down"), degraded_mode=mode)
+
+    assert (await hybrid.check_all_limits_async("acme", "get_client_overview"))[0] is allowed
+    calls = len(async_script.calls)
+    decisions = [(await hybrid.check_all_limits_async("acme", "get_client_overview"))[0] for _ in range(4)]
+    assert len(async_script.calls) == calls
+    assert hybrid.get_stats()["degraded"] is True
+
+    if mode == "local":
+        # Local buckets hold the per-client limit of 3 per minute
+        assert decisions == [True, True, False, False]
+
+
+@pytest.mark.unit
+async def test_hybrid_times_out_slow_redis(monkeypatch):
+    """A lease that misses the timeout is treated like a Redis failure."""
+    hybrid, _ = _hybrid(monkeypatch, degraded_mode="open")
+    hybrid.redis_timeout = 0.01
+
+    async def slow_lease(specs, buckets):
+        await asyncio.sleep(1)
+
+    monkeypatch.setattr(hybrid, "_lease", slow_lease)
+
+    assert await hybrid.check_all_limits_async("acme", "get_client_overview") == (True, None, None)
+    assert hybrid.stats["lease_failures"] == 1
+    assert hybrid.stats["degraded_decisions"] == 1
+
+
+@pytest.mark.unit
+async def test_hybrid_prunes_idle_buckets(monkeypatch):
+    """Buckets of clients that went quiet are dropped once their leases and denials lapse."""
+    hybrid, _ = _hybrid(monkeypatch)
+    for client in ("acme", "globex", "initech"):
+        await hybrid.check_all_limits_async(client, "get_client_overview")
+    await asyncio.gather(*(b.refill_task for b in hybrid._leases.values() if b.refill_task))
+    # Two global, one per-tool and two per-client buckets for each client
+    assert hybrid.get_stats()["leased_buckets"] == 9
+
+    now = rate_limiter_module.time.monotonic()
+    # Live leases are kept
+    assert hybrid.prune(now) == 0
+
+    denied = hybrid._leases[("client:globex", "minute")]
+    denied.denied_until = now + 3600
+    assert hybrid.prune(now + 10) == 8
+    assert list(hybrid._leases) == [("client:globex", "minute")]
+
+    # Degraded-mode buckets go once they have refilled to capacity
+    drained = hybrid._local[("client:acme", "minute")] = rate_limiter_module.LocalBucket(3, "minute", now)
+    drained.tokens = 0
+    hybrid._local[("client:globex", "minute")] = rate_limiter_module.LocalBucket(3, "minute", now)
+    assert hybrid.prune(now + 1) == 1
+    assert list(hybrid._local) == [("client:acme", "minute")]
+    assert hybrid.prune(now + 3600 + 60) == 2
+    assert hybrid.get_stats()["local_buckets"] == 0
+    assert hybrid.stats["pruned_buckets"] == 11
+
+
+class FixedWindowRedis:
+    """In-memory stand-in for the fixed window lease and release scripts."""
+
+    def __init__(self):
+        self.counters = {}
+
+    async def lease(self, keys, args):
+        now, grant = args[0], args[1]
+        for i, key in enumerate(keys):
+            limit, window = args[2 * i + 2], args[2 * i + 3]
+            available = limit - self.counters.get(key, 0)
+            if available < 1:
+                return [0, i + 1, window - now % window]
+            grant = min(grant, available)
+        for key in keys:
+            self.counters[key] = self.counters.get(key, 0) + grant
+        return [grant, 0, 0]
+
+    async def release(self, keys, args):
+        for i, key in enumerate(keys):
+            current = self.counters.get(key, 0)
+            if current > 0:
+                self.counters[key] = current - min(args[3 * i + 1], current)
+        return 0
+
+
+class FakeClock:
+    def __init__(self, start):
+        self.now = start
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.mark.unit
+async def test_hybrid_returns_unused_tokens_for_slow_traffic(monkeypatch):
+    """A client slower than the lease TTL is charged per request, not per chunk."""
+    # Start on an hour boundary so the hour windows do not roll over
+    clock = FakeClock(3600 * 500_000)
+    monkeypatch.setattr(rate_limiter_module, "time", clock)
+    monkeypatch.setattr(rate_limiter_module, "MAX_REQUESTS_PER_HOUR", 250)
+
+    redis = FixedWindowRedis()
+    limiter = _limiter(monkeypatch, async_script=redis.lease)
+    limiter._async_release_script = redis.release
+    hybrid = HybridRateLimiter(limiter)
+
+    for _ in range(200):
+        assert await hybrid.check_all_limits_async("acme", "get_client_overview") == (True, None, None)
+        await asyncio.gather(*hybrid._release_tasks, *(b.refill_task for b in hybrid._leases.values() if b.refill_task))
+        clock.now += 6
+
+    # Each hour counter holds the requests made plus at most the lease still held
+    global_hour = limiter._generate_key("global", "hour", clock.now)
+    client_hour = limiter._generate_key("client:acme", "hour", clock.now)
+    assert 200 <= redis.counters[global_hour] <= 200 + hybrid._leases[("global", "hour")].chunk
+    assert 200 <= redis.counters[client_hour] <= 200 + hybrid._leases[("client:acme", "hour")].chunk
+    assert hybrid.stats["released_tokens"] > 0
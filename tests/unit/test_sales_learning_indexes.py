@@ -0,0 +1,107 @@
+"""
+Unit Tests for SalesLearningEngine indexes
+
+Tests that indexed similar-outcome and context-pattern lookups return the
+same results as a full scan, and that indexes survive a reload from disk.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.agents.sales_learning_system import OutcomeType, SalesLearningEngine, SalesOutcome
+
+
+def _outcome(i, rng):
+    context = {"territory": rng.choice(["east", "west", "north"])} if i % 4 else {}
+    strategy = {"strategy_type": rng.choice(["land", "expand"])} if i % 3 else {}
+    return SalesOutcome(
+        outcome_id=f"o_{i}",
+        outcome_type=rng.choice([OutcomeType.WIN, OutcomeType.LOSS, OutcomeType.PIPELINE]),
+        deal_value=rng.choice([5_000, 20_000, 100_000, 500_000]),
+        sales_cycle_days=rng.choice([10, 45, 120, 200]),
+        rep_id=rng.choice(["rep_a", "rep_b", "rep_c"]),
+        client_id=rng.choice(["cs_1", "cs_2"]),
+        strategy_used=strategy,
+        context_factors=context,
+        outcome_date=datetime(2026, 1, 1) + timedelta(days=i),
+    )
+
+
+def _scan_patterns(engine, context, min_confidence):
+    """Reference implementation: linear scan over all patterns."""
+    matched = []
+    for pattern in engine.learned_patterns.values():
+        if pattern.confidence_score < min_confidence:
+            continue
+        matches = True
+        for key, value in pattern.conditions.items():
+            if key == "outcome_type":
+                continue
+            elif key in context and context[key] != value:
+                matches = False
+            elif key == "deal_size_category" and "deal_value" in context:
+                matches = engine._categorize_deal_size(context["deal_value"]) == value
+            elif key == "cycle_category" and "expected_cycle_days" in context:
+                matches = engine._categorize_cycle_length(context["expected_cycle_days"]) == value
+            if not matches:
+                break
+        if matches:
+            matched.append(pattern.pattern_id)
+    return sorted(matched)
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    rng = random.Random(7)
+    engine = SalesLearningEngine("cs_1", storage_dir=tmp_path)
+    for i in range(120):
+        await engine.record_outcome(_outcome(i, rng))
+    return engine
+
+
+@pytest.mark.unit
+async def test_similar_outcomes_match_full_scan(engine):
+    """Index intersections return exactly the outcomes _matches_conditions accepts, in order."""
+    conditions_list = [
+        {"rep_id": "rep_a", "outcome_type": "win"},
+        {"territory": "east", "outcome_type": "loss"},
+        {"deal_size_category": "large", "cycle_category": "short"},
+        {"strategy_type": "expand", "outcome_type": "pipeline"},
+        {"rep_id": "rep_z"},
+        {"unknown_key": "x"},
+    ]
+    for conditions in conditions_list:
+        expected = [o for o in engine.outcomes_history if engine._matches_conditions(o, conditions)]
+        assert engine._find_similar_outcomes(conditions) == expected
+
+
+@pytest.mark.unit
+async def test_patterns_for_context_match_full_scan(engine):
+    """Context lookups agree with the linear scan, including derived categories."""
+    assert engine.learned_patterns
+
+    contexts = [
+        {},
+        {"rep_id": "rep_b"},
+        {"territory": "west", "deal_value": 20_000},
+        {"expected_cycle_days": 150, "strategy_type": "land"},
+        {"outcome_type": "win", "rep_id": "rep_c", "deal_size_category": "enterprise"},
+    ]
+    for context in contexts:
+        for min_confidence in (0.0, 0.5):
+            found = engine.get_patterns_for_context(context, min_confidence=min_confidence)
+            assert sorted(p.pattern_id for p in found) == _scan_patterns(engine, context, min_confidence)
+
+
+@pytest.mark.unit
+async def test_indexes_rebuilt_on_load(engine, tmp_path):
+    """A reloaded engine answers lookups from rebuilt indexes."""
+    reloaded = SalesLearningEngine("cs_1", storage_dir=tmp_path)
+
+    conditions = {"rep_id": "rep_a", "outcome_type": "win"}
+    assert [o.outcome_id for o in reloaded._find_similar_outcomes(conditions)] == \
+        [o.outcome_id for o in engine._find_similar_outcomes(conditions)]
+    assert {p.pattern_id for p in reloaded.get_patterns_for_context({"rep_id": "rep_a"}, 0.0)} == \
+        {p.pattern_id for p in engine.get_patterns_for_context({"rep_id": "rep_a"}, 0.0)}
@@ -0,0 +1,146 @@
+"""
+Unit Tests for sales learning storage
+
+Tests the append-only outcome / interaction logs, pattern and preference
+snapshots with tail replay, compaction and migration of the legacy JSON
+files.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.agents.sales_learning_system import (
+    ClientPreferenceLearner,
+    OutcomeType,
+    SalesLearningEngine,
+    SalesOutcome,
+    _outcome_to_dict,
+    _pattern_to_dict,
+)
+
+
+def _outcome(i):
+    return SalesOutcome(
+        outcome_id=f"o_{i}",
+        outcome_type=OutcomeType.WIN if i % 3 else OutcomeType.LOSS,
+        deal_value=20_000 if i % 2 else 100_000,
+        sales_cycle_days=45,
+        rep_id=f"rep_{i % 2}",
+        client_id="cs_1",
+        strategy_used={"strategy_type": "land"},
+        context_factors={"territory": "east"},
+        outcome_date=datetime(2026, 1, 1) + timedelta(days=i),
+    )
+
+
+def _patterns(engine):
+    """Pattern state without wall-clock fields."""
+    return {
+        pattern_id: {k: v for k, v in _pattern_to_dict(p).items() if k != "last_updated"}
+        for pattern_id, p in engine.learned_patterns.items()
+    }
+
+
+def _lines(path):
+    return path.read_text().splitlines()
+
+
+@pytest.mark.unit
+async def test_outcomes_are_appended_one_line_each(tmp_path):
+    """Each outcome adds one log line; the snapshot is only written at the interval."""
+    engine = SalesLearningEngine("cs_1", storage_dir=tmp_path)
+    engine.snapshot_interval = 10
+
+    for i in range(25):
+        await engine.record_outcome(_outcome(i))
+
+    assert len(_lines(tmp_path / "outcomes.jsonl")) == 25
+    snapshot = json.loads((tmp_path / "patterns_snapshot.json").read_text())
+    assert snapshot["last_seq"] == 20
+    assert not (tmp_path / "outcomes_history.json").exists()
+
+
+@pytest.mark.unit
+async def test_reload_replays_tail_after_snapshot(tmp_path):
+    """Snapshot plus replayed tail reproduces the in-memory patterns and history."""
+    engine = SalesLearningEngine("cs_1", storage_dir=tmp_path)
+    engine.snapshot_interval = 10
+    for i in range(25):
+        await engine.record_outcome(_outcome(i))
+
+    reloaded = SalesLearningEngine("cs_1", storage_dir=tmp_path)
+
+    assert [o.outcome_id for o in reloaded.outcomes_history] == [o.outcome_id for o in engine.outcomes_history]
+    assert _patterns(reloaded) == _patterns(engine)
+
+
+@pytest.mark.unit
+async def test_compaction_trims_log_to_history_limit(tmp_path):
+    """Compaction keeps max_outcomes_history outcomes with their sequence numbers."""
+    engine = SalesLearningEngine("cs_1", storage_dir=tmp_path)
+    engine.snapshot_interval = 10
+    engine.max_outcomes_history = 8
+    for i in range(30):
+        await engine.record_outcome(_outcome(i))
+
+    records = [json.loads(line) for line in _lines(tmp_path / "outcomes.jsonl")]
+    assert [r["seq"] for r in records] == list(range(23, 31))
+    assert [r["outcome_id"] for r in records] == [f"o_{i}" for i in range(22, 30)]
+
+    reloaded = SalesLearningEngine("cs_1", storage_dir=tmp_path)
+    assert len(reloaded.outcomes_history) == 8
+    assert _patterns(reloaded) == _patterns(engine)
+
+
+@pytest.mark.unit
+async def test_torn_last_line_is_skipped(tmp_path):
+    """A partially written record does not prevent loading."""
+    engine = SalesLearningEngine("cs_1", storage_dir=tmp_path)
+    for i in range(6):
+        await engine.record_outcome(_outcome(i))
+    with open(tmp_path / "outcomes.jsonl", "a") as f:
+        f.write('{"seq": 7, "outcome_id": "o_')
+
+    reloaded = SalesLearningEngine("cs_1", storage_dir=tmp_path)
+    assert len(reloaded.outcomes_history) == 6
+
+
+@pytest.mark.unit
+async def test_legacy_json_files_are_migrated(tmp_path):
+    """outcomes_history.json / learned_patterns.json are converted to log + snapshot."""
+    legacy = SalesLearningEngine("cs_1", storage_dir=tmp_path / "legacy")
+    for i in range(12):
+        await legacy.record_outcome(_outcome(i))
+
+    (tmp_path / "outcomes_history.json").write_text(
+        json.dumps([_outcome_to_dict(o) for o in legacy.outcomes_history])
+    )
+    (tmp_path / "learned_patterns.json").write_text(
+        json.dumps({pid: _pattern_to_dict(p) for pid, p in legacy.learned_patterns.items()})
+    )
+
+    migrated = SalesLearningEngine("cs_1", storage_dir=tmp_path)
+
+    assert len(_lines(tmp_path / "outcomes.jsonl")) == 12
+    assert (tmp_path / "outcomes_history.json.migrated").exists()
+    assert _patterns(migrated) == _patterns(legacy)
+    assert _patterns(SalesLearningEngine("cs_1", storage_dir=tmp_path)) == _patterns(legacy)
+
+
+@pytest.mark.unit
+async def test_preference_learner_appends_and_replays(tmp_path):
+    """Interactions are appended; preferences are rebuilt from snapshot plus tail."""
+    learner = ClientPreferenceLearner("cs_1", storage_dir=tmp_path)
+    learner.SNAPSHOT_INTERVAL = 4
+    for i in range(6):
+        await learner.record_interaction("report_generation", {"style": "detailed"}, satisfaction_score=0.9)
+
+    assert len(_lines(tmp_path / "client_interactions.jsonl")) == 6
+    assert json.loads((tmp_path / "client_preferences.json").read_text())["last_seq"] == 4
+
+    reloaded = ClientPreferenceLearner("cs_1", storage_dir=tmp_path)
+    assert reloaded.preferences == learner.preferences
+    assert reloaded.preferences["report_detail_level"] == pytest.approx(1.0)
+    assert len(reloaded.interaction_patterns) == 6
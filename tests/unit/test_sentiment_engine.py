@@ -0,0 +1,146 @@
+"""
+Unit Tests for the Batch Sentiment Engine
+
+Tests lexicon matching (word-start prefixes, phrases, distinct terms),
+that batch and multi-process scoring agree with single-item scoring, and
+the re-scoring path against an in-memory SQLite database.
+"""
+
+import pytest
+from datetime import datetime
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateTable
+
+from src.database.models import CustomerFeedback
+from src.services.sentiment_engine import SentimentEngine, SentimentLexicon
+
+SAMPLES = [
+    "Great product, the support team was very helpful and the new feature is amazing",
+    "Terrible performance, the dashboard is slow and broken. Another bug!",
+    "I am frustrated, the interface is confusing and the export has an issue",
+    "Build finished, nothing else to report",
+    "Love it. Happy with the design but login is slow",
+]
+
+
+@pytest.fixture
+def engine():
+    return SentimentEngine()
+
+
+@pytest.mark.unit
+def test_analyze_matches_legacy_labels(engine):
+    """Scores, themes and emotions keep the previous helper's output format."""
+    result = engine.analyze(SAMPLES[0]).to_dict()
+    assert result['sentiment'] == 'very_positive'
+    assert result['score'] == 0.8
+    assert result['themes'] == ['customer_support', 'product_features']
+    assert result['emotion'] == 'neutral'
+    assert result['impact_notes'] == (
+        "Sentiment: Very Positive. Key themes: customer_support, product_features."
+    )
+
+    negative = engine.analyze(SAMPLES[1], title="Dashboard problem")
+    assert negative.sentiment == 'very_negative'
+    assert negative.negative_matches == 5
+    assert negative.themes == ['performance']
+
+    assert engine.analyze(SAMPLES[2]).emotion == 'frustrated'
+    assert engine.analyze(SAMPLES[4]).sentiment == 'neutral'
+
+
+@pytest.mark.unit
+def test_terms_match_at_word_start_only(engine):
+    """Suffixes match ("bugs", "helpful") but terms inside words do not ("ui" in "build")."""
+    assert engine.analyze(SAMPLES[3]).themes == []
+    result = engine.analyze("Bugs everywhere, help!")
+    assert result.negative_matches == 1
+    assert result.themes == ['customer_support']
+    assert engine.analyze("unhelpful").positive_matches == 0
+
+
+@pytest.mark.unit
+def test_phrases_and_distinct_terms():
+    lexicon = SentimentLexicon(negative=('not working', 'slow'), positive=('works',))
+    engine = SentimentEngine(lexicon)
+
+    result = engine.analyze("Sync is not working. Still not working, slow slow slow")
+    assert result.negative_matches == 2
+    assert engine.analyze("not sure it works").negative_matches == 0
+
+
+@pytest.mark.unit
+def test_batch_and_process_pool_match_single(engine):
+    texts = SAMPLES * 50
+    expected = [engine.analyze(text) for text in texts]
+
+    assert engine.analyze_batch(texts) == expected
+    assert engine.analyze_batch(texts, processes=2, chunk_size=40) == expected
+
+
+@pytest.mark.unit
+def test_summarize_groups_themes_by_sentiment(engine):
+    summary = engine.summarize(engine.analyze_batch(SAMPLES))
+
+    assert summary['total'] == 5
+    assert summary['counts']['very_positive'] == 1
+    assert [t['theme'] for t in summary['positive']] == ['customer_support', 'product_features']
+    assert summary['negative'][0]['theme'] == 'performance'
+
+
+@pytest.fixture
+def feedback_session():
+    """In-memory SQLite session with the feedback table."""
+    db_engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    with db_engine.begin() as conn:
+        conn.execute(CreateTable(CustomerFeedback.__table__))
+    session = sessionmaker(bind=db_engine)()
+    yield session
+    session.close()
+    db_engine.dispose()
+
+
+@pytest.mark.unit
+def test_rescore_feedback_updates_changed_rows(engine, feedback_session):
+    for i, text in enumerate(SAMPLES):
+        feedback_session.add(CustomerFeedback(
+            feedback_id=f"FB-{i}",
+            client_id="cs_1" if i < 4 else "cs_2",
+            feedback_type="general",
+            source="email",
+            submitter_email="a@example.com",
+            submitter_name="A",
+            title="Feedback",
+            content=text,
+            category="general",
+            sentiment="neutral",
+            sentiment_score=0.0,
+            created_at=datetime(2026, 1, 1 + i)
+        ))
+    feedback_session.commit()
+
+    result = engine.rescore_feedback(feedback_session, client_ids=["cs_1"], batch_size=2)
+
+    assert result.items_scored == 4
+    assert result.items_changed == 3
+    rows = dict(feedback_session.execute(
+        select(CustomerFeedback.feedback_id, CustomerFeedback.sentiment)
+    ).all())
+    assert rows == {
+        "FB-0": "very_positive",
+        "FB-1": "very_negative",
+        "FB-2": "negative",
+        "FB-3": "neutral",
+        "FB-4": "neutral",
+    }
+
+    again = engine.rescore_feedback(feedback_session, since=datetime(2026, 1, 2))
+    assert again.items_scored == 4
+    assert again.items_changed == 0
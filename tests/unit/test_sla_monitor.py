@@ -0,0 +1,273 @@
+"""
+Unit Tests for the SLA Breach Monitor
+
+Tests that the timing wheel fires timers exactly at their tick across
+level cascades, and that the monitor raises at-risk and breach events
+once, updating incrementally as tickets change.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+import src.services.sla_monitor as sla_monitor
+from src.services.sla_monitor import SLAMonitor, TimerWheel, load_open_tickets, ticket_in_utc
+
+T0 = datetime(2026, 1, 5, 9, 0, 0)
+
+
+class _Clock:
+    def __init__(self, now=T0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _ticket(ticket_id, first_response=60, resolution=600, created_at=T0, **fields):
+    ticket = {
+        'ticket_id': ticket_id,
+        'client_id': 'cs_1',
+        'priority': 'P2',
+        'status': 'open',
+        'created_at': created_at,
+        'first_response_at': None,
+        'resolved_at': None,
+        'sla_first_response_minutes': first_response,
+        'sla_resolution_minutes': resolution,
+    }
+    ticket.update(fields)
+    return ticket
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("offset", [1, 63, 64, 65, 4095, 4096, 262145, 300000])
+def test_wheel_fires_exactly_on_tick(offset):
+    """Timers fire at their tick, not before, whatever level they start on."""
+    wheel = TimerWheel(origin=T0)
+    wheel.schedule("t", T0 + timedelta(seconds=offset))
+
+    assert wheel.advance(T0 + timedelta(seconds=offset - 1)) == []
+    assert wheel.advance(T0 + timedelta(seconds=offset)) == [("t", T0 + timedelta(seconds=offset))]
+    assert len(wheel) == 0
+
+
+@pytest.mark.unit
+def test_wheel_beyond_span_cancel_and_order():
+    wheel = TimerWheel(origin=T0, levels=2)  # spans 4096 ticks
+    wheel.schedule("far", T0 + timedelta(seconds=10000))
+    wheel.schedule("near", T0 + timedelta(seconds=100))
+    wheel.schedule("cancelled", T0 + timedelta(seconds=50))
+    assert wheel.cancel("cancelled")
+
+    assert [k for k, _ in wheel.advance(T0 + timedelta(seconds=9999))] == ["near"]
+    assert [k for k, _ in wheel.advance(T0 + timedelta(seconds=20000))] == ["far"]
+
+
+@pytest.mark.unit
+def test_wheel_random_schedule_matches_sorted_deadlines():
+    import random
+
+    rng = random.Random(7)
+    wheel = TimerWheel(origin=T0)
+    deadlines = {i: T0 + timedelta(seconds=rng.randint(1, 200000)) for i in range(2000)}
+    for key, when in deadlines.items():
+        wheel.schedule(key, when)
+
+    fired = []
+    now = T0
+    while now < T0 + timedelta(seconds=200000):
+        now += timedelta(seconds=rng.randint(1, 5000))
+        for key, when in wheel.advance(now):
+            assert when <= now
+            fired.append(key)
+
+    assert sorted(fired) == sorted(deadlines)
+    assert [deadlines[k] for k in fired] == sorted(deadlines.values())
+
+
+@pytest.mark.unit
+def test_at_risk_then_breach_fire_once():
+    clock = _Clock()
+    monitor = SLAMonitor(clock=clock)
+    assert monitor.track(_ticket("T1")) == {'first_response': 'on_track', 'resolution': 'on_track'}
+
+    clock.now = T0 + timedelta(minutes=47, seconds=59)
+    assert monitor.advance() == []
+
+    clock.now = T0 + timedelta(minutes=48)
+    events = monitor.advance()
+    assert [(e.ticket_id, e.kind, e.status) for e in events] == [("T1", "first_response", "at_risk")]
+    assert events[0].due_at == T0 + timedelta(minutes=48)
+    assert [r['ticket_id'] for r in monitor.at_risk()] == ["T1"]
+
+    clock.now = T0 + timedelta(minutes=61)
+    assert [e.status for e in monitor.advance()] == ["breached"]
+    assert monitor.advance() == []
+    assert [r['sla'] for r in monitor.breached()] == ["first_response"]
+    assert monitor.at_risk() == []
+
+
+@pytest.mark.unit
+def test_first_response_priority_change_and_resolution_update_incrementally():
+    clock = _Clock()
+    monitor = SLAMonitor(clock=clock)
+    monitor.track(_ticket("T1"))
+
+    # Agent responds: first response clock stops
+    clock.now = T0 + timedelta(minutes=30)
+    assert monitor.track(_ticket("T1", first_response_at=clock.now)) == {'resolution': 'on_track'}
+
+    # Priority raised with a tighter resolution target already at risk
+    clock.now = T0 + timedelta(minutes=100)
+    status = monitor.track(_ticket("T1", resolution=120, priority='P1', first_response_at=T0))
+    assert status == {'resolution': 'at_risk'}
+    events = monitor.advance()
+    assert [(e.kind, e.status, e.priority) for e in events] == [("resolution", "at_risk", "P1")]
+
+    # Re-tracking without change does not report again
+    monitor.track(_ticket("T1", resolution=120, priority='P1', first_response_at=T0))
+    assert monitor.advance() == []
+
+    # Resolved: timers cancelled, nothing fires later
+    monitor.track(_ticket("T1", status='resolved', resolved_at=clock.now))
+    clock.now = T0 + timedelta(days=2)
+    assert monitor.advance() == []
+    assert "T1" not in monitor
+    assert monitor.get_stats()['pending_timers'] == 0
+
+
+@pytest.mark.unit
+def test_loading_existing_tickets_reports_current_state():
+    clock = _Clock(T0 + timedelta(hours=3))
+    monitor = SLAMonitor(clock=clock, at_risk_lead=timedelta(hours=2))
+
+    monitor.track_many([
+        _ticket("OLD", resolution=120),
+        _ticket("SOON", resolution=240),   # 1h left: inside the 2h lead
+        _ticket("LATER", resolution=1440),
+        _ticket("DONE", status='closed'),
+    ])
+
+    events = monitor.advance()
+    assert {(e.ticket_id, e.kind, e.status) for e in events} == {
+        ("OLD", "first_response", "breached"),
+        ("OLD", "resolution", "breached"),
+        ("SOON", "first_response", "breached"),
+        ("SOON", "resolution", "at_risk"),
+        ("LATER", "first_response", "breached"),
+    }
+    assert [r['ticket_id'] for r in monitor.at_risk(within=timedelta(hours=2))] == ["SOON"]
+    assert len(monitor) == 3
+
+
+@pytest.mark.unit
+def test_load_open_tickets_seeds_monitor_from_database():
+    """Open tickets are read from the database; closed ones are not tracked."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from src.database.models import SupportTicket
+
+    engine = create_engine("sqlite://")
+    SupportTicket.__table__.create(engine)
+    session_factory = sessionmaker(bind=engine)
+    with session_factory() as db:
+        for ticket_id, status in (("T1", "open"), ("T2", "in_progress"), ("T3", "closed")):
+            db.add(SupportTicket(
+                ticket_id=ticket_id, client_id="cs_1", subject="s", description="d",
+                priority="P2", category="technical_issue", status=status,
+                requester_email="a@example.com", requester_name="A",
+                created_at=T0, updated_at=T0,
+                sla_first_response_minutes=60, sla_resolution_minutes=600,
+            ))
+        db.commit()
+
+    monitor = SLAMonitor(clock=_Clock())
+
+    assert load_open_tickets(monitor, session_factory) == 2
+    assert "T1" in monitor and "T2" in monitor and "T3" not in monitor
+
+
+@pytest.mark.unit
+def test_load_open_tickets_tolerates_unavailable_database():
+    def unavailable():
+        raise ConnectionError("database down")
+
+    assert load_open_tickets(SLAMonitor(clock=_Clock()), unavailable) == 0
+
+
+@pytest.mark.unit
+def test_worker_alerts_on_new_breaches(monkeypatch):
+    from autonomous.workers.support_sla_tracker import SupportSLATracker
+
+    worker = SupportSLATracker(name="support_sla_tracker", config={"params": {"hours_until_breach": 2}}, tools=None)
+    clock = _Clock(T0 + timedelta(minutes=30))
+    worker.monitor = SLAMonitor(clock=clock, at_risk_lead=timedelta(hours=2))
+    monkeypatch.setattr(worker, "_sync", lambda: worker.monitor.track_many([_ticket("T1", first_response=15)]))
+
+    result = asyncio.run(worker.execute())
+
+    assert result["breached_count"] == 1
+    assert result["new_breach_count"] == 1
+    assert result["near_breach_count"] == 0
+    assert result["alerts"][0].startswith("🚨 1 tickets entered SLA BREACH")
+
+    # Nothing new crossed since the last run
+    result = asyncio.run(worker.execute())
+    assert result["new_breach_count"] == 0
+    assert result["alerts"] == []
+
+
+@pytest.mark.unit
+def test_run_drains_events_to_consumer():
+    """The tick loop hands events to the consumer so nothing accumulates."""
+    clock = _Clock(T0 + timedelta(hours=2))
+    monitor = SLAMonitor(clock=clock, resolution_seconds=0.01)
+    monitor.track(_ticket("T1"))
+    received = []
+
+    async def main():
+        stop = asyncio.Event()
+
+        async def consume(events):
+            received.extend(events)
+            stop.set()
+
+        await asyncio.wait_for(monitor.run(consume, stop), timeout=1)
+
+    asyncio.run(main())
+
+    assert {(e.kind, e.status) for e in received} == {("first_response", "breached")}
+    assert monitor.advance() == []
+
+
+@pytest.mark.unit
+def test_worker_monitor_uses_utc_clock():
+    """Database rows are stamped with utcnow, so the worker's monitor must be too."""
+    from autonomous.workers.support_sla_tracker import SupportSLATracker
+
+    worker = SupportSLATracker(name="support_sla_tracker", config={}, tools=None)
+    assert worker._get_monitor(2).clock == datetime.utcnow
+
+
+@pytest.mark.unit
+def test_server_monitor_uses_utc_clock(monkeypatch):
+    """The lifespan monitor syncs database rows too, so it runs on utcnow."""
+    monkeypatch.setattr(sla_monitor, "_sla_monitor", None)
+    assert sla_monitor.get_sla_monitor().clock == datetime.utcnow
+
+
+@pytest.mark.unit
+def test_tool_tickets_are_converted_to_utc():
+    """Locally stamped tickets land on the UTC clock and keep their SLA fields."""
+    local = datetime.now().replace(microsecond=0)
+    utc = datetime.utcnow().replace(microsecond=0)
+    ticket = ticket_in_utc(_ticket('T-1', created_at=local))
+
+    assert abs(ticket['created_at'] - utc) <= timedelta(seconds=1)
+    assert ticket['first_response_at'] is None
+    assert ticket['sla_resolution_minutes'] == 600
+
+    monitor = SLAMonitor(clock=lambda: utc)
+    assert monitor.track(ticket) == {'first_response': 'on_track', 'resolution': 'on_track'}
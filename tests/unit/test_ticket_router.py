@@ -0,0 +1,145 @@
+"""
+Unit Tests for the Ticket Routing Engine
+
+Tests that heap-based routing makes the same assignments as the per-ticket
+agent scan, respects capacity, and handles release, rebalance and
+escalation incrementally.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.services.ticket_router import TicketRouter
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'scripts'))
+from benchmark_routing import scan_route, synthetic_queue  # noqa: E402
+
+
+def _agent(email, expertise=(), load=0, capacity=5, seniority='standard', status='available'):
+    return {
+        'email': email,
+        'name': email,
+        'team': 'Support',
+        'expertise': list(expertise),
+        'current_tickets': load,
+        'max_tickets': capacity,
+        'seniority': seniority,
+        'status': status,
+    }
+
+
+def _ticket(ticket_id, category='technical_issue', priority='P2', risk=0, agent=None):
+    return {
+        'ticket_id': ticket_id,
+        'category': category,
+        'priority': priority,
+        'sla_breach_risk': risk,
+        'assigned_agent': agent,
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_matches_scan_assignments(seed):
+    """Same tickets to the same agents as scoring every agent per ticket."""
+    tickets, agents = synthetic_queue(tickets=800, agents=40, categories=6, capacity=25, seed=seed)
+
+    router = TicketRouter(agents)
+    assignments, unrouted = router.route(tickets)
+
+    assert [(a.ticket_id, a.agent.email) for a in assignments] == scan_route(tickets, agents)
+    assert len(assignments) + len(unrouted) == len(tickets)
+    assert all(a.load <= a.capacity for a in router.agents)
+
+
+@pytest.mark.unit
+def test_urgent_tickets_route_first_and_capacity_is_respected():
+    router = TicketRouter([_agent("a@x.com", ["billing"], capacity=1)])
+    tickets = [_ticket("T1", "billing", "P3"), _ticket("T2", "billing", "P1"), _ticket("T3", "billing", "P1", risk=2)]
+
+    assignments, unrouted = router.route(tickets)
+
+    assert [a.ticket_id for a in assignments] == ["T3"]
+    assert [t['ticket_id'] for t in unrouted] == ["T2", "T1"]
+
+
+@pytest.mark.unit
+def test_release_returns_capacity():
+    router = TicketRouter([_agent("a@x.com", capacity=1), _agent("b@x.com", load=1, capacity=1)])
+
+    router.assign("T1", "a@x.com")
+    assert router.best_agent("technical_issue") is None
+
+    assert router.release("T1").email == "a@x.com"
+    assert router.best_agent("technical_issue").email == "a@x.com"
+    assert router.release("T1") is None
+
+
+@pytest.mark.unit
+def test_expertise_and_load_balance():
+    """Experts win unless a generalist has much more room; load_balance=False always prefers experts."""
+    agents = [_agent("generalist@x.com", capacity=10), _agent("expert@x.com", ["billing"], load=4, capacity=10)]
+
+    # 10 + 2*6 = 22 vs 2*10 = 20
+    assert TicketRouter(agents).best_agent("billing").email == "expert@x.com"
+
+    agents[1]['current_tickets'] = 6
+    # 10 + 2*4 = 18 vs 20
+    assert TicketRouter(agents).best_agent("billing").email == "generalist@x.com"
+    assert TicketRouter(agents).best_agent("billing", load_balance=False).email == "expert@x.com"
+    assert TicketRouter(agents).best_agent("billing", match_expertise=False).email == "generalist@x.com"
+
+
+@pytest.mark.unit
+def test_unavailable_and_removed_agents_are_not_routed():
+    router = TicketRouter([_agent("away@x.com", status="away"), _agent("a@x.com")])
+    assert [a.email for a in router.agents] == ["a@x.com"]
+
+    router.remove_agent("a@x.com")
+    assert router.best_agent("technical_issue") is None
+
+    router.add_agent(_agent("a@x.com", capacity=2))
+    router.assign("T1", "a@x.com")
+    assert router.best_agent("technical_issue").remaining == 1
+
+
+@pytest.mark.unit
+def test_rebalance_moves_lowest_priority_tickets():
+    agents = [_agent("busy@x.com", load=4, capacity=10), _agent("idle@x.com", capacity=10)]
+    tickets = [
+        _ticket("T1", priority="P0", agent="busy@x.com"),
+        _ticket("T2", priority="P4", agent="busy@x.com"),
+        _ticket("T3", priority="P2", agent="busy@x.com"),
+        _ticket("T4", priority="P3", agent="busy@x.com"),
+    ]
+    router = TicketRouter(agents)
+
+    moves = router.rebalance(tickets)
+
+    assert [(m.ticket_id, m.from_agent, m.agent.email) for m in moves] == [
+        ("T2", "busy@x.com", "idle@x.com"),
+        ("T4", "busy@x.com", "idle@x.com"),
+    ]
+    assert [a.load for a in router.agents] == [2, 2]
+
+    router.release("T2")
+    assert router.get_agent("idle@x.com").load == 1
+
+
+@pytest.mark.unit
+def test_senior_pool_and_heap_compaction():
+    agents = [_agent(f"s{i}@x.com", seniority='senior', capacity=1000) for i in range(3)]
+    agents.append(_agent("junior@x.com", capacity=1000))
+    router = TicketRouter(agents)
+
+    for i in range(600):
+        senior = router.best_in_pool('seniority:senior')
+        router.assign(f"T{i}", senior.email)
+
+    assert {a.email: a.load for a in router.agents if a.seniority == 'senior'} == {
+        "s0@x.com": 200, "s1@x.com": 200, "s2@x.com": 200
+    }
+    assert router.get_agent("junior@x.com").load == 0
+    assert router.get_stats()['heap_entries'] < 100
@@ -0,0 +1,187 @@
+"""
+Unit Tests for the tool manifest
+
+Tests manifest generation from tool sources (including modules that do not
+parse as a whole), that the committed manifest is current, and that lazy
+registration defers importing tool modules until the first call and skips
+modules that would fail to import.
+"""
+
+import inspect
+import sys
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from src.tools import TOOL_COUNT, register_all_tools
+from src.tools.manifest import describe_tool, load_manifest, make_lazy_tool, register_manifest_tools, stale_tools
+
+TOOL_SOURCE = '''
+"""
+rank_accounts - Rank accounts by health
+
+Rank accounts by health.
+"""
+
+from fastmcp import Context
+from typing import Dict, List, Any, Optional, Literal
+
+DEFAULT_LIMIT = 25
+
+LOADS = []
+LOADS.append(1)
+
+
+async def rank_accounts(
+        ctx: Context,
+        tier: Literal["starter", "enterprise"],
+        client_ids: Optional[List[str]] = None,
+        limit: int = DEFAULT_LIMIT,
+        include_trend: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Rank accounts by health score.
+
+        Args:
+            tier: Customer tier
+        """
+        return {"ctx": ctx, "tier": tier, "client_ids": client_ids, "limit": limit}
+'''
+
+
+@pytest.fixture
+def tool_module(tmp_path, monkeypatch):
+    """A tool module on sys.path that records how often it is imported."""
+    path = tmp_path / "rank_accounts.py"
+    path.write_text(TOOL_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield path
+    sys.modules.pop("rank_accounts", None)
+
+
+DOMAIN_INIT = '''
+import importlib
+
+__all__ = ["rank_accounts"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        tool = getattr(importlib.import_module(f"{__name__}.{name}"), name)
+        globals()[name] = tool
+        return tool
+    raise AttributeError(name)
+'''
+
+
+@pytest.fixture
+def domain_package(tmp_path, monkeypatch):
+    """A domain package exposing rank_accounts through a lazy __getattr__."""
+    package = tmp_path / "lazy_domain"
+    package.mkdir()
+    (package / "__init__.py").write_text(DOMAIN_INIT)
+    (package / "rank_accounts.py").write_text(TOOL_SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield package / "rank_accounts.py"
+    for name in ("lazy_domain", "lazy_domain.rank_accounts"):
+        sys.modules.pop(name, None)
+
+
+@pytest.mark.unit
+def test_committed_manifest_is_current():
+    """tool_manifest.json matches the tool sources; regenerate with python -m src.tools.manifest."""
+    manifest = load_manifest()
+
+    assert stale_tools(manifest) == []
+    assert len(manifest["tools"]) == TOOL_COUNT
+
+
+@pytest.mark.unit
+def test_describe_tool_reads_signature_and_docstring(tool_module):
+    entry = describe_tool(tool_module)
+
+    assert entry["description"].startswith("Rank accounts by health score.")
+    assert entry["context_param"] == "ctx"
+    assert entry["input_schema"]["required"] == ["tier"]
+    properties = entry["input_schema"]["properties"]
+    assert properties["tier"] == {"enum": ["starter", "enterprise"]}
+    assert properties["client_ids"]["anyOf"][0] == {"type": "array", "items": {"type": "string"}}
+    assert properties["include_trend"] == {"type": "boolean", "default": True}
+    limit = next(p for p in entry["parameters"] if p["name"] == "limit")
+    assert limit["default_expr"] == "DEFAULT_LIMIT"
+
+
+@pytest.mark.unit
+def test_header_is_extracted_from_module_that_does_not_parse(tool_module):
+    """Tools whose body has syntax errors still get a manifest entry from their header."""
+    tool_module.write_text(TOOL_SOURCE.replace('return {"ctx"', 'return {"ctx'))
+
+    entry = describe_tool(tool_module)
+
+    assert [p["name"] for p in entry["parameters"]] == ["tier", "client_ids", "limit", "include_trend"]
+    assert entry["description"].startswith("Rank accounts by health score.")
+
+
+@pytest.mark.unit
+async def test_lazy_tool_imports_module_on_first_call(tool_module):
+    """The proxy imports the module once, forwards ctx and keeps expression defaults."""
+    entry = dict(describe_tool(tool_module), module="rank_accounts")
+    proxy = make_lazy_tool(entry)
+
+    assert "rank_accounts" not in sys.modules
+    assert not proxy.loaded()
+
+    first = await proxy(ctx="CTX", tier="starter", limit=None)
+    second = await proxy(ctx="CTX", tier="enterprise", limit=5)
+
+    assert proxy.loaded()
+    assert sys.modules["rank_accounts"].LOADS == [1]
+    assert first == {"ctx": "CTX", "tier": "starter", "client_ids": None, "limit": 25}
+    assert second["limit"] == 5
+
+
+@pytest.mark.unit
+async def test_domain_import_returns_tool_after_proxy_call(domain_package):
+    """Loading a tool through its proxy leaves the package attribute bound to the function."""
+    entry = dict(describe_tool(domain_package), module="lazy_domain.rank_accounts")
+    await make_lazy_tool(entry)(ctx="CTX", tier="starter")
+
+    from lazy_domain import rank_accounts
+
+    assert inspect.iscoroutinefunction(rank_accounts)
+    assert rank_accounts is sys.modules["lazy_domain.rank_accounts"].rank_accounts
+
+
+@pytest.mark.unit
+async def test_register_all_tools_imports_no_tool_modules():
+    """Startup registration uses the manifest only; schemas come from the manifest signature."""
+    before = {name for name in sys.modules if name.startswith("src.tools.") and name.count(".") >= 3}
+    mcp = FastMCP("test")
+    parseable = [tool["name"] for tool in load_manifest()["tools"] if tool["parses"]]
+
+    assert register_all_tools(mcp) == len(parseable)
+
+    after = {name for name in sys.modules if name.startswith("src.tools.") and name.count(".") >= 3}
+    assert after == before
+
+    tools = {tool.name: tool for tool in await mcp.list_tools()}
+    assert sorted(tools) == sorted(parseable)
+    schema = tools["list_clients"].inputSchema
+    assert "ctx" not in schema["properties"]
+    assert schema["properties"]["limit"]["default"] == 50
+
+
+@pytest.mark.unit
+def test_modules_that_do_not_parse_are_not_registered(tool_module):
+    """A tool described from its header alone is recorded as not parsing and skipped."""
+    good = dict(describe_tool(tool_module), module="rank_accounts")
+    tool_module.write_text(TOOL_SOURCE.replace('return {"ctx"', 'return {"ctx'))
+    broken = dict(describe_tool(tool_module), name="broken_tool")
+
+    assert good["parses"] is True
+    assert broken["parses"] is False
+
+    mcp = FastMCP("test")
+    registered, failed = register_manifest_tools(mcp, {"version": 1, "tools": [good, broken]})
+
+    assert (registered, failed) == (1, ["broken_tool"])